@@ -34,7 +34,10 @@ from app.schemas.pipeline import (
     PipelineListItemResponse,
     PipelineListPageResponse,
     PipelineListResponse,
+    PipelineOptimizedPlanResponse,
     PipelineResponse,
+    PipelineRunEstimateResponse,
+    PipelineRunPerfComparisonResponse,
     PipelineRunResponse,
     PipelineRunSubmitRequest,
     PipelineSaveResponse,
@@ -47,6 +50,7 @@ from app.schemas.pipeline import (
     PipelineVersionUpdateRequest,
     SchemaPreviewRequest,
     SchemaPreviewResponse,
+    optimize_pipeline_config,
 )
 from app.services.pipeline_automation_service import PipelineAutomationService
 from app.services.pipeline_service import PipelineService
@@ -103,6 +107,7 @@ def _build_run_response(run: PipelineRun) -> PipelineRunResponse:
     return PipelineRunResponse(
         id=run.id,
         output_dataset_id=run.output_dataset_id,
+        extra_output_dataset_ids=run.extra_output_dataset_ids or [],
         config=run.transform_config,
         status=run.status,
         current_stage=run.current_stage,
@@ -111,7 +116,9 @@ def _build_run_response(run: PipelineRun) -> PipelineRunResponse:
         error_message=run.error_message,
         celery_task_id=run.celery_task_id,
         task_progress=run.task_progress,
+        perf_report=run.perf_report,
         pipeline_image_url=pipeline_image_url,
+        reused_from_run_id=run.reused_from_run_id,
         pipeline_name=pipeline_name,
         pipeline_version=pipeline_version_str,
         output_dataset_version=output_dataset_version,
@@ -137,6 +144,22 @@ def _pydantic_errors_to_issues(exc) -> list[PipelineValidationIssueResponse]:
     ]
 
 
+def _optimized_plan_to_response(config: PipelineConfig) -> PipelineOptimizedPlanResponse | None:
+    """검증 통과한 config 의 DAG 최적화 계획 → 응답. passthrough 는 None."""
+    if config.is_passthrough:
+        return None
+    plan = optimize_pipeline_config(config)
+    return PipelineOptimizedPlanResponse(
+        terminal_task=plan.terminal_task_name,
+        extra_terminal_tasks=plan.extra_terminal_task_names,
+        execution_order=plan.computed_task_names,
+        removed_tasks=plan.removed_tasks,
+        duplicate_of=plan.duplicate_of,
+        moved_ahead=plan.moved_ahead,
+        merge_filters=plan.merge_filters,
+    )
+
+
 def _version_summary(version: PipelineVersion) -> PipelineVersionSummary:
     return PipelineVersionSummary(
         id=version.id,
@@ -317,6 +340,9 @@ async def validate_pipeline(
             )
             for issue in validation_result.issues
         ],
+        optimized_plan=(
+            _optimized_plan_to_response(config) if validation_result.is_valid else None
+        ),
     )
 
 
@@ -435,6 +461,47 @@ async def get_pipeline_run(
     return _build_run_response(run)
 
 
+@router.post(
+    "/runs/{run_id}/resume",
+    response_model=PipelineSubmitResponse,
+    status_code=202,
+)
+async def resume_pipeline_run(
+    run_id: str,
+    force: bool = Query(False, description="worker 가 죽어 RUNNING 으로 남은 run 도 허용"),
+    db: AsyncSession = Depends(get_db),
+):
+    """실패/중단된 run 을 checkpoint 에서 이어서 실행 (끝난 태스크 / 이미지는 건너뜀)."""
+    service = PipelineService(db)
+    try:
+        return await service.resume_run(run_id, force=force)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.get(
+    "/runs/{run_id}/perf-comparison",
+    response_model=PipelineRunPerfComparisonResponse,
+)
+async def compare_pipeline_run_performance(
+    run_id: str,
+    baseline_run_id: str | None = Query(
+        None, description="기준 run (기본: 같은 PipelineVersion 의 직전 성공 run)",
+    ),
+    slowdown_ratio: float = Query(1.5, gt=1.0, description="이 배율 이상 느려지면 보고"),
+    min_seconds: float = Query(1.0, ge=0.0, description="이보다 짧은 항목은 비교하지 않음"),
+    db: AsyncSession = Depends(get_db),
+):
+    """같은 PipelineVersion 의 이전 run 대비 느려진 태스크 / phase / 실체화 처리량."""
+    service = PipelineService(db)
+    try:
+        return await service.compare_run_performance(
+            run_id, baseline_run_id, slowdown_ratio, min_seconds,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
 # ═════════════════════════════════════════════════════════════════════════════
 # PipelineFamily — `/families`
 # ═════════════════════════════════════════════════════════════════════════════
@@ -566,6 +633,29 @@ async def submit_run_for_version(
     try:
         return await service.submit_run_from_pipeline_version(
             version_id, payload.resolved_input_versions,
+            duplicate_policy=payload.duplicate_policy,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@router.post(
+    "/versions/{version_id}/runs/estimate",
+    response_model=PipelineRunEstimateResponse,
+)
+async def estimate_run_for_version(
+    version_id: str,
+    payload: PipelineRunSubmitRequest,
+    max_source_images: int | None = Query(
+        None, ge=1, description="source 당 최대 이미지 수 — 넘으면 표본 (기본: 설정값)",
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """제출 전 비용 추정 (dry-run) — annotation 처리만 하고 이미지는 쓰지 않는다."""
+    service = PipelineService(db)
+    try:
+        return await service.estimate_run_from_pipeline_version(
+            version_id, payload.resolved_input_versions, max_source_images,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
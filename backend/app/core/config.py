@@ -6,9 +6,10 @@
 from __future__ import annotations
 
 import configparser
+from dataclasses import asdict, dataclass
 from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -135,6 +136,35 @@ class Settings(BaseSettings):
         return self.app_env == "production"
 
 
+@dataclass(frozen=True)
+class PipelineExecutorOptions:
+    """
+    config.ini [pipeline] 의 PipelineDagExecutor 튜닝 값 묶음.
+
+    AppConfig.pipeline_executor_options 가 만들고, to_executor_kwargs() 결과를
+    executor 생성자 키워드 인자로 그대로 넘긴다. MB 단위 설정은 byte 로 바꿔 둔다.
+    """
+    execution_mode: str
+    max_workers: int | None
+    source_load_workers: int
+    stream_records: bool
+    spill_dir: str | None
+    spill_level_gap: int
+    checkpoint: bool
+    processing_log_max_bytes: int
+    index_source_images: bool
+    clone_passthrough: bool
+    materialize_io_workers: int
+    materialize_transform_workers: int | None
+    materialize_transform_pool: str
+    materialize_link_strategy: str
+    materialize_buffer_bytes: int
+
+    def to_executor_kwargs(self) -> dict[str, Any]:
+        """PipelineDagExecutor(**kwargs) 용 dict."""
+        return asdict(self)
+
+
 class AppConfig:
     """
     config.ini 기반 비민감 설정.
@@ -177,6 +207,16 @@ class AppConfig:
     def annotations_dirname(self) -> str:
         return self.get("storage", "annotations_dirname", "annotations")
 
+    @property
+    def image_blob_store_dir(self) -> str | None:
+        """content-addressed 이미지 blob 저장소 (storage base 기준 상대경로). 비어 있으면 None."""
+        return self.get("storage", "image_blob_store_dir", "") or None
+
+    @property
+    def image_blob_gc_grace_hours(self) -> int:
+        """참조 없는 blob 정리 시 최근 링크가 바뀐 blob 을 남기는 유예 시간 (시간)."""
+        return max(0, self.getint("storage", "image_blob_gc_grace_hours", 24))
+
     @property
     def version_initial(self) -> str:
         return self.get("storage", "version_initial", "v1.0.0")
@@ -189,6 +229,123 @@ class AppConfig:
     def default_jpeg_quality(self) -> int:
         return self.getint("pipeline", "default_jpeg_quality", 95)
 
+    @property
+    def pipeline_execution_mode(self) -> str:
+        """PipelineDagExecutor Phase A 실행 방식 — serial | thread | process."""
+        return self.get("pipeline", "execution_mode", "serial")
+
+    @property
+    def pipeline_max_workers(self) -> int | None:
+        """병렬 실행 pool 크기. 0 이면 None (concurrent.futures 기본값)."""
+        return self.getint("pipeline", "max_workers", 0) or None
+
+    @property
+    def pipeline_source_load_workers(self) -> int:
+        """source annotation 선행 로드 thread 수 (1 = 순차)."""
+        return max(1, self.getint("pipeline", "source_load_workers", 4))
+
+    @property
+    def pipeline_stream_records(self) -> bool:
+        """최종 per-record 구간 + 이미지 실체화 / annotation 작성을 레코드 단위로 streaming."""
+        return self.getbool("pipeline", "stream_records", False)
+
+    @property
+    def pipeline_spill_dir(self) -> str | None:
+        """중간 태스크 결과 spill 디렉토리. 비어 있으면 None (spill 안 함)."""
+        return self.get("pipeline", "spill_dir", "") or None
+
+    @property
+    def pipeline_spill_level_gap(self) -> int:
+        """첫 소비가 이 level 수보다 더 뒤인 중간 결과만 spill 한다."""
+        return max(0, self.getint("pipeline", "spill_level_gap", 2))
+
+    @property
+    def pipeline_task_cache_dir(self) -> str | None:
+        """run 간 태스크 결과 캐시 디렉토리. 비어 있으면 None (캐시 안 함)."""
+        return self.get("pipeline", "task_cache_dir", "") or None
+
+    @property
+    def pipeline_task_cache_max_mb(self) -> int:
+        """태스크 결과 캐시 전체 크기 상한 (MB). 넘으면 오래 안 쓴 항목부터 지운다."""
+        return max(0, self.getint("pipeline", "task_cache_max_mb", 2048))
+
+    @property
+    def pipeline_checkpoint(self) -> bool:
+        """Phase A 결과와 이미지 실체화 journal 을 남겨 실패한 run 을 이어서 실행한다."""
+        return self.getbool("pipeline", "checkpoint", False)
+
+    @property
+    def pipeline_materialize_io_workers(self) -> int:
+        """Phase B 복사/hardlink 이미지 실체화 thread 수 (1 = 순차)."""
+        return max(1, self.getint("pipeline", "materialize_io_workers", 1))
+
+    @property
+    def pipeline_materialize_transform_workers(self) -> int | None:
+        """Phase B 변환 이미지 실체화 worker 수. 0 이면 None (CPU 코어 수)."""
+        return self.getint("pipeline", "materialize_transform_workers", 1) or None
+
+    @property
+    def pipeline_materialize_transform_pool(self) -> str:
+        """Phase B 변환 worker 방식 — process | thread."""
+        return self.get("pipeline", "materialize_transform_pool", "process")
+
+    @property
+    def pipeline_materialize_link_strategy(self) -> str:
+        """Phase B 복사 이미지 배치 첫 방식 — hardlink | reflink | copy_file_range | copy."""
+        return self.get("pipeline", "materialize_link_strategy", "copy")
+
+    @property
+    def pipeline_materialize_buffer_mb(self) -> int:
+        """Phase B 병렬 실체화의 읽기 → 변환 → 쓰기 버퍼 상한 (MB, 최소 1)."""
+        return max(1, self.getint("pipeline", "materialize_buffer_mb", 256))
+
+    @property
+    def pipeline_index_source_images(self) -> bool:
+        """source 로드 시 images 디렉토리를 훑어 이미지 파일이 없는 레코드를 미리 뺀다."""
+        return self.getbool("pipeline", "index_source_images", True)
+
+    @property
+    def pipeline_clone_passthrough(self) -> bool:
+        """출력 포맷이 source 와 같은 passthrough 를 source 버전 디렉토리 복제로 실행한다."""
+        return self.getbool("pipeline", "clone_passthrough", True)
+
+    @property
+    def pipeline_processing_log_max_mb(self) -> int:
+        """processing.log 상세 실행 로그 spool 크기 상한 (MB, 0 = 상한 없음)."""
+        return max(0, self.getint("pipeline", "processing_log_max_mb", 64))
+
+    @property
+    def pipeline_executor_options(self) -> PipelineExecutorOptions:
+        """위 [pipeline] executor 튜닝 값들을 한 묶음으로 반환한다."""
+        return PipelineExecutorOptions(
+            execution_mode=self.pipeline_execution_mode,
+            max_workers=self.pipeline_max_workers,
+            source_load_workers=self.pipeline_source_load_workers,
+            stream_records=self.pipeline_stream_records,
+            spill_dir=self.pipeline_spill_dir,
+            spill_level_gap=self.pipeline_spill_level_gap,
+            checkpoint=self.pipeline_checkpoint,
+            processing_log_max_bytes=self.pipeline_processing_log_max_mb * 1024 * 1024,
+            index_source_images=self.pipeline_index_source_images,
+            clone_passthrough=self.pipeline_clone_passthrough,
+            materialize_io_workers=self.pipeline_materialize_io_workers,
+            materialize_transform_workers=self.pipeline_materialize_transform_workers,
+            materialize_transform_pool=self.pipeline_materialize_transform_pool,
+            materialize_link_strategy=self.pipeline_materialize_link_strategy,
+            materialize_buffer_bytes=self.pipeline_materialize_buffer_mb * 1024 * 1024,
+        )
+
+    @property
+    def pipeline_estimate_max_source_images(self) -> int | None:
+        """비용 추정(dry-run) 시 source 당 최대 이미지 수 — 넘으면 표본 (0 = 전체)"""
+        return max(0, self.getint("pipeline", "estimate_max_source_images", 20000)) or None
+
+    @property
+    def pipeline_duplicate_run_policy(self) -> str:
+        """같은 입력으로 성공한 run 이 있을 때 제출 처리 — offer | reuse | run."""
+        policy = self.get("pipeline", "duplicate_run_policy", "offer").strip().lower()
+        return policy if policy in ("offer", "reuse", "run") else "offer"
+
     @property
     def auto_refresh_materialized_view(self) -> bool:
         return self.getbool("materialized_view", "auto_refresh", True)
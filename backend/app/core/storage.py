@@ -14,6 +14,7 @@
     source/...
     processed/...
     fusion/...
+    {image_blob_store_dir}/   (설정 시) content-addressed 이미지 blob — 버전 images/ 파일이 hardlink
 """
 from __future__ import annotations
 
@@ -24,6 +25,7 @@ from pathlib import Path
 import structlog
 
 from app.core.config import get_app_config, get_settings
+from lib.pipeline.image_blob_store import ImageBlobStore, read_image_refs
 
 logger = structlog.get_logger(__name__)
 
@@ -32,8 +34,12 @@ class StorageClient(ABC):
     """
     스토리지 추상 인터페이스.
     비즈니스 로직은 이 인터페이스만 사용한다.
+
+    image_blob_store: content-addressed 이미지 blob 저장소 (설정하지 않았거나 지원하지 않으면 None)
     """
 
+    image_blob_store: ImageBlobStore | None = None
+
     @abstractmethod
     def resolve_path(self, relative_path: str) -> Path:
         """
@@ -185,8 +191,10 @@ class LocalStorageClient(StorageClient):
     1~2차 단계에서 사용.
     """
 
-    def __init__(self, base_path: str) -> None:
+    def __init__(self, base_path: str, image_blob_store_dir: str | None = None) -> None:
         self._base = Path(base_path)
+        if image_blob_store_dir:
+            self.image_blob_store = ImageBlobStore(self._base / image_blob_store_dir)
 
     def resolve_path(self, relative_path: str) -> Path:
         return self._base / relative_path
@@ -257,13 +265,26 @@ class LocalStorageClient(StorageClient):
         데이터셋 디렉토리 전체 삭제 (images/, annotations/ 포함).
         삭제 후 비어있는 상위 디렉토리도 base 경로까지 재귀적으로 정리한다.
         예: raw/coco-v3/train/v1.0.0 삭제 후 train/, coco-v3/ 가 비면 함께 제거.
+        blob 저장소를 쓰면 이 버전이 참조하던(.image_refs) blob 중 참조가 없어진 것과
+        이 버전의 소스 digest 색인도 지운다.
         """
         target_path = self.resolve_path(storage_uri)
         if not target_path.exists():
             logger.warning("삭제 대상 경로가 존재하지 않음", storage_uri=storage_uri)
             return False
+        image_refs = read_image_refs(target_path) if self.image_blob_store is not None else {}
         shutil.rmtree(target_path)
         logger.info("데이터셋 디렉토리 삭제 완료", storage_uri=storage_uri, path=str(target_path))
+        if self.image_blob_store is not None:
+            self.image_blob_store.forget_source_refs(target_path)
+        if image_refs:
+            release_result = self.image_blob_store.release(image_refs.values())
+            logger.info(
+                "참조 없는 이미지 blob 삭제",
+                storage_uri=storage_uri,
+                removed=release_result.removed,
+                freed_bytes=release_result.freed_bytes,
+            )
 
         # 빈 상위 디렉토리 정리 (base 경로까지만)
         parent = target_path.parent
@@ -368,6 +389,7 @@ def get_storage_client() -> StorageClient:
     if storage_backend_config.storage_backend == "local":
         return LocalStorageClient(
             base_path=storage_backend_config.local_storage_base,
+            image_blob_store_dir=get_app_config().image_blob_store_dir,
         )
     elif storage_backend_config.storage_backend == "s3":
         return S3StorageClient(
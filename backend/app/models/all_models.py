@@ -536,6 +536,13 @@ class PipelineRun(Base):
     output_dataset_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False), ForeignKey("dataset_versions.id", ondelete="CASCADE"), nullable=False
     )
+    extra_output_dataset_ids: Mapped[list | None] = mapped_column(
+        JSONB, nullable=True,
+        comment=(
+            "multi-output run 의 추가 출력 DatasetVersion.id 목록 "
+            "(transform_config.extra_outputs 순서). 단일 출력 run 은 NULL"
+        ),
+    )
     transform_config: Mapped[dict | None] = mapped_column(
         JSONB, nullable=True,
         comment=(
@@ -547,6 +554,21 @@ class PipelineRun(Base):
         JSONB, nullable=True,
         comment="{split_id: version} — run 제출 시점의 input 버전 해석",
     )
+    config_hash: Mapped[str | None] = mapped_column(
+        String(64), nullable=True, index=True,
+        comment=(
+            "(pipeline_version_id, resolved_input_versions, transform_config) 정규화 sha256 — "
+            "같은 입력의 DONE run 출력 재사용 판정용"
+        ),
+    )
+    reused_from_run_id: Mapped[str | None] = mapped_column(
+        UUID(as_uuid=False), nullable=True,
+        comment="REUSED run 이 출력을 가리키는 원래 DONE run id (그 외 NULL)",
+    )
+    incremental: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default="false",
+        comment="증분 실행으로 제출됐는지 — resume 시 같은 모드로 이어서 실행",
+    )
     trigger_kind: Mapped[str] = mapped_column(
         String(40), nullable=False, default="manual_from_editor",
         server_default="manual_from_editor",
@@ -566,7 +588,10 @@ class PipelineRun(Base):
     )
     status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="PENDING",
-        comment="PENDING | RUNNING | DONE | FAILED | SKIPPED_NO_DELTA | SKIPPED_UPSTREAM_FAILED"
+        comment=(
+            "PENDING | RUNNING | DONE | FAILED | REUSED | SKIPPED_NO_DELTA | "
+            "SKIPPED_UPSTREAM_FAILED"
+        ),
     )
     current_stage: Mapped[str | None] = mapped_column(
         String(50), nullable=True,
@@ -580,6 +605,10 @@ class PipelineRun(Base):
         JSONB, nullable=True,
         comment="DAG 태스크별 진행 상태. {task_name: {status, started_at, finished_at, ...}}"
     )
+    perf_report: Mapped[dict | None] = mapped_column(
+        JSONB, nullable=True,
+        comment="성공한 run 의 성능 보고서 (출력 디렉토리 perf.json 과 같은 내용)",
+    )
     started_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=False), nullable=True)
     finished_at: Mapped[datetime | None] = mapped_column(TIMESTAMP(timezone=False), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
@@ -4,12 +4,13 @@ Pydantic 스키마 정의 - Manipulator & Pipeline
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
 # 파이프라인 설정 스키마 — lib.pipeline.config에서 re-export
 from lib.pipeline.config import (  # noqa: F401
+    ExtraOutputConfig,
     OutputConfig,
     PartialPipelineConfig,
     PipelineConfig,
@@ -17,6 +18,12 @@ from lib.pipeline.config import (  # noqa: F401
     load_pipeline_config_from_yaml,
 )
 
+# DAG 최적화 계획 — lib.pipeline.dag_optimizer에서 re-export
+from lib.pipeline.dag_optimizer import (  # noqa: F401
+    OptimizedPipelinePlan,
+    optimize_pipeline_config,
+)
+
 # 파이프라인 검증 — lib.pipeline.pipeline_validator에서 re-export
 from lib.pipeline.pipeline_validator import (  # noqa: F401
     PipelineValidationIssue,
@@ -56,6 +63,10 @@ class PipelineRunResponse(BaseModel):
     """파이프라인 실행 응답."""
     id: str
     output_dataset_id: str
+    extra_output_dataset_ids: list[str] = Field(
+        default_factory=list,
+        description="multi-output run 의 추가 출력 DatasetVersion.id (config.extra_outputs 순서)",
+    )
     config: dict[str, Any] | None
     status: str
     current_stage: str | None
@@ -64,7 +75,14 @@ class PipelineRunResponse(BaseModel):
     error_message: str | None
     celery_task_id: str | None
     task_progress: dict[str, Any] | None = None
+    perf_report: dict[str, Any] | None = Field(
+        default=None,
+        description="성공한 run 의 성능 보고서 (출력 디렉토리 perf.json 과 같은 내용)",
+    )
     pipeline_image_url: str | None = None
+    reused_from_run_id: str | None = Field(
+        default=None, description="REUSED run 이 출력을 가리키는 원래 DONE run id",
+    )
     # 실행 이력 목록에서 사람이 읽기 좋은 라벨로 노출하기 위한 평탄화 필드들 (v7.13).
     # ORM 의 PipelineRun → pipeline_version → pipeline / output_dataset → split_slot → group
     # 체인을 selectinload 로 미리 끌어와 router 가 채운다.
@@ -104,6 +122,30 @@ class PipelineValidationIssueResponse(BaseModel):
     field: str = Field(default="", description="문제 발생 위치 (예: tasks.merge.operator)")
 
 
+class PipelineOptimizedPlanResponse(BaseModel):
+    """DAG 최적화 후 실제 실행 계획 (lib.pipeline.dag_optimizer.OptimizedPipelinePlan)."""
+    terminal_task: str = Field(..., description="최종 출력 태스크명")
+    extra_terminal_tasks: list[str] = Field(
+        default_factory=list, description="추가 출력 태스크명 (config.extra_outputs 순서)",
+    )
+    execution_order: list[str] = Field(
+        default_factory=list, description="실제로 계산하는 태스크 (실행 순서)",
+    )
+    removed_tasks: list[str] = Field(
+        default_factory=list, description="최종 출력에 도달하지 않아 실행하지 않는 태스크",
+    )
+    duplicate_of: dict[str, str] = Field(
+        default_factory=dict, description="중복 태스크명 → 결과를 재사용하는 대표 태스크명",
+    )
+    moved_ahead: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="앞당겨 실행하는 필터 태스크명 → 앞지른 이미지 변환 태스크명",
+    )
+    merge_filters: dict[str, list[str]] = Field(
+        default_factory=dict, description="병합 태스크명 → 병합 중에 적용하는 필터 태스크명",
+    )
+
+
 class PipelineValidationResponse(BaseModel):
     """
     파이프라인 검증 응답.
@@ -118,13 +160,94 @@ class PipelineValidationResponse(BaseModel):
         default_factory=list,
         description="검증 문제 목록 (ERROR + WARNING 모두 포함)",
     )
+    optimized_plan: PipelineOptimizedPlanResponse | None = Field(
+        default=None,
+        description="DAG 최적화 후 실행 계획. 검증 통과 시에만 채워짐 (passthrough 는 null)",
+    )
 
 
 class PipelineSubmitResponse(BaseModel):
-    """파이프라인 제출 응답."""
+    """
+    파이프라인 제출 응답.
+
+    outcome:
+        DISPATCHED        — 새 run 을 만들어 worker 에 보냈다 (기본)
+        REUSED            — 같은 입력의 DONE run 출력을 가리키는 REUSED run 을 만들었다.
+                            worker 에는 보내지 않는다.
+        DUPLICATE_OFFERED — 같은 입력의 DONE run 이 있어 아무것도 만들지 않았다.
+                            execution_id 는 그 run. duplicate_policy 를 정해 다시 제출한다.
+    """
     execution_id: str
     celery_task_id: str | None
     message: str
+    outcome: Literal["DISPATCHED", "REUSED", "DUPLICATE_OFFERED"] = "DISPATCHED"
+    duplicate_of_execution_id: str | None = Field(
+        default=None, description="같은 입력으로 이미 성공한 run id (REUSED / DUPLICATE_OFFERED)",
+    )
+    output_dataset_id: str | None = Field(
+        default=None, description="재사용한 (또는 재사용할 수 있는) 출력 DatasetVersion.id",
+    )
+
+
+class PipelineOutputEstimateResponse(BaseModel):
+    """출력 1개의 추정 비용 (dry-run)."""
+    output_split: str
+    image_count: int
+    copy_only_count: int
+    transform_count: int = Field(..., description="디코드 → 변환 → 인코드가 필요한 이미지 수")
+    transform_operations: dict[str, int] = Field(
+        default_factory=dict, description="변환 operation 별 적용 횟수",
+    )
+    bytes_to_copy: int
+    missing_image_count: int = Field(..., description="소스 파일이 없어 건너뛸 이미지 수")
+
+
+class PipelineRunEstimateResponse(BaseModel):
+    """
+    `POST /pipelines/versions/{id}/runs/estimate` 응답 — 제출 전 비용 추정.
+
+    is_sampled 면 source 레코드 일부로 annotation 처리를 돌려 비율로 확대한 값이다.
+    estimated_duration_seconds 는 최근 성공 run 의 처리 속도 기준 (이력이 없으면 null).
+    """
+    outputs: list[PipelineOutputEstimateResponse]
+    total_images: int
+    total_bytes: int
+    total_transforms: int
+    source_image_count: int
+    sampled_source_image_count: int
+    is_sampled: bool
+    images_per_second: float | None = Field(
+        default=None, description="최근 성공 run 의 이미지 처리 속도 (이력이 없으면 null)",
+    )
+    estimated_duration_seconds: float | None = None
+
+
+class PipelinePerfRegressionResponse(BaseModel):
+    """기준 run 보다 느려진 항목 1개."""
+    kind: str = Field(..., description="task | phase | throughput")
+    name: str = Field(..., description="태스크명(fusion 체인은 'a → b') / phase / 처리량 지표 이름")
+    baseline: float
+    current: float
+    ratio: float = Field(
+        ..., description="느려진 배율 (시간은 current / baseline, 처리량은 baseline / current)",
+    )
+
+
+class PipelineRunPerfComparisonResponse(BaseModel):
+    """
+    `GET /pipelines/runs/{id}/perf-comparison` 응답 — 같은 PipelineVersion 의 기준 run 과 성능 비교.
+
+    기준 run 을 지정하지 않으면 이 run 직전에 끝난 성공 run 과 비교한다.
+    """
+    run_id: str
+    baseline_run_id: str
+    slowdown_ratio: float
+    regressions: list[PipelinePerfRegressionResponse]
+    unmatched_tasks: list[str] = Field(
+        default_factory=list, description="한쪽 run 에만 있는 태스크 (DAG 구성이 바뀐 경우)",
+    )
+    run_perf_report: dict[str, Any]
+    baseline_perf_report: dict[str, Any]
 
 
 class PipelineSaveResponse(BaseModel):
@@ -341,6 +464,14 @@ class PipelineRunSubmitRequest(BaseModel):
         default_factory=dict,
         description="{split_id: version} — run 시점 input 해석 맵",
     )
+    duplicate_policy: Literal["offer", "reuse", "run"] | None = Field(
+        default=None,
+        description=(
+            "같은 입력으로 성공한 run 이 있을 때 — offer: 제출하지 않고 알림, "
+            "reuse: 그 출력 재사용, run: 새로 실행. 미지정이면 서버 설정 "
+            "([pipeline] duplicate_run_policy)"
+        ),
+    )
 
 
 # =============================================================================
@@ -394,6 +525,10 @@ class PipelineAutomationRerunRequest(BaseModel):
         default="if_delta",
         description="if_delta | force_latest",
     )
+    incremental: bool = Field(
+        default=True,
+        description="직전 성공 run 출력에서 변경 없는 이미지를 재사용 (증분 재실행)",
+    )
 
 
 # =============================================================================
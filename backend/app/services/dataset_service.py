@@ -28,6 +28,7 @@ from app.schemas.dataset import (
     FormatValidateRequest,
     FormatValidateResponse,
 )
+from lib.pipeline.io.meta_cache import invalidate_meta_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -1041,6 +1042,8 @@ class DatasetGroupService:
 
         # 관리 스토리지로 복사 (기존 파일이 있으면 덮어쓰기됨)
         new_filename = self.storage.copy_annotation_meta_file(validated_path, dataset.storage_uri)
+        # 파싱 결과 캐시는 메타 파일(클래스명 등)에 의존 → 삭제 후 다음 로드 때 재생성
+        invalidate_meta_cache(self.storage, dataset.storage_uri)
         logger.info(
             "어노테이션 메타 파일 교체 완료",
             dataset_id=dataset.id,
@@ -1194,6 +1197,7 @@ class DatasetGroupService:
         """
         데이터셋의 annotation 파일을 파싱하여 DatasetMeta로 반환.
         READY 상태이고 annotation_files가 있을 때만 동작.
+        READY 버전은 파싱 결과 사이드카 캐시(등록/파이프라인 완료 시 생성)가 있으면 재사용한다.
         파싱 실패 시 None 반환.
         """
         annotation_format = dataset.annotation_format or dataset.group.annotation_format
@@ -1212,6 +1216,7 @@ class DatasetGroupService:
                 annotation_meta_file=dataset.annotation_meta_file,
                 dataset_id=dataset.id,
                 skip_image_sizes=True,
+                use_meta_cache=dataset.status == "READY",
             )
         except Exception as parse_error:
             logger.warning(
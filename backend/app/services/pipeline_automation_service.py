@@ -18,6 +18,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import get_app_config
 from app.models.all_models import (
     DatasetSplit,
     DatasetVersion,
@@ -207,6 +208,7 @@ class PipelineAutomationService:
           - if_delta: `last_seen_input_versions` vs 현재 최신 input versions 비교.
                       delta 없으면 SKIPPED_NO_DELTA 이력만 남김
           - force_latest: delta 무시. 무조건 최신 version 으로 dispatch
+        request.incremental 이면 직전 성공 run 출력에서 변경 없는 이미지를 재사용한다.
         """
         automation = await self.get_by_id(automation_id)
         if automation is None:
@@ -273,9 +275,18 @@ class PipelineAutomationService:
 
         from app.services.pipeline_service import PipelineService
 
+        # 같은 입력으로 성공한 run 이 있으면 — force_latest 는 새로 실행, if_delta 는 정책대로
+        # (응답할 사람이 없으므로 offer 는 reuse 로 처리)
+        if request.mode == "force_latest":
+            duplicate_policy = "run"
+        else:
+            duplicate_policy = get_app_config().pipeline_duplicate_run_policy
+            if duplicate_policy == "offer":
+                duplicate_policy = "reuse"
         service = PipelineService(self.db)
         response = await service.submit_run_from_pipeline_version(
-            pipeline_version.id, latest_versions,
+            pipeline_version.id, latest_versions, incremental=request.incremental,
+            duplicate_policy=duplicate_policy,
         )
 
         run_result = await self.db.execute(
@@ -5,24 +5,18 @@
 """
 from __future__ import annotations
 
+import asyncio
 import random
 import uuid
+from datetime import datetime
 from typing import Any
 
-
-def _random_family_color() -> str:
-    """가독성 좋은 mid-tone 랜덤 hex (각 채널 80~200) — Family 자동 색상 할당."""
-    return "#{:02x}{:02x}{:02x}".format(
-        random.randint(80, 200),
-        random.randint(80, 200),
-        random.randint(80, 200),
-    )
-
 import structlog
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.config import get_app_config
 from app.core.storage import get_storage_client
 from app.models.all_models import (
     DatasetGroup,
@@ -34,21 +28,47 @@ from app.models.all_models import (
     PipelineRun,
     PipelineVersion,
 )
-from app.schemas.pipeline import PipelineSaveResponse, PipelineSubmitResponse
+from app.schemas.pipeline import (
+    PipelineOutputEstimateResponse,
+    PipelinePerfRegressionResponse,
+    PipelineRunEstimateResponse,
+    PipelineRunPerfComparisonResponse,
+    PipelineSaveResponse,
+    PipelineSubmitResponse,
+)
 from lib.pipeline.config import (
     SOURCE_TYPE_SPLIT,
     SOURCE_TYPE_VERSION,
     PartialPipelineConfig,
     PipelineConfig,
+    build_run_config_hash,
     parse_source_ref,
 )
+from lib.pipeline.dag_executor import (
+    PipelineDagExecutor,
+    SourceDescriptor,
+    load_source_meta_from_descriptor,
+)
+from lib.pipeline.io.meta_cache import build_meta_cache_key
+from lib.pipeline.perf_report import compare_perf_reports
+from lib.pipeline.pipeline_data_models import DatasetMeta
 from lib.pipeline.pipeline_validator import (
     PipelineValidationResult,
     validate_pipeline_config_static,
 )
+from lib.pipeline.storage_protocol import StorageProtocol
 
 logger = structlog.get_logger(__name__)
 
+# 비용 추정의 처리 속도 기준으로 삼는 최근 성공 run 수
+_THROUGHPUT_SAMPLE_RUNS = 20
+
+
+def _random_family_color() -> str:
+    """가독성 좋은 mid-tone 랜덤 hex (각 채널 80~200) — Family 자동 색상 할당."""
+    red, green, blue = (random.randint(80, 200) for _ in range(3))
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
 
 class PipelineService:
     """파이프라인 실행 관련 비즈니스 로직."""
@@ -702,6 +722,113 @@ class PipelineService:
         )
         return result.scalar_one_or_none()
 
+    async def resume_run(self, execution_id: str, force: bool = False) -> PipelineSubmitResponse:
+        """
+        `POST /pipelines/runs/{id}/resume` — 실패/중단된 PipelineRun 을 이어서 실행한다.
+
+        같은 PipelineRun / 출력 DatasetVersion 으로 resume_pipeline 을 dispatch 하며, executor 가
+        출력 디렉토리의 checkpoint 에서 끝난 태스크와 이미지를 건너뛴다.
+        FAILED run 만 대상이다. worker 가 죽어 RUNNING 으로 남은 run 은 force=True 일 때만
+        허용한다 (실제로 실행 중인지는 호출자가 확인한다).
+        """
+        run = await self.get_execution_status(execution_id)
+        if run is None:
+            raise ValueError(f"PipelineRun not found: {execution_id}")
+        resumable_statuses = ("FAILED", "RUNNING") if force else ("FAILED",)
+        if run.status not in resumable_statuses:
+            raise ValueError(
+                f"이어서 실행할 수 없는 상태입니다: status={run.status} "
+                f"(허용: {', '.join(resumable_statuses)})"
+            )
+        if not run.transform_config:
+            raise ValueError("실행 config 가 없는 run 은 이어서 실행할 수 없습니다.")
+
+        run.status = "PENDING"
+        run.error_message = None
+        from app.tasks.pipeline_tasks import resume_pipeline
+        celery_result = resume_pipeline.delay(run.id)
+        run.celery_task_id = celery_result.id
+        await self.db.flush()
+
+        logger.info(
+            "Pipeline run 이어서 실행 디스패치",
+            run_id=run.id, celery_task_id=run.celery_task_id, force=force,
+        )
+        return PipelineSubmitResponse(
+            execution_id=run.id,
+            celery_task_id=run.celery_task_id,
+            message="파이프라인 이어서 실행이 제출되었습니다.",
+        )
+
+    async def compare_run_performance(
+        self,
+        execution_id: str,
+        baseline_run_id: str | None = None,
+        slowdown_ratio: float = 1.5,
+        min_seconds: float = 1.0,
+    ) -> PipelineRunPerfComparisonResponse:
+        """
+        `GET /pipelines/runs/{id}/perf-comparison` — 같은 PipelineVersion 의 기준 run 과
+        perf_report 를 비교해 느려진 태스크 / phase / 실체화 처리량을 찾는다.
+
+        baseline_run_id 가 없으면 이 run 보다 먼저 끝난 성공 run 중 가장 최근 것과 비교한다.
+        """
+        run = await self.db.get(PipelineRun, execution_id)
+        if run is None:
+            raise ValueError(f"PipelineRun not found: {execution_id}")
+        if not run.perf_report:
+            raise ValueError("성능 보고서가 없는 run 입니다 (성공한 run 만 비교할 수 있습니다).")
+
+        if baseline_run_id is not None:
+            baseline = await self.db.get(PipelineRun, baseline_run_id)
+            if baseline is None:
+                raise ValueError(f"PipelineRun not found: {baseline_run_id}")
+            if baseline.pipeline_version_id != run.pipeline_version_id:
+                raise ValueError("같은 PipelineVersion 의 run 끼리만 비교할 수 있습니다.")
+            if not baseline.perf_report:
+                raise ValueError("기준 run 에 성능 보고서가 없습니다.")
+        else:
+            baseline = (await self.db.execute(
+                select(PipelineRun)
+                .where(
+                    PipelineRun.pipeline_version_id == run.pipeline_version_id,
+                    PipelineRun.id != run.id,
+                    PipelineRun.status == "DONE",
+                    PipelineRun.perf_report.is_not(None),
+                    PipelineRun.finished_at < run.finished_at,
+                )
+                .order_by(PipelineRun.finished_at.desc())
+                .limit(1)
+            )).scalar_one_or_none()
+            if baseline is None:
+                raise ValueError("비교할 이전 성공 run 이 없습니다.")
+
+        comparison = compare_perf_reports(
+            baseline.perf_report, run.perf_report,
+            slowdown_ratio=slowdown_ratio, min_seconds=min_seconds,
+        )
+        if comparison.regressions:
+            logger.info(
+                "Pipeline run 성능 저하 감지",
+                run_id=run.id, baseline_run_id=baseline.id,
+                regressions=[regression.name for regression in comparison.regressions],
+            )
+        return PipelineRunPerfComparisonResponse(
+            run_id=run.id,
+            baseline_run_id=baseline.id,
+            slowdown_ratio=slowdown_ratio,
+            regressions=[
+                PipelinePerfRegressionResponse(
+                    kind=regression.kind, name=regression.name, baseline=regression.baseline,
+                    current=regression.current, ratio=regression.ratio,
+                )
+                for regression in comparison.regressions
+            ],
+            unmatched_tasks=comparison.unmatched_tasks,
+            run_perf_report=run.perf_report,
+            baseline_perf_report=baseline.perf_report,
+        )
+
     # -------------------------------------------------------------------------
     # 실행 이력 목록
     # -------------------------------------------------------------------------
@@ -1699,6 +1826,8 @@ class PipelineService:
         self,
         pipeline_version_id: str,
         resolved_input_versions: dict[str, str],
+        incremental: bool = False,
+        duplicate_policy: str | None = None,
     ) -> PipelineSubmitResponse:
         """
         `POST /pipeline-versions/{id}/runs` 구현 (v7.11). Version Resolver Modal 이
@@ -1706,6 +1835,16 @@ class PipelineService:
 
         soft-deleted PipelineVersion 또는 모 Pipeline 은 차단.
 
+        incremental=True 면 같은 PipelineVersion 의 직전 성공 run 출력에서 변경 없는 이미지를
+        재사용한다 (자동화 재실행 — run_pipeline 참고).
+
+        같은 입력(pipeline_version_id, resolved_input_versions, resolved transform_config)의
+        정규화 해시(config_hash)로 이미 성공한 run 을 찾으면 duplicate_policy 에 따라 처리한다
+        (None 이면 설정 [pipeline] duplicate_run_policy):
+          - offer: 아무것도 만들지 않고 기존 run 을 알린다 (outcome=DUPLICATE_OFFERED)
+          - reuse: worker 없이 기존 출력을 가리키는 REUSED run 을 만든다 (outcome=REUSED)
+          - run:   중복 검사 없이 새로 실행한다
+
         본 메서드는 §12-5 기준 "실행 시점" 에 해당하므로 validate_runtime 성격의
         최소 체크만 수행.
         """
@@ -1771,6 +1910,27 @@ class PipelineService:
             resolved_input_versions
         )
 
+        # PipelineRun.transform_config — PipelineVersion.config 는 split_id 단위 spec 이므로
+        # source:dataset_split:<split_id> → source:dataset_version:<version_id> 로 치환한
+        # resolved dict 를 저장한다. Celery executor 는 이 dict 의 dataset_version_id 단위로 로드.
+        resolved_config_dict = self._substitute_resolved_versions(
+            pipeline_version.config, runtime_dataset_ids,
+        )
+
+        # 같은 입력으로 이미 성공한 run — 출력 재사용 / 알림
+        config_hash = build_run_config_hash(
+            pipeline_version.id, resolved_input_versions, resolved_config_dict,
+            await self._input_file_fingerprints(runtime_dataset_ids),
+        )
+        duplicate_policy = duplicate_policy or get_app_config().pipeline_duplicate_run_policy
+        if duplicate_policy != "run":
+            previous_run = await self._find_reusable_run(config_hash)
+            if previous_run is not None:
+                return await self._respond_to_duplicate_run(
+                    previous_run, duplicate_policy, config_hash,
+                    resolved_config_dict, resolved_input_versions,
+                )
+
         # output 버전 자동 증가 (manual 실행 = major++)
         version = await self._next_version(output_split_slot.id)
         logger.info(
@@ -1807,20 +1967,22 @@ class PipelineService:
         self.db.add(dataset)
         await self.db.flush()
 
-        # PipelineRun 생성 — PipelineVersion.config 는 split_id 단위 spec 이므로 실행 시점에
-        # source:dataset_split:<split_id> → source:dataset_version:<version_id> 로 치환한
-        # resolved dict 를 transform_config 에 저장. Celery executor 는 이 resolved dict 의
-        # dataset_version_id 단위로 데이터를 로드한다.
-        resolved_config_dict = self._substitute_resolved_versions(
-            pipeline_version.config, runtime_dataset_ids,
-        )
+        # multi-output — 추가 출력마다 같은 그룹의 split 슬롯에 DatasetVersion 1개 (PENDING)
+        extra_datasets = await self._create_extra_output_datasets(config, output_group)
+
+        # PipelineRun 생성 — transform_config 는 위에서 치환한 resolved dict
         run = PipelineRun(
             id=str(uuid.uuid4()),
             pipeline_version_id=pipeline_version.id,
             automation_id=None,
             output_dataset_id=dataset.id,
+            extra_output_dataset_ids=(
+                [extra_dataset.id for extra_dataset in extra_datasets] or None
+            ),
             transform_config=resolved_config_dict,
             resolved_input_versions=resolved_input_versions,
+            config_hash=config_hash,
+            incremental=incremental,
             trigger_kind="manual_from_editor",
             status="PENDING",
         )
@@ -1829,7 +1991,7 @@ class PipelineService:
 
         # Celery dispatch — resolved dict (dataset_version_id 단위) 을 executor 에 전달
         from app.tasks.pipeline_tasks import run_pipeline
-        celery_result = run_pipeline.delay(run.id, resolved_config_dict)
+        celery_result = run_pipeline.delay(run.id, resolved_config_dict, incremental=incremental)
         run.celery_task_id = celery_result.id
         await self.db.flush()
 
@@ -1847,6 +2009,299 @@ class PipelineService:
             message="파이프라인 실행이 제출되었습니다.",
         )
 
+    async def _input_file_fingerprints(
+        self, runtime_dataset_ids: dict[str, str],
+    ) -> dict[str, list]:
+        """
+        {split_id: 입력 버전의 annotation / 메타 파일 (이름, 크기, mtime_ns) 목록}.
+
+        파싱 결과 캐시 키와 같은 파일 목록이다. 메타 파일 교체는 버전 번호를 바꾸지 않으므로
+        run 중복 판정 해시에 함께 넣어 교체 전 run 의 출력을 재사용하지 않게 한다.
+        """
+        descriptors = await self._describe_source_versions(list(runtime_dataset_ids.values()))
+        fingerprints: dict[str, list] = {}
+        for split_id, dataset_version_id in runtime_dataset_ids.items():
+            descriptor = descriptors[dataset_version_id]
+            fingerprints[split_id] = build_meta_cache_key(
+                self.storage, descriptor.storage_uri, descriptor.annotation_format,
+                descriptor.annotation_files, descriptor.annotation_meta_file,
+                dataset_version_id,
+            )["files"]
+        return fingerprints
+
+    async def _find_reusable_run(self, config_hash: str) -> PipelineRun | None:
+        """
+        config_hash 가 같은 DONE run 중 출력이 모두 READY 로 남아 있는 가장 최근 run.
+
+        기본 출력과 추가 출력(extra_output_dataset_ids) 중 하나라도 삭제 / READY 아님이면 제외한다.
+        """
+        candidates_result = await self.db.execute(
+            select(PipelineRun)
+            .join(DatasetVersion, PipelineRun.output_dataset_id == DatasetVersion.id)
+            .where(
+                PipelineRun.config_hash == config_hash,
+                PipelineRun.status == "DONE",
+                DatasetVersion.status == "READY",
+                DatasetVersion.deleted_at.is_(None),
+            )
+            .order_by(PipelineRun.finished_at.desc())
+        )
+        for candidate in candidates_result.scalars().all():
+            extra_output_ids = candidate.extra_output_dataset_ids or []
+            if not extra_output_ids:
+                return candidate
+            ready_count = await self.db.scalar(
+                select(func.count())
+                .select_from(DatasetVersion)
+                .where(
+                    DatasetVersion.id.in_(extra_output_ids),
+                    DatasetVersion.status == "READY",
+                    DatasetVersion.deleted_at.is_(None),
+                )
+            )
+            if ready_count == len(extra_output_ids):
+                return candidate
+        return None
+
+    async def _respond_to_duplicate_run(
+        self,
+        previous_run: PipelineRun,
+        duplicate_policy: str,
+        config_hash: str,
+        resolved_config_dict: dict[str, Any],
+        resolved_input_versions: dict[str, str],
+    ) -> PipelineSubmitResponse:
+        """같은 입력으로 성공한 run 이 있을 때 — offer 면 알리기만, reuse 면 REUSED run 생성."""
+        if duplicate_policy == "offer":
+            logger.info(
+                "같은 입력의 성공 run 존재 — 제출 보류 (offer)",
+                previous_run_id=previous_run.id, config_hash=config_hash,
+            )
+            return PipelineSubmitResponse(
+                execution_id=previous_run.id,
+                celery_task_id=None,
+                message=(
+                    "같은 입력으로 이미 성공한 실행이 있습니다 — "
+                    "출력을 재사용하거나 새로 실행하세요."
+                ),
+                outcome="DUPLICATE_OFFERED",
+                duplicate_of_execution_id=previous_run.id,
+                output_dataset_id=previous_run.output_dataset_id,
+            )
+
+        now = datetime.utcnow()
+        reused_run = PipelineRun(
+            id=str(uuid.uuid4()),
+            pipeline_version_id=previous_run.pipeline_version_id,
+            automation_id=None,
+            output_dataset_id=previous_run.output_dataset_id,
+            extra_output_dataset_ids=previous_run.extra_output_dataset_ids,
+            transform_config=resolved_config_dict,
+            resolved_input_versions=resolved_input_versions,
+            config_hash=config_hash,
+            reused_from_run_id=previous_run.id,
+            trigger_kind="manual_from_editor",
+            status="REUSED",
+            current_stage="completed",
+            processed_count=previous_run.processed_count,
+            total_count=previous_run.total_count,
+            started_at=now,
+            finished_at=now,
+        )
+        self.db.add(reused_run)
+        await self.db.flush()
+        logger.info(
+            "같은 입력의 성공 run 출력 재사용 — worker 디스패치 생략",
+            run_id=reused_run.id, previous_run_id=previous_run.id,
+            output_dataset_id=previous_run.output_dataset_id,
+        )
+        return PipelineSubmitResponse(
+            execution_id=reused_run.id,
+            celery_task_id=None,
+            message="같은 입력으로 성공한 실행의 출력을 재사용했습니다.",
+            outcome="REUSED",
+            duplicate_of_execution_id=previous_run.id,
+            output_dataset_id=previous_run.output_dataset_id,
+        )
+
+    async def estimate_run_from_pipeline_version(
+        self,
+        pipeline_version_id: str,
+        resolved_input_versions: dict[str, str],
+        max_source_images: int | None = None,
+    ) -> PipelineRunEstimateResponse:
+        """
+        `POST /pipelines/versions/{id}/runs/estimate` — run 을 제출하지 않고 비용만 추정한다.
+
+        submit_run_from_pipeline_version 과 같은 입력 버전 해석 후 executor 를 plan only 로
+        돌린다 (Phase A 만, 이미지 실체화 / DatasetVersion 생성 없음). source 가 크면
+        max_source_images(기본: 설정값) 장씩 표본으로 돌린다. 예상 소요 시간은
+        같은 PipelineVersion(없으면 전체)의 최근 성공 run 처리 속도로 계산한다.
+        """
+        pipeline_version = await self.get_pipeline_version(pipeline_version_id)
+        if pipeline_version is None:
+            raise ValueError(f"PipelineVersion not found: {pipeline_version_id}")
+        config = PipelineConfig(**pipeline_version.config)
+
+        missing = set(config.get_all_source_split_ids()) - set(resolved_input_versions.keys())
+        if missing:
+            raise ValueError(
+                f"resolved_input_versions 에 다음 split_id 가 누락되었습니다: {sorted(missing)}"
+            )
+        runtime_dataset_ids = await self._resolve_versions_to_dataset_ids(
+            resolved_input_versions
+        )
+        resolved_config = PipelineConfig(**self._substitute_resolved_versions(
+            pipeline_version.config, runtime_dataset_ids,
+        ))
+        source_descriptors = await self._describe_source_versions(
+            list(runtime_dataset_ids.values())
+        )
+        if max_source_images is None:
+            max_source_images = get_app_config().pipeline_estimate_max_source_images
+
+        # annotation 파싱은 동기 I/O — 이벤트 루프를 막지 않도록 thread 에서 실행
+        executor = _DescribedSourceDagExecutor(self.storage, source_descriptors)
+        estimate = await asyncio.to_thread(
+            executor.estimate, resolved_config, max_source_images=max_source_images,
+        )
+
+        images_per_second = await self._recent_images_per_second(pipeline_version.id)
+        logger.info(
+            "Pipeline run 비용 추정",
+            pipeline_version_id=pipeline_version.id, total_images=estimate.total_images,
+            total_bytes=estimate.total_bytes, is_sampled=estimate.is_sampled,
+            images_per_second=images_per_second,
+        )
+        return PipelineRunEstimateResponse(
+            outputs=[
+                PipelineOutputEstimateResponse(
+                    output_split=output.output_split,
+                    image_count=output.image_count,
+                    copy_only_count=output.copy_only_count,
+                    transform_count=output.transform_count,
+                    transform_operations=output.transform_operations,
+                    bytes_to_copy=output.bytes_to_copy,
+                    missing_image_count=output.missing_image_count,
+                )
+                for output in estimate.outputs
+            ],
+            total_images=estimate.total_images,
+            total_bytes=estimate.total_bytes,
+            total_transforms=estimate.total_transforms,
+            source_image_count=estimate.source_image_count,
+            sampled_source_image_count=estimate.sampled_source_image_count,
+            is_sampled=estimate.is_sampled,
+            images_per_second=images_per_second,
+            estimated_duration_seconds=(
+                estimate.total_images / images_per_second if images_per_second else None
+            ),
+        )
+
+    async def _describe_source_versions(
+        self, dataset_version_ids: list[str],
+    ) -> dict[str, SourceDescriptor]:
+        """
+        DatasetVersion id → SourceDescriptor (pipeline_tasks._DbAwareDagExecutor._describe_source 와
+        같은 규칙). async 세션은 thread 에서 쓸 수 없으므로 executor 실행 전에 미리 조회한다.
+        """
+        if not dataset_version_ids:
+            return {}
+        rows = (await self.db.execute(
+            select(DatasetVersion)
+            .options(selectinload(DatasetVersion.split_slot).selectinload(DatasetSplit.group))
+            .where(DatasetVersion.id.in_(dataset_version_ids))
+        )).scalars().all()
+        return {
+            dataset_version.id: SourceDescriptor(
+                dataset_id=dataset_version.id,
+                storage_uri=dataset_version.storage_uri,
+                annotation_format=dataset_version.annotation_format or "COCO",
+                annotation_files=dataset_version.annotation_files or [],
+                annotation_meta_file=dataset_version.annotation_meta_file,
+                extra={"dataset_name": dataset_version.split_slot.group.name},
+                use_meta_cache=dataset_version.status == "READY",
+            )
+            for dataset_version in rows
+        }
+
+    async def _recent_images_per_second(self, pipeline_version_id: str) -> float | None:
+        """
+        최근 성공 run 의 출력 이미지 수 / 실행 시간. 같은 PipelineVersion 의 이력이 없으면
+        전체 파이프라인의 최근 성공 run 을 쓴다. 이력이 전혀 없으면 None.
+        """
+        for version_filter in (PipelineRun.pipeline_version_id == pipeline_version_id, None):
+            query = (
+                select(PipelineRun)
+                .where(
+                    PipelineRun.status == "DONE",
+                    PipelineRun.started_at.is_not(None),
+                    PipelineRun.finished_at.is_not(None),
+                )
+                .order_by(PipelineRun.finished_at.desc())
+                .limit(_THROUGHPUT_SAMPLE_RUNS)
+            )
+            if version_filter is not None:
+                query = query.where(version_filter)
+            runs = (await self.db.execute(query)).scalars().all()
+            total_images = 0
+            total_seconds = 0.0
+            for run in runs:
+                # 출력마다 __image_materialize__[:<태스크>] 진행 항목이 있다 (multi-output)
+                run_images = sum(
+                    detail.get("materialized") or 0
+                    for task_name, detail in (run.task_progress or {}).items()
+                    if task_name.startswith("__image_materialize__") and isinstance(detail, dict)
+                )
+                run_seconds = (run.finished_at - run.started_at).total_seconds()
+                if run_images and run_seconds > 0:
+                    total_images += run_images
+                    total_seconds += run_seconds
+            if total_seconds > 0:
+                return total_images / total_seconds
+        return None
+
+    async def _create_extra_output_datasets(
+        self, config: PipelineConfig, output_group: DatasetGroup,
+    ) -> list[DatasetVersion]:
+        """
+        config.extra_outputs 마다 출력 DatasetVersion (status=PENDING) 을 만든다.
+
+        추가 출력은 기본 출력과 같은 그룹을 쓰고 split 으로 구분한다 (PipelineConfig 검증에서
+        dataset_type 일치 / split 중복 없음 보장). split 슬롯이 없으면 만들고,
+        버전은 슬롯별로 기본 출력과 같은 규칙(_next_version)으로 올린다.
+
+        Returns:
+            extra_outputs 순서의 DatasetVersion 목록
+        """
+        extra_datasets: list[DatasetVersion] = []
+        for extra_output in config.extra_outputs:
+            split_slot = await self._get_or_create_split(output_group.id, extra_output.output.split)
+            version = await self._next_version(split_slot.id)
+            extra_dataset = DatasetVersion(
+                id=str(uuid.uuid4()),
+                split_id=split_slot.id,
+                version=version,
+                annotation_format=extra_output.output.annotation_format.upper(),
+                storage_uri=self.storage.build_dataset_uri(
+                    dataset_type=output_group.dataset_type,
+                    name=output_group.name,
+                    split=split_slot.split,
+                    version=version,
+                ),
+                status="PENDING",
+            )
+            self.db.add(extra_dataset)
+            extra_datasets.append(extra_dataset)
+            logger.info(
+                "추가 출력 DatasetVersion 생성",
+                terminal_task=extra_output.terminal_task, split=split_slot.split,
+                new_version=version, dataset_id=extra_dataset.id,
+            )
+        if extra_datasets:
+            await self.db.flush()
+        return extra_datasets
+
     async def _resolve_versions_to_dataset_ids(
         self, resolved_input_versions: dict[str, str],
     ) -> dict[str, str]:
@@ -1881,3 +2336,24 @@ class PipelineService:
                 )
             resolved[split_id] = dataset_version.id
         return resolved
+
+
+class _DescribedSourceDagExecutor(PipelineDagExecutor):
+    """비용 추정용 executor — 미리 조회한 SourceDescriptor 로 source 를 로드한다 (DB 접근 없음)."""
+
+    def __init__(
+        self,
+        storage: StorageProtocol,
+        source_descriptors: dict[str, SourceDescriptor],
+    ) -> None:
+        super().__init__(storage)
+        self._source_descriptors = source_descriptors
+
+    def _describe_source(self, dataset_id: str) -> SourceDescriptor:
+        descriptor = self._source_descriptors.get(dataset_id)
+        if descriptor is None:
+            raise ValueError(f"소스 데이터셋을 찾을 수 없습니다: {dataset_id}")
+        return descriptor
+
+    def _load_source_meta(self, dataset_id: str) -> DatasetMeta:
+        return load_source_meta_from_descriptor(self.storage, self._describe_source(dataset_id))
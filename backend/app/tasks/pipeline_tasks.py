@@ -7,15 +7,26 @@ Celery worker에서 실행되며, 동기 DB 세션(psycopg2)을 사용한다.
     1. PipelineRun 조회 → status=RUNNING
     2. Dataset.status=PROCESSING
     3. PipelineDagExecutor.run(config) 실행
-    4. 성공: Dataset READY, PipelineRun DONE, DatasetLineage 생성
+       (incremental 이면 직전 성공 run 출력을 incremental_base_uri 로 넘겨 이미지 재사용)
+    4. 성공: Dataset READY, PipelineRun DONE (+ perf_report), DatasetLineage 생성
     5. 실패: Dataset ERROR, PipelineRun FAILED + error_message
+
+resume_pipeline 은 실패/중단된 PipelineRun 을 같은 config / 출력 버전으로 다시 실행한다.
+executor 가 출력 디렉토리의 checkpoint 에서 Phase A 결과와 이미 쓴 이미지를 이어받는다.
+
+multi-output run (config.extra_outputs) 은 추가 출력 Dataset(PipelineRun.extra_output_dataset_ids)도
+같은 방식으로 상태를 바꾸고, 출력마다 자기 상류 source 에서 오는 lineage 엣지를 만든다.
+
+collect_image_blob_garbage 는 content-addressed 이미지 blob 저장소에서 참조 없는 blob 을 지운다.
 """
 from __future__ import annotations
 
 import logging
 import uuid
 from datetime import datetime
+from typing import Any
 
+from app.core.config import get_app_config
 from app.core.database import SyncSessionLocal
 from app.core.storage import get_storage_client
 from app.models.all_models import (
@@ -30,10 +41,13 @@ from lib.pipeline.config import PipelineConfig
 from lib.pipeline.dag_executor import (
     PipelineDagExecutor,
     PipelineResult,
-    load_source_meta_from_storage,
+    SourceDescriptor,
+    load_source_meta_from_descriptor,
+    warm_source_meta_cache,
 )
 from lib.pipeline.pipeline_data_models import DatasetMeta
 from lib.pipeline.storage_protocol import StorageProtocol
+from lib.pipeline.task_result_cache import TaskResultCache
 
 logger = logging.getLogger(__name__)
 
@@ -43,21 +57,22 @@ class _DbAwareDagExecutor(PipelineDagExecutor):
     DB 기반 소스 데이터셋 로드를 지원하는 DAG 실행기.
 
     Celery 태스크 내부에서 사용한다.
-    sync DB 세션으로 소스 Dataset 정보를 조회하고,
-    load_source_meta_from_storage()로 annotation을 파싱한다.
+    sync DB 세션으로 소스 Dataset 정보를 조회하고(_describe_source, 호출 스레드),
+    annotation 파싱은 load_source_meta_from_descriptor()로 수행한다 (prefetch 시 병렬).
     """
 
     def __init__(
         self,
         storage: StorageProtocol,
         sync_db_session,
-        on_task_progress=None,
+        **executor_kwargs: Any,
     ) -> None:
-        super().__init__(storage, on_task_progress=on_task_progress)
+        # 튜닝 값은 PipelineExecutorOptions.to_executor_kwargs() 로 받아 그대로 넘긴다.
+        super().__init__(storage, **executor_kwargs)
         self._sync_db = sync_db_session
 
-    def _load_source_meta(self, dataset_id: str) -> DatasetMeta:
-        """DB에서 소스 데이터셋 정보를 조회하여 DatasetMeta를 로드한다."""
+    def _describe_source(self, dataset_id: str) -> SourceDescriptor:
+        """DB에서 소스 데이터셋 정보를 조회하여 SourceDescriptor로 반환한다."""
         source_dataset = (
             self._sync_db.query(DatasetVersion)
             .filter(DatasetVersion.id == dataset_id)
@@ -66,18 +81,6 @@ class _DbAwareDagExecutor(PipelineDagExecutor):
         if source_dataset is None:
             raise ValueError(f"소스 데이터셋을 찾을 수 없습니다: {dataset_id}")
 
-        # annotation_files가 None이면 빈 리스트 처리
-        annotation_files = source_dataset.annotation_files or []
-
-        meta = load_source_meta_from_storage(
-            storage=self.storage,
-            storage_uri=source_dataset.storage_uri,
-            annotation_format=source_dataset.annotation_format or "COCO",
-            annotation_files=annotation_files,
-            annotation_meta_file=source_dataset.annotation_meta_file,
-            dataset_id=dataset_id,
-        )
-
         # merge 파이프라인에서 파일명 prefix 생성 시 사용할 dataset_name 주입.
         # v7.9: group_id 접근은 split_slot 경유 (association_proxy).
         group_id_value = source_dataset.group_id  # association_proxy 로 split_slot → group_id
@@ -86,9 +89,24 @@ class _DbAwareDagExecutor(PipelineDagExecutor):
             .filter(DatasetGroup.id == group_id_value)
             .one()
         )
-        meta.extra["dataset_name"] = group.name
 
-        return meta
+        return SourceDescriptor(
+            dataset_id=dataset_id,
+            storage_uri=source_dataset.storage_uri,
+            annotation_format=source_dataset.annotation_format or "COCO",
+            # annotation_files가 None이면 빈 리스트 처리
+            annotation_files=source_dataset.annotation_files or [],
+            annotation_meta_file=source_dataset.annotation_meta_file,
+            extra={"dataset_name": group.name},
+            # READY 버전은 불변 → 파싱 결과 사이드카 캐시 사용
+            use_meta_cache=source_dataset.status == "READY",
+        )
+
+    def _load_source_meta(self, dataset_id: str) -> DatasetMeta:
+        """DB에서 소스 데이터셋 정보를 조회하여 DatasetMeta를 로드한다."""
+        return load_source_meta_from_descriptor(
+            self.storage, self._describe_source(dataset_id),
+        )
 
 
 @celery_app.task(
@@ -97,7 +115,12 @@ class _DbAwareDagExecutor(PipelineDagExecutor):
     queue="pipeline",
     max_retries=0,  # 파이프라인은 재시도 없음 (멱등성 보장 어려움)
 )
-def run_pipeline(self, execution_id: str, pipeline_config: dict) -> dict:
+def run_pipeline(
+    self,
+    execution_id: str,
+    pipeline_config: dict,
+    incremental: bool = False,
+) -> dict:
     """
     데이터셋 파이프라인을 실행한다.
 
@@ -107,22 +130,88 @@ def run_pipeline(self, execution_id: str, pipeline_config: dict) -> dict:
     Args:
         execution_id: PipelineRun.id (UUID 문자열)
         pipeline_config: PipelineConfig를 dict로 직렬화한 값
+        incremental: True 면 같은 PipelineVersion 의 직전 성공 run 출력에서
+            변경 없는 이미지를 재사용한다 (증분 재실행).
 
     Returns:
         실행 결과 요약 dict (status, image_count 등)
     """
     db = SyncSessionLocal()
     try:
-        return _execute_pipeline(self, db, execution_id, pipeline_config)
+        return _execute_pipeline(self, db, execution_id, pipeline_config, incremental)
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.pipeline_tasks.resume_pipeline",
+    queue="pipeline",
+    max_retries=0,
+)
+def resume_pipeline(self, execution_id: str) -> dict:
+    """
+    실패/중단된 파이프라인 run 을 checkpoint 에서 이어서 실행한다.
+
+    PipelineRun.transform_config(실행 당시 resolve 된 config)와 기존 출력 DatasetVersion 을
+    그대로 쓰므로 출력 경로 / 버전이 같다. 제출 시의 incremental 여부(PipelineRun.incremental)도
+    그대로 이어받는다. checkpoint 가 없으면 처음부터 실행한다.
+
+    Args:
+        execution_id: PipelineRun.id (UUID 문자열)
+
+    Returns:
+        실행 결과 요약 dict (run_pipeline 과 동일)
+    """
+    db = SyncSessionLocal()
+    try:
+        execution = db.query(PipelineRun).filter_by(id=execution_id).one()
+        logger.info("파이프라인 이어서 실행: execution_id=%s", execution_id)
+        return _execute_pipeline(
+            self, db, execution_id, execution.transform_config,
+            incremental=execution.incremental, resume=True,
+        )
     finally:
         db.close()
 
 
+@celery_app.task(
+    name="app.tasks.pipeline_tasks.collect_image_blob_garbage",
+    queue="pipeline",
+    max_retries=0,
+)
+def collect_image_blob_garbage() -> dict:
+    """
+    content-addressed 이미지 blob 저장소에서 참조가 없는 blob 을 지운다.
+
+    버전 삭제 시 그 버전의 .image_refs 에 있던 blob 은 바로 정리되므로, 이 태스크는 참조 목록이
+    없던 버전(이전 실패 run 등)이 남긴 blob 을 주기적으로 치운다. 최근에 링크가 바뀐 blob 은
+    [storage] image_blob_gc_grace_hours 동안 남긴다 (실행 중인 파이프라인이 막 넣은 blob 보호).
+
+    Returns:
+        {"scanned", "removed", "freed_bytes"} (저장소를 쓰지 않으면 모두 0)
+    """
+    image_blob_store = get_storage_client().image_blob_store
+    if image_blob_store is None:
+        logger.info("이미지 blob 저장소가 설정되지 않아 정리를 건너뜀")
+        return {"scanned": 0, "removed": 0, "freed_bytes": 0}
+    gc_result = image_blob_store.collect_garbage(
+        grace_seconds=get_app_config().image_blob_gc_grace_hours * 3600,
+    )
+    return {
+        "scanned": gc_result.scanned,
+        "removed": gc_result.removed,
+        "freed_bytes": gc_result.freed_bytes,
+    }
+
+
 def _execute_pipeline(
     celery_task,
     db,
     execution_id: str,
     pipeline_config: dict,
+    incremental: bool = False,
+    resume: bool = False,
 ) -> dict:
     """
     파이프라인 실행의 실제 로직.
@@ -136,10 +225,19 @@ def _execute_pipeline(
     execution.started_at = datetime.utcnow()
     execution.celery_task_id = celery_task.request.id
     execution.current_stage = "annotation_processing"
+    execution.error_message = None
+    execution.finished_at = None
     db.commit()
 
     output_dataset = db.query(DatasetVersion).filter_by(id=execution.output_dataset_id).one()
     output_dataset.status = "PROCESSING"
+    # 추가 출력 — transform_config.extra_outputs 순서
+    extra_output_datasets = [
+        db.query(DatasetVersion).filter_by(id=extra_dataset_id).one()
+        for extra_dataset_id in execution.extra_output_dataset_ids or []
+    ]
+    for extra_output_dataset in extra_output_datasets:
+        extra_output_dataset.status = "PROCESSING"
     db.commit()
 
     logger.info(
@@ -196,120 +294,96 @@ def _execute_pipeline(
             task_progress_state[task_name].update(detail)
 
         # ── 4. Executor 생성 + 실행 ──
+        # 독립 분기 병렬 실행 설정은 config.ini [pipeline] 에서 읽는다.
+        app_config = get_app_config()
+        task_result_cache: TaskResultCache | None = None
+        if app_config.pipeline_task_cache_dir:
+            task_result_cache = TaskResultCache(
+                app_config.pipeline_task_cache_dir,
+                max_bytes=app_config.pipeline_task_cache_max_mb * 1024 * 1024,
+            )
         executor = _DbAwareDagExecutor(
             storage=storage,
             sync_db_session=db,
             on_task_progress=_on_task_progress,
+            task_result_cache=task_result_cache,
+            image_blob_store=storage.image_blob_store,
+            **app_config.pipeline_executor_options.to_executor_kwargs(),
         )
 
         # 서비스 레이어에서 사전 생성한 version 추출
         target_version = output_dataset.version
-        result: PipelineResult = executor.run(config, target_version=target_version)
+        result: PipelineResult = executor.run(
+            config,
+            target_version=target_version,
+            extra_target_versions=(
+                [extra_output_dataset.version for extra_output_dataset in extra_output_datasets]
+                if extra_output_datasets else None
+            ),
+            incremental_base_uri=(
+                _find_incremental_base_uri(db, execution) if incremental else None
+            ),
+            resume=resume,
+        )
+        outputs: list[tuple[DatasetVersion, PipelineResult]] = [
+            (output_dataset, result),
+            *zip(extra_output_datasets, result.extra_results, strict=True),
+        ]
 
         # ── 4. 성공: Dataset 업데이트 ──
-        output_dataset.status = "READY"
-        output_dataset.storage_uri = result.output_storage_uri
-        output_dataset.image_count = result.image_count
-        output_dataset.annotation_files = result.annotation_filenames
-        output_dataset.annotation_meta_file = result.annotation_meta_filename
-        output_dataset.annotation_format = result.output_format
-
-        # task_kind 에 따라 class_count/metadata 작성 방식이 다르다.
-        # - DETECTION: categories(list[str]) 기반 class_mapping
-        # - CLASSIFICATION: head_schema(list[HeadSchema]) 기반 heads 구조
-        if result.output_meta.task_kind == "CLASSIFICATION":
-            head_schema = result.output_meta.head_schema or []
-            # head/class 별 이미지 수를 image_records.labels 로부터 재계산 — RAW 와 동일 규약.
-            per_head_class_counts: dict[str, dict[str, int]] = {
-                head.name: {class_name: 0 for class_name in head.classes}
-                for head in head_schema
-            }
-            for record in result.output_meta.image_records:
-                for head_name, class_names in (record.labels or {}).items():
-                    if class_names is None:
-                        continue  # null = unknown (§2-12) — 카운트 대상 아님
-                    head_bucket = per_head_class_counts.get(head_name)
-                    if head_bucket is None:
-                        continue
-                    for class_name in class_names:
-                        if class_name in head_bucket:
-                            head_bucket[class_name] += 1
-            class_info_heads = [
-                {
-                    "name": head.name,
-                    "multi_label": head.multi_label,
-                    "class_mapping": {
-                        str(class_idx): class_name
-                        for class_idx, class_name in enumerate(head.classes)
-                    },
-                    "per_class_image_count": per_head_class_counts[head.name],
-                }
-                for head in head_schema
-            ]
-            # classification 은 단일 int class_count 가 의미 없어 NULL 유지 (RAW 등록과 동일 규약).
-            output_dataset.class_count = None
-            output_dataset.metadata_ = {
-                "class_info": {
-                    "heads": class_info_heads,
-                },
-            }
-
-            # ── DatasetGroup.head_schema SSOT 초기화 (setdefault 시맨틱) ──
-            # 설계서 §2-8: "Group 내 모든 Dataset 은 동일 head_schema".
-            # 신규 그룹에 classification 출력이 처음 들어올 때 group.head_schema
-            # 가 아직 None 이면 이번 파이프라인 결과로 초기화한다. 이미 값이
-            # 있는 경우(기존 그룹)는 건드리지 않음 — 불일치 여부는 실행 전
-            # 정적 검증 단계에서 이미 차단되므로 여기서 재검사하지 않는다.
-            if output_dataset.group is not None and output_dataset.group.head_schema is None:
-                output_dataset.group.head_schema = {
-                    "heads": [
-                        {
-                            "name": head.name,
-                            "multi_label": head.multi_label,
-                            "classes": list(head.classes),
-                        }
-                        for head in head_schema
-                    ],
-                }
-        else:
-            output_dataset.class_count = len(result.output_meta.categories)
-            class_mapping = {
-                str(idx): name
-                for idx, name in enumerate(result.output_meta.categories)
-            }
-            output_dataset.metadata_ = {
-                "class_info": {
-                    "class_count": len(result.output_meta.categories),
-                    "class_mapping": class_mapping,
-                },
-            }
+        for dataset_version, output_result in outputs:
+            _apply_result_to_dataset(dataset_version, output_result)
 
         # ── 5. PipelineRun 완료 ──
         execution.status = "DONE"
         execution.finished_at = datetime.utcnow()
         execution.current_stage = "completed"
-        execution.total_count = result.image_count
-        execution.processed_count = result.image_count
+        # multi-output 이면 모든 출력의 이미지 수 합
+        written_image_count = sum(output_result.image_count for _, output_result in outputs)
+        execution.total_count = written_image_count
+        execution.processed_count = written_image_count
         execution.task_progress = dict(task_progress_state) if task_progress_state else None
-
-        # ── 6. DatasetLineage 엣지 생성 ──
-        for source_dataset_id in result.source_dataset_ids:
-            lineage_edge = DatasetLineage(
-                id=str(uuid.uuid4()),
-                parent_id=source_dataset_id,
-                child_id=output_dataset.id,
-                transform_config=pipeline_config,
-            )
-            db.add(lineage_edge)
+        # 출력 디렉토리의 perf.json 과 같은 내용 — run 간 성능 비교용
+        execution.perf_report = result.perf_report
+
+        # ── 6. DatasetLineage 엣지 생성 (출력별 — 그 출력의 상류 source 만) ──
+        lineage_edge_count = 0
+        for dataset_version, output_result in outputs:
+            for source_dataset_id in output_result.source_dataset_ids:
+                lineage_edge = DatasetLineage(
+                    id=str(uuid.uuid4()),
+                    parent_id=source_dataset_id,
+                    child_id=dataset_version.id,
+                    transform_config=pipeline_config,
+                )
+                db.add(lineage_edge)
+                lineage_edge_count += 1
 
         db.commit()
 
         logger.info(
-            "파이프라인 실행 완료: execution_id=%s, images=%d, skipped=%d, lineage_edges=%d",
+            "파이프라인 실행 완료: execution_id=%s, images=%d, skipped=%d, outputs=%d, "
+            "lineage_edges=%d",
             execution_id, result.image_count, result.skipped_image_count,
-            len(result.source_dataset_ids),
+            len(outputs), lineage_edge_count,
         )
 
+        # READY 커밋 이후 — 다음 파이프라인/뷰어가 재파싱하지 않도록 파싱 결과 캐시 생성
+        for dataset_version, output_result in outputs:
+            warm_source_meta_cache(
+                storage=storage,
+                storage_uri=output_result.output_storage_uri,
+                annotation_format=output_result.output_format,
+                annotation_files=output_result.annotation_filenames,
+                annotation_meta_file=output_result.annotation_meta_filename,
+                dataset_id=dataset_version.id,
+                # passthrough 복제 출력은 source 파싱 결과를 그대로 캐시한다 (재파싱 없음)
+                parsed_meta=(
+                    output_result.output_meta
+                    if output_result.cloned_source_dataset_id is not None else None
+                ),
+            )
+
         return {
             "status": "DONE",
             "image_count": result.image_count,
@@ -334,10 +408,13 @@ def _execute_pipeline(
             execution.current_stage = "failed"
             execution.task_progress = dict(task_progress_state) if task_progress_state else None
 
-            output_dataset = db.query(DatasetVersion).filter_by(
-                id=execution.output_dataset_id
-            ).one()
-            output_dataset.status = "ERROR"
+            output_dataset_ids = [
+                execution.output_dataset_id, *(execution.extra_output_dataset_ids or []),
+            ]
+            for failed_dataset in db.query(DatasetVersion).filter(
+                DatasetVersion.id.in_(output_dataset_ids)
+            ):
+                failed_dataset.status = "ERROR"
 
             db.commit()
         except Exception as db_error:
@@ -351,3 +428,116 @@ def _execute_pipeline(
             "status": "FAILED",
             "error": str(exc)[:500],
         }
+
+
+def _find_incremental_base_uri(db, execution: PipelineRun) -> str | None:
+    """
+    증분 재실행 기준 출력 — 같은 PipelineVersion 의 직전 성공 run 출력 storage_uri.
+
+    출력 DatasetVersion 이 READY 이고 삭제되지 않은 run 만 본다. 없으면 None (전체 실행).
+    executor 가 출력 루트의 증분 상태로 재사용 가능 여부를 다시 판정한다.
+    """
+    previous_output = (
+        db.query(DatasetVersion)
+        .join(PipelineRun, PipelineRun.output_dataset_id == DatasetVersion.id)
+        .filter(
+            PipelineRun.pipeline_version_id == execution.pipeline_version_id,
+            PipelineRun.id != execution.id,
+            PipelineRun.status == "DONE",
+            DatasetVersion.status == "READY",
+            DatasetVersion.deleted_at.is_(None),
+        )
+        .order_by(PipelineRun.finished_at.desc())
+        .first()
+    )
+    if previous_output is None:
+        logger.info("증분 재실행 기준 run 없음 — 전체 실행: execution_id=%s", execution.id)
+        return None
+    logger.info(
+        "증분 재실행 기준 출력: execution_id=%s, base=%s",
+        execution.id, previous_output.storage_uri,
+    )
+    return previous_output.storage_uri
+
+
+def _apply_result_to_dataset(
+    dataset_version: DatasetVersion,
+    output_result: PipelineResult,
+) -> None:
+    """출력 1개의 실행 결과로 DatasetVersion 을 READY 로 채운다 (기본 / 추가 출력 공용)."""
+    dataset_version.status = "READY"
+    dataset_version.storage_uri = output_result.output_storage_uri
+    dataset_version.image_count = output_result.image_count
+    dataset_version.annotation_files = output_result.annotation_filenames
+    dataset_version.annotation_meta_file = output_result.annotation_meta_filename
+    dataset_version.annotation_format = output_result.output_format
+
+    # task_kind 에 따라 class_count/metadata 작성 방식이 다르다.
+    # - DETECTION: categories(list[str]) 기반 class_mapping
+    # - CLASSIFICATION: head_schema(list[HeadSchema]) 기반 heads 구조
+    if output_result.output_meta.task_kind == "CLASSIFICATION":
+        head_schema = output_result.output_meta.head_schema or []
+        # head/class 별 이미지 수를 image_records.labels 로부터 재계산 — RAW 와 동일 규약.
+        per_head_class_counts: dict[str, dict[str, int]] = {
+            head.name: {class_name: 0 for class_name in head.classes}
+            for head in head_schema
+        }
+        for record in output_result.output_meta.image_records:
+            for head_name, class_names in (record.labels or {}).items():
+                if class_names is None:
+                    continue  # null = unknown (§2-12) — 카운트 대상 아님
+                head_bucket = per_head_class_counts.get(head_name)
+                if head_bucket is None:
+                    continue
+                for class_name in class_names:
+                    if class_name in head_bucket:
+                        head_bucket[class_name] += 1
+        class_info_heads = [
+            {
+                "name": head.name,
+                "multi_label": head.multi_label,
+                "class_mapping": {
+                    str(class_idx): class_name
+                    for class_idx, class_name in enumerate(head.classes)
+                },
+                "per_class_image_count": per_head_class_counts[head.name],
+            }
+            for head in head_schema
+        ]
+        # classification 은 단일 int class_count 가 의미 없어 NULL 유지 (RAW 등록과 동일 규약).
+        dataset_version.class_count = None
+        dataset_version.metadata_ = {
+            "class_info": {
+                "heads": class_info_heads,
+            },
+        }
+
+        # ── DatasetGroup.head_schema SSOT 초기화 (setdefault 시맨틱) ──
+        # 설계서 §2-8: "Group 내 모든 Dataset 은 동일 head_schema".
+        # 신규 그룹에 classification 출력이 처음 들어올 때 group.head_schema
+        # 가 아직 None 이면 이번 파이프라인 결과로 초기화한다. 이미 값이
+        # 있는 경우(기존 그룹)는 건드리지 않음 — 불일치 여부는 실행 전
+        # 정적 검증 단계에서 이미 차단되므로 여기서 재검사하지 않는다.
+        if dataset_version.group is not None and dataset_version.group.head_schema is None:
+            dataset_version.group.head_schema = {
+                "heads": [
+                    {
+                        "name": head.name,
+                        "multi_label": head.multi_label,
+                        "classes": list(head.classes),
+                    }
+                    for head in head_schema
+                ],
+            }
+    else:
+        dataset_version.class_count = len(output_result.output_meta.categories)
+        class_mapping = {
+            str(idx): name
+            for idx, name in enumerate(output_result.output_meta.categories)
+        }
+        dataset_version.metadata_ = {
+            "class_info": {
+                "class_count": len(output_result.output_meta.categories),
+                "class_mapping": class_mapping,
+            },
+        }
@@ -38,6 +38,7 @@ from lib.classification import (
     FilenameCollision,
     ingest_classification,
 )
+from lib.pipeline.dag_executor import warm_source_meta_cache
 
 logger = logging.getLogger(__name__)
 
@@ -252,6 +253,16 @@ def _execute_classification_register(
             result.image_count,
             len(result.skipped_collisions),
         )
+
+        # 파싱 결과 캐시 생성 (best-effort)
+        warm_source_meta_cache(
+            storage=storage,
+            storage_uri=storage_uri,
+            annotation_format="CLS_MANIFEST",
+            annotation_files=[result.manifest_relpath],
+            annotation_meta_file=result.head_schema_relpath,
+            dataset_id=dataset_id,
+        )
         return {
             "status": "READY",
             "dataset_id": dataset_id,
@@ -20,6 +20,7 @@ from app.core.database import SyncSessionLocal
 from app.core.storage import get_storage_client
 from app.models.all_models import DatasetVersion
 from app.tasks.celery_app import celery_app
+from lib.pipeline.dag_executor import warm_source_meta_cache
 
 logger = logging.getLogger(__name__)
 
@@ -139,6 +140,17 @@ def _execute_register(
         logger.info(
             "데이터셋 등록 완료: dataset_id=%s, images=%d", dataset_id, image_count
         )
+
+        # 파싱 결과 캐시 생성 (best-effort) — 이후 파이프라인/뷰어는 재파싱하지 않는다.
+        if annotation_format.upper() in ("COCO", "YOLO"):
+            warm_source_meta_cache(
+                storage=storage,
+                storage_uri=storage_uri,
+                annotation_format=annotation_format,
+                annotation_files=annotation_filenames,
+                annotation_meta_file=annotation_meta_filename,
+                dataset_id=dataset_id,
+            )
         return {
             "status": "READY",
             "dataset_id": dataset_id,
@@ -24,7 +24,7 @@ params:
     2. build_image_manipulation:
        - ImageManipulationSpec(operation="crop_image_vertical",
                                params={"direction": "up"|"down", "crop_pct": N}) 반환.
-       - 실제 픽셀 crop 은 ImageMaterializer._apply_crop_vertical 이 Phase B 에서 수행.
+       - 실제 픽셀 crop 은 ImageMaterializer 가 (변환 체인으로 합쳐) Phase B 에서 수행.
 
 설계 결정:
     - direction 은 Korean("상단"/"하단") 으로 입력받지만, 내부 spec 및 파일명 postfix 는
@@ -35,16 +35,17 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
 import os.path
+from dataclasses import replace
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
 from lib.pipeline.pipeline_data_models import (
     DatasetMeta,
     ImageManipulationSpec,
     ImageRecord,
+    derive_dataset_meta,
 )
 
 logger = logging.getLogger(__name__)
@@ -60,6 +61,8 @@ class CropImageClassification(UnitManipulator):
     """DB seed name: "cls_crop_image"."""
 
     REQUIRED_PARAMS = ["direction", "crop_pct"]
+    supports_record_fusion = True
+    commutes_with_record_selection = True
 
     @property
     def name(self) -> str:
@@ -83,13 +86,21 @@ class CropImageClassification(UnitManipulator):
             context: 실행 컨텍스트 (현재 사용 안 함).
 
         Returns:
-            file_name / height / extra 가 갱신된 DatasetMeta (deep copy).
+            file_name / height / extra 가 갱신된 DatasetMeta (입력은 수정하지 않음).
 
         Raises:
             TypeError: input_meta 가 list 인 경우.
             ValueError: direction 이 _DIRECTION_TO_CODE 밖, 또는 crop_pct 가 정수
                         [1, 99] 범위를 벗어나는 경우.
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """direction/crop_pct 검증 후 레코드별 crop(높이 축소 + rename + spec 누적)을 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "cls_crop_image 는 단건 DatasetMeta 만 입력 가능합니다."
@@ -98,38 +109,43 @@ class CropImageClassification(UnitManipulator):
         direction_code = _parse_direction(params.get("direction", "상단"))
         crop_pct = _parse_crop_pct(params.get("crop_pct", 30))
 
-        cropped_meta = copy.deepcopy(input_meta)
+        cropped_meta = derive_dataset_meta(input_meta, image_records=[])
         postfix = f"_crop_{direction_code}_{crop_pct:03d}"
         remain_ratio = (100 - crop_pct) / 100.0
 
-        for record in cropped_meta.image_records:
+        def _crop_record(record: ImageRecord) -> ImageRecord:
             # height 가 알려져 있을 때만 축소 계산. 정수 내림 — Phase B 픽셀 crop 과 일치.
+            new_height = record.height
             if record.height is not None:
                 new_height = max(1, int(record.height * remain_ratio))
-                record.height = new_height
 
             # src 복원용 메타데이터: 최초 변형 시에만 기록. merge 등으로 이미 채워져
             # 있으면 그대로 둔다 (원본 추적 체인 보존).
-            if "source_storage_uri" not in record.extra:
-                record.extra["source_storage_uri"] = cropped_meta.storage_uri
-            if "original_file_name" not in record.extra:
-                record.extra["original_file_name"] = record.file_name
-
-            record.file_name = _append_postfix_to_filename(record.file_name, postfix)
-
-            existing_specs = record.extra.get("image_manipulation_specs", [])
-            existing_specs.append({
-                "operation": "crop_image_vertical",
-                "params": {"direction": direction_code, "crop_pct": crop_pct},
-            })
-            record.extra["image_manipulation_specs"] = existing_specs
-
-        logger.info(
-            "cls_crop_image 완료: %d장 이미지 × direction=%s crop_pct=%d%%",
-            len(cropped_meta.image_records), direction_code, crop_pct,
-        )
+            new_extra = dict(record.extra)
+            new_extra.setdefault("source_storage_uri", cropped_meta.storage_uri)
+            new_extra.setdefault("original_file_name", record.file_name)
+            new_extra["image_manipulation_specs"] = [
+                *record.extra.get("image_manipulation_specs", []),
+                {
+                    "operation": "crop_image_vertical",
+                    "params": {"direction": direction_code, "crop_pct": crop_pct},
+                },
+            ]
+
+            return replace(
+                record,
+                file_name=_append_postfix_to_filename(record.file_name, postfix),
+                height=new_height,
+                extra=new_extra,
+            )
+
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "cls_crop_image 완료: %d장 이미지 × direction=%s crop_pct=%d%%",
+                output_count, direction_code, crop_pct,
+            )
 
-        return cropped_meta
+        return RecordTransform(cropped_meta, _crop_record, _log_summary)
 
     def build_image_manipulation(
         self,
@@ -269,6 +269,7 @@ class FilterByClassClassification(UnitManipulator):
     """DB seed name: "cls_filter_by_class"."""
 
     REQUIRED_PARAMS = ["head_name", "mode"]
+    record_selection = "per_record"
 
     @property
     def name(self) -> str:
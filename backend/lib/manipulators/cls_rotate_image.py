@@ -21,7 +21,7 @@ params:
 
     2. build_image_manipulation:
        - ImageManipulationSpec(operation="rotate_image", params={"degrees": N}) 반환.
-       - 실제 픽셀 회전은 ImageMaterializer._apply_rotate 가 Phase B 에서 수행.
+       - 실제 픽셀 회전은 ImageMaterializer 가 (변환 체인으로 합쳐) Phase B 에서 수행.
 
 Phase B 경로 요약:
     src  = record.extra.source_storage_uri / record.extra.original_file_name
@@ -30,16 +30,17 @@ Phase B 경로 요약:
 """
 from __future__ import annotations
 
-import copy
 import logging
 import os.path
+from dataclasses import replace
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
 from lib.pipeline.pipeline_data_models import (
     DatasetMeta,
     ImageManipulationSpec,
     ImageRecord,
+    derive_dataset_meta,
 )
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,8 @@ class RotateImageClassification(UnitManipulator):
     """DB seed name: "cls_rotate_image"."""
 
     REQUIRED_PARAMS = ["degrees"]
+    supports_record_fusion = True
+    commutes_with_record_selection = True
 
     @property
     def name(self) -> str:
@@ -73,12 +76,20 @@ class RotateImageClassification(UnitManipulator):
             context: 실행 컨텍스트 (현재 사용 안 함).
 
         Returns:
-            file_name / width / height / extra 가 갱신된 DatasetMeta (deep copy).
+            file_name / width / height / extra 가 갱신된 DatasetMeta (입력은 수정하지 않음).
 
         Raises:
             TypeError: input_meta 가 list 인 경우.
             ValueError: degrees 가 VALID_DEGREES 에 속하지 않는 경우.
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """degrees 검증 후 레코드별 회전(크기 교환 + rename + spec 누적) 함수를 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "cls_rotate_image 는 단건 DatasetMeta 만 입력 가능합니다."
@@ -90,36 +101,40 @@ class RotateImageClassification(UnitManipulator):
                 f"degrees 는 {sorted(VALID_DEGREES)} 중 하나여야 합니다. 입력값: {degrees}"
             )
 
-        rotated_meta = copy.deepcopy(input_meta)
+        rotated_meta = derive_dataset_meta(input_meta, image_records=[])
         postfix = f"_rotated_{degrees}"
 
-        for record in rotated_meta.image_records:
+        def _rotate_record(record: ImageRecord) -> ImageRecord:
             # 90°/270° 에서만 가로·세로 교환. 180° 는 dimension 불변.
+            new_width, new_height = record.width, record.height
             if degrees in (90, 270) and record.width is not None and record.height is not None:
-                record.width, record.height = record.height, record.width
+                new_width, new_height = record.height, record.width
 
             # src 복원용 메타데이터: 최초 변형 시에만 기록. merge 경로 등에서 이미
             # 채워져 있으면 그대로 둔다 (원본 추적 체인을 끊지 않기 위함).
-            if "source_storage_uri" not in record.extra:
-                record.extra["source_storage_uri"] = rotated_meta.storage_uri
-            if "original_file_name" not in record.extra:
-                record.extra["original_file_name"] = record.file_name
-
-            record.file_name = _append_postfix_to_filename(record.file_name, postfix)
-
-            existing_specs = record.extra.get("image_manipulation_specs", [])
-            existing_specs.append({
-                "operation": "rotate_image",
-                "params": {"degrees": degrees},
-            })
-            record.extra["image_manipulation_specs"] = existing_specs
-
-        logger.info(
-            "cls_rotate_image 완료: %d장 이미지 × %d° 회전",
-            len(rotated_meta.image_records), degrees,
-        )
-
-        return rotated_meta
+            new_extra = dict(record.extra)
+            new_extra.setdefault("source_storage_uri", rotated_meta.storage_uri)
+            new_extra.setdefault("original_file_name", record.file_name)
+            new_extra["image_manipulation_specs"] = [
+                *record.extra.get("image_manipulation_specs", []),
+                {"operation": "rotate_image", "params": {"degrees": degrees}},
+            ]
+
+            return replace(
+                record,
+                file_name=_append_postfix_to_filename(record.file_name, postfix),
+                width=new_width,
+                height=new_height,
+                extra=new_extra,
+            )
+
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "cls_rotate_image 완료: %d장 이미지 × %d° 회전",
+                output_count, degrees,
+            )
+
+        return RecordTransform(rotated_meta, _rotate_record, _log_summary)
 
     def build_image_manipulation(
         self,
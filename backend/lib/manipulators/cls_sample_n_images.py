@@ -13,13 +13,12 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
 import random
 from typing import Any
 
 from lib.pipeline.manipulator_base import UnitManipulator
-from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.pipeline_data_models import DatasetMeta, derive_dataset_meta
 
 logger = logging.getLogger(__name__)
 
@@ -35,11 +34,16 @@ class SampleNImagesClassification(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["n"]
+    record_selection = "whole_dataset"
 
     @property
     def name(self) -> str:
         return "cls_sample_n_images"
 
+    def is_deterministic(self, params: dict[str, Any]) -> bool:
+        """seed=None 이면 매 실행 다른 샘플이 나온다."""
+        return params.get("seed", 42) is not None
+
     def transform_annotation(
         self,
         input_meta: DatasetMeta | list[DatasetMeta],
@@ -60,7 +64,7 @@ class SampleNImagesClassification(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            샘플링된 DatasetMeta (deep copy)
+            샘플링된 DatasetMeta (copy-on-write — 레코드는 입력과 공유)
 
         Raises:
             TypeError: input_meta 가 list 일 때
@@ -86,7 +90,7 @@ class SampleNImagesClassification(UnitManipulator):
         if seed_value is not None:
             seed_value = int(seed_value)
 
-        sampled_meta = copy.deepcopy(input_meta)
+        sampled_meta = derive_dataset_meta(input_meta)
         original_image_count = len(sampled_meta.image_records)
 
         # 총 이미지 수가 N 이하이면 전체 유지.
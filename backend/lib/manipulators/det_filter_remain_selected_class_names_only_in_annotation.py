@@ -16,12 +16,12 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
+from dataclasses import replace
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
-from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImageRecord, derive_dataset_meta
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,7 @@ class FilterRemainSelectedClassNamesOnlyInAnnotation(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["keep_class_names"]
+    supports_record_fusion = True
 
     @property
     def name(self) -> str:
@@ -58,12 +59,20 @@ class FilterRemainSelectedClassNamesOnlyInAnnotation(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            annotation이 필터링된 DatasetMeta (deep copy)
+            annotation이 필터링된 DatasetMeta (copy-on-write — 변경 없는 레코드는 입력과 공유)
 
         Raises:
             TypeError: input_meta가 list일 때
             ValueError: keep_class_names가 비어있을 때
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """keep_class_names 파싱/검증 + categories 축소 후 레코드별 annotation 필터를 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_filter_remain_selected_class_names_only_in_annotation는 단건 DatasetMeta만 입력 가능합니다."
@@ -83,10 +92,8 @@ class FilterRemainSelectedClassNamesOnlyInAnnotation(UnitManipulator):
                 "keep_class_names가 비어있습니다. 남길 class 이름을 하나 이상 입력하세요."
             )
 
-        filtered_meta = copy.deepcopy(input_meta)
-
         # 매칭되지 않는 이름이 있으면 경고
-        existing_names = set(filtered_meta.categories)
+        existing_names = set(input_meta.categories)
         matched_names = keep_names & existing_names
         unmatched_names = keep_names - existing_names
         if unmatched_names:
@@ -95,26 +102,35 @@ class FilterRemainSelectedClassNamesOnlyInAnnotation(UnitManipulator):
                 ", ".join(sorted(unmatched_names)),
             )
 
+        # categories도 유지 대상만 남김
+        filtered_meta = derive_dataset_meta(
+            input_meta,
+            categories=[name for name in input_meta.categories if name in keep_names],
+            image_records=[],
+        )
+
         # annotation 필터링 — 이미지는 유지, annotation만 제거
+        # 제거할 annotation 이 있는 레코드만 새로 만들고 나머지는 입력과 공유한다.
         total_removed = 0
-        for image_record in filtered_meta.image_records:
-            original_count = len(image_record.annotations)
-            image_record.annotations = [
+
+        def _remain_selected(image_record: ImageRecord) -> ImageRecord:
+            nonlocal total_removed
+            kept_annotations = [
                 ann for ann in image_record.annotations
                 if ann.category_name in keep_names
             ]
-            total_removed += original_count - len(image_record.annotations)
-
-        # categories도 유지 대상만 남김
-        filtered_meta.categories = [
-            name for name in filtered_meta.categories
-            if name in keep_names
-        ]
-
-        logger.info(
-            "det_filter_remain_selected_class_names_only_in_annotation 완료: 유지 class %d개, 제거된 annotation %d개, "
-            "이미지 수 변동 없음 (%d장)",
-            len(matched_names), total_removed, len(filtered_meta.image_records),
-        )
+            removed_count = len(image_record.annotations) - len(kept_annotations)
+            if not removed_count:
+                return image_record
+            total_removed += removed_count
+            return replace(image_record, annotations=kept_annotations)
+
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "det_filter_remain_selected_class_names_only_in_annotation 완료: "
+                "유지 class %d개, 제거된 annotation %d개, "
+                "이미지 수 변동 없음 (%d장)",
+                len(matched_names), total_removed, output_count,
+            )
 
-        return filtered_meta
+        return RecordTransform(filtered_meta, _remain_selected, _log_summary)
@@ -15,12 +15,11 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
-from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImageRecord, derive_dataset_meta
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +34,8 @@ class FilterRemoveImagesContainingClassName(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["class_names"]
+    supports_record_fusion = True
+    record_selection = "per_record"
 
     @property
     def name(self) -> str:
@@ -56,12 +57,20 @@ class FilterRemoveImagesContainingClassName(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            이미지가 제거된 DatasetMeta (deep copy)
+            이미지가 제거된 DatasetMeta (copy-on-write — 변경 없는 레코드는 입력과 공유)
 
         Raises:
             TypeError: input_meta가 list일 때
             ValueError: class_names가 비어있을 때
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """class_names 파싱/검증 후 레코드별 제거 여부 판정 함수를 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_filter_remove_images_containing_class_name는 단건 DatasetMeta만 입력 가능합니다."
@@ -80,7 +89,7 @@ class FilterRemoveImagesContainingClassName(UnitManipulator):
                 "class_names가 비어있습니다. 제거할 class 이름을 하나 이상 입력하세요."
             )
 
-        filtered_meta = copy.deepcopy(input_meta)
+        filtered_meta = derive_dataset_meta(input_meta, image_records=[])
 
         # 매칭되지 않는 이름이 있으면 경고
         existing_names = set(filtered_meta.categories)
@@ -93,24 +102,19 @@ class FilterRemoveImagesContainingClassName(UnitManipulator):
             )
 
         # 이미지 필터링 — 지정 class의 annotation이 1개라도 있으면 이미지 전체 제거
-        original_image_count = len(filtered_meta.image_records)
-        filtered_meta.image_records = [
-            image_record
-            for image_record in filtered_meta.image_records
-            if not any(
-                ann.category_name in remove_names
-                for ann in image_record.annotations
+        def _remove_if_contains(image_record: ImageRecord) -> ImageRecord | None:
+            if any(ann.category_name in remove_names for ann in image_record.annotations):
+                return None
+            return image_record
+
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "det_filter_remove_images_containing_class_name 완료: 제거 대상 class %d개 (%s), "
+                "제거된 이미지 %d장, 남은 이미지 %d장",
+                len(matched_names),
+                ", ".join(sorted(matched_names)),
+                input_count - output_count,
+                output_count,
             )
-        ]
-        removed_image_count = original_image_count - len(filtered_meta.image_records)
-
-        logger.info(
-            "det_filter_remove_images_containing_class_name 완료: 제거 대상 class %d개 (%s), "
-            "제거된 이미지 %d장, 남은 이미지 %d장",
-            len(matched_names),
-            ", ".join(sorted(matched_names)),
-            removed_image_count,
-            len(filtered_meta.image_records),
-        )
-
-        return filtered_meta
+
+        return RecordTransform(filtered_meta, _remove_if_contains, _log_summary)
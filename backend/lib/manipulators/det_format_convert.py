@@ -7,16 +7,20 @@
 """
 from __future__ import annotations
 
-import copy
 import logging
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
-from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImageRecord, derive_dataset_meta
 
 logger = logging.getLogger(__name__)
 
 
+def _passthrough_record(record: ImageRecord) -> ImageRecord:
+    """no-op 변환 — 레코드를 그대로 공유한다."""
+    return record
+
+
 class FormatConvertToYolo(UnitManipulator):
     """
     COCO → YOLO 포맷 변환 (no-op).
@@ -27,6 +31,8 @@ class FormatConvertToYolo(UnitManipulator):
     DB seed name: "det_format_convert_to_yolo"
     """
 
+    supports_record_fusion = True
+
     @property
     def name(self) -> str:
         return "det_format_convert_to_yolo"
@@ -37,6 +43,13 @@ class FormatConvertToYolo(UnitManipulator):
         params: dict[str, Any],
         context: dict[str, Any] | None = None,
     ) -> DatasetMeta:
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_format_convert_to_yolo는 PER_SOURCE 전용입니다. "
@@ -46,7 +59,9 @@ class FormatConvertToYolo(UnitManipulator):
             "det_format_convert_to_yolo: 통일포맷에서 no-op. "
             "출력 포맷은 Save 노드에서 결정됩니다."
         )
-        return copy.deepcopy(input_meta)
+        return RecordTransform(
+            derive_dataset_meta(input_meta, image_records=[]), _passthrough_record,
+        )
 
 
 class FormatConvertToCoco(UnitManipulator):
@@ -59,6 +74,8 @@ class FormatConvertToCoco(UnitManipulator):
     DB seed name: "det_format_convert_to_coco"
     """
 
+    supports_record_fusion = True
+
     @property
     def name(self) -> str:
         return "det_format_convert_to_coco"
@@ -69,6 +86,13 @@ class FormatConvertToCoco(UnitManipulator):
         params: dict[str, Any],
         context: dict[str, Any] | None = None,
     ) -> DatasetMeta:
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_format_convert_to_coco는 PER_SOURCE 전용입니다. "
@@ -78,7 +102,9 @@ class FormatConvertToCoco(UnitManipulator):
             "det_format_convert_to_coco: 통일포맷에서 no-op. "
             "출력 포맷은 Save 노드에서 결정됩니다."
         )
-        return copy.deepcopy(input_meta)
+        return RecordTransform(
+            derive_dataset_meta(input_meta, image_records=[]), _passthrough_record,
+        )
 
 
 class FormatConvertVisDroneToCoco(UnitManipulator):
@@ -91,6 +117,8 @@ class FormatConvertVisDroneToCoco(UnitManipulator):
     DB seed name: "det_format_convert_visdrone_to_coco"
     """
 
+    supports_record_fusion = True
+
     @property
     def name(self) -> str:
         return "det_format_convert_visdrone_to_coco"
@@ -101,6 +129,13 @@ class FormatConvertVisDroneToCoco(UnitManipulator):
         params: dict[str, Any],
         context: dict[str, Any] | None = None,
     ) -> DatasetMeta:
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_format_convert_visdrone_to_coco는 PER_SOURCE 전용입니다. "
@@ -110,7 +145,9 @@ class FormatConvertVisDroneToCoco(UnitManipulator):
             "det_format_convert_visdrone_to_coco: 통일포맷에서 no-op. "
             "출력 포맷은 Save 노드에서 결정됩니다."
         )
-        return copy.deepcopy(input_meta)
+        return RecordTransform(
+            derive_dataset_meta(input_meta, image_records=[]), _passthrough_record,
+        )
 
 
 class FormatConvertVisDroneToYolo(UnitManipulator):
@@ -123,6 +160,8 @@ class FormatConvertVisDroneToYolo(UnitManipulator):
     DB seed name: "det_format_convert_visdrone_to_yolo"
     """
 
+    supports_record_fusion = True
+
     @property
     def name(self) -> str:
         return "det_format_convert_visdrone_to_yolo"
@@ -133,6 +172,13 @@ class FormatConvertVisDroneToYolo(UnitManipulator):
         params: dict[str, Any],
         context: dict[str, Any] | None = None,
     ) -> DatasetMeta:
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_format_convert_visdrone_to_yolo는 PER_SOURCE 전용입니다. "
@@ -142,4 +188,6 @@ class FormatConvertVisDroneToYolo(UnitManipulator):
             "det_format_convert_visdrone_to_yolo: 통일포맷에서 no-op. "
             "출력 포맷은 Save 노드에서 결정됩니다."
         )
-        return copy.deepcopy(input_meta)
+        return RecordTransform(
+            derive_dataset_meta(input_meta, image_records=[]), _passthrough_record,
+        )
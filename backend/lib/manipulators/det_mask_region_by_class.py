@@ -15,15 +15,16 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
+from dataclasses import replace
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
 from lib.pipeline.pipeline_data_models import (
     DatasetMeta,
     ImageManipulationSpec,
     ImageRecord,
+    derive_dataset_meta,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,8 @@ class MaskRegionByClass(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["class_names"]
+    supports_record_fusion = True
+    commutes_with_record_selection = True
 
     @property
     def name(self) -> str:
@@ -66,12 +69,21 @@ class MaskRegionByClass(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            image_manipulation_specs가 추가된 DatasetMeta (deep copy)
+            image_manipulation_specs가 추가된 DatasetMeta
+            (copy-on-write — 대상 없는 레코드는 입력과 공유)
 
         Raises:
             TypeError: input_meta가 list일 때
             ValueError: class_names가 비어있을 때
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """class_names/fill_color 파싱 후 레코드별 mask spec 누적 함수를 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_mask_region_by_class는 단건 DatasetMeta만 입력 가능합니다."
@@ -95,7 +107,7 @@ class MaskRegionByClass(UnitManipulator):
         if fill_color not in VALID_FILL_COLORS:
             fill_color = "black"
 
-        masked_meta = copy.deepcopy(input_meta)
+        masked_meta = derive_dataset_meta(input_meta, image_records=[])
 
         # 매칭되지 않는 이름 경고
         existing_names = set(masked_meta.categories)
@@ -108,36 +120,49 @@ class MaskRegionByClass(UnitManipulator):
             )
 
         # 이미지별로 마스킹 대상 bbox를 수집하여 specs에 누적
+        # 마스킹 대상이 있는 레코드만 새로 만들고 나머지는 입력과 공유한다.
         total_mask_count = 0
-        for record in masked_meta.image_records:
-            mask_bboxes = []
-            for annotation in record.annotations:
-                if annotation.category_name in target_names and annotation.bbox:
-                    mask_bboxes.append(annotation.bbox)
+
+        def _mask_record(record: ImageRecord) -> ImageRecord:
+            nonlocal total_mask_count
+            mask_bboxes = [
+                list(annotation.bbox)
+                for annotation in record.annotations
+                if annotation.category_name in target_names and annotation.bbox
+            ]
 
             if not mask_bboxes:
-                continue
+                return record
 
             total_mask_count += len(mask_bboxes)
 
             # image_manipulation_specs에 누적
             existing_specs = record.extra.get("image_manipulation_specs", [])
-            existing_specs.append({
-                "operation": "mask_region",
-                "params": {
-                    "bboxes": mask_bboxes,
-                    "fill_color": fill_color,
-                    "bbox_normalized": record.width is None,
+            return replace(
+                record,
+                extra={
+                    **record.extra,
+                    "image_manipulation_specs": [
+                        *existing_specs,
+                        {
+                            "operation": "mask_region",
+                            "params": {
+                                "bboxes": mask_bboxes,
+                                "fill_color": fill_color,
+                                "bbox_normalized": record.width is None,
+                            },
+                        },
+                    ],
                 },
-            })
-            record.extra["image_manipulation_specs"] = existing_specs
+            )
 
-        logger.info(
-            "det_mask_region_by_class 완료: 대상 class %d개, 마스킹 bbox %d개, 이미지 %d장",
-            len(matched_names), total_mask_count, len(masked_meta.image_records),
-        )
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "det_mask_region_by_class 완료: 대상 class %d개, 마스킹 bbox %d개, 이미지 %d장",
+                len(matched_names), total_mask_count, output_count,
+            )
 
-        return masked_meta
+        return RecordTransform(masked_meta, _mask_record, _log_summary)
 
     def build_image_manipulation(
         self,
@@ -33,10 +33,14 @@ class MergeDatasets(UnitManipulator):
     accepts_multi_input = True 로 표시하여 DAG executor가
     _merge_metas()를 건너뛰고 list[DatasetMeta]를 직접 전달하도록 한다.
 
+    accepts_pushed_record_filter = True — 병합 직후의 per-record 필터를 병합 중에 적용할 수
+    있다 (context["record_filter"]). annotation 을 그대로 옮기므로 필터 판정이 병합 전후로 같다.
+
     DB seed name: "det_merge_datasets"
     """
 
     accepts_multi_input: bool = True
+    accepts_pushed_record_filter = True
 
     @property
     def name(self) -> str:
@@ -58,6 +62,9 @@ class MergeDatasets(UnitManipulator):
             input_meta: list[DatasetMeta] (2개 이상 필수)
             params: 현재 사용하지 않음 (향후 확장용)
             context: 실행 컨텍스트 (선택)
+                - record_filter: Callable[[ImageRecord], bool] — False 인 입력 레코드는
+                  결과에서 뺀다. 파일명 충돌 판정 / rename / image_id 번호는 걸러지기 전
+                  전체 레코드 기준이므로, 병합 후 같은 필터를 적용한 결과와 동일하다.
 
         Returns:
             병합된 DatasetMeta.
@@ -97,9 +104,11 @@ class MergeDatasets(UnitManipulator):
         )
 
         # ── 이미지 레코드 병합 ──
+        record_filter = (context or {}).get("record_filter")
         merged_records: list[ImageRecord] = []
         file_name_mapping: dict[str, dict[str, str]] = {}
         image_id_counter = 1
+        filtered_count = 0
 
         for meta in input_meta:
             dataset_id = meta.dataset_id
@@ -119,6 +128,12 @@ class MergeDatasets(UnitManipulator):
                 else:
                     new_file_name = original_file_name
 
+                # 병합 후 필터를 앞당겨 적용 — 걸러진 레코드도 image_id 번호는 차지한다
+                if record_filter is not None and not record_filter(record):
+                    filtered_count += 1
+                    image_id_counter += 1
+                    continue
+
                 # 출처 정보를 extra에 저장 (모든 레코드, rename 여부 무관)
                 merged_extra = {
                     **record.extra,
@@ -147,6 +162,8 @@ class MergeDatasets(UnitManipulator):
             len(unified_categories),
             sum(len(v) for v in file_name_mapping.values()),
         )
+        if record_filter is not None:
+            logger.info("병합 중 필터 적용: %d장 제외", filtered_count)
 
         return DatasetMeta(
             dataset_id="",
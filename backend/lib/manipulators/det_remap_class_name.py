@@ -14,12 +14,12 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
+from dataclasses import replace
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
-from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImageRecord, derive_dataset_meta
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +38,7 @@ class RemapClassName(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["mapping"]
+    supports_record_fusion = True
 
     @property
     def name(self) -> str:
@@ -59,12 +60,20 @@ class RemapClassName(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            class name이 변경된 DatasetMeta (deep copy)
+            class name이 변경된 DatasetMeta (copy-on-write — 변경 없는 레코드는 입력과 공유)
 
         Raises:
             TypeError: input_meta가 list일 때
             ValueError: mapping이 비어있을 때
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """mapping 검증 + categories 변경 후 레코드별 category_name 변경 함수를 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_remap_class_name는 단건 DatasetMeta만 입력 가능합니다."
@@ -76,8 +85,6 @@ class RemapClassName(UnitManipulator):
                 "mapping이 비어있습니다. 변경할 class 이름 매핑을 하나 이상 입력하세요."
             )
 
-        remapped_meta = copy.deepcopy(input_meta)
-
         # 매핑에 존재하지만 categories에 없는 이름 경고
         existing_names = set(input_meta.categories)
         unmatched_keys = set(mapping.keys()) - existing_names
@@ -91,27 +98,40 @@ class RemapClassName(UnitManipulator):
         renamed_count = 0
         new_categories: list[str] = []
         seen_names: set[str] = set()
-        for original_name in remapped_meta.categories:
+        for original_name in input_meta.categories:
             new_name = mapping.get(original_name, original_name)
             if new_name != original_name:
                 renamed_count += 1
             if new_name not in seen_names:
                 new_categories.append(new_name)
                 seen_names.add(new_name)
-        remapped_meta.categories = new_categories
+        remapped_meta = derive_dataset_meta(
+            input_meta, categories=new_categories, image_records=[],
+        )
 
         # annotation의 category_name도 함께 변경
+        # 매핑 대상 annotation 이 있는 레코드만 새로 만들고 나머지는 입력과 공유한다.
         annotation_renamed_count = 0
-        for image_record in remapped_meta.image_records:
+
+        def _remap_record(image_record: ImageRecord) -> ImageRecord:
+            nonlocal annotation_renamed_count
+            if not any(ann.category_name in mapping for ann in image_record.annotations):
+                return image_record
+            new_annotations = []
             for annotation in image_record.annotations:
                 if annotation.category_name in mapping:
-                    annotation.category_name = mapping[annotation.category_name]
+                    annotation = replace(
+                        annotation, category_name=mapping[annotation.category_name],
+                    )
                     annotation_renamed_count += 1
+                new_annotations.append(annotation)
+            return replace(image_record, annotations=new_annotations)
+
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "det_remap_class_name 완료: categories %d개 변경 → %d개 (병합 후), "
+                "annotation %d건 변경",
+                renamed_count, len(new_categories), annotation_renamed_count,
+            )
 
-        logger.info(
-            "det_remap_class_name 완료: categories %d개 변경 → %d개 (병합 후), "
-            "annotation %d건 변경",
-            renamed_count, len(remapped_meta.categories), annotation_renamed_count,
-        )
-
-        return remapped_meta
+        return RecordTransform(remapped_meta, _remap_record, _log_summary)
@@ -21,16 +21,17 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
+from dataclasses import replace
 from typing import Any
 
-from lib.pipeline.manipulator_base import UnitManipulator
+from lib.pipeline.manipulator_base import RecordTransform, UnitManipulator
 from lib.pipeline.pipeline_data_models import (
     Annotation,
     DatasetMeta,
     ImageManipulationSpec,
     ImageRecord,
+    derive_dataset_meta,
 )
 
 logger = logging.getLogger(__name__)
@@ -50,6 +51,8 @@ class RotateImage(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["degrees"]
+    supports_record_fusion = True
+    commutes_with_record_selection = True
 
     @property
     def name(self) -> str:
@@ -71,12 +74,20 @@ class RotateImage(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            bbox가 변환된 DatasetMeta (deep copy)
+            bbox가 변환된 DatasetMeta (입력은 수정하지 않음)
 
         Raises:
             TypeError: input_meta가 list일 때
             ValueError: degrees가 유효하지 않을 때
         """
+        return self.apply_record_transform(input_meta, params)
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """degrees 검증 후 레코드별 bbox/크기 회전 + spec 누적 함수를 만든다."""
         if isinstance(input_meta, list):
             raise TypeError(
                 "det_rotate_image는 단건 DatasetMeta만 입력 가능합니다."
@@ -88,9 +99,10 @@ class RotateImage(UnitManipulator):
                 f"degrees는 {VALID_DEGREES} 중 하나여야 합니다. 입력값: {degrees}"
             )
 
-        rotated_meta = copy.deepcopy(input_meta)
+        rotated_meta = derive_dataset_meta(input_meta, image_records=[])
 
-        for record in rotated_meta.image_records:
+        # 모든 레코드가 바뀌므로 레코드/annotation 을 새로 만든다 (입력은 수정하지 않음)
+        def _rotate_record(record: ImageRecord) -> ImageRecord:
             image_width = record.width
             image_height = record.height
 
@@ -101,31 +113,44 @@ class RotateImage(UnitManipulator):
                 image_width = 1
                 image_height = 1
 
-            for annotation in record.annotations:
-                if annotation.bbox is not None:
-                    annotation.bbox = _rotate_bbox(
-                        annotation.bbox, degrees, image_width, image_height,
-                    )
+            rotated_annotations = [
+                replace(
+                    annotation,
+                    bbox=_rotate_bbox(annotation.bbox, degrees, image_width, image_height),
+                )
+                if annotation.bbox is not None else annotation
+                for annotation in record.annotations
+            ]
 
             # 90°/270° 회전 시 width ↔ height 교환
+            new_width, new_height = record.width, record.height
             if degrees in (90, 270) and not use_normalized:
-                record.width, record.height = record.height, record.width
+                new_width, new_height = record.height, record.width
 
             # 이미지 변환 명세를 record.extra에 누적
             # Phase B의 _build_image_plans에서 추출하여 ImagePlan.specs에 넣는다
             existing_specs = record.extra.get("image_manipulation_specs", [])
-            existing_specs.append({
-                "operation": "rotate_image",
-                "params": {"degrees": degrees},
-            })
-            record.extra["image_manipulation_specs"] = existing_specs
-
-        logger.info(
-            "det_rotate_image 완료: %d장 이미지 × %d° 회전",
-            len(rotated_meta.image_records), degrees,
-        )
-
-        return rotated_meta
+            return replace(
+                record,
+                width=new_width,
+                height=new_height,
+                annotations=rotated_annotations,
+                extra={
+                    **record.extra,
+                    "image_manipulation_specs": [
+                        *existing_specs,
+                        {"operation": "rotate_image", "params": {"degrees": degrees}},
+                    ],
+                },
+            )
+
+        def _log_summary(input_count: int, output_count: int) -> None:
+            logger.info(
+                "det_rotate_image 완료: %d장 이미지 × %d° 회전",
+                output_count, degrees,
+            )
+
+        return RecordTransform(rotated_meta, _rotate_record, _log_summary)
 
     def build_image_manipulation(
         self,
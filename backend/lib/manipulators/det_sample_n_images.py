@@ -16,13 +16,12 @@ params:
 """
 from __future__ import annotations
 
-import copy
 import logging
 import random
 from typing import Any
 
 from lib.pipeline.manipulator_base import UnitManipulator
-from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.pipeline_data_models import DatasetMeta, derive_dataset_meta
 
 logger = logging.getLogger(__name__)
 
@@ -38,11 +37,16 @@ class SampleNImages(UnitManipulator):
     """
 
     REQUIRED_PARAMS = ["n"]
+    record_selection = "whole_dataset"
 
     @property
     def name(self) -> str:
         return "det_sample_n_images"
 
+    def is_deterministic(self, params: dict[str, Any]) -> bool:
+        """seed=None 이면 매 실행 다른 샘플이 나온다."""
+        return params.get("seed", 42) is not None
+
     def transform_annotation(
         self,
         input_meta: DatasetMeta | list[DatasetMeta],
@@ -60,7 +64,7 @@ class SampleNImages(UnitManipulator):
             context: 실행 컨텍스트 (선택)
 
         Returns:
-            샘플링된 DatasetMeta (deep copy)
+            샘플링된 DatasetMeta (copy-on-write — 변경 없는 레코드는 입력과 공유)
 
         Raises:
             TypeError: input_meta가 list일 때
@@ -81,7 +85,7 @@ class SampleNImages(UnitManipulator):
         if seed_value is not None:
             seed_value = int(seed_value)
 
-        filtered_meta = copy.deepcopy(input_meta)
+        filtered_meta = derive_dataset_meta(input_meta)
         original_image_count = len(filtered_meta.image_records)
 
         # 총 이미지 수가 N 이하이면 전체 유지
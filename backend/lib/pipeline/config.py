@@ -20,6 +20,10 @@ YAML 구조 (schema_version=3, v7.11 — source 토큰에 type 명시):
           # inputs: ["source:dataset_version:<version_id>"]
           params: { ... }
       passthrough_source_split_id: "<split_id>"
+      terminal_task: task_name                           # 선택 — Save 노드에 연결된 태스크
+      extra_outputs:                                     # 선택 — 추가 Save 노드 (multi-output)
+        - terminal_task: other_task
+          output: { dataset_type: SOURCE, annotation_format: COCO, split: VAL }
       schema_version: 3
 
 source 토큰의 type 차원:
@@ -32,11 +36,13 @@ submit 단계 `_substitute_resolved_versions` 가 spec → resolved 변환 시 t
 """
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
 import yaml
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, model_serializer, model_validator
 
 
 # 현재 SDK 가 생성하고 backend 가 받는 PipelineConfig schema 버전.
@@ -128,6 +134,17 @@ class OutputConfig(BaseModel):
     )
 
 
+class ExtraOutputConfig(BaseModel):
+    """
+    추가 출력 (multi-output) — 같은 run 에서 다른 태스크의 결과를 별도 DatasetVersion 으로 저장.
+
+    출력 그룹(name / dataset_type)은 기본 출력과 공유하고 split 으로 구분한다
+    (예: 같은 전처리 뒤 분기한 TRAIN / VAL). 공통 상류 태스크는 run 당 1회만 계산된다.
+    """
+    terminal_task: str = Field(..., description="이 출력에 저장할 태스크명 (Save 노드 입력)")
+    output: OutputConfig
+
+
 class PipelineConfig(BaseModel):
     """
     DAG 기반 파이프라인 실행 전체 설정.
@@ -161,6 +178,35 @@ class PipelineConfig(BaseModel):
         default=None,
         description="DAG schema 버전 (현재 3 만 허용)",
     )
+    # Save 노드에 연결된 태스크. 지정되면 이 태스크가 최종 출력이고,
+    # 여기에 도달하지 않는 태스크(편집기에 남은 미연결 분기)는 실행하지 않는다.
+    # None 이면 기존대로 유일한 sink 노드가 최종 출력.
+    terminal_task: str | None = Field(
+        default=None,
+        description="최종 출력 태스크명 (Save 노드 입력). None 이면 유일한 sink 노드",
+    )
+    # 기본 출력(output / terminal_task) 외의 추가 출력. 비어 있으면 단일 출력 파이프라인.
+    extra_outputs: list[ExtraOutputConfig] = Field(
+        default_factory=list,
+        description=(
+            "추가 출력 목록 — 출력마다 DatasetVersion 1개 (기본 출력과 같은 그룹, 다른 split)"
+        ),
+    )
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_terminal_task(self, handler: Any) -> dict[str, Any]:
+        """
+        terminal_task 가 None 이거나 extra_outputs 가 비어 있으면 해당 필드를 직렬화에서 뺀다.
+
+        PipelineVersion.config 재사용 판정이 model_dump() JSON 비교라서, 필드 추가 전에
+        저장된 config 와 dump 결과가 달라지면 동일 파이프라인이 새 version 으로 올라간다.
+        """
+        data = handler(self)
+        if data.get("terminal_task") is None:
+            data.pop("terminal_task", None)
+        if not data.get("extra_outputs"):
+            data.pop("extra_outputs", None)
+        return data
 
     @model_validator(mode="after")
     def _validate_tasks_or_passthrough(self) -> PipelineConfig:
@@ -188,6 +234,44 @@ class PipelineConfig(BaseModel):
                 raise ValueError(
                     f"태스크 '{task_name}'이 자기 자신을 input으로 참조합니다."
                 )
+        if self.terminal_task is not None and self.terminal_task not in task_names:
+            raise ValueError(
+                f"terminal_task '{self.terminal_task}'가 "
+                f"정의된 태스크 목록에 없습니다: {sorted(task_names)}"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def _validate_extra_outputs(self) -> PipelineConfig:
+        """
+        추가 출력 검증 — 태스크 존재, 기본 출력과 같은 dataset_type, 출력끼리 split 중복 금지.
+
+        출력들은 한 DatasetGroup 의 split 슬롯을 나눠 쓰므로 split 이 겹치면 같은 경로에 쓴다.
+        """
+        if not self.extra_outputs:
+            return self
+        if self.is_passthrough:
+            raise ValueError("extra_outputs 는 tasks 가 있는 파이프라인에서만 쓸 수 있습니다.")
+        used_splits = {self.output.split.upper()}
+        for index, extra_output in enumerate(self.extra_outputs):
+            if extra_output.terminal_task not in self.tasks:
+                raise ValueError(
+                    f"extra_outputs[{index}].terminal_task '{extra_output.terminal_task}'가 "
+                    f"정의된 태스크 목록에 없습니다: {sorted(self.tasks)}"
+                )
+            if extra_output.output.dataset_type.upper() != self.output.dataset_type.upper():
+                raise ValueError(
+                    f"extra_outputs[{index}].output.dataset_type 은 기본 출력과 같아야 합니다 "
+                    f"(같은 DatasetGroup): {extra_output.output.dataset_type!r} != "
+                    f"{self.output.dataset_type!r}"
+                )
+            split_upper = extra_output.output.split.upper()
+            if split_upper in used_splits:
+                raise ValueError(
+                    f"extra_outputs[{index}].output.split '{split_upper}'이(가) "
+                    "다른 출력과 겹칩니다. 출력마다 split 이 달라야 합니다."
+                )
+            used_splits.add(split_upper)
         return self
 
     @model_validator(mode="after")
@@ -246,6 +330,29 @@ class PipelineConfig(BaseModel):
 
         return order
 
+    def execution_levels(self) -> list[list[str]]:
+        """
+        태스크를 의존 깊이(level) 단위로 묶어 반환한다.
+
+        level 0 은 source 만 입력으로 받는 태스크, level N 은 의존 태스크 중
+        가장 깊은 것이 level N-1 인 태스크다. 같은 level 의 태스크끼리는 서로
+        의존하지 않으므로 병렬 실행이 가능하다. level 내부는 이름순 정렬.
+        """
+        level_by_task: dict[str, int] = {}
+        for task_name in self.topological_order():
+            dependency_names = self.tasks[task_name].get_dependency_task_names()
+            level_by_task[task_name] = (
+                max(level_by_task[dep] for dep in dependency_names) + 1
+                if dependency_names else 0
+            )
+
+        levels: list[list[str]] = [
+            [] for _ in range(max(level_by_task.values(), default=-1) + 1)
+        ]
+        for task_name, level in level_by_task.items():
+            levels[level].append(task_name)
+        return [sorted(level_tasks) for level_tasks in levels]
+
     def get_all_source_split_ids(self) -> list[str]:
         """
         spec 단계 — `source:dataset_split:<id>` 토큰의 모든 id 를 중복 제거 반환.
@@ -291,12 +398,19 @@ class PipelineConfig(BaseModel):
     def get_terminal_task_name(self) -> str:
         """
         DAG의 최종 출력 태스크(sink 노드)를 반환.
+        terminal_task 가 지정되어 있으면 그 태스크, 아니면
         다른 태스크의 input으로 참조되지 않는 유일한 태스크.
+        추가 출력(extra_outputs)의 태스크는 sink 후보에서 뺀다.
 
         Raises:
-            ValueError: sink 노드가 0개 또는 2개 이상일 때
+            ValueError: terminal_task 미지정이고 sink 노드가 0개 또는 2개 이상일 때
         """
-        referenced_as_input: set[str] = set()
+        if self.terminal_task is not None:
+            return self.terminal_task
+
+        referenced_as_input: set[str] = {
+            extra_output.terminal_task for extra_output in self.extra_outputs
+        }
         for task_config in self.tasks.values():
             referenced_as_input.update(task_config.get_dependency_task_names())
 
@@ -310,11 +424,38 @@ class PipelineConfig(BaseModel):
         if len(terminal_tasks) > 1:
             raise ValueError(
                 f"최종 출력 태스크가 2개 이상입니다: {terminal_tasks}. "
-                "det_merge_datasets 등으로 하나로 합쳐야 합니다."
+                "det_merge_datasets 등으로 하나로 합치거나 Save 노드에 연결된 태스크"
+                "(terminal_task)를 지정해야 합니다."
             )
         return terminal_tasks[0]
 
 
+    def get_upstream_source_dataset_ids(self, task_name: str) -> list[str]:
+        """
+        resolved 단계 — task_name 과 그 상류 태스크가 읽는 `source:dataset_version:<id>` 의 id.
+        topological 순서, 중복 제거. 출력별 lineage 엣지 생성에 쓴다.
+        """
+        upstream_names: set[str] = set()
+        pending_names = [task_name]
+        while pending_names:
+            current_name = pending_names.pop()
+            if current_name in upstream_names:
+                continue
+            upstream_names.add(current_name)
+            pending_names.extend(self.tasks[current_name].get_dependency_task_names())
+
+        seen: set[str] = set()
+        result: list[str] = []
+        for current_name in self.topological_order():
+            if current_name not in upstream_names:
+                continue
+            for version_id in self.tasks[current_name].get_source_version_ids():
+                if version_id not in seen:
+                    seen.add(version_id)
+                    result.append(version_id)
+        return result
+
+
 class PartialPipelineConfig(BaseModel):
     """
     Save 노드 없이도 유효한 부분 파이프라인 설정.
@@ -418,6 +559,37 @@ def extract_source_split_ids(
     return config.get_all_source_split_ids()
 
 
+def build_run_config_hash(
+    pipeline_version_id: str,
+    resolved_input_versions: dict[str, str],
+    transform_config: dict[str, Any],
+    input_file_fingerprints: dict[str, Any] | None = None,
+) -> str:
+    """
+    run 1건의 입력을 나타내는 정규화 해시 (sha256 hex) — 같은 입력의 run 중복 판정용.
+
+    (pipeline_version_id, resolved_input_versions, transform_config, input_file_fingerprints)
+    를 키 정렬 JSON 으로 직렬화한다. transform_config 는 PipelineConfig 로 검증 후 다시 덤프해
+    기본값 생략 / 키 순서 차이를 없앤다.
+
+    input_file_fingerprints 는 {split_id: 입력 버전의 annotation / 메타 파일 (이름, 크기,
+    mtime_ns) 목록}. 메타 파일 교체처럼 버전 번호는 그대로인 채 입력 내용이 바뀌면 해시도 바뀐다.
+    """
+    canonical_config = PipelineConfig.model_validate(transform_config).model_dump(mode="json")
+    canonical_json = json.dumps(
+        {
+            "pipeline_version_id": pipeline_version_id,
+            "resolved_input_versions": resolved_input_versions,
+            "transform_config": canonical_config,
+            "input_file_fingerprints": input_file_fingerprints,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
 def load_pipeline_config_from_yaml(yaml_path: str | Path) -> PipelineConfig:
     """
     YAML 파일을 읽어서 PipelineConfig로 파싱.
@@ -0,0 +1,147 @@
+"""
+파이프라인 실행 비용 추정 (dry-run) — 이미지를 한 장도 쓰지 않고 출력 규모를 미리 본다.
+
+PipelineDagExecutor.estimate() 가 Phase A(annotation 처리)만 실행해 출력별 DatasetPlan 을 만들면,
+여기서 ImagePlan 을 훑어 이미지 수 / 복사할 바이트 수 / 디코드·인코드가 필요한 이미지 수
+(누적된 image_manipulation_specs) / 소스가 없어 건너뛸 이미지 수를 센다.
+
+파일 크기는 이미지마다 stat 하지 않고 소스 디렉토리를 한 번씩 scandir 해서 얻는다.
+큰 source 는 레코드를 일정 간격으로 표본 추출해 Phase A 를 돌릴 수 있는데, 이때 모든 값은
+(전체 source 이미지 수 / 표본 이미지 수) 비율로 확대한 추정치다.
+샘플링·병합처럼 레코드 수에 따라 결과가 달라지는 태스크가 있으면 오차가 커진다.
+"""
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from lib.pipeline.pipeline_data_models import DatasetPlan
+from lib.pipeline.storage_protocol import StorageProtocol
+
+
+@dataclass
+class OutputCostEstimate:
+    """
+    출력 1개의 추정 비용.
+
+    attributes:
+        output_split: 출력 split (TRAIN / VAL / ...)
+        image_count: 출력 이미지 수 (소스가 없어 건너뛸 이미지 포함)
+        copy_only_count: 변환 없이 복사만 하는 이미지 수
+        transform_count: 디코드 → 변환 → 인코드가 필요한 이미지 수
+        transform_operations: 변환 operation 별 적용 횟수 (이미지 1장에 여러 번 쌓일 수 있다)
+        bytes_to_copy: 읽어서 써야 할 소스 이미지 바이트 수
+        missing_image_count: 소스 파일이 없어 실체화 단계에서 건너뛸 이미지 수
+    """
+    output_split: str
+    image_count: int = 0
+    copy_only_count: int = 0
+    transform_count: int = 0
+    transform_operations: dict[str, int] = field(default_factory=dict)
+    bytes_to_copy: int = 0
+    missing_image_count: int = 0
+
+
+@dataclass
+class PipelineCostEstimate:
+    """
+    run 1회의 추정 비용 (기본 출력이 outputs[0], 이후 config.extra_outputs 순서).
+
+    attributes:
+        source_image_count: 참조하는 source 의 전체 이미지 수
+        sampled_source_image_count: Phase A 에 실제로 넣은 source 이미지 수
+    """
+    outputs: list[OutputCostEstimate]
+    source_image_count: int
+    sampled_source_image_count: int
+
+    @property
+    def is_sampled(self) -> bool:
+        return self.sampled_source_image_count < self.source_image_count
+
+    @property
+    def total_images(self) -> int:
+        return sum(output.image_count for output in self.outputs)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(output.bytes_to_copy for output in self.outputs)
+
+    @property
+    def total_transforms(self) -> int:
+        return sum(output.transform_count for output in self.outputs)
+
+
+class FileSizeIndex:
+    """디렉토리 단위로 한 번만 scandir 해 파일 크기를 돌려준다 (이미지마다 stat 하지 않음)."""
+
+    def __init__(self) -> None:
+        self._sizes_by_dir: dict[Path, dict[str, int]] = {}
+
+    def size_of(self, path: Path) -> int | None:
+        """파일 크기. 없으면 None."""
+        directory_sizes = self._sizes_by_dir.get(path.parent)
+        if directory_sizes is None:
+            directory_sizes = self._scan(path.parent)
+            self._sizes_by_dir[path.parent] = directory_sizes
+        return directory_sizes.get(path.name)
+
+    @staticmethod
+    def _scan(directory: Path) -> dict[str, int]:
+        sizes: dict[str, int] = {}
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return sizes
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    sizes[entry.name] = entry.stat().st_size
+            except OSError:
+                continue
+        return sizes
+
+
+def estimate_dataset_plan(
+    storage: StorageProtocol,
+    dataset_plan: DatasetPlan,
+    output_split: str,
+    file_sizes: FileSizeIndex,
+    scale: float = 1.0,
+) -> OutputCostEstimate:
+    """
+    DatasetPlan 의 ImagePlan 을 훑어 출력 1개의 비용을 센다.
+
+    scale: 표본으로 돌린 Phase A 를 전체 규모로 확대하는 비율 (표본이 아니면 1.0).
+    """
+    image_count = copy_only_count = missing_image_count = 0
+    bytes_to_copy = 0
+    transform_operations: dict[str, int] = {}
+    for image_plan in dataset_plan.image_plans:
+        image_count += 1
+        source_size = file_sizes.size_of(storage.resolve_path(image_plan.src_uri))
+        if source_size is None:
+            missing_image_count += 1
+            continue
+        bytes_to_copy += source_size
+        if image_plan.is_copy_only:
+            copy_only_count += 1
+            continue
+        for spec in image_plan.specs:
+            transform_operations[spec.operation] = transform_operations.get(spec.operation, 0) + 1
+
+    def _scaled(value: int) -> int:
+        return round(value * scale)
+
+    return OutputCostEstimate(
+        output_split=output_split,
+        image_count=_scaled(image_count),
+        copy_only_count=_scaled(copy_only_count),
+        transform_count=_scaled(image_count - copy_only_count - missing_image_count),
+        transform_operations={
+            operation: _scaled(count) for operation, count in transform_operations.items()
+        },
+        bytes_to_copy=_scaled(bytes_to_copy),
+        missing_image_count=_scaled(missing_image_count),
+    )
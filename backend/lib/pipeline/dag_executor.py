@@ -10,12 +10,96 @@ manipulator를 적용하고 DatasetMeta를 출력한다.
   - 디스크 포맷(COCO/YOLO)은 로드 시 파라미터로 전달, 저장 시 config.output.annotation_format으로 결정.
 
 실행 흐름:
+    0. DAG 최적화 (dag_optimizer) — dead branch 제거 + 중복 태스크 공유 + 필터 선행 이동,
+       계획은 processing.log 에 기록
     1. topological sort로 실행 순서 결정
+       + 참조된 distinct source 를 1회씩 선행 로드 (source_load_workers 로 병렬 파싱)
     2. 태스크별 실행:
-       a. inputs 해석 (source: → 파일 로드, 태스크명 → 이전 결과 참조)
+       a. inputs 해석 (source: → 선행 로드분 공유, 태스크명 → 이전 결과 참조)
        b. 다중 입력이면 merge
        c. operator(manipulator) 적용
     3. 최종 태스크의 DatasetMeta로 이미지 실체화 + annotation 작성
+       (추가 출력(extra_outputs)이 있으면 출력마다 따로 — 추가 출력 먼저, 기본 출력 마지막)
+
+Multi-output (config.extra_outputs):
+    출력 태스크가 여럿이어도 DAG 는 한 번만 실행하므로 공통 상류 태스크는 1회 계산된다.
+    출력 태스크의 결과는 fusion 체인 / streamed tail / 병합 중 필터에 흡수되지 않고 보존되며,
+    출력마다 자기 상류의 source 만으로 이미지 경로와 lineage(source_dataset_ids)를 정한다.
+
+병렬 실행 (execution_mode="thread" | "process"):
+    config.execution_levels() 로 태스크를 의존 깊이별로 묶고, 같은 level 의
+    독립 분기(예: source 별 filter → remap → rotate)를 pool 에서 동시에 실행한다.
+    출력은 직렬 실행과 동일하다.
+
+Operator fusion (fuse_record_operators=True, 기본):
+    supports_record_fusion manipulator(필터/이름 변경/회전 등 레코드별 독립 변환)가
+    단일 입력·단일 소비자로 일렬로 이어진 구간을 하나의 작업 단위로 묶어,
+    image_records 를 레코드당 1회만 순회한다 (중간 레코드 리스트를 만들지 않음).
+    진행 콜백(RUNNING/DONE)과 input_images/output_images 는 태스크별로 그대로 보고된다.
+
+Streaming 실행 (stream_records=True, COCO/YOLO 출력):
+    최종 출력까지 이어지는 per-record 태스크 구간(streamed tail)은 Phase A 에서 계산하지 않고,
+    Phase B 가 레코드를 하나씩 당겨 간다 — 레코드마다 변환 → ImagePlan → 이미지 실체화 →
+    annotation 기록. 출력 레코드 리스트 / ImagePlan 리스트 / COCO 배열을 만들지 않는다.
+    샘플링·병합처럼 전체 레코드를 봐야 하는 태스크는 pipeline breaker 로서 기존처럼
+    결과를 모두 만든 뒤 tail 에 넘긴다. 출력은 stream_records=False 와 동일하다.
+
+중간 결과 보존 (liveness):
+    태스크 결과는 마지막 소비 태스크가 꺼내 가면 바로 보관소에서 뺀다 (최종 태스크 제외,
+    retain_task_results=True 면 모두 보존). spill_dir 을 주면 한참 뒤 level 에서야 쓰이는
+    결과는 디스크(pickle)에 내려 두었다가 소비 시 다시 읽는다.
+    태스크 DONE 콜백에 현재 RSS(rss_mb), 이미지 실체화 DONE 에 run 최대 RSS(peak_rss_mb)를 싣는다.
+
+run 간 memoization (task_result_cache):
+    태스크마다 (operator, params, manipulator 코드 버전, 입력 fingerprint) 로 캐시 키를 만들고
+    (task_result_cache 모듈 참고), 작업 단위를 계산하기 전에 캐시에서 가장 긴 prefix 를 찾는다.
+    fusion 체인은 마지막 태스크 결과만 저장한다 (중간 레코드 리스트가 없으므로).
+    streamed tail 과 결정적이지 않은 태스크(및 그 하류)는 캐시하지 않는다.
+    태스크 DONE 에 cache("hit" | "miss"), 이미지 실체화 DONE 에 run 의 cache_hits / cache_misses.
+
+증분 재실행 (run(incremental_base_uri=...)):
+    source 1개에 레코드별 변환만 이어진 파이프라인은 출력 루트에 증분 상태(fingerprint +
+    source 버전)를 남긴다. 다음 run 에 이전 출력 경로를 주면 이전 / 현재 source 레코드를 비교해
+    변경 없는 레코드의 이미지는 이전 출력 파일을 hardlink 한다 (incremental 모듈 참고).
+    annotation 은 전체를 다시 쓰므로 출력은 전체 재실행과 같다.
+    이미지 실체화 DONE 에 재사용 이미지 수(reused)를 싣는다.
+
+checkpoint / 이어서 실행 (checkpoint=True, run(resume=True)):
+    기본 출력 디렉토리의 .checkpoint/ 에 Phase A 결과(출력별 최종 DatasetMeta)와 이미지 실체화
+    journal 을 남긴다 (run_checkpoint 모듈 참고). 실패/중단된 run 을 resume=True 로 다시 실행하면
+    Phase A 를 건너뛰고, journal 에 있고 크기가 같은 이미지는 다시 만들지 않는다.
+    checkpoint 를 남기는 run 은 streamed tail 을 쓰지 않는다 (최종 레코드를 저장해야 하므로).
+    run 이 성공하면 checkpoint 를 지운다.
+
+비용 추정 (estimate(), plan only):
+    Phase A 만 실행해 출력별 DatasetPlan 을 만들고 ImageMaterializer 없이 이미지 수 / 복사 바이트 /
+    디코드·인코드 이미지 수를 센다 (cost_estimate 모듈 참고). 큰 source 는 표본으로 돌릴 수 있다.
+
+단계 계측 (instrumentation 모듈):
+    source 로드 / DAG 최적화·ImagePlan 생성 / 작업 단위(fusion 체인은 체인 전체) / 이미지 실체화 /
+    annotation 작성마다 wall·CPU 시간, RSS, 레코드·annotation 수를 잰다.
+    run 의 모든 단계를 기본 출력의 이미지 실체화 DONE(detail["stages"])과 processing.log 의
+    [단계별 성능] 에 싣고, instrumentation_hooks 에도 단계마다 넘긴다.
+    기본 출력 디렉토리에는 phase / 태스크별 시간, 실체화 처리량(images/s, MB/s), 변환 횟수,
+    캐시 hit 비율을 담은 perf.json 도 쓴다 (perf_report 모듈, PipelineResult.perf_report).
+
+없는 소스 이미지 (index_source_images=True, source_image_index 모듈):
+    source 를 로드할 때 images 디렉토리를 scandir 1회로 훑어 인덱스를 source DatasetMeta 에 붙이고,
+    이미지 파일이 없는 레코드는 manipulator 적용 전에 뺀다. 뺀 파일명은 그 source 를 쓰는 출력마다
+    skipped 로 보고한다. Phase B 는 이미지마다 존재 여부를 stat 하지 않는다.
+
+passthrough 복제 (clone_passthrough=True):
+    tasks 가 없고 출력 포맷이 source 포맷과 같으면 source 버전 디렉토리를 복제한다 —
+    annotation / 메타 파일은 바이트 그대로 복사하고 이미지는 hardlink 한다 (안 되면 복사).
+    수치(이미지 수 / 클래스)는 source 파싱 결과 캐시에서 읽고,
+    PipelineResult.cloned_source_dataset_id 로 표시해 앱이 출력 캐시를 파싱 없이 기록하게 한다.
+    복제 전에 images 디렉토리 인덱스로 레코드의 이미지 파일과 디렉토리 파일이 정확히 같은지
+    확인하고, 없는 이미지나 레코드 없는 파일이 있으면 일반 실체화 경로로 돌아간다.
+
+상세 실행 로그 (processing_log 모듈):
+    run 동안 "lib" logger 로그를 기본 출력 디렉토리의 spool 파일에 바로 쓰고 (크기 상한 / 회전),
+    출력마다 processing.log 를 쓸 때 헤더 / 요약 뒤에 이어 붙인다. run 이 성공하면 spool 을 지우고,
+    실패하면 출력 디렉토리에 남긴다.
 
 이 모듈은 app/ 레이어에 의존하지 않는다.
 StorageProtocol을 통해 스토리지 접근을 추상화한다.
@@ -23,28 +107,98 @@ StorageProtocol을 통해 스토리지 접근을 추상화한다.
 from __future__ import annotations
 
 import logging
-import uuid
-from datetime import datetime, timezone
-from typing import Any, Callable
+import pickle
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal
 
 from lib.manipulators import MANIPULATOR_REGISTRY
 from lib.pipeline.config import (
     SOURCE_TYPE_VERSION,
+    OutputConfig,
     PipelineConfig,
     TaskConfig,
     parse_source_ref,
 )
-from lib.pipeline.image_materializer import ImageMaterializer
-from lib.pipeline.io.coco_io import parse_coco_json, write_coco_json
+from lib.pipeline.cost_estimate import (
+    FileSizeIndex,
+    PipelineCostEstimate,
+    estimate_dataset_plan,
+)
+from lib.pipeline.dag_optimizer import OptimizedPipelinePlan, optimize_pipeline_config
+from lib.pipeline.image_blob_store import IMAGE_REFS_FILENAME, ImageBlobStore
+from lib.pipeline.image_materializer import (
+    DEFAULT_MATERIALIZE_BUFFER_BYTES,
+    ImageMaterializer,
+    LinkStrategy,
+    MaterializeResult,
+    TransformPoolMode,
+)
+from lib.pipeline.incremental import (
+    IncrementalReusePlan,
+    diff_source_records,
+    incremental_fingerprint,
+    read_incremental_state,
+    scan_image_files,
+    write_incremental_state,
+)
+from lib.pipeline.instrumentation import (
+    STAGE_ANNOTATION_WRITE,
+    STAGE_MATERIALIZE,
+    STAGE_PLAN,
+    STAGE_SOURCE_LOAD,
+    STAGE_TASK,
+    InstrumentationHook,
+    StageMetrics,
+    StageMetricsCollector,
+    format_stage_summary,
+    measure_stage,
+)
+from lib.pipeline.io.coco_io import CocoJsonStreamWriter, parse_coco_json, write_coco_json
 from lib.pipeline.io.manifest_io import parse_manifest_dir, write_manifest_dir
-from lib.pipeline.io.yolo_io import parse_yolo_dir, write_yolo_dir
+from lib.pipeline.io.meta_cache import build_meta_cache_key, read_meta_cache, write_meta_cache
+from lib.pipeline.io.yolo_io import YoloLabelStreamWriter, parse_yolo_dir, write_yolo_dir
+from lib.pipeline.manipulator_base import RecordTransform
+from lib.pipeline.memory_usage import RunPeakRss, bytes_to_mb
+from lib.pipeline.perf_report import RunPerfTracker, write_perf_report
 from lib.pipeline.pipeline_data_models import (
-    Annotation, DatasetMeta, DatasetPlan, ImageManipulationSpec, ImagePlan, ImageRecord,
+    DatasetMeta,
+    DatasetPlan,
+    ImageManipulationSpec,
+    ImagePlan,
+    ImageRecord,
+    derive_dataset_meta,
+)
+from lib.pipeline.processing_log import (
+    DEFAULT_PROCESSING_LOG_MAX_BYTES,
+    PROCESSING_LOG_FILENAME,
+    PROCESSING_LOG_SPOOL_FILENAME,
+    ProcessingLogSpoolHandler,
+)
+from lib.pipeline.run_checkpoint import (
+    MaterializeJournal,
+    PhaseACheckpoint,
+    RunCheckpoint,
+    build_checkpoint_key,
 )
+from lib.pipeline.source_image_index import build_source_image_index, prune_missing_images
 from lib.pipeline.storage_protocol import StorageProtocol
+from lib.pipeline.task_result_cache import TaskResultCache, build_task_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Phase A 태스크 실행 방식 (PipelineDagExecutor.execution_mode)
+ExecutionMode = Literal["serial", "thread", "process"]
+_VALID_EXECUTION_MODES = ("serial", "thread", "process")
+# stream_records=True 일 때 Phase B 를 레코드 단위로 흘려 쓸 수 있는 출력 포맷.
+# CLS_MANIFEST 는 실행 후 head/class 별 이미지 수를 output_meta.image_records 로 집계하므로 제외.
+_STREAMABLE_OUTPUT_FORMATS = ("COCO", "YOLO")
+
 
 class PipelineDagExecutor:
     """
@@ -56,12 +210,61 @@ class PipelineDagExecutor:
     Args:
         storage: StorageProtocol 구현체 (경로 해석, 파일 존재 확인 등)
         images_dirname: 이미지 서브디렉토리 이름 (기본: "images")
+        execution_mode: Phase A 태스크 실행 방식.
+            "serial"  — topological 순서로 하나씩 (기본)
+            "thread"  — 같은 level 의 독립 태스크를 thread pool 에서 동시 실행
+            "process" — 같은 level 의 독립 태스크를 process pool 에서 동시 실행
+                        (Celery prefork worker 는 daemon 이라 자식 프로세스를 만들 수 없다
+                        → thread 사용)
+        max_workers: 병렬 모드 pool 크기. None 이면 concurrent.futures 기본값.
+        source_load_workers: source annotation 선행 로드(prefetch) thread 수.
+            1 이면 호출 스레드에서 순차 로드한다.
+        fuse_record_operators: 연속된 per-record 태스크를 1회 순회로 합쳐 실행할지 여부.
+        push_down_filters: 필터를 이미지 변환 앞 / 병합 안으로 옮겨 실행할지 여부 (출력은 동일).
+        stream_records: 최종 per-record 구간과 Phase B 를 레코드 단위 streaming 으로 실행할지 여부.
+            COCO/YOLO 출력에만 적용된다 (출력은 동일). 이 경우 PipelineResult.output_meta 는
+            streamed tail 이 있으면 image_records 를 담지 않는다.
+        retain_task_results: True 면 중간 태스크 결과를 run 끝까지 보존한다 (checkpoint 등).
+            False(기본)면 마지막 소비 태스크가 꺼내 간 결과는 바로 놓아준다.
+        spill_dir: 주어지면 다음 소비가 spill_level_gap level 보다 뒤인 중간 결과를
+            이 디렉토리 아래 run 별 임시 디렉토리에 pickle 로 내려 둔다.
+            None 이면 spill 하지 않는다.
+        spill_level_gap: spill 판단 기준 level 차이.
+        task_result_cache: 주어지면 태스크 결과를 run 간에 재사용한다 (memoization).
+            None 이면 캐시하지 않는다.
+        checkpoint: True 면 기본 출력 디렉토리에 Phase A 결과와 이미지 실체화 journal 을 남겨
+            실패한 run 을 run(resume=True) 로 이어서 실행할 수 있게 한다.
+        instrumentation_hooks: 단계 계측값(StageMetrics)을 받을 hook 목록.
+            내장 수집기(task_progress / processing.log)와 별개로 단계마다 불린다.
+        processing_log_max_bytes: processing.log 상세 실행 로그 spool 크기 상한 (0 이면 상한 없음).
+        index_source_images: True 면 source 로드 시 images 디렉토리를 한 번 훑어 이미지 파일이
+            없는 레코드를 manipulator 적용 전에 뺀다 (Phase B 는 이미지마다 존재 확인을 하지 않음).
+        clone_passthrough: True 면 출력 포맷이 source 포맷과 같은 passthrough 를 source 버전
+            디렉토리 복제로 실행한다 (annotation 재파싱 / 재작성 없음, 이미지는 hardlink).
+            _describe_source 가 SourceDescriptor 를 주는 source 에만 적용된다.
+        materialize_io_workers: Phase B 에서 복사/hardlink 이미지를 실체화할 thread 수.
+        materialize_transform_workers: Phase B 에서 변환 이미지를 실체화할 worker 수
+            (None 이면 CPU 코어 수). 두 값이 모두 1 이면 이미지를 순차 실체화한다.
+            streaming 실행(stream_records)의 Phase B 는 레코드 순서대로 순차 실체화한다.
+        materialize_transform_pool: 변환 worker 방식 — "process" | "thread"
+            (daemon 프로세스에서는 "process" 여도 thread).
+        materialize_link_strategy: 변환 없이 복사만 하는 이미지를 배치할 첫 방식 —
+            "hardlink" | "reflink" | "copy_file_range" | "copy"(기본). 실패하면 뒤의 방식으로
+            넘어가며, 실제로 쓴 방식과 대체 횟수는 MaterializeResult / processing.log 에 남는다.
+        materialize_buffer_bytes: 병렬 실체화에서 읽기 → 변환 → 쓰기 단계 사이에 들고 있을
+            변환 이미지 바이트 상한 (넘으면 새 이미지를 읽지 않고 기다린다).
+        image_blob_store: content-addressed 이미지 저장소.
+            주어지면 출력 이미지를 blob 의 hardlink 로 배치하고 출력 버전의 참조 목록
+            (.image_refs)과 저장소의 소스 digest 색인을 남긴다 (소스 버전 디렉토리는
+            바꾸지 않는다). None 이면 쓰지 않는다.
     """
 
     # 태스크 진행 콜백 시그니처:
     #   (task_name, status, detail_dict) -> None
-    #   status: "PENDING" | "RUNNING" | "DONE" | "FAILED"
+    #   status: "PENDING" | "RUNNING" | "DONE" | "FAILED" | "SKIPPED"
+    #   SKIPPED: DAG 최적화로 실행하지 않는 태스크 (detail["skip_reason"] == "dead_branch")
     #   detail_dict: {"operator": str, "started_at": str, "finished_at": str, "input_images": int, "output_images": int, ...}
+    #   병렬 모드에서도 콜백은 항상 run() 을 호출한 스레드에서 불린다.
     TaskProgressCallback = Callable[[str, str, dict[str, Any]], None]
 
     def __init__(
@@ -69,15 +272,79 @@ class PipelineDagExecutor:
         storage: StorageProtocol,
         images_dirname: str = "images",
         on_task_progress: TaskProgressCallback | None = None,
+        execution_mode: ExecutionMode = "serial",
+        max_workers: int | None = None,
+        source_load_workers: int = 4,
+        fuse_record_operators: bool = True,
+        push_down_filters: bool = True,
+        stream_records: bool = False,
+        retain_task_results: bool = False,
+        spill_dir: str | Path | None = None,
+        spill_level_gap: int = 2,
+        task_result_cache: TaskResultCache | None = None,
+        checkpoint: bool = False,
+        instrumentation_hooks: Iterable[InstrumentationHook] = (),
+        processing_log_max_bytes: int = DEFAULT_PROCESSING_LOG_MAX_BYTES,
+        index_source_images: bool = True,
+        clone_passthrough: bool = True,
+        materialize_io_workers: int = 1,
+        materialize_transform_workers: int | None = 1,
+        materialize_transform_pool: TransformPoolMode = "process",
+        materialize_link_strategy: LinkStrategy = "copy",
+        materialize_buffer_bytes: int = DEFAULT_MATERIALIZE_BUFFER_BYTES,
+        image_blob_store: ImageBlobStore | None = None,
     ) -> None:
+        if execution_mode not in _VALID_EXECUTION_MODES:
+            raise ValueError(
+                f"지원하지 않는 execution_mode: {execution_mode!r}. "
+                f"유효: {_VALID_EXECUTION_MODES}"
+            )
         self.storage = storage
         self.images_dirname = images_dirname
         self._on_task_progress = on_task_progress
+        self.execution_mode = execution_mode
+        self.max_workers = max_workers
+        self.source_load_workers = max(1, source_load_workers)
+        self.fuse_record_operators = fuse_record_operators
+        self.push_down_filters = push_down_filters
+        self.stream_records = stream_records
+        self.retain_task_results = retain_task_results
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.spill_level_gap = max(0, spill_level_gap)
+        self.task_result_cache = task_result_cache
+        self.checkpoint = checkpoint
+        self.instrumentation_hooks = list(instrumentation_hooks)
+        self.processing_log_max_bytes = processing_log_max_bytes
+        self.index_source_images = index_source_images
+        self.clone_passthrough = clone_passthrough
+        self.materialize_io_workers = materialize_io_workers
+        self.materialize_transform_workers = materialize_transform_workers
+        self.materialize_transform_pool = materialize_transform_pool
+        self.materialize_link_strategy = materialize_link_strategy
+        self.materialize_buffer_bytes = materialize_buffer_bytes
+        self.image_blob_store = image_blob_store
+        # run() 동안만 설정된다 (태스크 DONE 마다 RSS 표본 기록)
+        self._run_peak_rss: RunPeakRss | None = None
+        # run() 동안만 설정된다 (캐시 hit / miss 태스크 수)
+        self._run_cache_counts: dict[str, int] | None = None
+        # run() 동안만 설정된다 (증분 재실행의 이전 출력 이미지 재사용 계획)
+        self._incremental_reuse: IncrementalReusePlan | None = None
+        # run() 동안만 설정된다 (checkpoint 의 이미지 실체화 journal)
+        self._run_journal: MaterializeJournal | None = None
+        # run() 동안만 설정된다 (단계별 계측값)
+        self._run_stage_metrics: StageMetricsCollector | None = None
+        # run() 동안만 설정된다 (perf.json 용 phase 경계 / 출력별 실체화 성능)
+        self._run_perf: RunPerfTracker | None = None
+        # run() 동안만 설정된다 (source dataset_id → 로드 시 이미지 파일이 없어 뺀 파일명)
+        self._run_missing_images: dict[str, list[str]] | None = None
 
     def run(
         self,
         config: PipelineConfig,
         target_version: str = "v1.0.0",
+        extra_target_versions: list[str] | None = None,
+        incremental_base_uri: str | None = None,
+        resume: bool = False,
     ) -> PipelineResult:
         """
         파이프라인 전체 실행.
@@ -85,32 +352,185 @@ class PipelineDagExecutor:
         Args:
             config: DAG 기반 파이프라인 설정
             target_version: 출력 데이터셋 버전. 서비스 레이어에서 자동 생성된 값을 전달한다.
+            extra_target_versions: 추가 출력(config.extra_outputs)별 버전 (같은 순서).
+                None 이면 모두 target_version 을 쓴다.
+            incremental_base_uri: 이전 run 출력의 storage_uri. 주어지면 변경 없는 레코드의 이미지를
+                그 출력에서 재사용한다. 증분 실행할 수 없으면(구성 변경 등) 전체 실행한다.
+            resume: True 면 같은 config / 버전으로 실패했던 run 의 checkpoint 에서 이어서 실행한다.
+                checkpoint 가 없거나 다른 run 의 것이면 처음부터 실행한다.
+                이 run 도 checkpoint 를 남긴다.
 
         Returns:
-            PipelineResult: 실행 결과
+            PipelineResult: 실행 결과 (추가 출력 결과는 extra_results)
         """
-        # ── 파일 로그 수집기 설정 ──
-        log_buffer_handler = _ProcessingLogBufferHandler()
-        log_buffer_handler.setFormatter(
+        if (
+            extra_target_versions is not None
+            and len(extra_target_versions) != len(config.extra_outputs)
+        ):
+            raise ValueError(
+                f"extra_target_versions 개수({len(extra_target_versions)})가 "
+                f"extra_outputs 개수({len(config.extra_outputs)})와 다릅니다."
+            )
+        primary_output_uri = self.storage.build_dataset_uri(
+            dataset_type=config.output.dataset_type.upper(),
+            name=config.name,
+            split=config.output.split.upper(),
+            version=target_version,
+        )
+        # ── 파일 로그 수집기 설정 (기본 출력 디렉토리의 spool 에 바로 쓴다) ──
+        self.storage.makedirs(primary_output_uri)
+        log_handler = ProcessingLogSpoolHandler(
+            self.storage.resolve_path(primary_output_uri) / PROCESSING_LOG_SPOOL_FILENAME,
+            max_bytes=self.processing_log_max_bytes,
+            append=resume,
+        )
+        log_handler.setFormatter(
             logging.Formatter("%(asctime)s [%(levelname)s] %(name)s — %(message)s")
         )
         pipeline_root_logger = logging.getLogger("lib")
-        pipeline_root_logger.addHandler(log_buffer_handler)
+        pipeline_root_logger.addHandler(log_handler)
+        self._run_peak_rss = RunPeakRss()
+        self._run_cache_counts = {"hits": 0, "misses": 0}
+        self._run_stage_metrics = StageMetricsCollector()
+        self._run_perf = RunPerfTracker()
+        self._run_missing_images = {}
+        extra_target_versions = (
+            extra_target_versions or [target_version] * len(config.extra_outputs)
+        )
+        run_checkpoint: RunCheckpoint | None = None
+        if self.checkpoint or resume:
+            run_checkpoint = RunCheckpoint(
+                self.storage,
+                primary_output_uri,
+                build_checkpoint_key(
+                    config.model_dump(), target_version, extra_target_versions,
+                    self.images_dirname,
+                ),
+            )
+            self._run_journal = run_checkpoint.open_journal(resume)
 
         try:
-            return self._run_pipeline(
-                config, target_version, log_buffer_handler, pipeline_root_logger,
+            result = self._run_pipeline(
+                config, target_version, log_handler, pipeline_root_logger,
+                extra_target_versions, incremental_base_uri,
+                run_checkpoint, resume,
             )
         finally:
-            pipeline_root_logger.removeHandler(log_buffer_handler)
+            pipeline_root_logger.removeHandler(log_handler)
+            # 실패하면 spool 을 출력 디렉토리에 남긴다 (원인 확인 / resume 시 이어 쓰기)
+            log_handler.close()
+            self._run_peak_rss = None
+            self._run_cache_counts = None
+            self._run_stage_metrics = None
+            self._run_perf = None
+            self._run_missing_images = None
+            self._incremental_reuse = None
+            if self._run_journal is not None:
+                self._run_journal.close()
+                self._run_journal = None
+        log_handler.discard()
+        if run_checkpoint is not None:
+            run_checkpoint.clear()
+        return result
+
+    def estimate(
+        self,
+        config: PipelineConfig,
+        target_version: str = "v1.0.0",
+        extra_target_versions: list[str] | None = None,
+        max_source_images: int | None = None,
+    ) -> PipelineCostEstimate:
+        """
+        plan only (dry-run): Phase A 만 실행해 출력별 DatasetPlan 을 만들고 비용을 추정한다.
+
+        ImageMaterializer 를 쓰지 않고 출력 디렉토리도 만들지 않는다 (cost_estimate 모듈 참고).
+        표본 결과가 섞이지 않도록 태스크 결과 캐시는 읽지도 쓰지도 않는다.
+
+        Args:
+            config: DAG 기반 파이프라인 설정
+            target_version / extra_target_versions: run() 과 같다 (출력 경로 계산용)
+            max_source_images: source 이미지 수가 이보다 많으면 일정 간격으로 표본 추출해
+                Phase A 를 돌리고 결과를 비율로 확대한다. None 이면 전체 레코드를 쓴다.
+
+        Returns:
+            PipelineCostEstimate (기본 출력이 outputs[0])
+        """
+        extra_target_versions = (
+            extra_target_versions or [target_version] * len(config.extra_outputs)
+        )
+        if config.is_passthrough:
+            source_meta = self._load_indexed_source(
+                self._load_source_meta, config.passthrough_source_dataset_id,
+            )
+            source_image_count = source_meta.image_count
+            output_meta = _sample_records(source_meta, max_source_images)
+            sampled_source_image_count = output_meta.image_count
+            phase_a_result = PhaseACheckpoint(
+                output_meta=output_meta, source_storage_uris=[source_meta.storage_uri],
+            )
+        else:
+            plan = optimize_pipeline_config(config, push_down_filters=self.push_down_filters)
+            config = plan.config
+            source_pool = self._prefetch_source_metas(config, plan.computed_task_names)
+            source_image_count, sampled_source_image_count = source_pool.sample(
+                max_source_images,
+            )
+            phase_a_result, _ = self._compute_phase_a(
+                config, plan, source_pool, {}, allow_streamed_tail=False,
+            )
+
+        scale = (
+            source_image_count / sampled_source_image_count if sampled_source_image_count else 1.0
+        )
+        file_sizes = FileSizeIndex()
+        output_estimates = []
+        for output_config, version, output_meta, source_storage_uris in zip(
+            [config.output] + [extra_output.output for extra_output in config.extra_outputs],
+            [target_version] + extra_target_versions,
+            [phase_a_result.output_meta] + phase_a_result.extra_output_metas,
+            [phase_a_result.source_storage_uris] + phase_a_result.extra_source_storage_uris,
+            strict=True,
+        ):
+            output_storage_uri = self.storage.build_dataset_uri(
+                dataset_type=output_config.dataset_type.upper(),
+                name=config.name,
+                split=output_config.split.upper(),
+                version=version,
+            )
+            dataset_plan = DatasetPlan(
+                output_meta=output_meta,
+                image_plans=self._build_image_plans(
+                    output_meta, source_storage_uris, output_storage_uri,
+                ),
+            )
+            output_estimates.append(estimate_dataset_plan(
+                self.storage, dataset_plan, output_config.split.upper(), file_sizes, scale,
+            ))
+
+        estimate = PipelineCostEstimate(
+            outputs=output_estimates,
+            source_image_count=source_image_count,
+            sampled_source_image_count=sampled_source_image_count,
+        )
+        logger.info(
+            "비용 추정 (dry-run): name=%s, images=%d, bytes=%d, transforms=%d, "
+            "source_images=%d (표본 %d)",
+            config.name, estimate.total_images, estimate.total_bytes, estimate.total_transforms,
+            source_image_count, sampled_source_image_count,
+        )
+        return estimate
 
     def _run_pipeline(
         self,
         config: PipelineConfig,
         target_version: str,
-        log_buffer_handler: '_ProcessingLogBufferHandler',
+        log_handler: ProcessingLogSpoolHandler,
         pipeline_root_logger: logging.Logger,
-    ) -> 'PipelineResult':
+        extra_target_versions: list[str],
+        incremental_base_uri: str | None = None,
+        run_checkpoint: RunCheckpoint | None = None,
+        resume: bool = False,
+    ) -> PipelineResult:
         """파이프라인 실제 실행 로직. run()에서 호출된다."""
         logger.info(
             "파이프라인 실행 시작: name=%s, tasks=%d, passthrough=%s",
@@ -120,19 +540,99 @@ class PipelineDagExecutor:
         # ── Passthrough 모드: tasks 가 비어있으면 소스를 그대로 output 으로 복사 ──
         if config.is_passthrough:
             return self._run_passthrough(
-                config, target_version, log_buffer_handler,
+                config, target_version, log_handler,
             )
 
-        execution_order = config.topological_order()
-        terminal_task_name = config.get_terminal_task_name()
+        # ── DAG 최적화: 최종 출력에 도달하지 않는 분기 제거 + 중복 태스크 공유 + 필터 선행 이동 ──
+        with measure_stage(STAGE_PLAN, "dag_optimize") as plan_metrics:
+            plan = optimize_pipeline_config(config, push_down_filters=self.push_down_filters)
+        self._record_stage(plan_metrics)
+        for plan_line in plan.describe():
+            logger.info(plan_line)
+        self._notify_removed_tasks(config, plan)
+        config = plan.config
+        execution_order = plan.execution_order
+
+        # 출력 루트에 남길 증분 재실행 fingerprint (증분 실행할 수 없는 구성이면 None)
+        fingerprint = incremental_fingerprint(config, self.images_dirname)
+
+        # ── 이어서 실행: Phase A checkpoint 가 있으면 태스크를 다시 계산하지 않는다 ──
+        phase_a_checkpoint = (
+            run_checkpoint.load_phase_a() if run_checkpoint is not None and resume else None
+        )
+        if phase_a_checkpoint is not None:
+            self._run_missing_images = dict(phase_a_checkpoint.missing_source_images)
+            logger.info(
+                "checkpoint 에서 이어서 실행: Phase A 생략 (images=%d), 실체화 완료 기록=%d장",
+                phase_a_checkpoint.output_meta.image_count,
+                len(self._run_journal.completed) if self._run_journal else 0,
+            )
+            if self._on_task_progress:
+                for task_name in execution_order:
+                    self._on_task_progress(task_name, "DONE", {
+                        "operator": config.tasks[task_name].operator,
+                        "resumed": True,
+                    })
+            return self._materialize_outputs(
+                config, plan, target_version, extra_target_versions, log_handler,
+                phase_a_checkpoint, fingerprint,
+            )
+
+        # ── Phase A: DAG 태스크 실행 (annotation 처리) ──
+        # 같은 source 를 여러 태스크가 참조해도 파싱은 run 당 1회.
+        # 모든 distinct source 를 먼저 동시에 로드해 두고, 태스크끼리 공유한다 (copy-on-write).
+        source_pool = self._prefetch_source_metas(config, plan.computed_task_names)
+
+        # 증분 재실행: 이전 출력에서 변경 없는 이미지 재사용 계획
+        if incremental_base_uri is not None:
+            self._incremental_reuse = self._plan_incremental_reuse(
+                config, fingerprint, incremental_base_uri, source_pool,
+            )
+
+        # run 간 memoization: 태스크별 캐시 키 (캐시하지 않는 태스크는 None)
+        task_cache_keys: dict[str, str | None] = {}
+        if self.task_result_cache is not None:
+            task_cache_keys = self._build_task_cache_keys(
+                config, execution_order, plan.result_names, source_pool,
+            )
+
+        phase_a_result, record_stream = self._compute_phase_a(
+            config, plan, source_pool, task_cache_keys,
+            # checkpoint 를 남기는 run 은 최종 레코드를 저장해야 하므로 streamed tail 을 쓰지 않는다
+            allow_streamed_tail=run_checkpoint is None,
+        )
+        if run_checkpoint is not None:
+            run_checkpoint.save_phase_a(phase_a_result)
+
+        return self._materialize_outputs(
+            config, plan, target_version, extra_target_versions, log_handler,
+            phase_a_result, fingerprint, record_stream,
+        )
 
-        logger.info("실행 순서: %s", " → ".join(execution_order))
+    def _compute_phase_a(
+        self,
+        config: PipelineConfig,
+        plan: OptimizedPipelinePlan,
+        source_pool: _SourceMetaPool,
+        task_cache_keys: dict[str, str | None],
+        allow_streamed_tail: bool = True,
+    ) -> tuple[PhaseACheckpoint, Iterator[ImageRecord] | None]:
+        """
+        Phase A: 태스크를 실행해 출력별 최종 DatasetMeta 와 이미지 소스 경로를 만든다.
 
-        # ── Phase A: DAG 태스크 순차 실행 (annotation 처리) ──
-        # 태스크명 → 해당 태스크의 출력 DatasetMeta
-        task_results: dict[str, DatasetMeta] = {}
-        # 태스크별 source storage_uri 수집 (이미지 실체화용)
-        all_source_storage_uris: list[str] = []
+        streamed tail 이 있으면 기본 출력의 레코드는 두 번째 반환값(record_stream)으로 흘려보내고
+        PhaseACheckpoint.output_meta 에는 image_records 를 담지 않는다.
+        run() 과 estimate() 가 공유한다.
+        """
+        duplicate_of = plan.duplicate_of
+        result_names = plan.result_names
+        execution_order = plan.execution_order
+        terminal_task_name = plan.terminal_task_name
+        output_task_names = plan.output_task_names
+
+        # 태스크별 source storage_uri (이미지 실체화용).
+        # 병렬 모드에서도 직렬 실행과 같은 순서로 합치기 위해 태스크 단위로 보관한다.
+        source_storage_uris_by_task: dict[str, list[str]] = {}
 
         # 태스크 진행 콜백: 전체 태스크를 PENDING으로 초기화
         if self._on_task_progress:
@@ -142,114 +642,1340 @@ class PipelineDagExecutor:
                     "operator": task_config.operator,
                 })
 
-        for task_name in execution_order:
-            task_config = config.tasks[task_name]
-            task_started_at = datetime.now(timezone.utc).isoformat()
+        # per-record 태스크 체인: head 태스크명 → 체인 태스크명 목록
+        fused_chains = self._plan_fused_chains(
+            config, duplicate_of, plan.merge_filters, output_task_names,
+        )
+
+        # 출력 포맷은 config에서 결정 (통일포맷이므로 내부 모델에 포맷 정보 없음)
+        output_format = config.output.annotation_format.upper()
 
+        # streaming: 최종 출력까지 이어지는 per-record 구간은 Phase B 에서 레코드 단위로 계산한다
+        streamed_tail: list[str] = []
+        if self._streams_output(output_format) and allow_streamed_tail:
+            streamed_tail = self._plan_streamed_tail(
+                config, terminal_task_name, duplicate_of, fused_chains,
+                plan.extra_terminal_task_names,
+            )
+            fused_chains = {
+                head_name: chain for head_name, chain in fused_chains.items()
+                if head_name not in streamed_tail
+            }
+        for chain in fused_chains.values():
+            logger.info("operator fusion: %s", " → ".join(chain))
+        if streamed_tail:
+            tail_input = config.tasks[streamed_tail[0]].inputs[0]
             logger.info(
-                "태스크 실행: %s (operator=%s, inputs=%s)",
-                task_name, task_config.operator, task_config.inputs,
+                "streaming 실행: %s (입력: %s%s)",
+                " → ".join(streamed_tail), tail_input,
+                "" if tail_input.startswith("source:") else " — pipeline breaker",
             )
 
-            # 태스크 진행 콜백: RUNNING
-            if self._on_task_progress:
-                self._on_task_progress(task_name, "RUNNING", {
-                    "operator": task_config.operator,
-                    "started_at": task_started_at,
-                })
+        # 태스크명 → 해당 태스크의 출력 DatasetMeta (마지막 소비 후 해제)
+        task_results = self._create_task_result_store(
+            config, fused_chains, duplicate_of, streamed_tail, output_task_names,
+        )
+        try:
+            self._run_phase_a(
+                config, execution_order, fused_chains, duplicate_of, result_names,
+                streamed_tail, task_results, source_storage_uris_by_task, source_pool,
+                task_cache_keys,
+            )
+            # 추가 출력 — 기본 출력의 streamed tail 이 입력으로 공유할 수 있으므로
+            # Phase B 에서 storage_uri / image_records 를 바꿔도 되도록 사본을 쓴다
+            extra_output_metas = [
+                derive_dataset_meta(task_results[extra_task_name])
+                for extra_task_name in plan.extra_terminal_task_names
+            ]
 
-            # 입력 DatasetMeta 수집
-            input_metas: list[DatasetMeta] = []
+            record_stream: Iterator[ImageRecord] | None = None
+            if streamed_tail:
+                output_meta, record_stream = self._open_streamed_tail(
+                    streamed_tail, config, task_results, source_storage_uris_by_task, source_pool,
+                )
+                output_meta.dataset_id = (
+                    f"__task__{result_names.get(terminal_task_name) or terminal_task_name}"
+                )
+            else:
+                # 최종 태스크의 출력이 파이프라인의 최종 결과
+                output_meta = task_results[terminal_task_name]
+        finally:
+            task_results.close()
+
+        def _output_source_storage_uris(output_task_name: str) -> list[str]:
+            upstream_names = _upstream_task_names(config, output_task_name, duplicate_of)
+            return [
+                storage_uri
+                for task_name in execution_order if task_name in upstream_names
+                for storage_uri in source_storage_uris_by_task.get(task_name, [])
+            ]
 
-            for ref in task_config.inputs:
-                if ref.startswith("source:"):
-                    # v3 포맷 — `source:dataset_version:<id>` (executor 단계는 항상 resolved).
-                    # split 단계 토큰은 submit 시점 _substitute_resolved_versions 가 이미 치환했어야 함.
-                    parsed = parse_source_ref(ref)
-                    if parsed is None or parsed[0] != SOURCE_TYPE_VERSION:
-                        raise RuntimeError(
-                            f"executor 가 받은 source 토큰이 dataset_version 이 아닙니다: {ref!r}. "
-                            f"submit 단계 resolved 치환이 누락된 것으로 보입니다."
-                        )
-                    dataset_id = parsed[1]
-                    source_meta = self._load_source_meta(dataset_id)
-                    all_source_storage_uris.append(source_meta.storage_uri)
-                    logger.info(
-                        "소스 로드 완료: dataset_id=%s, images=%d, categories=%d",
-                        dataset_id, source_meta.image_count,
-                        len(source_meta.categories),
+        if record_stream is None:
+            logger.info(
+                "Phase A 완료 (annotation 처리): images=%d, categories=%d, output_format=%s",
+                output_meta.image_count, len(output_meta.categories), output_format,
+            )
+        else:
+            logger.info(
+                "Phase A 완료 (annotation 처리, streamed tail 대기): "
+                "categories=%d, output_format=%s",
+                len(output_meta.categories), output_format,
+            )
+
+        phase_a_result = PhaseACheckpoint(
+            output_meta=output_meta,
+            source_storage_uris=_output_source_storage_uris(terminal_task_name),
+            extra_output_metas=extra_output_metas,
+            extra_source_storage_uris=[
+                _output_source_storage_uris(extra_task_name)
+                for extra_task_name in plan.extra_terminal_task_names
+            ],
+            missing_source_images=dict(self._run_missing_images or {}),
+        )
+        return phase_a_result, record_stream
+
+    def _materialize_outputs(
+        self,
+        config: PipelineConfig,
+        plan: OptimizedPipelinePlan,
+        target_version: str,
+        extra_target_versions: list[str],
+        log_handler: ProcessingLogSpoolHandler,
+        phase_a_result: PhaseACheckpoint,
+        fingerprint: str | None,
+        record_stream: Iterator[ImageRecord] | None = None,
+    ) -> PipelineResult:
+        """
+        Phase B: 출력마다 공통 실체화 경로를 탄다 (추가 출력 → 기본 출력).
+
+        기본 출력의 streamed tail(record_stream)은 기본 출력 Phase B 가 당길 때 계산되므로
+        마지막에 쓴다. Phase A 를 checkpoint 에서 복원한 경우에도 같은 경로를 쓴다.
+        """
+        terminal_task_name = plan.terminal_task_name
+        extra_results: list[PipelineResult] = []
+        for extra_output, extra_task_name, extra_meta, extra_source_uris, extra_version in zip(
+            config.extra_outputs, plan.extra_terminal_task_names,
+            phase_a_result.extra_output_metas, phase_a_result.extra_source_storage_uris,
+            extra_target_versions, strict=True,
+        ):
+            logger.info(
+                "추가 출력 실체화: %s → split=%s, images=%d",
+                extra_task_name, extra_output.output.split, extra_meta.image_count,
+            )
+            extra_results.append(self._materialize_and_write(
+                config=config,
+                target_version=extra_version,
+                output_meta=extra_meta,
+                all_source_storage_uris=extra_source_uris,
+                output_format=extra_output.output.annotation_format.upper(),
+                log_handler=log_handler,
+                output_config=extra_output.output,
+                source_dataset_ids=config.get_upstream_source_dataset_ids(extra_task_name),
+                progress_task_name=f"__image_materialize__:{extra_task_name}",
+            ))
+
+        result = self._materialize_and_write(
+            config=config,
+            target_version=target_version,
+            output_meta=phase_a_result.output_meta,
+            all_source_storage_uris=phase_a_result.source_storage_uris,
+            output_format=config.output.annotation_format.upper(),
+            log_handler=log_handler,
+            record_stream=record_stream,
+            source_dataset_ids=config.get_upstream_source_dataset_ids(terminal_task_name),
+        )
+        result.extra_results = extra_results
+        if fingerprint is not None:
+            write_incremental_state(
+                self.storage, result.output_storage_uri, fingerprint,
+                config.get_all_source_dataset_ids()[0],
+            )
+        return result
+
+    def _plan_incremental_reuse(
+        self,
+        config: PipelineConfig,
+        fingerprint: str | None,
+        base_uri: str,
+        source_pool: _SourceMetaPool,
+    ) -> IncrementalReusePlan | None:
+        """
+        이전 출력(base_uri)의 이미지 재사용 계획. 재사용할 수 없으면 사유를 남기고 None (전체 실행).
+
+        이전 출력의 증분 상태에 기록된 source 버전과 현재 source 버전의 레코드를 비교한다.
+        """
+        if fingerprint is None:
+            logger.info(
+                "증분 재실행 불가 (단일 source 의 레코드별 변환 파이프라인이 아님) — 전체 실행",
+            )
+            return None
+        state = read_incremental_state(self.storage, base_uri)
+        if state is None or state.get("fingerprint") != fingerprint:
+            logger.info(
+                "증분 재실행 불가 (이전 출력과 파이프라인 구성/코드가 다름) — 전체 실행: base=%s",
+                base_uri,
+            )
+            return None
+
+        source_dataset_id = config.get_all_source_dataset_ids()[0]
+        previous_source_id = state.get("source_dataset_id")
+        current_meta = source_pool.peek(source_dataset_id)
+        try:
+            if previous_source_id == source_dataset_id:
+                previous_meta = current_meta
+            else:
+                descriptor = self._describe_source(previous_source_id)
+                previous_meta = (
+                    load_source_meta_from_descriptor(self.storage, descriptor)
+                    if descriptor is not None
+                    else self._load_source_meta(previous_source_id)
+                )
+        except Exception as load_error:
+            logger.warning(
+                "이전 source 로드 실패 — 전체 실행: dataset_id=%s (%s)",
+                previous_source_id, load_error,
+            )
+            return None
+
+        source_diff = diff_source_records(
+            previous_meta,
+            current_meta,
+            scan_image_files(self.storage, previous_meta.storage_uri, self.images_dirname),
+            scan_image_files(self.storage, current_meta.storage_uri, self.images_dirname),
+            self.images_dirname,
+        )
+        logger.info(
+            "증분 재실행: base=%s, 이전 source=%s, 변경 없음=%d, 추가=%d, 변경=%d, 삭제=%d",
+            base_uri, previous_source_id, len(source_diff.unchanged_paths),
+            source_diff.added_count, source_diff.changed_count, source_diff.removed_count,
+        )
+        return IncrementalReusePlan(
+            source_storage_uri=current_meta.storage_uri,
+            previous_output_storage_uri=base_uri,
+            unchanged_source_paths=source_diff.unchanged_paths,
+            previous_output_paths=set(
+                scan_image_files(self.storage, base_uri, self.images_dirname)
+            ),
+        )
+
+    def _run_phase_a(
+        self,
+        config: PipelineConfig,
+        execution_order: list[str],
+        fused_chains: dict[str, list[str]],
+        duplicate_of: dict[str, str],
+        result_names: dict[str, str],
+        streamed_tail: list[str],
+        task_results: _TaskResultStore,
+        source_storage_uris_by_task: dict[str, list[str]],
+        source_pool: _SourceMetaPool,
+        task_cache_keys: dict[str, str | None],
+    ) -> None:
+        """Phase A 태스크를 직렬 또는 level 병렬로 실행한다 (streamed tail 제외)."""
+        if self.execution_mode == "serial":
+            fused_member_names = {
+                task_name for chain in fused_chains.values() for task_name in chain[1:]
+            }
+            for task_name in execution_order:
+                if task_name in fused_member_names or task_name in streamed_tail:
+                    continue
+                if task_name in duplicate_of:
+                    self._finish_duplicate_task(
+                        task_name, duplicate_of[task_name], config, task_results, source_pool,
+                        result_names,
+                    )
+                    continue
+                chain = fused_chains.get(task_name, [task_name])
+                task_started_ats, input_metas = self._start_work_item(
+                    chain, config, task_results, source_storage_uris_by_task, source_pool,
+                )
+                cached_prefix = self._load_cached_prefix(chain, task_cache_keys)
+                steps, compute_input_metas = self._remaining_work(
+                    config, chain, input_metas, cached_prefix,
+                )
+                stage_metrics: StageMetrics | None = None
+                if steps:
+                    result_meta, step_stats, stage_metrics = self._compute_measured_work_item(
+                        steps, compute_input_metas, _work_item_stage_name(chain, steps),
                     )
-                    input_metas.append(source_meta)
                 else:
-                    # 이전 태스크 출력 참조
-                    if ref not in task_results:
-                        raise RuntimeError(
-                            f"태스크 '{task_name}'의 input '{ref}'가 "
-                            f"아직 실행되지 않았습니다."
+                    result_meta, step_stats = cached_prefix.meta, None
+                self._finish_work_item(
+                    chain, config, task_started_ats,
+                    input_metas, result_meta, step_stats, task_results, result_names,
+                    cached_prefix, task_cache_keys, stage_metrics,
+                )
+        else:
+            self._run_tasks_by_level(
+                config, fused_chains, duplicate_of, result_names,
+                task_results, source_storage_uris_by_task, source_pool,
+                frozenset(streamed_tail), task_cache_keys,
+            )
+
+    # -------------------------------------------------------------------------
+    # 태스크 실행 단위 (직렬 / level 병렬 공용)
+    # -------------------------------------------------------------------------
+
+    def _run_tasks_by_level(
+        self,
+        config: PipelineConfig,
+        fused_chains: dict[str, list[str]],
+        duplicate_of: dict[str, str],
+        result_names: dict[str, str],
+        task_results: _TaskResultStore,
+        source_storage_uris_by_task: dict[str, list[str]],
+        source_pool: _SourceMetaPool,
+        streamed_task_names: frozenset[str] = frozenset(),
+        task_cache_keys: dict[str, str | None] | None = None,
+    ) -> None:
+        """
+        같은 level 의 태스크를 thread/process pool 에서 동시에 실행한다.
+
+        입력 해석(_collect_task_inputs)과 진행 콜백은 항상 호출 스레드에서 수행한다.
+        pool 에는 manipulator 적용만 보낸다.
+
+        fusion 체인은 head 의 level 에서 하나의 작업 단위로 실행하고,
+        이후 level 의 체인 구성원은 건너뛴다. 중복 태스크는 대표 태스크와 같은 level 이므로
+        level 의 작업이 모두 끝난 뒤 대표 결과로 완료 처리한다.
+
+        작업 단위가 1개뿐인 level 은 pool 을 거치지 않고 그 자리에서 실행한다.
+        process 모드에서 worker 가 남긴 로그는 processing.log 에 수집되지 않는다.
+        streamed_task_names(streamed tail)는 Phase B 에서 계산하므로 건너뛴다.
+        캐시 조회/저장은 호출 스레드에서 하고, 캐시에서 다 찾은 작업 단위는 pool 에 보내지 않는다.
+        """
+        task_cache_keys = task_cache_keys or {}
+        pool_class = ThreadPoolExecutor if self.execution_mode == "thread" else ProcessPoolExecutor
+        fused_member_names = {
+            task_name for chain in fused_chains.values() for task_name in chain[1:]
+        }
+
+        with pool_class(max_workers=self.max_workers) as pool:
+            for level_index, level_task_names in enumerate(config.execution_levels()):
+                head_task_names = [
+                    task_name for task_name in level_task_names
+                    if task_name not in fused_member_names
+                    and task_name not in duplicate_of
+                    and task_name not in streamed_task_names
+                ]
+                if not head_task_names:
+                    continue
+                logger.info(
+                    "level %d 실행 (mode=%s): %s",
+                    level_index, self.execution_mode, ", ".join(head_task_names),
+                )
+
+                pending_items: dict[
+                    Future,
+                    tuple[list[str], list[str], list[DatasetMeta], _CachedPrefix | None],
+                ] = {}
+                try:
+                    for task_name in head_task_names:
+                        chain = fused_chains.get(task_name, [task_name])
+                        task_started_ats, input_metas = self._start_work_item(
+                            chain, config, task_results, source_storage_uris_by_task, source_pool,
                         )
-                    input_metas.append(task_results[ref])
+                        cached_prefix = self._load_cached_prefix(chain, task_cache_keys)
+                        steps, compute_input_metas = self._remaining_work(
+                            config, chain, input_metas, cached_prefix,
+                        )
+
+                        stage_name = _work_item_stage_name(chain, steps)
+                        if not steps or len(head_task_names) == 1:
+                            stage_metrics: StageMetrics | None = None
+                            if steps:
+                                result_meta, step_stats, stage_metrics = (
+                                    self._compute_measured_work_item(
+                                        steps, compute_input_metas, stage_name,
+                                    )
+                                )
+                            else:
+                                result_meta, step_stats = cached_prefix.meta, None
+                            self._finish_work_item(
+                                chain, config, task_started_ats,
+                                input_metas, result_meta, step_stats, task_results,
+                                result_names, cached_prefix, task_cache_keys, stage_metrics,
+                            )
+                            continue
+
+                        if self.execution_mode == "thread":
+                            future = pool.submit(
+                                self._compute_measured_work_item,
+                                steps, compute_input_metas, stage_name,
+                            )
+                        else:
+                            future = pool.submit(
+                                _compute_work_item_in_worker,
+                                steps, compute_input_metas, stage_name,
+                            )
+                        pending_items[future] = (
+                            chain, task_started_ats, input_metas, cached_prefix,
+                        )
+
+                    for future in as_completed(pending_items):
+                        chain, task_started_ats, input_metas, cached_prefix = pending_items[future]
+                        result_meta, step_stats, stage_metrics = future.result()
+                        self._finish_work_item(
+                            chain, config, task_started_ats,
+                            input_metas, result_meta, step_stats, task_results,
+                            result_names, cached_prefix, task_cache_keys, stage_metrics,
+                        )
+                except BaseException:
+                    # 한 태스크라도 실패하면 아직 시작 안 한 태스크는 취소하고 예외 전파
+                    for future in pending_items:
+                        future.cancel()
+                    raise
+
+                for task_name in level_task_names:
+                    if task_name in duplicate_of:
+                        self._finish_duplicate_task(
+                            task_name, duplicate_of[task_name], config, task_results, source_pool,
+                            result_names,
+                        )
+
+    def _create_task_result_store(
+        self,
+        config: PipelineConfig,
+        fused_chains: dict[str, list[str]],
+        duplicate_of: dict[str, str],
+        streamed_tail: list[str],
+        output_task_names: list[str],
+    ) -> _TaskResultStore:
+        """
+        태스크 결과별 소비 계획(읽는 태스크의 level 목록)을 세어 _TaskResultStore 를 만든다.
+
+        소비자는 작업 단위의 head(입력 해석)와 중복 태스크(대표 결과 + 입력 이미지 수 조회)다.
+        fusion 체인 / streamed tail 의 뒤쪽 태스크는 앞 태스크 결과를 task_results 로 받지 않는다.
+        """
+        task_levels = {
+            task_name: level_index
+            for level_index, level_task_names in enumerate(config.execution_levels())
+            for task_name in level_task_names
+        }
+        inner_member_names = {
+            task_name for chain in fused_chains.values() for task_name in chain[1:]
+        }
+        inner_member_names.update(streamed_tail[1:])
+
+        read_levels: dict[str, list[int]] = {}
+        for task_name, task_config in config.tasks.items():
+            if task_name in inner_member_names:
+                continue
+            read_refs = [ref for ref in task_config.inputs if not ref.startswith("source:")]
+            if task_name in duplicate_of:
+                read_refs.append(duplicate_of[task_name])
+            for ref in read_refs:
+                read_levels.setdefault(ref, []).append(task_levels[task_name])
+
+        return _TaskResultStore(
+            read_levels=read_levels,
+            producer_levels=task_levels,
+            retained_names=set(output_task_names),
+            retain_all=self.retain_task_results,
+            spill_dir=self.spill_dir,
+            spill_level_gap=self.spill_level_gap,
+        )
+
+    def _plan_fused_chains(
+        self,
+        config: PipelineConfig,
+        duplicate_of: dict[str, str] | None = None,
+        merge_filters: dict[str, list[str]] | None = None,
+        output_task_names: Iterable[str] = (),
+    ) -> dict[str, list[str]]:
+        """
+        operator fusion 대상 체인을 찾는다.
+
+        A → B 는 다음을 모두 만족할 때 같은 체인으로 묶는다:
+          - A, B 모두 supports_record_fusion manipulator 이고 입력이 1개
+          - B.inputs == [A] 이고 A 의 소비자는 B 하나뿐 (중간 결과를 다른 태스크가 보지 않음)
+          - A 가 중복 태스크의 대표가 아님 (대표 결과는 중복 태스크가 재사용한다)
+          - A 가 출력 태스크가 아님 (output_task_names — 결과를 저장해야 한다)
+        중복 태스크(duplicate_of 의 키)는 계산하지 않으므로 체인에 넣지 않는다.
+
+        병합 중 적용할 필터(merge_filters, DAG optimizer 결정)가 있으면 병합 태스크를 head 로
+        필터(와 필터에서 시작하는 체인)를 붙인다. fusion 을 끈 경우에도 이 체인은 만든다.
+
+        Returns:
+            head 태스크명 → 체인 태스크명 목록 (길이 2 이상인 체인만)
+        """
+        fused_chains = self._plan_record_chains(
+            config, duplicate_of or {}, set(output_task_names),
+        )
+        for merge_name, filter_names in (merge_filters or {}).items():
+            chain = fused_chains.pop(filter_names[0], filter_names)
+            fused_chains[merge_name] = [merge_name, *chain]
+        return fused_chains
+
+    def _plan_record_chains(
+        self,
+        config: PipelineConfig,
+        duplicate_of: dict[str, str],
+        output_task_names: set[str],
+    ) -> dict[str, list[str]]:
+        """_plan_fused_chains 의 per-record 체인 탐지 부분."""
+        if not self.fuse_record_operators:
+            return {}
+        # 결과를 체인 밖에서 봐야 하는 태스크 — 체인은 여기서 끝난다
+        shared_task_names = set(duplicate_of.values()) | output_task_names
+
+        consumers: dict[str, list[str]] = {}
+        for task_name, task_config in config.tasks.items():
+            for ref in task_config.inputs:
+                if not ref.startswith("source:"):
+                    consumers.setdefault(ref, []).append(task_name)
+
+        def _is_fusable(task_name: str) -> bool:
+            task_config = config.tasks[task_name]
+            manipulator_class = MANIPULATOR_REGISTRY.get(task_config.operator)
+            return (
+                manipulator_class is not None
+                and manipulator_class.supports_record_fusion
+                and len(task_config.inputs) == 1
+                and task_name not in duplicate_of
+            )
+
+        fused_chains: dict[str, list[str]] = {}
+        assigned_names: set[str] = set()
+        # topological 순서로 보므로 체인의 앞 태스크가 항상 먼저 head 로 잡힌다
+        for task_name in config.topological_order():
+            if task_name in assigned_names or not _is_fusable(task_name):
+                continue
+            chain = [task_name]
+            while chain[-1] not in shared_task_names:
+                next_names = consumers.get(chain[-1], [])
+                if len(next_names) != 1:
+                    break
+                next_name = next_names[0]
+                if config.tasks[next_name].inputs != [chain[-1]] or not _is_fusable(next_name):
+                    break
+                chain.append(next_name)
+            assigned_names.update(chain)
+            if len(chain) > 1:
+                fused_chains[task_name] = chain
+
+        return fused_chains
+
+    def _plan_streamed_tail(
+        self,
+        config: PipelineConfig,
+        terminal_task_name: str,
+        duplicate_of: dict[str, str],
+        fused_chains: dict[str, list[str]],
+        extra_terminal_task_names: list[str] | None = None,
+    ) -> list[str]:
+        """
+        최종 태스크에서 거슬러 올라가며 streaming 으로 실행할 per-record 구간을 찾는다.
+
+        fusion 체인과 같은 조건(supports_record_fusion, 단일 입력, 입력 태스크의 소비자가
+        하나뿐, 중복 태스크/대표 태스크 아님)을 만족하는 동안 앞으로 넓힌다.
+        그 밖의 태스크 — 샘플링(전체 목록 기준 선택), 병합(파일명 충돌 판정) 등 — 는
+        pipeline breaker 로서 결과를 모두 만든 뒤 구간의 입력이 된다.
+        병합 안에서 적용하는 필터 체인(merge_filters)은 병합과 함께 계산하므로 포함하지 않는다.
+        추가 출력 태스크는 결과를 저장해야 하므로 구간에 넣지 않는다 (구간의 입력은 될 수 있다).
+
+        Returns:
+            topological 순서의 태스크명 목록 (없으면 빈 리스트)
+        """
+        shared_task_names = set(duplicate_of.values()) | set(extra_terminal_task_names or ())
+        merge_chain_names = {
+            task_name
+            for head_name, chain in fused_chains.items()
+            if not getattr(
+                MANIPULATOR_REGISTRY.get(config.tasks[head_name].operator),
+                "supports_record_fusion", False,
+            )
+            for task_name in chain
+        }
+        consumer_counts: dict[str, int] = {}
+        for task_config in config.tasks.values():
+            for ref in task_config.inputs:
+                consumer_counts[ref] = consumer_counts.get(ref, 0) + 1
+
+        def _is_streamable(task_name: str) -> bool:
+            task_config = config.tasks[task_name]
+            manipulator_class = MANIPULATOR_REGISTRY.get(task_config.operator)
+            return (
+                manipulator_class is not None
+                and manipulator_class.supports_record_fusion
+                and len(task_config.inputs) == 1
+                and task_name not in duplicate_of
+                and task_name not in shared_task_names
+                and task_name not in merge_chain_names
+            )
+
+        tail: list[str] = []
+        task_name = terminal_task_name
+        while _is_streamable(task_name):
+            tail.append(task_name)
+            input_ref = config.tasks[task_name].inputs[0]
+            if input_ref.startswith("source:") or consumer_counts.get(input_ref, 0) != 1:
+                break
+            task_name = input_ref
+        tail.reverse()
+        return tail
+
+    def _open_streamed_tail(
+        self,
+        tail: list[str],
+        config: PipelineConfig,
+        task_results: _TaskResultStore,
+        source_storage_uris_by_task: dict[str, list[str]],
+        source_pool: _SourceMetaPool,
+    ) -> tuple[DatasetMeta, Iterator[ImageRecord]]:
+        """
+        streamed tail 을 시작한다: 구성 태스크 RUNNING 보고 + 입력 해석 + RecordTransform 준비.
+
+        레코드는 반환하는 iterator 를 Phase B 가 당길 때 변환된다. iterator 가 끝나면
+        태스크별 통계로 DONE 을 보고한다 (실체화와 번갈아 진행되므로 DONE 은 Phase B 중에 온다).
+
+        Returns:
+            (출력 DatasetMeta — categories 등 확정, image_records 는 빈 리스트,
+             출력 레코드 iterator)
+        """
+        task_started_ats, input_metas = self._start_work_item(
+            tail, config, task_results, source_storage_uris_by_task, source_pool,
+        )
+        steps = _chain_steps(config, tail)
+        input_meta = input_metas[0]
+        record_transforms = self._build_record_transforms(steps, input_meta)
+
+        def _iter_tail_records() -> Iterator[ImageRecord]:
+            passed_counts = [0] * len(record_transforms)
+            yield from _iter_record_transforms(
+                input_meta.image_records, record_transforms, passed_counts,
+            )
+            step_stats = self._finish_record_transforms(
+                steps, record_transforms, input_meta.image_count, passed_counts, "streaming",
+            )
+            for task_name, task_started_at, stats in zip(
+                tail, task_started_ats, step_stats, strict=True,
+            ):
+                self._report_task_done(
+                    task_name, config.tasks[task_name].operator, task_started_at,
+                    stats.input_images, stats.output_images, stats.category_count,
+                )
+
+        return record_transforms[-1].output_meta, _iter_tail_records()
+
+    def _notify_removed_tasks(
+        self,
+        original_config: PipelineConfig,
+        plan: OptimizedPipelinePlan,
+    ) -> None:
+        """dead branch 로 제거된 태스크를 SKIPPED 로 보고한다."""
+        if not self._on_task_progress:
+            return
+        for task_name in plan.removed_tasks:
+            self._on_task_progress(task_name, "SKIPPED", {
+                "operator": original_config.tasks[task_name].operator,
+                "skip_reason": "dead_branch",
+            })
+
+    def _finish_duplicate_task(
+        self,
+        task_name: str,
+        canonical_task_name: str,
+        config: PipelineConfig,
+        task_results: _TaskResultStore,
+        source_pool: _SourceMetaPool,
+        result_names: dict[str, str],
+    ) -> None:
+        """
+        중복 태스크를 대표 태스크의 결과로 완료 처리한다.
+
+        레코드는 대표 결과와 공유하고(copy-on-write) dataset_id 만 태스크별로 따로 부여한다.
+        source storage_uri 는 대표 태스크가 이미 등록했으므로 다시 넣지 않는다.
+        """
+        task_config = config.tasks[task_name]
+        task_started_at = self._notify_task_running(task_name, task_config)
+        input_image_count = sum(
+            source_pool.image_count(_parse_resolved_source_ref(ref))
+            if ref.startswith("source:") else task_results.checkout(ref).image_count
+            for ref in task_config.inputs
+        )
+        logger.info("중복 태스크: %s → %s 결과 재사용", task_name, canonical_task_name)
+        self._finish_task(
+            task_name, task_config, task_started_at, input_image_count,
+            derive_dataset_meta(task_results.checkout(canonical_task_name)), task_results,
+            result_names.get(task_name),
+        )
+
+    def _start_work_item(
+        self,
+        chain: list[str],
+        config: PipelineConfig,
+        task_results: _TaskResultStore,
+        source_storage_uris_by_task: dict[str, list[str]],
+        source_pool: _SourceMetaPool,
+    ) -> tuple[list[str], list[DatasetMeta]]:
+        """
+        작업 단위(단일 태스크 또는 fusion 체인) 시작: 구성 태스크 모두 RUNNING 콜백 후
+        head 태스크의 입력을 해석한다.
+
+        Returns:
+            (태스크별 시작 시각 목록, head 입력 DatasetMeta 목록)
+        """
+        task_started_ats = [
+            self._notify_task_running(task_name, config.tasks[task_name])
+            for task_name in chain
+        ]
+        head_task_name = chain[0]
+        input_metas, source_storage_uris = self._collect_task_inputs(
+            head_task_name, config.tasks[head_task_name], task_results, source_pool,
+        )
+        source_storage_uris_by_task[head_task_name] = source_storage_uris
+        return task_started_ats, input_metas
+
+    def _compute_work_item(
+        self,
+        steps: list[tuple[str, dict[str, Any]]],
+        input_metas: list[DatasetMeta],
+    ) -> tuple[DatasetMeta, list[_FusedStepStats] | None]:
+        """
+        작업 단위를 계산한다. 단일 태스크면 step_stats 는 None.
+
+        병합 태스크가 head 인 체인은 병합 중 필터 적용(_compute_merge_with_pushed_filters),
+        그 외 체인은 per-record fusion 으로 계산한다.
+
+        Returns:
+            (마지막 태스크의 출력 DatasetMeta, fusion 체인의 단계별 통계)
+        """
+        if len(steps) == 1:
+            operator_name, params = steps[0]
+            return self._compute_task_output(operator_name, params, input_metas), None
+        head_class = MANIPULATOR_REGISTRY.get(steps[0][0])
+        if head_class is not None and head_class.accepts_pushed_record_filter:
+            return self._compute_merge_with_pushed_filters(steps, input_metas)
+        return self._compute_fused_chain_output(steps, input_metas[0])
+
+    def _compute_measured_work_item(
+        self,
+        steps: list[tuple[str, dict[str, Any]]],
+        input_metas: list[DatasetMeta],
+        stage_name: str,
+    ) -> tuple[DatasetMeta, list[_FusedStepStats] | None, StageMetrics]:
+        """_compute_work_item + 단계 계측. pool 에서 실행하므로 계측값은 기록하지 않고 돌려준다."""
+        with measure_stage(STAGE_TASK, stage_name) as stage_metrics:
+            result_meta, step_stats = self._compute_work_item(steps, input_metas)
+            stage_metrics.record_count = result_meta.image_count
+            stage_metrics.annotation_count = _annotation_count(result_meta)
+        return result_meta, step_stats, stage_metrics
+
+    def _finish_work_item(
+        self,
+        chain: list[str],
+        config: PipelineConfig,
+        task_started_ats: list[str],
+        input_metas: list[DatasetMeta],
+        result_meta: DatasetMeta,
+        step_stats: list[_FusedStepStats] | None,
+        task_results: _TaskResultStore,
+        result_names: dict[str, str],
+        cached_prefix: _CachedPrefix | None = None,
+        task_cache_keys: dict[str, str | None] | None = None,
+        stage_metrics: StageMetrics | None = None,
+    ) -> None:
+        """
+        작업 단위 완료 처리.
+
+        fusion 체인의 중간 태스크는 출력 DatasetMeta 가 없으므로 단계별 통계로 DONE 만 보고하고,
+        마지막 태스크의 출력만 task_results 에 등록한다.
+        캐시에서 찾은 prefix(cached_prefix)는 저장된 통계로 보고하고,
+        새로 계산한 결과는 캐시에 넣는다.
+        stage_metrics: 새로 계산한 구간의 계측값 (캐시에서 다 찾았으면 None).
+        """
+        if stage_metrics is not None:
+            self._record_stage(stage_metrics)
+        cache_statuses = self._cache_statuses(chain, cached_prefix, task_cache_keys or {})
+        if cached_prefix is not None:
+            computed_stats = step_stats or []
+            if step_stats is None and cached_prefix.member_count < len(chain):
+                computed_stats = [_FusedStepStats(
+                    input_images=cached_prefix.meta.image_count,
+                    output_images=result_meta.image_count,
+                    category_count=len(result_meta.categories),
+                )]
+            step_stats = cached_prefix.step_stats + computed_stats
+        elif step_stats is None:
+            step_stats = [_FusedStepStats(
+                input_images=sum(m.image_count for m in input_metas),
+                output_images=result_meta.image_count,
+                category_count=len(result_meta.categories),
+            )]
+
+        for task_name, task_started_at, stats, cache_status in zip(
+            chain[:-1], task_started_ats, step_stats, cache_statuses, strict=False,
+        ):
+            self._report_task_done(
+                task_name, config.tasks[task_name].operator, task_started_at,
+                stats.input_images, stats.output_images, stats.category_count, cache_status,
+            )
+        tail_task_name = chain[-1]
+        self._finish_task(
+            tail_task_name, config.tasks[tail_task_name], task_started_ats[-1],
+            step_stats[-1].input_images, result_meta, task_results,
+            result_names.get(tail_task_name), cache_statuses[-1],
+        )
+        if cache_statuses[-1] == "miss":
+            self._store_work_item_result(chain, task_cache_keys, result_meta, step_stats)
+
+    # -------------------------------------------------------------------------
+    # run 간 memoization (task_result_cache)
+    # -------------------------------------------------------------------------
+
+    def _build_task_cache_keys(
+        self,
+        config: PipelineConfig,
+        execution_order: list[str],
+        result_names: dict[str, str],
+        source_pool: _SourceMetaPool,
+    ) -> dict[str, str | None]:
+        """
+        태스크별 캐시 키. 결정적이지 않은 태스크와 그 하류는 None (캐시하지 않음).
+
+        입력 fingerprint:
+          - source: DatasetVersion id + storage_uri + 표시 이름(병합 rename prefix 에 쓰임)
+            + annotation / 메타 파일의 (이름, 크기, mtime_ns) — 같은 버전에서 메타 파일
+            (data.yaml 등)을 교체하면 키가 바뀐다 (디스크립터가 있는 source 만)
+            (+ 이미지 파일이 없어 로드 시 뺀 파일명이 있으면 그 목록)
+          - 태스크: 생산 태스크의 키. multi-input manipulator(병합)는 입력 dataset_id 로
+            rename hash 를 만들므로 소비자가 보는 dataset_id(태스크명 기반)도 넣는다.
+            그 외 태스크는 태스크명이 달라도 같은 키가 되어 다른 파이프라인과 결과를 공유한다.
+        """
+        task_cache_keys: dict[str, str | None] = {}
+        source_files: dict[str, list | None] = {}
+        for task_name in execution_order:
+            task_config = config.tasks[task_name]
+            manipulator_class = MANIPULATOR_REGISTRY.get(task_config.operator)
+            task_cache_keys[task_name] = None
+            if (
+                manipulator_class is None
+                or not manipulator_class().is_deterministic(task_config.params)
+            ):
+                continue
+
+            uses_input_dataset_ids = self._is_multi_input_manipulator(task_config.operator)
+            input_fingerprints: list[list[str | None]] = []
+            for ref in task_config.inputs:
+                if ref.startswith("source:"):
+                    dataset_id = _parse_resolved_source_ref(ref)
+                    source_meta = source_pool.peek(dataset_id)
+                    if dataset_id not in source_files:
+                        source_files[dataset_id] = self._source_files_fingerprint(dataset_id)
+                    source_fingerprint = [
+                        "source", dataset_id, source_meta.storage_uri,
+                        source_meta.extra.get("dataset_name"), source_files[dataset_id],
+                    ]
+                    image_index = source_meta.image_index
+                    if image_index is not None and image_index.missing_files:
+                        # 로드 시 뺀 레코드가 있으면 결과가 달라진다
+                        source_fingerprint.append(image_index.missing_files)
+                    input_fingerprints.append(source_fingerprint)
+                elif task_cache_keys.get(ref) is not None:
+                    input_fingerprints.append([
+                        "task", task_cache_keys[ref],
+                        f"__task__{result_names.get(ref) or ref}" if uses_input_dataset_ids
+                        else None,
+                    ])
+                else:
+                    break
+            else:
+                task_cache_keys[task_name] = build_task_cache_key(
+                    task_config.operator, task_config.params, input_fingerprints,
+                )
+        return task_cache_keys
+
+    def _source_files_fingerprint(self, dataset_id: str) -> list | None:
+        """
+        source 가 읽는 annotation / 메타 파일의 (이름, 크기, mtime_ns) 목록.
+        파싱 결과 캐시 키의 파일 목록과 같다.
+
+        디스크립터가 없는 source 는 읽는 파일을 알 수 없으므로 None.
+        """
+        descriptor = self._describe_source(dataset_id)
+        if descriptor is None:
+            return None
+        return build_meta_cache_key(
+            self.storage, descriptor.storage_uri, descriptor.annotation_format,
+            descriptor.annotation_files, descriptor.annotation_meta_file, dataset_id,
+        )["files"]
+
+    def _load_cached_prefix(
+        self,
+        chain: list[str],
+        task_cache_keys: dict[str, str | None],
+    ) -> _CachedPrefix | None:
+        """
+        작업 단위의 가장 긴 캐시 prefix 를 찾는다 (체인 뒤쪽 태스크부터).
+
+        prefix 구성 태스크의 진행 통계는 찾은 항목의 헤더에서, 없으면(다른 체인 구성으로
+        저장된 경우) 각 태스크 자신의 항목 헤더에서 찾는다. 통계를 다 찾지 못하면 더 짧은
+        prefix 를 본다.
+        """
+        if self.task_result_cache is None:
+            return None
+        for member_count in range(len(chain), 0, -1):
+            key = task_cache_keys.get(chain[member_count - 1])
+            if key is None:
+                continue
+            entry_stats = self.task_result_cache.read_stats(key)
+            if entry_stats is None:
+                continue
+            step_stats: list[_FusedStepStats] = []
+            for task_name in chain[:member_count]:
+                member_key = task_cache_keys[task_name]
+                member_stats = entry_stats.get(member_key) or (
+                    self.task_result_cache.read_stats(member_key) or {}
+                ).get(member_key)
+                if member_stats is None:
+                    break
+                step_stats.append(_FusedStepStats(**member_stats))
+            else:
+                cached_entry = self.task_result_cache.get(key)
+                if cached_entry is None:
+                    continue
+                logger.info(
+                    "태스크 결과 캐시 hit: %s (key=%s)",
+                    " → ".join(chain[:member_count]), key[:12],
+                )
+                return _CachedPrefix(
+                    member_count=member_count, meta=cached_entry[0], step_stats=step_stats,
+                )
+        return None
+
+    def _remaining_work(
+        self,
+        config: PipelineConfig,
+        chain: list[str],
+        input_metas: list[DatasetMeta],
+        cached_prefix: _CachedPrefix | None,
+    ) -> tuple[list[tuple[str, dict[str, Any]]], list[DatasetMeta]]:
+        """
+        캐시 prefix 뒤에 남은 계산 (steps, 입력 DatasetMeta 목록).
+        다 찾았으면 steps 는 빈 리스트.
+        """
+        if cached_prefix is None:
+            return _chain_steps(config, chain), input_metas
+        return (
+            _chain_steps(config, chain[cached_prefix.member_count:]),
+            [cached_prefix.meta],
+        )
+
+    def _cache_statuses(
+        self,
+        chain: list[str],
+        cached_prefix: _CachedPrefix | None,
+        task_cache_keys: dict[str, str | None],
+    ) -> list[str | None]:
+        """체인 태스크별 "hit" | "miss" | None(캐시하지 않음). run 의 hit/miss 수를 센다."""
+        if self.task_result_cache is None:
+            return [None] * len(chain)
+        hit_count = cached_prefix.member_count if cached_prefix is not None else 0
+        cache_statuses: list[str | None] = []
+        for index, task_name in enumerate(chain):
+            if task_cache_keys.get(task_name) is None:
+                cache_statuses.append(None)
+                continue
+            cache_status = "hit" if index < hit_count else "miss"
+            cache_statuses.append(cache_status)
+            if self._run_cache_counts is not None:
+                self._run_cache_counts["hits" if cache_status == "hit" else "misses"] += 1
+        return cache_statuses
+
+    def _store_work_item_result(
+        self,
+        chain: list[str],
+        task_cache_keys: dict[str, str | None],
+        result_meta: DatasetMeta,
+        step_stats: list[_FusedStepStats],
+    ) -> None:
+        """작업 단위 결과(마지막 태스크)를 구성 태스크 전체의 진행 통계와 함께 캐시에 넣는다."""
+        task_stats = {
+            task_cache_keys[task_name]: {
+                "input_images": stats.input_images,
+                "output_images": stats.output_images,
+                "category_count": stats.category_count,
+            }
+            for task_name, stats in zip(chain, step_stats, strict=False)
+            if task_cache_keys.get(task_name) is not None
+        }
+        self.task_result_cache.put(task_cache_keys[chain[-1]], result_meta, task_stats)
+
+    def _notify_task_running(self, task_name: str, task_config: TaskConfig) -> str:
+        """태스크 시작 로그 + RUNNING 콜백. 시작 시각(ISO)을 반환한다."""
+        task_started_at = datetime.now(UTC).isoformat()
+
+        logger.info(
+            "태스크 실행: %s (operator=%s, inputs=%s)",
+            task_name, task_config.operator, task_config.inputs,
+        )
+
+        if self._on_task_progress:
+            self._on_task_progress(task_name, "RUNNING", {
+                "operator": task_config.operator,
+                "started_at": task_started_at,
+            })
+        return task_started_at
+
+    def _collect_task_inputs(
+        self,
+        task_name: str,
+        task_config: TaskConfig,
+        task_results: _TaskResultStore,
+        source_pool: _SourceMetaPool,
+    ) -> tuple[list[DatasetMeta], list[str]]:
+        """
+        태스크 inputs 를 DatasetMeta 목록으로 해석한다.
+
+        source 는 선행 로드된 source_pool 에서, 이전 태스크 출력은 task_results 에서 꺼낸다
+        (다른 태스크와 공유, 읽기 전용). 마지막 소비자가 꺼내 가면 보관소에서 빠진다.
+
+        Returns:
+            (입력 DatasetMeta 목록, 이 태스크가 참조한 source 의 storage_uri 목록)
+        """
+        input_metas: list[DatasetMeta] = []
+        source_storage_uris: list[str] = []
+
+        for ref in task_config.inputs:
+            if ref.startswith("source:"):
+                source_meta = source_pool.checkout(_parse_resolved_source_ref(ref))
+                source_storage_uris.append(source_meta.storage_uri)
+                input_metas.append(source_meta)
+            else:
+                # 이전 태스크 출력 참조
+                if ref not in task_results:
+                    raise RuntimeError(
+                        f"태스크 '{task_name}'의 input '{ref}'가 "
+                        f"아직 실행되지 않았습니다."
+                    )
+                input_metas.append(task_results.checkout(ref))
+
+        return input_metas, source_storage_uris
+
+    def _prefetch_source_metas(
+        self,
+        config: PipelineConfig,
+        task_names: list[str] | None = None,
+    ) -> _SourceMetaPool:
+        """
+        태스크들(task_names, 기본은 config 전체)이 참조하는 distinct source 를 모두 로드해
+        _SourceMetaPool 로 반환한다.
+
+        _describe_source 가 SourceDescriptor 를 주는 source 는 파일 파싱만 남으므로
+        thread pool 에서 동시에 파싱한다 (annotation 파일 read / Pillow 크기 조회가 I/O 위주).
+        디스크립터가 없는 source 는 _load_source_meta 로 호출 스레드에서 로드한다.
+        """
+        consumer_counts: dict[str, int] = {}
+        for task_name in task_names if task_names is not None else config.topological_order():
+            for ref in config.tasks[task_name].inputs:
+                if ref.startswith("source:"):
+                    dataset_id = _parse_resolved_source_ref(ref)
+                    consumer_counts[dataset_id] = consumer_counts.get(dataset_id, 0) + 1
+
+        # 디스크립터 조회(DB 접근 가능)는 항상 호출 스레드에서
+        descriptors: dict[str, SourceDescriptor] = {}
+        undescribed_ids: list[str] = []
+        for dataset_id in consumer_counts:
+            descriptor = self._describe_source(dataset_id)
+            if descriptor is None:
+                undescribed_ids.append(dataset_id)
+            else:
+                descriptors[dataset_id] = descriptor
+
+        load_results: dict[str, tuple[DatasetMeta, StageMetrics]] = {}
+        if len(descriptors) > 1 and self.source_load_workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.source_load_workers, len(descriptors)),
+                thread_name_prefix="source-load",
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        _measure_source_load, dataset_id, self._load_indexed_source,
+                        load_source_meta_from_descriptor, self.storage, descriptor,
+                    ): dataset_id
+                    for dataset_id, descriptor in descriptors.items()
+                }
+                for dataset_id in undescribed_ids:
+                    load_results[dataset_id] = _measure_source_load(
+                        dataset_id, self._load_indexed_source, self._load_source_meta, dataset_id,
+                    )
+                for future in as_completed(futures):
+                    load_results[futures[future]] = future.result()
+        else:
+            for dataset_id, descriptor in descriptors.items():
+                load_results[dataset_id] = _measure_source_load(
+                    dataset_id, self._load_indexed_source,
+                    load_source_meta_from_descriptor, self.storage, descriptor,
+                )
+            for dataset_id in undescribed_ids:
+                load_results[dataset_id] = _measure_source_load(
+                    dataset_id, self._load_indexed_source, self._load_source_meta, dataset_id,
+                )
+
+        loaded_metas: dict[str, DatasetMeta] = {}
+        for dataset_id in consumer_counts:
+            source_meta, load_metrics = load_results[dataset_id]
+            loaded_metas[dataset_id] = source_meta
+            self._record_stage(load_metrics)
+            self._note_missing_images(dataset_id, source_meta)
+            logger.info(
+                "소스 로드 완료: dataset_id=%s, images=%d, categories=%d, consumers=%d",
+                dataset_id, source_meta.image_count,
+                len(source_meta.categories), consumer_counts[dataset_id],
+            )
+
+        return _SourceMetaPool(loaded_metas, consumer_counts)
+
+    def _compute_task_output(
+        self,
+        operator_name: str,
+        params: dict[str, Any],
+        input_metas: list[DatasetMeta],
+    ) -> DatasetMeta:
+        """
+        입력 DatasetMeta 목록에 operator 를 적용한다.
+
+        multi-input manipulator(예: det_merge_datasets)는 list를 직접 받고,
+        그 외 multi-input은 기존 _merge_metas()로 단건 병합 후 전달한다.
+        """
+        if self._is_multi_input_manipulator(operator_name):
+            return self._apply_manipulator(input_metas, operator_name, params)
+        if len(input_metas) == 1:
+            return self._apply_manipulator(input_metas[0], operator_name, params)
+        working_meta = self._merge_metas(input_metas)
+        return self._apply_manipulator(working_meta, operator_name, params)
+
+    def _compute_fused_chain_output(
+        self,
+        steps: list[tuple[str, dict[str, Any]]],
+        input_meta: DatasetMeta,
+    ) -> tuple[DatasetMeta, list[_FusedStepStats]]:
+        """
+        per-record manipulator 체인을 레코드당 1회 순회로 실행한다.
+
+        각 단계의 build_record_transform 은 앞 단계의 출력 메타(레코드 없음)를 받아
+        categories 등 메타 레벨 변경을 먼저 확정한다. 이후 레코드마다 모든 단계의 apply 를
+        차례로 적용하고, 어느 단계에서 None 이 나오면 그 레코드는 뒤 단계로 가지 않는다.
+
+        Returns:
+            (마지막 단계의 출력 DatasetMeta, 단계별 통계)
+        """
+        record_transforms = self._build_record_transforms(steps, input_meta)
+
+        # passed_counts[i] = i 번째 단계를 통과한(출력된) 레코드 수
+        passed_counts = [0] * len(record_transforms)
+        result_meta = record_transforms[-1].output_meta
+        result_meta.image_records = list(_iter_record_transforms(
+            input_meta.image_records, record_transforms, passed_counts,
+        ))
+
+        step_stats = self._finish_record_transforms(
+            steps, record_transforms, input_meta.image_count, passed_counts, "fused",
+        )
+        return result_meta, step_stats
+
+    def _build_record_transforms(
+        self,
+        steps: list[tuple[str, dict[str, Any]]],
+        input_meta: DatasetMeta,
+    ) -> list[RecordTransform]:
+        """
+        각 단계의 RecordTransform 을 만든다. 단계마다 앞 단계의 출력 메타(레코드 없음)를 받아
+        categories 등 메타 레벨 변경을 먼저 확정한다.
+        """
+        record_transforms: list[RecordTransform] = []
+        step_input_meta = input_meta
+        for operator_name, params in steps:
+            manipulator_class = MANIPULATOR_REGISTRY.get(operator_name)
+            if manipulator_class is None:
+                raise ValueError(f"등록되지 않은 manipulator: {operator_name}")
+            record_transform = manipulator_class().build_record_transform(step_input_meta, params)
+            record_transforms.append(record_transform)
+            step_input_meta = record_transform.output_meta
+        return record_transforms
+
+    def _finish_record_transforms(
+        self,
+        steps: list[tuple[str, dict[str, Any]]],
+        record_transforms: list[RecordTransform],
+        input_image_count: int,
+        passed_counts: list[int],
+        mode_label: str,
+    ) -> list[_FusedStepStats]:
+        """모든 레코드를 흘려보낸 뒤 단계별 finish 호출 + 적용 로그. 단계별 통계를 반환한다."""
+        step_stats: list[_FusedStepStats] = []
+        step_input_count = input_image_count
+        for (operator_name, _), record_transform, output_count in zip(
+            steps, record_transforms, passed_counts, strict=True,
+        ):
+            if record_transform.finish is not None:
+                record_transform.finish(step_input_count, output_count)
+            logger.info(
+                "manipulator 적용 완료 (%s): name=%s, input_images=%d, output_images=%d",
+                mode_label, operator_name, step_input_count, output_count,
+            )
+            step_stats.append(_FusedStepStats(
+                input_images=step_input_count,
+                output_images=output_count,
+                category_count=len(record_transform.output_meta.categories),
+            ))
+            step_input_count = output_count
+        return step_stats
+
+    def _compute_merge_with_pushed_filters(
+        self,
+        steps: list[tuple[str, dict[str, Any]]],
+        input_metas: list[DatasetMeta],
+    ) -> tuple[DatasetMeta, list[_FusedStepStats]]:
+        """
+        병합 + 병합 직후 "per_record" 필터들을 한 번에 계산한다 (predicate pushdown).
+
+        필터의 판정 함수는 병합 결과와 같은 categories 를 가진 빈 메타로 미리 만들고,
+        병합 manipulator 가 입력 레코드마다 호출한다 (context["record_filter"]).
+        걸러진 레코드는 병합 레코드를 만들지 않는다. 필터는 레코드/메타를 바꾸지 않으므로
+        (record_selection 규약) 병합 결과가 곧 마지막 필터의 출력이다.
+        필터 뒤에 이어진 per-record 단계가 있으면 fusion 으로 이어서 계산한다.
+
+        Returns:
+            (마지막 단계의 출력 DatasetMeta, 단계별 통계 — 병합 단계 출력 수는 필터 적용 전 기준)
+        """
+        merge_operator, merge_params = steps[0]
+        filter_count = 0
+        for operator_name, _ in steps[1:]:
+            manipulator_class = MANIPULATOR_REGISTRY.get(operator_name)
+            if manipulator_class is None or manipulator_class.record_selection != "per_record":
+                break
+            filter_count += 1
+        filter_steps = steps[1:1 + filter_count]
+
+        preview_meta = derive_dataset_meta(
+            input_metas[0],
+            categories=list(dict.fromkeys(
+                name for meta in input_metas for name in meta.categories
+            )),
+            image_records=[],
+        )
+        record_transforms: list[RecordTransform] = []
+        for operator_name, params in filter_steps:
+            record_transform = MANIPULATOR_REGISTRY[operator_name]().build_record_transform(
+                preview_meta, params,
+            )
+            record_transforms.append(record_transform)
+            preview_meta = record_transform.output_meta
 
-            # 입력 이미지 수 집계 (진행 추적용)
-            input_image_count = sum(m.image_count for m in input_metas)
+        passed_counts = [0] * len(record_transforms)
 
-            # multi-input manipulator(예: det_merge_datasets)는 list를 직접 받고,
-            # 그 외 multi-input은 기존 _merge_metas()로 단건 병합 후 전달
-            if self._is_multi_input_manipulator(task_config.operator):
-                result_meta = self._apply_manipulator(
-                    input_metas, task_config.operator, task_config.params,
-                )
-            elif len(input_metas) == 1:
-                result_meta = self._apply_manipulator(
-                    input_metas[0], task_config.operator, task_config.params,
-                )
-            else:
-                working_meta = self._merge_metas(input_metas)
-                result_meta = self._apply_manipulator(
-                    working_meta, task_config.operator, task_config.params,
-                )
-            # DAG 분기 시 동일 소스의 중간 결과를 구분하기 위해
-            # 각 태스크 출력에 고유 dataset_id를 부여한다.
-            # 이것이 없으면 merge가 같은 dataset_id를 가진 레코드들의
-            # 파일명 충돌을 감지하지 못해 이미지가 덮어쓰기된다.
-            result_meta.dataset_id = f"__task__{task_name}__{uuid.uuid4().hex[:8]}"
-            task_results[task_name] = result_meta
-
-            task_finished_at = datetime.now(timezone.utc).isoformat()
+        def _passes_pushed_filters(record: ImageRecord) -> bool:
+            for step_index, record_transform in enumerate(record_transforms):
+                if record_transform.apply(record) is None:
+                    return False
+                passed_counts[step_index] += 1
+            return True
+
+        merged_meta = self._apply_manipulator(
+            input_metas, merge_operator, merge_params,
+            context={"record_filter": _passes_pushed_filters},
+        )
+
+        merged_image_count = sum(meta.image_count for meta in input_metas)
+        step_stats = [_FusedStepStats(
+            input_images=merged_image_count,
+            output_images=merged_image_count,
+            category_count=len(merged_meta.categories),
+        )]
+        step_input_count = merged_image_count
+        for (operator_name, _), record_transform, output_count in zip(
+            filter_steps, record_transforms, passed_counts, strict=True,
+        ):
+            if record_transform.finish is not None:
+                record_transform.finish(step_input_count, output_count)
             logger.info(
-                "태스크 완료: %s → images=%d, categories=%d",
-                task_name, result_meta.image_count, len(result_meta.categories),
+                "manipulator 적용 완료 (병합 중 적용): name=%s, input_images=%d, output_images=%d",
+                operator_name, step_input_count, output_count,
             )
+            step_stats.append(_FusedStepStats(
+                input_images=step_input_count,
+                output_images=output_count,
+                category_count=len(merged_meta.categories),
+            ))
+            step_input_count = output_count
+
+        remaining_steps = steps[1 + filter_count:]
+        if not remaining_steps:
+            return merged_meta, step_stats
+        result_meta, remaining_stats = self._compute_fused_chain_output(
+            remaining_steps, merged_meta,
+        )
+        return result_meta, step_stats + remaining_stats
 
-            # 태스크 진행 콜백: DONE
-            if self._on_task_progress:
-                self._on_task_progress(task_name, "DONE", {
-                    "operator": task_config.operator,
-                    "started_at": task_started_at,
-                    "finished_at": task_finished_at,
-                    "input_images": input_image_count,
-                    "output_images": result_meta.image_count,
-                })
+    def _finish_task(
+        self,
+        task_name: str,
+        task_config: TaskConfig,
+        task_started_at: str,
+        input_image_count: int,
+        result_meta: DatasetMeta,
+        task_results: _TaskResultStore,
+        result_name: str | None = None,
+        cache_status: str | None = None,
+    ) -> None:
+        """
+        태스크 결과 등록 + 완료 로그 + DONE 콜백.
 
-        # 최종 태스크의 출력이 파이프라인의 최종 결과
-        output_meta = task_results[terminal_task_name]
+        result_name: 결과 dataset_id 에 쓸 이름. 필터 선행 이동으로 이 태스크가 다른 태스크의
+        자리(소비자 입력)를 물려받았으면 원래 태스크명이 온다 (OptimizedPipelinePlan.result_names).
+        """
+        # DAG 분기 시 동일 소스의 중간 결과를 구분하기 위해
+        # 각 태스크 출력에 고유 dataset_id를 부여한다.
+        # 이것이 없으면 merge가 같은 dataset_id를 가진 레코드들의
+        # 파일명 충돌을 감지하지 못해 이미지가 덮어쓰기된다.
+        # 태스크명은 config 내에서 유일하므로 그대로 쓴다 — 랜덤 suffix 를 붙이면
+        # merge rename hash 가 실행마다 달라져 직렬/병렬 결과가 재현되지 않는다.
+        result_meta.dataset_id = f"__task__{result_name or task_name}"
+        task_results[task_name] = result_meta
+
+        self._report_task_done(
+            task_name, task_config.operator, task_started_at,
+            input_image_count, result_meta.image_count, len(result_meta.categories),
+            cache_status,
+        )
 
-        # 출력 포맷은 config에서 결정 (통일포맷이므로 내부 모델에 포맷 정보 없음)
-        output_format = config.output.annotation_format.upper()
+    def _report_task_done(
+        self,
+        task_name: str,
+        operator_name: str,
+        task_started_at: str,
+        input_image_count: int,
+        output_image_count: int,
+        category_count: int,
+        cache_status: str | None = None,
+    ) -> None:
+        """
+        태스크 완료 로그 + DONE 콜백 (측정 가능하면 현재 RSS 포함).
 
+        cache_status: 태스크 결과 캐시를 쓰는 run 이면 "hit" | "miss".
+        """
+        task_finished_at = datetime.now(UTC).isoformat()
+        rss_mb = bytes_to_mb(self._run_peak_rss.sample()) if self._run_peak_rss else None
         logger.info(
-            "Phase A 완료 (annotation 처리): images=%d, categories=%d, output_format=%s",
-            output_meta.image_count, len(output_meta.categories), output_format,
+            "태스크 완료: %s → images=%d, categories=%d, rss_mb=%s",
+            task_name, output_image_count, category_count, rss_mb,
         )
 
-        # ── Phase B: 공통 실체화 경로 ──
-        return self._materialize_and_write(
-            config=config,
-            target_version=target_version,
-            output_meta=output_meta,
-            all_source_storage_uris=all_source_storage_uris,
-            output_format=output_format,
-            log_buffer_handler=log_buffer_handler,
-        )
+        if self._on_task_progress:
+            done_detail: dict[str, Any] = {
+                "operator": operator_name,
+                "started_at": task_started_at,
+                "finished_at": task_finished_at,
+                # 입력 이미지 수 집계 (진행 추적용)
+                "input_images": input_image_count,
+                "output_images": output_image_count,
+            }
+            if rss_mb is not None:
+                done_detail["rss_mb"] = rss_mb
+            if cache_status is not None:
+                done_detail["cache"] = cache_status
+            self._on_task_progress(task_name, "DONE", done_detail)
 
     # -------------------------------------------------------------------------
     # Passthrough (Load → Save 직결)
@@ -259,28 +1985,57 @@ class PipelineDagExecutor:
         self,
         config: PipelineConfig,
         target_version: str,
-        log_buffer_handler: '_ProcessingLogBufferHandler',
-    ) -> 'PipelineResult':
+        log_handler: ProcessingLogSpoolHandler,
+    ) -> PipelineResult:
         """
         Tasks 가 없는 파이프라인 — 소스 메타를 그대로 output 으로 복사한다.
 
         annotation 변환 없음. 이미지는 기존 Phase B 경로로 lazy-copy 된다.
+
+        출력 포맷이 source 포맷과 같으면 (clone_passthrough) source 버전 디렉토리를 복제한다 —
+        annotation 파일은 바이트 그대로 복사하고 이미지는 hardlink 한다 (안 되면 복사).
+        DB 갱신에 필요한 수치는 source 의 파싱 결과 캐시에서 읽으므로 annotation 을 다시 파싱 /
+        작성하지 않는다 (캐시가 없을 때만 파싱). images 디렉토리가 레코드와 정확히 맞지 않으면
+        (_clone_images_match_records) 복제하지 않고 일반 경로로 로드 / 실체화한다 — 없는 이미지는
+        빼고 skipped 로 보고하며, 레코드 없는 파일은 출력에 옮기지 않는다.
         """
         source_dataset_id = config.passthrough_source_dataset_id
         assert source_dataset_id is not None, "is_passthrough 체크에서 보장되어야 함"
 
-        logger.info("Passthrough 모드: source=%s", source_dataset_id)
+        output_format = config.output.annotation_format.upper()
+        clone_source: SourceDescriptor | None = None
+        if self.clone_passthrough:
+            descriptor = self._describe_source(source_dataset_id)
+            if descriptor is not None and descriptor.annotation_format.upper() == output_format:
+                clone_source = descriptor
+
+        logger.info(
+            "Passthrough 모드: source=%s, clone=%s", source_dataset_id, clone_source is not None,
+        )
 
         # Load 단계 진행 콜백 (단일 synthetic task)
         passthrough_task_name = "__passthrough_load__"
-        load_started_at = datetime.now(timezone.utc).isoformat()
+        load_started_at = datetime.now(UTC).isoformat()
         if self._on_task_progress:
             self._on_task_progress(passthrough_task_name, "RUNNING", {
                 "operator": "passthrough_load",
                 "started_at": load_started_at,
             })
 
-        source_meta = self._load_source_meta(source_dataset_id)
+        if clone_source is not None:
+            source_meta, load_metrics = _measure_source_load(
+                source_dataset_id, _load_clone_source_meta, self.storage, clone_source,
+            )
+            self._record_stage(load_metrics)
+            if not self._clone_images_match_records(source_meta):
+                clone_source = None
+        if clone_source is None:
+            source_meta, load_metrics = _measure_source_load(
+                source_dataset_id, self._load_indexed_source,
+                self._load_source_meta, source_dataset_id,
+            )
+            self._record_stage(load_metrics)
+        self._note_missing_images(source_dataset_id, source_meta)
         all_source_storage_uris = [source_meta.storage_uri]
 
         # 소스를 output 으로 그대로 사용. Phase B 에서 storage_uri 를 덮어쓴다.
@@ -290,13 +2045,11 @@ class PipelineDagExecutor:
             self._on_task_progress(passthrough_task_name, "DONE", {
                 "operator": "passthrough_load",
                 "started_at": load_started_at,
-                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "finished_at": datetime.now(UTC).isoformat(),
                 "input_images": output_meta.image_count,
                 "output_images": output_meta.image_count,
             })
 
-        output_format = config.output.annotation_format.upper()
-
         logger.info(
             "Phase A 완료 (passthrough): images=%d, task_kind=%s, output_format=%s",
             output_meta.image_count, output_meta.task_kind, output_format,
@@ -309,7 +2062,8 @@ class PipelineDagExecutor:
             output_meta=output_meta,
             all_source_storage_uris=all_source_storage_uris,
             output_format=output_format,
-            log_buffer_handler=log_buffer_handler,
+            log_handler=log_handler,
+            clone_source=clone_source,
         )
 
     def _materialize_and_write(
@@ -319,24 +2073,46 @@ class PipelineDagExecutor:
         output_meta: DatasetMeta,
         all_source_storage_uris: list[str],
         output_format: str,
-        log_buffer_handler: '_ProcessingLogBufferHandler',
-    ) -> 'PipelineResult':
+        log_handler: ProcessingLogSpoolHandler,
+        record_stream: Iterator[ImageRecord] | None = None,
+        output_config: OutputConfig | None = None,
+        source_dataset_ids: list[str] | None = None,
+        progress_task_name: str = "__image_materialize__",
+        clone_source: SourceDescriptor | None = None,
+    ) -> PipelineResult:
         """
         Phase B 공통 경로: 출력 경로 해석 → 이미지 실체화 → annotation 작성 → processing.log.
 
         _run_pipeline 과 _run_passthrough 가 공유한다.
         (원래 _run_pipeline 안에 인라인되어 있었으나 passthrough 도 같은 경로가 필요해 분리.)
+
+        stream_records 가 켜져 있고 포맷이 streaming 을 지원하면 레코드 단위로 실체화·기록한다.
+        record_stream(streamed tail 의 출력)이 있으면 output_meta.image_records 대신 그것을 쓴다.
+
+        추가 출력은 output_config(출력 설정), source_dataset_ids(lineage 대상),
+        progress_task_name(진행 콜백 키)을 출력별로 넘긴다. 기본값은 기본 출력 기준.
+
+        clone_source 가 있으면 (passthrough 복제) 이미지 계획 / annotation 작성 대신
+        source 버전 디렉토리를 복제한다. output_meta 는 source 의 파싱 결과 그대로다.
         """
-        image_materialize_started_at = datetime.now(timezone.utc).isoformat()
+        output_config = output_config or config.output
+        if self._run_perf is not None:
+            self._run_perf.mark_phase_b()
+        image_materialize_started_at = datetime.now(UTC).isoformat()
         if self._on_task_progress:
-            self._on_task_progress("__image_materialize__", "RUNNING", {
+            running_detail: dict[str, Any] = {
                 "operator": "image_materialize",
                 "started_at": image_materialize_started_at,
-                "total_images": output_meta.image_count,
-            })
+            }
+            # streamed tail 의 출력 수는 다 흘려보내기 전에는 알 수 없다
+            if record_stream is None:
+                running_detail["total_images"] = output_meta.image_count
+            if output_config is not config.output:
+                running_detail["output_split"] = output_config.split.upper()
+            self._on_task_progress(progress_task_name, "RUNNING", running_detail)
 
-        output_dataset_type = config.output.dataset_type.upper()
-        output_split = config.output.split.upper()
+        output_dataset_type = output_config.dataset_type.upper()
+        output_split = output_config.split.upper()
 
         output_storage_uri = self.storage.build_dataset_uri(
             dataset_type=output_dataset_type,
@@ -348,39 +2124,89 @@ class PipelineDagExecutor:
 
         self.storage.makedirs(output_storage_uri)
 
-        image_plans = self._build_image_plans(
-            output_meta, all_source_storage_uris, output_storage_uri,
-        )
-        dataset_plan = DatasetPlan(output_meta=output_meta, image_plans=image_plans)
+        if clone_source is not None:
+            with measure_stage(STAGE_MATERIALIZE, f"{output_split} (clone)") as materialize_metrics:
+                materialize_result, annotation_filenames = self._clone_source_version(
+                    clone_source, output_storage_uri,
+                )
+                materialize_metrics.record_count = materialize_result.materialized_count
+            self._record_stage(materialize_metrics)
+            written_image_count = output_meta.image_count
+        elif self._streams_output(output_format):
+            # streamed tail 계산 / ImagePlan / annotation 기록이 레코드마다 섞이므로 한 단계로 잰다
+            with measure_stage(
+                STAGE_MATERIALIZE, f"{output_split} (streaming)",
+            ) as materialize_metrics:
+                materialize_result, annotation_filenames, written_image_count = (
+                    self._stream_materialize_and_write(
+                        output_meta,
+                        record_stream if record_stream is not None else output_meta.image_records,
+                        all_source_storage_uris, output_storage_uri, output_format,
+                    )
+                )
+                materialize_metrics.record_count = materialize_result.materialized_count
+            self._record_stage(materialize_metrics)
+            if record_stream is None:
+                self._drop_skipped_records(output_meta, materialize_result)
+        else:
+            with measure_stage(STAGE_PLAN, f"image_plans:{output_split}") as plan_metrics:
+                image_plans = self._build_image_plans(
+                    output_meta, all_source_storage_uris, output_storage_uri,
+                )
+                plan_metrics.record_count = len(image_plans)
+            self._record_stage(plan_metrics)
+            dataset_plan = DatasetPlan(output_meta=output_meta, image_plans=image_plans)
 
-        logger.info(
-            "이미지 실체화 계획: total=%d, copy_only=%d, transform=%d",
-            dataset_plan.total_images, dataset_plan.copy_only_count,
-            dataset_plan.transform_count,
-        )
+            logger.info(
+                "이미지 실체화 계획: total=%d, copy_only=%d, transform=%d",
+                dataset_plan.total_images, dataset_plan.copy_only_count,
+                dataset_plan.transform_count,
+            )
 
-        image_materializer = ImageMaterializer(self.storage)
-        materialize_result = image_materializer.materialize(dataset_plan)
-
-        if materialize_result.skipped_count > 0:
-            skipped_file_set = set(materialize_result.skipped_files)
-            original_count = len(output_meta.image_records)
-            output_meta.image_records = [
-                record for record in output_meta.image_records
-                if record.file_name not in skipped_file_set
+            image_materializer = ImageMaterializer(
+                self.storage,
+                journal=self._run_journal,
+                io_workers=self.materialize_io_workers,
+                transform_workers=self.materialize_transform_workers,
+                transform_pool=self.materialize_transform_pool,
+                link_strategy=self.materialize_link_strategy,
+                blob_store=self.image_blob_store,
+                buffer_bytes=self.materialize_buffer_bytes,
+            )
+            with measure_stage(STAGE_MATERIALIZE, output_split) as materialize_metrics:
+                materialize_result = image_materializer.materialize(dataset_plan)
+                materialize_metrics.record_count = materialize_result.materialized_count
+            self._record_stage(materialize_metrics)
+            self._drop_skipped_records(output_meta, materialize_result)
+
+            with measure_stage(STAGE_ANNOTATION_WRITE, output_split) as annotation_metrics:
+                annotation_filenames = self._write_annotations(
+                    output_meta, output_storage_uri, output_format,
+                )
+                annotation_metrics.record_count = output_meta.image_count
+                annotation_metrics.annotation_count = _annotation_count(output_meta)
+            self._record_stage(annotation_metrics)
+            written_image_count = output_meta.image_count
+        if self._run_missing_images:
+            # 로드 시 이미지 파일이 없어 뺀 레코드도 이 출력의 source 것이면 skipped 로 보고한다
+            materialize_result.skipped_files[:0] = [
+                file_name
+                for dataset_id in (
+                    source_dataset_ids if source_dataset_ids is not None
+                    else config.get_all_source_dataset_ids()
+                )
+                for file_name in self._run_missing_images.get(dataset_id, [])
             ]
-            logger.warning(
-                "스킵된 이미지 제거: 원본 %d → 필터링 후 %d (제거 %d건)",
-                original_count, len(output_meta.image_records),
-                materialize_result.skipped_count,
+        if self._run_perf is not None:
+            self._run_perf.add_output(
+                output_split, materialize_result, materialize_metrics.wall_seconds,
             )
 
-        annotation_filenames = self._write_annotations(
-            output_meta, output_storage_uri, output_format,
-        )
-
         annotation_meta_filename: str | None = None
-        if output_format == "YOLO":
+        if clone_source is not None:
+            # 메타 파일(data.yaml 등)도 source 것을 그대로 복사했다
+            annotation_meta_filename = clone_source.annotation_meta_file
+        elif output_format == "YOLO":
             output_root_dir = self.storage.resolve_path(output_storage_uri)
             from lib.pipeline.io.yolo_io import _write_yolo_data_yaml
             sorted_category_names = sorted(output_meta.categories)
@@ -390,28 +2216,62 @@ class PipelineDagExecutor:
         elif output_format == "CLS_MANIFEST":
             annotation_meta_filename = "head_schema.json"
 
+        peak_rss_mb = bytes_to_mb(self._run_peak_rss.peak_bytes()) if self._run_peak_rss else None
+        # 단계별 계측 — 기본 출력이 마지막이므로 기본 출력에 run 전체를 싣는다
+        stage_metrics: list[StageMetrics] = []
+        perf_report: dict[str, Any] | None = None
+        if output_config is config.output and self._run_stage_metrics is not None:
+            stage_metrics = self._run_stage_metrics.metrics
+        if output_config is config.output and self._run_perf is not None:
+            perf_report = self._run_perf.build_report(
+                config.name, stage_metrics,
+                self._run_cache_counts if self.task_result_cache is not None else None,
+                peak_rss_mb,
+            )
+            write_perf_report(self.storage.resolve_path(output_storage_uri), perf_report)
         if self._on_task_progress:
-            self._on_task_progress("__image_materialize__", "DONE", {
+            materialize_detail: dict[str, Any] = {
                 "operator": "image_materialize",
                 "started_at": image_materialize_started_at,
-                "finished_at": datetime.now(timezone.utc).isoformat(),
-                "total_images": output_meta.image_count,
+                "finished_at": datetime.now(UTC).isoformat(),
+                "total_images": written_image_count,
                 "materialized": materialize_result.materialized_count,
                 "skipped": materialize_result.skipped_count,
-            })
+            }
+            # run 전체의 최대 RSS — 실행 이력 화면에서 run 단위로 보여준다
+            if peak_rss_mb is not None:
+                materialize_detail["peak_rss_mb"] = peak_rss_mb
+            if output_config is not config.output:
+                materialize_detail["output_split"] = output_split
+            elif self.task_result_cache is not None and self._run_cache_counts is not None:
+                # run 전체의 태스크 결과 캐시 hit / miss 수 (기본 출력에만 싣는다)
+                materialize_detail["cache_hits"] = self._run_cache_counts["hits"]
+                materialize_detail["cache_misses"] = self._run_cache_counts["misses"]
+            if self._incremental_reuse is not None:
+                materialize_detail["reused"] = materialize_result.reused_count
+            if materialize_result.resumed_count:
+                # 중단된 이전 시도에서 이미 만들어 둔 이미지 수 (이어서 실행)
+                materialize_detail["resumed"] = materialize_result.resumed_count
+            if stage_metrics:
+                materialize_detail["stages"] = [metrics.as_dict() for metrics in stage_metrics]
+            self._on_task_progress(progress_task_name, "DONE", materialize_detail)
 
         logger.info(
-            "파이프라인 실행 완료: output_uri=%s, images=%d, skipped=%d, annotations=%d",
+            "파이프라인 실행 완료: output_uri=%s, images=%d, skipped=%d, reused=%d, "
+            "annotations=%d, peak_rss_mb=%s",
             output_storage_uri, materialize_result.materialized_count,
-            materialize_result.skipped_count, len(annotation_filenames),
+            materialize_result.skipped_count, materialize_result.reused_count,
+            len(annotation_filenames), peak_rss_mb,
         )
 
         self._write_processing_log(
             output_storage_uri=output_storage_uri,
             config=config,
-            log_lines=log_buffer_handler.get_log_lines(),
+            output_config=output_config,
+            log_handler=log_handler,
             materialize_result=materialize_result,
             annotation_filenames=annotation_filenames,
+            stage_metrics=stage_metrics,
         )
 
         return PipelineResult(
@@ -422,16 +2282,247 @@ class PipelineDagExecutor:
             output_format=output_format,
             annotation_filenames=annotation_filenames,
             annotation_meta_filename=annotation_meta_filename,
-            image_count=materialize_result.materialized_count,
-            source_dataset_ids=config.get_all_source_dataset_ids(),
+            # 복제는 디렉토리 파일을 옮기므로 레코드 수를 쓴다 (복제 전에 같음을 확인했다)
+            image_count=(
+                output_meta.image_count if clone_source is not None
+                else materialize_result.materialized_count
+            ),
+            source_dataset_ids=(
+                source_dataset_ids if source_dataset_ids is not None
+                else config.get_all_source_dataset_ids()
+            ),
             skipped_image_count=materialize_result.skipped_count,
             skipped_image_files=materialize_result.skipped_files,
+            perf_report=perf_report,
+            cloned_source_dataset_id=clone_source.dataset_id if clone_source else None,
+        )
+
+    def _clone_source_version(
+        self,
+        descriptor: SourceDescriptor,
+        output_storage_uri: str,
+    ) -> tuple[MaterializeResult, list[str]]:
+        """
+        passthrough 복제: source 버전의 annotation / 메타 파일을 바이트 그대로 복사하고
+        images 디렉토리의 파일을 hardlink 한다.
+
+        YOLO 는 파서가 label 디렉토리를 통째로 읽으므로 *.txt 전부를, 그 외 포맷은
+        descriptor.annotation_files 를 복사한다 (CLS_MANIFEST 는 데이터셋 루트 기준).
+
+        Returns:
+            (이미지 복제 결과, 출력 annotation 파일명 목록)
+        """
+        format_upper = descriptor.annotation_format.upper()
+        source_root = self.storage.resolve_path(descriptor.storage_uri)
+        output_root = self.storage.resolve_path(output_storage_uri)
+        if format_upper == "CLS_MANIFEST":
+            source_annotations_dir, output_annotations_dir = source_root, output_root
+        else:
+            source_annotations_dir = self.storage.get_annotations_dir(descriptor.storage_uri)
+            output_annotations_dir = self.storage.get_annotations_dir(output_storage_uri)
+        if format_upper == "YOLO":
+            annotation_filenames = sorted(
+                path.name for path in source_annotations_dir.glob("*.txt")
+            )
+        else:
+            annotation_filenames = list(descriptor.annotation_files)
+
+        output_annotations_dir.mkdir(parents=True, exist_ok=True)
+        copy_paths = [
+            (source_annotations_dir / name, output_annotations_dir / name)
+            for name in annotation_filenames
+        ]
+        if descriptor.annotation_meta_file:
+            copy_paths.append((
+                source_root / descriptor.annotation_meta_file,
+                output_root / descriptor.annotation_meta_file,
+            ))
+        for source_path, output_path in copy_paths:
+            if source_path.exists():
+                shutil.copy2(source_path, output_path)
+        logger.info(
+            "annotation 복제 완료: format=%s, files=%d, source=%s",
+            format_upper, len(copy_paths), descriptor.storage_uri,
+        )
+
+        image_materializer = ImageMaterializer(self.storage)
+        materialize_result = image_materializer.clone_directory(
+            source_root / self.images_dirname, output_root / self.images_dirname,
+        )
+        if (source_root / IMAGE_REFS_FILENAME).exists():
+            # 이미지가 source 와 같은 inode 이므로 blob 참조 목록도 그대로 쓴다
+            shutil.copy2(source_root / IMAGE_REFS_FILENAME, output_root / IMAGE_REFS_FILENAME)
+        return materialize_result, annotation_filenames
+
+    def _clone_images_match_records(self, source_meta: DatasetMeta) -> bool:
+        """
+        passthrough 복제 전 검사 — images 디렉토리 파일이 레코드의 이미지 파일과 정확히 같은지.
+
+        scandir 1회로 만든 인덱스(source_image_index)로 레코드마다 확인한다. 없는 이미지
+        (레코드만 있음), 레코드 없는 파일, 인덱스로 판단할 수 없는 레코드가 있거나 디렉토리를
+        읽을 수 없으면 False — 디렉토리 복제로는 스킵 보고 / 레코드 수가 맞지 않는다.
+        """
+        image_index = build_source_image_index(
+            self.storage, source_meta.storage_uri, self.images_dirname,
+        )
+        if image_index is None:
+            return False
+        record_file_names: set[str] = set()
+        for record in source_meta.image_records:
+            if image_index.contains(record) is not True:
+                logger.info(
+                    "passthrough 복제 생략 — 이미지 파일 없음: %s (일반 실체화 경로)",
+                    record.file_name,
+                )
+                return False
+            record_file_names.add(record.file_name.rsplit("/", 1)[-1])
+        extra_count = len(image_index.file_names - record_file_names)
+        if extra_count:
+            logger.info(
+                "passthrough 복제 생략 — 레코드 없는 이미지 파일 %d개 (일반 실체화 경로)",
+                extra_count,
+            )
+            return False
+        return True
+
+    def _record_stage(self, metrics: StageMetrics) -> None:
+        """단계 계측값을 run 수집기와 hook 에 넘긴다 (hook 실패는 경고 후 무시)."""
+        if self._run_stage_metrics is None:
+            return
+        self._run_stage_metrics.on_stage_end(metrics)
+        for hook in self.instrumentation_hooks:
+            try:
+                hook.on_stage_end(metrics)
+            except Exception as hook_error:
+                logger.warning(
+                    "계측 hook 실패 — 무시: %s (%s/%s, %s)",
+                    type(hook).__name__, metrics.stage, metrics.name, hook_error,
+                )
+
+    def _streams_output(self, output_format: str) -> bool:
+        """Phase B 를 레코드 단위 streaming 으로 실행하는지 여부."""
+        return self.stream_records and output_format in _STREAMABLE_OUTPUT_FORMATS
+
+    def _stream_materialize_and_write(
+        self,
+        output_meta: DatasetMeta,
+        records: Iterable[ImageRecord],
+        source_storage_uris: list[str],
+        output_storage_uri: str,
+        output_format: str,
+    ) -> tuple[MaterializeResult, list[str], int]:
+        """
+        Phase B streaming 경로: 레코드마다 ImagePlan 생성 → 이미지 실체화 → annotation 기록.
+
+        소스 이미지가 없어 건너뛴 레코드는 annotation 에 쓰지 않는다 (일괄 경로의 스킵 제거와 동일).
+        output_meta 에서는 categories 만 읽는다 — 레코드는 records 로만 받는다.
+
+        Returns:
+            (실체화 결과, 작성된 annotation 파일명 목록, annotation 에 기록한 이미지 수)
+        """
+        annotations_dir = self.storage.get_annotations_dir(output_storage_uri)
+        is_classification = output_meta.task_kind == "CLASSIFICATION"
+        image_materializer = ImageMaterializer(
+            self.storage,
+            journal=self._run_journal,
+            link_strategy=self.materialize_link_strategy,
+            blob_store=self.image_blob_store,
+        )
+        materialize_result = MaterializeResult()
+        logger.info("이미지 실체화 + annotation 작성 (streaming): output_format=%s", output_format)
+
+        if output_format == "COCO":
+            stream_writer = CocoJsonStreamWriter(
+                output_meta.categories, annotations_dir / "instances.json",
+            )
+        else:
+            stream_writer = YoloLabelStreamWriter(output_meta.categories, annotations_dir)
+
+        with stream_writer:
+            for record in records:
+                image_plan = self._build_image_plan(
+                    record, is_classification, source_storage_uris, output_storage_uri,
+                )
+                if image_plan is not None and not image_materializer.materialize_one(
+                    image_plan, materialize_result,
+                ):
+                    continue
+                stream_writer.write(record)
+
+        image_materializer.write_image_refs()
+        image_materializer.log_summary(materialize_result)
+        if output_format == "COCO":
+            logger.info("COCO annotation 작성 완료: path=%s", annotations_dir / "instances.json")
+            annotation_filenames = ["instances.json"]
+        else:
+            annotation_filenames = sorted(f.name for f in annotations_dir.glob("*.txt"))
+            logger.info("YOLO annotation 작성 완료: file_count=%d", len(annotation_filenames))
+        return materialize_result, annotation_filenames, stream_writer.image_count
+
+    def _drop_skipped_records(
+        self,
+        output_meta: DatasetMeta,
+        materialize_result: MaterializeResult,
+    ) -> None:
+        """소스 이미지가 없어 실체화하지 못한 레코드를 output_meta 에서 뺀다."""
+        if materialize_result.skipped_count == 0:
+            return
+        skipped_file_set = set(materialize_result.skipped_files)
+        original_count = len(output_meta.image_records)
+        output_meta.image_records = [
+            record for record in output_meta.image_records
+            if record.file_name not in skipped_file_set
+        ]
+        logger.warning(
+            "스킵된 이미지 제거: 원본 %d → 필터링 후 %d (제거 %d건)",
+            original_count, len(output_meta.image_records),
+            materialize_result.skipped_count,
         )
 
     # -------------------------------------------------------------------------
     # 내부 헬퍼
     # -------------------------------------------------------------------------
 
+    def _load_indexed_source(
+        self,
+        load: Callable[..., DatasetMeta],
+        *load_args: Any,
+    ) -> DatasetMeta:
+        """
+        source 를 로드하고 images 디렉토리 인덱스를 붙인다 (이미지 파일이 없는 레코드는 뺀다).
+
+        source-load 스레드에서도 불린다 — 뺀 파일명은 meta.image_index 에 남기고
+        run 상태 기록은 호출 스레드의 _note_missing_images 가 한다.
+        """
+        source_meta = load(*load_args)
+        if not self.index_source_images:
+            return source_meta
+        image_index = build_source_image_index(
+            self.storage, source_meta.storage_uri, self.images_dirname,
+        )
+        if image_index is None:
+            return source_meta
+        return prune_missing_images(source_meta, image_index)
+
+    def _note_missing_images(self, dataset_id: str, source_meta: DatasetMeta) -> None:
+        """로드 시 뺀 파일명을 run 상태에 남긴다 (출력마다 skipped 로 보고)."""
+        if (
+            self._run_missing_images is not None
+            and source_meta.image_index is not None
+            and source_meta.image_index.missing_files
+        ):
+            self._run_missing_images[dataset_id] = source_meta.image_index.missing_files
+
+    def _describe_source(self, dataset_id: str) -> SourceDescriptor | None:
+        """
+        source 데이터셋의 파일 위치/포맷 정보를 반환한다.
+
+        서브클래스가 오버라이드하면 annotation 파싱을 thread pool 에서 병렬로 수행할 수 있다.
+        None 을 반환하면 _load_source_meta 로 호출 스레드에서 로드한다 (기본).
+        항상 호출 스레드에서 불리므로 DB 세션을 써도 된다.
+        """
+        return None
+
     def _load_source_meta(self, dataset_id: str) -> DatasetMeta:
         """
         DB에 등록된 데이터셋의 annotation을 파싱하여 DatasetMeta로 반환.
@@ -447,6 +2538,7 @@ class PipelineDagExecutor:
         meta: DatasetMeta | list[DatasetMeta],
         operator_name: str,
         params: dict[str, Any],
+        context: dict[str, Any] | None = None,
     ) -> DatasetMeta:
         """
         manipulator(operator)를 DatasetMeta에 적용한다.
@@ -459,7 +2551,7 @@ class PipelineDagExecutor:
             raise ValueError(f"등록되지 않은 manipulator: {operator_name}")
 
         manipulator_instance = manipulator_class()
-        result_meta = manipulator_instance.transform_annotation(meta, params)
+        result_meta = manipulator_instance.transform_annotation(meta, params, context)
 
         # 로깅
         if isinstance(meta, list):
@@ -545,49 +2637,71 @@ class PipelineDagExecutor:
         is_classification = output_meta.task_kind == "CLASSIFICATION"
 
         for record in output_meta.image_records:
-            source_uri_override = record.extra.get("source_storage_uri")
-            original_file_name = record.extra.get("original_file_name")
-
-            if is_classification:
-                # dst 는 merge rename 이 반영된 최종 이름.
-                dst_uri = f"{output_storage_uri}/{record.file_name}"
-                # src 는 rename 이전의 원본 경로여야 실제 파일을 찾을 수 있다.
-                if source_uri_override and original_file_name:
-                    src_uri = f"{source_uri_override}/{original_file_name}"
-                elif source_storage_uris:
-                    # 비-merge 경로: record.file_name 자체가 원본 경로와 동일.
-                    src_uri = f"{source_storage_uris[0]}/{record.file_name}"
-                else:
-                    logger.warning(
-                        "소스 경로를 결정할 수 없음 (건너뜀): file_name=%s",
-                        record.file_name,
-                    )
-                    continue
-            else:
-                if source_uri_override and original_file_name:
-                    src_uri = f"{source_uri_override}/{self.images_dirname}/{original_file_name}"
-                elif source_storage_uris:
-                    src_uri = (
-                        f"{source_storage_uris[0]}/{self.images_dirname}/{record.file_name}"
-                    )
-                else:
-                    logger.warning(
-                        "소스 경로를 결정할 수 없음 (건너뜀): file_name=%s",
-                        record.file_name,
-                    )
-                    continue
-                dst_uri = f"{output_storage_uri}/{self.images_dirname}/{record.file_name}"
+            image_plan = self._build_image_plan(
+                record, is_classification, source_storage_uris, output_storage_uri,
+            )
+            if image_plan is not None:
+                plans.append(image_plan)
 
-            # record.extra에 누적된 이미지 변환 명세 추출
-            raw_specs = record.extra.pop("image_manipulation_specs", [])
-            specs = [
-                ImageManipulationSpec(operation=s["operation"], params=s.get("params", {}))
-                for s in raw_specs
-            ]
+        return plans
 
-            plans.append(ImagePlan(src_uri=src_uri, dst_uri=dst_uri, specs=specs))
+    def _build_image_plan(
+        self,
+        record: ImageRecord,
+        is_classification: bool,
+        source_storage_uris: list[str],
+        output_storage_uri: str,
+    ) -> ImagePlan | None:
+        """
+        레코드 1장의 ImagePlan. 소스 경로를 정할 수 없으면 None.
 
-        return plans
+        경로 규칙은 _build_image_plans 참고.
+        """
+        source_uri_override = record.extra.get("source_storage_uri")
+        original_file_name = record.extra.get("original_file_name")
+
+        if is_classification:
+            # dst 는 merge rename 이 반영된 최종 이름.
+            dst_uri = f"{output_storage_uri}/{record.file_name}"
+            # src 는 rename 이전의 원본 경로여야 실제 파일을 찾을 수 있다.
+            if source_uri_override and original_file_name:
+                src_uri = f"{source_uri_override}/{original_file_name}"
+            elif source_storage_uris:
+                # 비-merge 경로: record.file_name 자체가 원본 경로와 동일.
+                src_uri = f"{source_storage_uris[0]}/{record.file_name}"
+            else:
+                logger.warning(
+                    "소스 경로를 결정할 수 없음 (건너뜀): file_name=%s",
+                    record.file_name,
+                )
+                return None
+        else:
+            if source_uri_override and original_file_name:
+                src_uri = f"{source_uri_override}/{self.images_dirname}/{original_file_name}"
+            elif source_storage_uris:
+                src_uri = (
+                    f"{source_storage_uris[0]}/{self.images_dirname}/{record.file_name}"
+                )
+            else:
+                logger.warning(
+                    "소스 경로를 결정할 수 없음 (건너뜀): file_name=%s",
+                    record.file_name,
+                )
+                return None
+            dst_uri = f"{output_storage_uri}/{self.images_dirname}/{record.file_name}"
+
+        # record.extra에 누적된 이미지 변환 명세 추출
+        # (레코드는 source/다른 태스크와 공유될 수 있으므로 pop 하지 않고 읽기만 한다)
+        raw_specs = record.extra.get("image_manipulation_specs", [])
+        specs = [
+            ImageManipulationSpec(operation=s["operation"], params=s.get("params", {}))
+            for s in raw_specs
+        ]
+
+        image_plan = ImagePlan(src_uri=src_uri, dst_uri=dst_uri, specs=specs)
+        if self._incremental_reuse is not None:
+            image_plan = self._incremental_reuse.apply(image_plan, output_storage_uri)
+        return image_plan
 
     def _write_annotations(
         self,
@@ -642,32 +2756,38 @@ class PipelineDagExecutor:
         self,
         output_storage_uri: str,
         config: PipelineConfig,
-        log_lines: list[str],
-        materialize_result: 'MaterializeResult',
+        log_handler: ProcessingLogSpoolHandler,
+        materialize_result: MaterializeResult,
         annotation_filenames: list[str],
+        output_config: OutputConfig | None = None,
+        stage_metrics: list[StageMetrics] | None = None,
     ) -> None:
         """
         파이프라인 실행 과정을 output 디렉토리에 processing.log로 기록한다.
+        output_config 는 이 디렉토리에 쓴 출력의 설정 (기본: config.output).
+        stage_metrics 가 있으면 [단계별 성능] 을 wall 시간 내림차순으로 쓴다.
+        상세 실행 로그는 log_handler 의 spool 에서 이어 붙인다 (메모리에 올리지 않음).
         """
-        from lib.pipeline.image_materializer import MaterializeResult  # noqa: F811
+        output_config = output_config or config.output
 
         output_dir = self.storage.resolve_path(output_storage_uri)
-        log_path = output_dir / "processing.log"
+        log_path = output_dir / PROCESSING_LOG_FILENAME
 
         try:
             with open(log_path, "w", encoding="utf-8") as log_file:
                 # ── 헤더: 파이프라인 설정 요약 ──
                 log_file.write("=" * 72 + "\n")
                 log_file.write(f"  파이프라인 실행 로그 — {config.name}\n")
-                log_file.write(f"  실행 시각: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n")
+                started_at = datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S UTC')
+                log_file.write(f"  실행 시각: {started_at}\n")
                 log_file.write("=" * 72 + "\n\n")
 
                 # 출력 설정
                 log_file.write("[출력 설정]\n")
                 log_file.write(f"  출력 경로       : {output_storage_uri}\n")
-                log_file.write(f"  데이터셋 타입   : {config.output.dataset_type}\n")
-                log_file.write(f"  Split           : {config.output.split}\n")
-                log_file.write(f"  어노테이션 포맷 : {config.output.annotation_format}\n")
+                log_file.write(f"  데이터셋 타입   : {output_config.dataset_type}\n")
+                log_file.write(f"  Split           : {output_config.split}\n")
+                log_file.write(f"  어노테이션 포맷 : {output_config.annotation_format}\n")
                 log_file.write("\n")
 
                 # DAG 태스크 목록
@@ -690,18 +2810,27 @@ class PipelineDagExecutor:
                 log_file.write(f"  최종 이미지 수       : {materialize_result.materialized_count}\n")
                 log_file.write(f"  스킵된 이미지 수     : {materialize_result.skipped_count}\n")
                 log_file.write(f"  생성된 어노테이션    : {', '.join(annotation_filenames)}\n")
+                if materialize_result.link_counts:
+                    log_file.write(
+                        f"  이미지 배치 방식     : {_format_link_summary(materialize_result)}"
+                        f" (설정: {self.materialize_link_strategy})\n"
+                    )
 
                 if materialize_result.skipped_count > 0:
                     log_file.write(f"\n[스킵된 이미지 목록] (총 {materialize_result.skipped_count}건)\n")
                     for skipped_file in materialize_result.skipped_files:
                         log_file.write(f"  - {skipped_file}\n")
 
+                if stage_metrics:
+                    log_file.write("\n[단계별 성능] (wall 시간 내림차순)\n")
+                    for summary_line in format_stage_summary(stage_metrics):
+                        log_file.write(f"  {summary_line}\n")
+
                 # 상세 실행 로그
                 log_file.write("\n" + "=" * 72 + "\n")
                 log_file.write("  상세 실행 로그\n")
                 log_file.write("=" * 72 + "\n\n")
-                for line in log_lines:
-                    log_file.write(line + "\n")
+                log_handler.copy_to(log_file)
 
             logger.info("processing.log 작성 완료: %s", log_path)
 
@@ -719,6 +2848,11 @@ class PipelineResult:
     파이프라인 실행 결과를 담는 컨테이너.
 
     output_format: 출력 annotation 포맷 ("COCO" | "YOLO")
+    extra_results: 추가 출력(config.extra_outputs)별 결과 (같은 순서, 단일 출력이면 빈 리스트)
+    perf_report: run 성능 보고서 (perf.json 내용, 기본 출력 결과에만 있다)
+    cloned_source_dataset_id: passthrough 복제 출력이면 복제한 source dataset_id.
+        이때 output_meta 는 출력 annotation 을 파싱한 결과와 같다
+        (파싱 결과 캐시로 바로 쓸 수 있다).
     """
 
     def __init__(
@@ -734,6 +2868,8 @@ class PipelineResult:
         source_dataset_ids: list[str],
         skipped_image_count: int = 0,
         skipped_image_files: list[str] | None = None,
+        perf_report: dict[str, Any] | None = None,
+        cloned_source_dataset_id: str | None = None,
     ) -> None:
         self.output_meta = output_meta
         self.output_storage_uri = output_storage_uri
@@ -746,6 +2882,339 @@ class PipelineResult:
         self.source_dataset_ids = source_dataset_ids
         self.skipped_image_count = skipped_image_count
         self.skipped_image_files = skipped_image_files or []
+        self.perf_report = perf_report
+        self.cloned_source_dataset_id = cloned_source_dataset_id
+        self.extra_results: list[PipelineResult] = []
+
+
+# ─── source 로드 ───
+
+def _parse_resolved_source_ref(ref: str) -> str:
+    """
+    `source:dataset_version:<id>` 토큰에서 dataset_id 를 꺼낸다.
+
+    executor 단계 토큰은 항상 resolved 여야 한다. split 단계 토큰은
+    submit 시점 _substitute_resolved_versions 가 이미 치환했어야 함.
+    """
+    parsed = parse_source_ref(ref)
+    if parsed is None or parsed[0] != SOURCE_TYPE_VERSION:
+        raise RuntimeError(
+            f"executor 가 받은 source 토큰이 dataset_version 이 아닙니다: {ref!r}. "
+            f"submit 단계 resolved 치환이 누락된 것으로 보입니다."
+        )
+    return parsed[1]
+
+
+@dataclass
+class SourceDescriptor:
+    """
+    source 데이터셋을 파일에서 로드하는 데 필요한 정보.
+
+    PipelineDagExecutor._describe_source 가 반환하며, 실제 파싱은
+    load_source_meta_from_descriptor 가 수행한다 (DB 접근 없음 → 스레드 안전).
+    extra 는 로드 후 DatasetMeta.extra 에 병합된다 (예: dataset_name).
+    """
+    dataset_id: str
+    storage_uri: str
+    annotation_format: str
+    annotation_files: list[str] = field(default_factory=list)
+    annotation_meta_file: str | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+    # READY 버전이면 True — 파싱 결과 사이드카 캐시를 읽고/쓴다.
+    use_meta_cache: bool = False
+
+
+def load_source_meta_from_descriptor(
+    storage: StorageProtocol,
+    descriptor: SourceDescriptor,
+) -> DatasetMeta:
+    """SourceDescriptor 기준으로 load_source_meta_from_storage 를 호출하고 extra 를 병합한다."""
+    meta = load_source_meta_from_storage(
+        storage=storage,
+        storage_uri=descriptor.storage_uri,
+        annotation_format=descriptor.annotation_format,
+        annotation_files=descriptor.annotation_files,
+        annotation_meta_file=descriptor.annotation_meta_file,
+        dataset_id=descriptor.dataset_id,
+        use_meta_cache=descriptor.use_meta_cache,
+    )
+    meta.extra.update(descriptor.extra)
+    return meta
+
+
+class _SourceMetaPool:
+    """
+    run 1회 동안 로드된 source DatasetMeta 를 보관하고 소비 태스크에 나눠준다.
+
+    manipulator 는 입력을 수정하지 않으므로(copy-on-write 규약, pipeline_data_models 참고)
+    모든 소비자가 같은 객체를 공유한다. 마지막 소비자가 꺼내 가면 pool 에서 제거해
+    이후 태스크 결과만 source 를 참조하도록 한다.
+    """
+
+    def __init__(
+        self,
+        metas: dict[str, DatasetMeta],
+        consumer_counts: dict[str, int],
+    ) -> None:
+        self._metas = metas
+        self._remaining = dict(consumer_counts)
+        # 꺼내 간 뒤에도 진행 보고용으로 이미지 수는 남겨 둔다
+        self._image_counts = {
+            dataset_id: meta.image_count for dataset_id, meta in metas.items()
+        }
+
+    def checkout(self, dataset_id: str) -> DatasetMeta:
+        if dataset_id not in self._metas:
+            raise RuntimeError(f"선행 로드되지 않은 source 입니다: {dataset_id}")
+        self._remaining[dataset_id] -= 1
+        if self._remaining[dataset_id] <= 0:
+            return self._metas.pop(dataset_id)
+        return self._metas[dataset_id]
+
+    def peek(self, dataset_id: str) -> DatasetMeta:
+        """소비 횟수를 줄이지 않고 읽는다 (캐시 키 계산용)."""
+        if dataset_id not in self._metas:
+            raise RuntimeError(f"선행 로드되지 않은 source 입니다: {dataset_id}")
+        return self._metas[dataset_id]
+
+    def image_count(self, dataset_id: str) -> int:
+        return self._image_counts[dataset_id]
+
+    def sample(self, max_images: int | None) -> tuple[int, int]:
+        """
+        source 마다 이미지가 max_images 보다 많으면 표본으로 바꾼다 (estimate 전용).
+
+        Returns:
+            (전체 source 이미지 수, 표본 적용 후 source 이미지 수)
+        """
+        total_count = sum(self._image_counts.values())
+        if max_images is not None:
+            self._metas = {
+                dataset_id: _sample_records(meta, max_images)
+                for dataset_id, meta in self._metas.items()
+            }
+        return total_count, sum(meta.image_count for meta in self._metas.values())
+
+
+def _sample_records(meta: DatasetMeta, max_images: int | None) -> DatasetMeta:
+    """이미지가 max_images 보다 많으면 일정 간격으로 고른 레코드만 담은 사본. 아니면 그대로."""
+    if max_images is None or meta.image_count <= max_images:
+        return meta
+    stride = -(-meta.image_count // max(1, max_images))
+    return derive_dataset_meta(meta, image_records=meta.image_records[::stride])
+
+
+class _TaskResultStore:
+    """
+    run 1회 동안 태스크 결과 DatasetMeta 를 보관한다 (liveness 기반 보존).
+
+    실행 전에 결과별 소비 횟수(read_levels 의 길이)를 세어 두고, 마지막 소비자가 checkout 으로
+    꺼내 가면 보관소에서 뺀다. 이미 꺼내 간 소비자가 들고 있는 참조는 그대로이므로, 넓은 DAG 에서
+    다 쓴 중간 결과를 run 끝까지 붙잡지 않게 될 뿐 계산 결과는 같다.
+    retained_names(최종 태스크)와 retain_all 이면 끝까지 보관한다.
+
+    spill_dir 이 있으면, 첫 소비 level 이 만든 level 보다 spill_level_gap 을 넘게 뒤인 결과는
+    등록 즉시 run 별 임시 디렉토리에 pickle 로 내리고 메모리에서 뺀다. 처음 꺼낼 때 다시 읽는다.
+    임시 디렉토리는 close() 에서 지운다.
+    """
+
+    def __init__(
+        self,
+        read_levels: dict[str, list[int]],
+        producer_levels: dict[str, int],
+        retained_names: set[str],
+        retain_all: bool = False,
+        spill_dir: Path | None = None,
+        spill_level_gap: int = 2,
+    ) -> None:
+        self._metas: dict[str, DatasetMeta] = {}
+        self._spilled_paths: dict[str, Path] = {}
+        self._remaining_reads = {name: len(levels) for name, levels in read_levels.items()}
+        self._first_read_levels = {name: min(levels) for name, levels in read_levels.items()}
+        self._producer_levels = producer_levels
+        self._retained_names = retained_names
+        self._retain_all = retain_all
+        self._spill_level_gap = spill_level_gap
+        self._spill_root: Path | None = None
+        if spill_dir is not None:
+            spill_dir.mkdir(parents=True, exist_ok=True)
+            self._spill_root = Path(tempfile.mkdtemp(prefix="pipeline-spill-", dir=spill_dir))
+        # 진행 보고/테스트용 기록
+        self.released_names: list[str] = []
+        self.spilled_names: list[str] = []
+
+    def __setitem__(self, task_name: str, meta: DatasetMeta) -> None:
+        if self._should_spill(task_name):
+            spill_path = self._spill_root / f"{len(self.spilled_names)}.pkl"
+            with open(spill_path, "wb") as spill_file:
+                pickle.dump(meta, spill_file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._spilled_paths[task_name] = spill_path
+            self.spilled_names.append(task_name)
+            logger.info(
+                "중간 결과 디스크 spill: %s (images=%d, level %d → 첫 소비 level %d)",
+                task_name, meta.image_count,
+                self._producer_levels[task_name], self._first_read_levels[task_name],
+            )
+            return
+        self._metas[task_name] = meta
+
+    def __getitem__(self, task_name: str) -> DatasetMeta:
+        """소비 횟수를 줄이지 않고 읽는다 (최종 결과 조회용)."""
+        spill_path = self._spilled_paths.pop(task_name, None)
+        if spill_path is not None:
+            with open(spill_path, "rb") as spill_file:
+                self._metas[task_name] = pickle.load(spill_file)
+            spill_path.unlink(missing_ok=True)
+        return self._metas[task_name]
+
+    def __contains__(self, task_name: object) -> bool:
+        return task_name in self._metas or task_name in self._spilled_paths
+
+    def checkout(self, task_name: str) -> DatasetMeta:
+        """소비자 1명분 읽기. 마지막 소비자면 보관소에서 뺀다."""
+        meta = self[task_name]
+        remaining_reads = self._remaining_reads.get(task_name, 0) - 1
+        self._remaining_reads[task_name] = remaining_reads
+        if remaining_reads <= 0 and not self._is_retained(task_name):
+            del self._metas[task_name]
+            self.released_names.append(task_name)
+            logger.info("중간 결과 해제 (마지막 소비 완료): %s", task_name)
+        return meta
+
+    def close(self) -> None:
+        """spill 임시 디렉토리를 지운다."""
+        if self._spill_root is not None:
+            shutil.rmtree(self._spill_root, ignore_errors=True)
+            self._spill_root = None
+        self._spilled_paths.clear()
+
+    def _is_retained(self, task_name: str) -> bool:
+        return self._retain_all or task_name in self._retained_names
+
+    def _should_spill(self, task_name: str) -> bool:
+        if self._spill_root is None or self._is_retained(task_name):
+            return False
+        first_read_level = self._first_read_levels.get(task_name)
+        if first_read_level is None:
+            return False
+        return first_read_level - self._producer_levels[task_name] > self._spill_level_gap
+
+
+def _upstream_task_names(
+    config: PipelineConfig,
+    task_name: str,
+    duplicate_of: dict[str, str],
+) -> set[str]:
+    """task_name 과 그 상류 태스크 (중복 태스크는 대표 태스크의 상류까지 포함)."""
+    upstream_names: set[str] = set()
+    pending_names = [task_name]
+    while pending_names:
+        current_name = pending_names.pop()
+        if current_name in upstream_names:
+            continue
+        upstream_names.add(current_name)
+        pending_names.extend(config.tasks[current_name].get_dependency_task_names())
+        if current_name in duplicate_of:
+            pending_names.append(duplicate_of[current_name])
+    return upstream_names
+
+
+@dataclass
+class _FusedStepStats:
+    """fusion 체인 한 단계의 처리 결과 (태스크별 진행 보고용)."""
+    input_images: int
+    output_images: int
+    category_count: int
+
+
+@dataclass
+class _CachedPrefix:
+    """작업 단위 앞쪽 member_count 개 태스크를 캐시에서 찾은 결과."""
+    member_count: int
+    meta: DatasetMeta
+    step_stats: list[_FusedStepStats]
+
+
+def _iter_record_transforms(
+    records: Iterable[ImageRecord],
+    record_transforms: list[RecordTransform],
+    passed_counts: list[int],
+) -> Iterator[ImageRecord]:
+    """
+    레코드마다 모든 단계의 apply 를 차례로 적용해 최종 레코드를 하나씩 내보낸다.
+
+    어느 단계에서 None 이 나오면 그 레코드는 뒤 단계로 가지 않는다.
+    passed_counts[i] 에 i 번째 단계를 통과한 레코드 수를 누적한다.
+    """
+    for record in records:
+        current_record: ImageRecord | None = record
+        for step_index, record_transform in enumerate(record_transforms):
+            current_record = record_transform.apply(current_record)
+            if current_record is None:
+                break
+            passed_counts[step_index] += 1
+        else:
+            yield current_record
+
+
+def _chain_steps(config: PipelineConfig, chain: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    """체인 태스크명 목록 → (operator, params) 목록."""
+    return [
+        (config.tasks[task_name].operator, config.tasks[task_name].params)
+        for task_name in chain
+    ]
+
+
+def _work_item_stage_name(chain: list[str], steps: list[tuple[str, dict[str, Any]]]) -> str:
+    """작업 단위 계측 이름 — 새로 계산하는 태스크들 (캐시에서 찾은 prefix 제외)."""
+    return " → ".join(chain[len(chain) - len(steps):])
+
+
+def _annotation_count(meta: DatasetMeta) -> int:
+    return sum(len(record.annotations) for record in meta.image_records)
+
+
+def _format_link_summary(materialize_result: MaterializeResult) -> str:
+    """processing.log 용 배치 방식 요약 — "hardlink=95, copy=5 / 대체: hardlink=5"."""
+    used_text = ", ".join(
+        f"{method}={count}" for method, count in sorted(materialize_result.link_counts.items())
+    )
+    if not materialize_result.link_fallbacks:
+        return used_text
+    fallback_text = ", ".join(
+        f"{method}={count}"
+        for method, count in sorted(materialize_result.link_fallbacks.items())
+    )
+    return f"{used_text} / 대체: {fallback_text}"
+
+
+def _measure_source_load(
+    dataset_id: str,
+    load: Callable[..., DatasetMeta],
+    *load_args: Any,
+) -> tuple[DatasetMeta, StageMetrics]:
+    """source 로드 1건 + 단계 계측 (source-load 스레드에서 실행되므로 기록은 호출자가 한다)."""
+    with measure_stage(STAGE_SOURCE_LOAD, dataset_id) as load_metrics:
+        source_meta = load(*load_args)
+        load_metrics.record_count = source_meta.image_count
+        load_metrics.annotation_count = _annotation_count(source_meta)
+    return source_meta, load_metrics
+
+
+def _compute_work_item_in_worker(
+    steps: list[tuple[str, dict[str, Any]]],
+    input_metas: list[DatasetMeta],
+    stage_name: str,
+) -> tuple[DatasetMeta, list[_FusedStepStats] | None, StageMetrics]:
+    """
+    process 모드 worker 진입점. pool 이 pickle 할 수 있도록 모듈 레벨 함수로 둔다.
+
+    manipulator 적용은 storage/콜백을 쓰지 않으므로 빈 executor 로 계산한다.
+    (서브클래스의 _apply_manipulator 오버라이드는 process 모드에서 적용되지 않는다.)
+    fusion 체인의 RecordTransform 은 closure 라 pickle 할 수 없으므로 worker 안에서 만든다.
+    """
+    worker_executor = PipelineDagExecutor(storage=None)  # type: ignore[arg-type]
+    return worker_executor._compute_measured_work_item(steps, input_metas, stage_name)
 
 
 def load_source_meta_from_storage(
@@ -756,6 +3225,7 @@ def load_source_meta_from_storage(
     annotation_meta_file: str | None = None,
     dataset_id: str = "",
     skip_image_sizes: bool = False,
+    use_meta_cache: bool = False,
 ) -> DatasetMeta:
     """
     스토리지에 저장된 데이터셋의 annotation을 파싱하여 통일포맷 DatasetMeta로 반환.
@@ -771,10 +3241,111 @@ def load_source_meta_from_storage(
         annotation_files: 어노테이션 파일명 리스트
         annotation_meta_file: 메타 파일명 (예: data.yaml)
         dataset_id: DatasetMeta.dataset_id
+        use_meta_cache: READY 데이터셋 전용. 사이드카 캐시(meta_cache)가 유효하면
+            파싱 없이 반환하고, 없으면 파싱 후 캐시를 기록한다.
+            skip_image_sizes=True 파싱 결과는 불완전하므로 캐시에 기록하지 않는다.
 
     Returns:
         파싱된 DatasetMeta (통일포맷)
     """
+    if not use_meta_cache:
+        return _parse_source_meta_files(
+            storage, storage_uri, annotation_format, annotation_files,
+            annotation_meta_file, dataset_id, skip_image_sizes,
+        )
+
+    cache_key = build_meta_cache_key(
+        storage, storage_uri, annotation_format, annotation_files,
+        annotation_meta_file, dataset_id,
+    )
+    cached_meta = read_meta_cache(storage, storage_uri, cache_key)
+    if cached_meta is not None:
+        return cached_meta
+
+    meta = _parse_source_meta_files(
+        storage, storage_uri, annotation_format, annotation_files,
+        annotation_meta_file, dataset_id, skip_image_sizes,
+    )
+    if not skip_image_sizes:
+        write_meta_cache(storage, storage_uri, cache_key, meta)
+    return meta
+
+
+def _load_clone_source_meta(
+    storage: StorageProtocol,
+    descriptor: SourceDescriptor,
+) -> DatasetMeta:
+    """
+    passthrough 복제용 source meta — 파싱 결과 캐시가 유효하면 파싱하지 않는다.
+
+    출력 파싱 결과 캐시로도 쓰므로 descriptor.extra 를 병합하지 않는다.
+    """
+    return load_source_meta_from_storage(
+        storage=storage,
+        storage_uri=descriptor.storage_uri,
+        annotation_format=descriptor.annotation_format,
+        annotation_files=descriptor.annotation_files,
+        annotation_meta_file=descriptor.annotation_meta_file,
+        dataset_id=descriptor.dataset_id,
+        use_meta_cache=descriptor.use_meta_cache,
+    )
+
+
+def warm_source_meta_cache(
+    storage: StorageProtocol,
+    storage_uri: str,
+    annotation_format: str,
+    annotation_files: list[str],
+    annotation_meta_file: str | None = None,
+    dataset_id: str = "",
+    parsed_meta: DatasetMeta | None = None,
+) -> bool:
+    """
+    READY 전환 직후(등록/파이프라인 완료) 파싱 결과 캐시를 미리 만든다.
+
+    parsed_meta 가 주어지면 (passthrough 복제 출력 — annotation 이 source 와 바이트 단위로 같다)
+    파싱하지 않고 dataset_id / storage_uri 만 바꿔 캐시에 기록한다.
+
+    best-effort — 실패해도 예외를 올리지 않는다. 성공 시 True.
+    """
+    try:
+        if parsed_meta is not None:
+            cache_key = build_meta_cache_key(
+                storage, storage_uri, annotation_format, annotation_files,
+                annotation_meta_file, dataset_id,
+            )
+            write_meta_cache(storage, storage_uri, cache_key, derive_dataset_meta(
+                parsed_meta, dataset_id=dataset_id, storage_uri=storage_uri,
+            ))
+            return True
+        load_source_meta_from_storage(
+            storage=storage,
+            storage_uri=storage_uri,
+            annotation_format=annotation_format,
+            annotation_files=annotation_files,
+            annotation_meta_file=annotation_meta_file,
+            dataset_id=dataset_id,
+            use_meta_cache=True,
+        )
+    except Exception as cache_error:
+        logger.warning(
+            "DatasetMeta 캐시 생성 실패 (결과에는 영향 없음): dataset_id=%s, error=%s",
+            dataset_id, cache_error,
+        )
+        return False
+    return True
+
+
+def _parse_source_meta_files(
+    storage: StorageProtocol,
+    storage_uri: str,
+    annotation_format: str,
+    annotation_files: list[str],
+    annotation_meta_file: str | None,
+    dataset_id: str,
+    skip_image_sizes: bool,
+) -> DatasetMeta:
+    """load_source_meta_from_storage 의 실제 파싱 (포맷별 파서 선택)."""
     annotations_dir = storage.get_annotations_dir(storage_uri)
     images_dir = storage.get_images_dir(storage_uri)
     format_upper = annotation_format.upper()
@@ -827,25 +3398,3 @@ def load_source_meta_from_storage(
 
     else:
         raise ValueError(f"지원하지 않는 annotation 포맷: {format_upper}")
-
-
-# ─── 파이프라인 실행 로그 버퍼 핸들러 ───
-
-class _ProcessingLogBufferHandler(logging.Handler):
-    """
-    파이프라인 실행 중 발생하는 로그를 메모리에 버퍼링하는 핸들러.
-    """
-
-    def __init__(self) -> None:
-        super().__init__()
-        self._log_lines: list[str] = []
-
-    def emit(self, record: logging.LogRecord) -> None:
-        try:
-            formatted_message = self.format(record)
-            self._log_lines.append(formatted_message)
-        except Exception:
-            self.handleError(record)
-
-    def get_log_lines(self) -> list[str]:
-        return self._log_lines
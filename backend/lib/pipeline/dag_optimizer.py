@@ -0,0 +1,394 @@
+"""
+파이프라인 DAG 최적화 패스.
+
+config 검증 이후, 실행 직전에 PipelineConfig 를 실제로 실행할 계획으로 다시 쓴다.
+
+최적화 항목:
+  1. dead branch 제거 — 최종 출력 태스크(get_terminal_task_name)와 추가 출력(extra_outputs)
+     어디에도 도달하지 않는 태스크는 실행하지 않는다. 편집기에서 Save 노드에 연결하지 않고
+     남겨 둔 분기가 여기에 해당한다. 출력끼리 공유하는 상류 태스크는 한 번만 계산된다.
+  2. 공통 부분식 공유 (CSE) — operator / params / inputs 가 같은 태스크는 한 번만 계산한다.
+     inputs 비교 시 이미 중복으로 판정된 태스크는 대표 태스크로 치환하므로,
+     같은 source 에서 시작하는 동일한 체인은 체인 전체가 공유된다.
+     난수 시드가 고정되지 않은 태스크(is_deterministic=False)는 공유하지 않는다.
+  3. 필터 선행 이동 (predicate pushdown) — manipulator 클래스에 선언된 교환 법칙을 따른다.
+     a. record_selection 태스크(필터/시드 고정 샘플링)는 바로 앞의 이미지 변환
+        (commutes_with_record_selection) 보다 먼저 실행한다. 버려질 이미지를 변환하지 않는다.
+     b. accepts_pushed_record_filter 병합 바로 뒤의 "per_record" 필터는 병합 중에 적용한다
+        (merge_filters). 병합의 파일명 충돌 rename 과 image_id 번호가 전체 입력 기준이라
+        필터를 각 분기로 옮기면 출력이 달라지므로, 분기 대신 병합 안으로만 옮긴다.
+
+출력 태스크(기본 + 추가 출력)의 결과는 그대로 저장되어야 하므로, 3 의 재배선은 출력 태스크의
+결과를 바꾸는 경우(출력 태스크를 필터가 앞지르거나 병합 안으로 흡수하는 경우)를 건너뛴다.
+
+중복 태스크는 config 에서 제거하지 않고 duplicate_of 로만 표시한다. executor 는 대표 태스크의
+결과를 재사용하되 태스크별 dataset_id 를 따로 부여한다 — merge 의 파일명 충돌 rename 이
+입력 태스크별 dataset_id 로 결정되므로, 입력을 대표 태스크로 바꿔 쓰면 출력이 달라진다.
+
+이 모듈은 app/ 레이어에 의존하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+
+from lib.manipulators import MANIPULATOR_REGISTRY
+from lib.pipeline.config import PipelineConfig, TaskConfig
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OptimizedPipelinePlan:
+    """
+    최적화된 실행 계획.
+
+    attributes:
+        config: 실제로 실행할 config (dead branch 제거됨, 중복 태스크는 남아 있음)
+        terminal_task_name: 최종 출력 태스크
+        extra_terminal_task_names: 추가 출력 태스크 (config.extra_outputs 순서)
+        execution_order: config 의 topological 순서
+        removed_tasks: dead branch 로 제거된 태스크명 (원래 config 의 topological 순서)
+        duplicate_of: 중복 태스크명 → 결과를 재사용할 대표 태스크명
+        moved_ahead: 선행 이동한 필터 태스크명 → 앞질러 간 이미지 변환 태스크명 목록
+        merge_filters: 병합 태스크명 → 병합 중에 적용할 필터 태스크명 목록 (실행 순서)
+        result_names: 태스크명 → 결과 dataset_id 에 쓸 원래 태스크명.
+                      필터 선행 이동으로 소비자가 다른 태스크의 결과를 받게 되어도
+                      merge rename hash 가 바뀌지 않도록 원래 이름을 물려준다.
+    """
+    config: PipelineConfig
+    terminal_task_name: str
+    extra_terminal_task_names: list[str] = field(default_factory=list)
+    execution_order: list[str] = field(default_factory=list)
+    removed_tasks: list[str] = field(default_factory=list)
+    duplicate_of: dict[str, str] = field(default_factory=dict)
+    moved_ahead: dict[str, list[str]] = field(default_factory=dict)
+    merge_filters: dict[str, list[str]] = field(default_factory=dict)
+    result_names: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def output_task_names(self) -> list[str]:
+        """결과를 저장하는 태스크 (기본 출력 → 추가 출력 순)."""
+        return [self.terminal_task_name, *self.extra_terminal_task_names]
+
+    @property
+    def computed_task_names(self) -> list[str]:
+        """실제로 manipulator 를 실행하는 태스크 (topological 순서)."""
+        return [name for name in self.execution_order if name not in self.duplicate_of]
+
+    @property
+    def is_rewritten(self) -> bool:
+        """원래 config 와 다르게 실행되는지 여부."""
+        return bool(
+            self.removed_tasks or self.duplicate_of or self.moved_ahead or self.merge_filters
+        )
+
+    def describe(self) -> list[str]:
+        """processing.log 용 계획 요약 (한 줄씩)."""
+        lines = [
+            f"실행 계획: 태스크 {len(self.computed_task_names)}개 계산 "
+            f"(정의 {len(self.execution_order) + len(self.removed_tasks)}개, "
+            f"최종 출력={self.terminal_task_name})",
+        ]
+        if self.extra_terminal_task_names:
+            lines.append("  - 추가 출력: " + ", ".join(self.extra_terminal_task_names))
+        if self.removed_tasks:
+            lines.append(
+                "  - dead branch 제거 (최종 출력에 도달하지 않음): "
+                + ", ".join(self.removed_tasks)
+            )
+        for task_name, canonical_name in self.duplicate_of.items():
+            lines.append(f"  - 중복 태스크 공유: {task_name} → {canonical_name} 결과 재사용")
+        for task_name, transform_names in self.moved_ahead.items():
+            lines.append(
+                f"  - 필터 선행 이동: {task_name} 을 {', '.join(transform_names)} 앞에서 실행"
+            )
+        for merge_name, filter_names in self.merge_filters.items():
+            lines.append(f"  - 병합 중 필터 적용: {merge_name} ← {', '.join(filter_names)}")
+        lines.append("  - 실행 순서: " + " → ".join(self.computed_task_names))
+        return lines
+
+
+def optimize_pipeline_config(
+    config: PipelineConfig,
+    push_down_filters: bool = True,
+) -> OptimizedPipelinePlan:
+    """
+    config 를 실행 계획으로 최적화한다. passthrough config 는 그대로 반환한다.
+
+    Args:
+        config: 검증된 PipelineConfig
+        push_down_filters: False 면 필터 선행 이동(3)을 하지 않는다.
+
+    Raises:
+        ValueError: 최종 출력 태스크를 정할 수 없을 때 (get_terminal_task_name 과 동일)
+    """
+    if config.is_passthrough:
+        return OptimizedPipelinePlan(config=config, terminal_task_name="")
+
+    terminal_task_name = config.get_terminal_task_name()
+    extra_terminal_task_names = [
+        extra_output.terminal_task for extra_output in config.extra_outputs
+    ]
+
+    # 1. dead branch 제거 — 출력 태스크들에서 거꾸로 따라가며 도달 가능한 태스크만 남긴다
+    live_task_names: set[str] = set()
+    pending_names = [terminal_task_name, *extra_terminal_task_names]
+    while pending_names:
+        task_name = pending_names.pop()
+        if task_name in live_task_names:
+            continue
+        live_task_names.add(task_name)
+        pending_names.extend(config.tasks[task_name].get_dependency_task_names())
+
+    original_order = config.topological_order()
+    removed_tasks = [name for name in original_order if name not in live_task_names]
+    if removed_tasks:
+        optimized_config = config.model_copy(update={
+            "tasks": {
+                name: task_config
+                for name, task_config in config.tasks.items()
+                if name in live_task_names
+            },
+        })
+    else:
+        optimized_config = config
+
+    # 3a. 필터 선행 이동 — 입력 배선이 바뀌므로 공통 부분식 판정보다 먼저 한다
+    moved_ahead: dict[str, list[str]] = {}
+    result_names: dict[str, str] = {}
+    if push_down_filters:
+        (
+            optimized_config, terminal_task_name, extra_terminal_task_names,
+            moved_ahead, result_names,
+        ) = _move_selections_ahead_of_transforms(
+            optimized_config, terminal_task_name, extra_terminal_task_names,
+        )
+    execution_order = optimized_config.topological_order()
+
+    # 2. 공통 부분식 공유 — topological 순서상 먼저 나온 태스크가 대표
+    duplicate_of: dict[str, str] = {}
+    canonical_by_signature: dict[str, str] = {}
+    for task_name in execution_order:
+        signature = _task_signature(optimized_config, task_name, duplicate_of)
+        if signature is None:
+            continue
+        canonical_name = canonical_by_signature.setdefault(signature, task_name)
+        if canonical_name != task_name:
+            duplicate_of[task_name] = canonical_name
+
+    # 3b. 병합 중 필터 적용
+    merge_filters = (
+        _plan_merge_filters(
+            optimized_config, execution_order, duplicate_of,
+            {terminal_task_name, *extra_terminal_task_names},
+        )
+        if push_down_filters else {}
+    )
+
+    return OptimizedPipelinePlan(
+        config=optimized_config,
+        terminal_task_name=terminal_task_name,
+        extra_terminal_task_names=extra_terminal_task_names,
+        execution_order=execution_order,
+        removed_tasks=removed_tasks,
+        duplicate_of=duplicate_of,
+        moved_ahead=moved_ahead,
+        merge_filters=merge_filters,
+        result_names=result_names,
+    )
+
+
+def _move_selections_ahead_of_transforms(
+    config: PipelineConfig,
+    terminal_task_name: str,
+    extra_terminal_task_names: list[str],
+) -> tuple[PipelineConfig, str, list[str], dict[str, list[str]], dict[str, str]]:
+    """
+    T → S (S: record_selection, T: commutes_with_record_selection) 를 S → T 로 바꾼다.
+
+    T 의 소비자가 S 하나뿐이고 둘 다 입력이 1개일 때만 바꾸며, 더 바꿀 곳이 없을 때까지
+    반복한다 (S 는 연속된 이미지 변환을 여러 개 앞지를 수 있다).
+    S 의 소비자는 T 를 참조하도록 고치고, T 의 결과는 S 의 이름(result_names)을 물려받는다.
+    S 는 T 가 읽던 입력 X 의 자리에 들어가므로 X 의 이름을 물려받는다.
+    T 가 출력 태스크면 T 의 결과(필터 전)를 저장해야 하므로 바꾸지 않는다.
+    S 가 출력 태스크면 바꾼 뒤에는 T 가 그 출력을 맡는다.
+
+    Returns:
+        (새 config, 새 terminal 태스크명, 새 추가 출력 태스크명, moved_ahead, result_names)
+    """
+    tasks = dict(config.tasks)
+    moved_ahead: dict[str, list[str]] = {}
+    result_names: dict[str, str] = {}
+
+    swapped = True
+    while swapped:
+        swapped = False
+        consumers = _build_consumers(tasks)
+        for selection_name, selection_config in tasks.items():
+            if not _is_movable_selection(selection_config):
+                continue
+            transform_name = selection_config.inputs[0]
+            transform_config = tasks[transform_name]
+            if (
+                len(transform_config.inputs) != 1
+                or consumers.get(transform_name) != [selection_name]
+                or transform_name == terminal_task_name
+                or transform_name in extra_terminal_task_names
+            ):
+                continue
+            transform_class = MANIPULATOR_REGISTRY.get(transform_config.operator)
+            if transform_class is None or not transform_class.commutes_with_record_selection:
+                continue
+
+            tasks[selection_name] = selection_config.model_copy(
+                update={"inputs": list(transform_config.inputs)},
+            )
+            tasks[transform_name] = transform_config.model_copy(
+                update={"inputs": [selection_name]},
+            )
+            for consumer_name in consumers.get(selection_name, []):
+                consumer_config = tasks[consumer_name]
+                tasks[consumer_name] = consumer_config.model_copy(update={
+                    "inputs": [
+                        transform_name if ref == selection_name else ref
+                        for ref in consumer_config.inputs
+                    ],
+                })
+            if terminal_task_name == selection_name:
+                terminal_task_name = transform_name
+            extra_terminal_task_names = [
+                transform_name if name == selection_name else name
+                for name in extra_terminal_task_names
+            ]
+            upstream_ref = transform_config.inputs[0]
+            result_names[transform_name] = result_names.get(selection_name, selection_name)
+            result_names[selection_name] = (
+                selection_name if upstream_ref.startswith("source:")
+                else result_names.get(upstream_ref, upstream_ref)
+            )
+            moved_ahead.setdefault(selection_name, []).append(transform_name)
+            swapped = True
+            break
+
+    result_names = {name: original for name, original in result_names.items() if name != original}
+    if not moved_ahead:
+        return config, terminal_task_name, extra_terminal_task_names, moved_ahead, result_names
+    update: dict = {"tasks": tasks}
+    if config.terminal_task is not None:
+        update["terminal_task"] = terminal_task_name
+    if config.extra_outputs:
+        update["extra_outputs"] = [
+            extra_output.model_copy(update={"terminal_task": extra_terminal_name})
+            for extra_output, extra_terminal_name in zip(
+                config.extra_outputs, extra_terminal_task_names, strict=True,
+            )
+        ]
+    return (
+        config.model_copy(update=update), terminal_task_name, extra_terminal_task_names,
+        moved_ahead, result_names,
+    )
+
+
+def _is_movable_selection(task_config: TaskConfig) -> bool:
+    """이미지 변환 앞으로 옮길 수 있는 record_selection 태스크인지 (입력이 태스크 1개)."""
+    if len(task_config.inputs) != 1 or task_config.inputs[0].startswith("source:"):
+        return False
+    manipulator_class = MANIPULATOR_REGISTRY.get(task_config.operator)
+    return (
+        manipulator_class is not None
+        and manipulator_class.record_selection is not None
+        and manipulator_class().is_deterministic(task_config.params)
+    )
+
+
+def _plan_merge_filters(
+    config: PipelineConfig,
+    execution_order: list[str],
+    duplicate_of: dict[str, str],
+    output_task_names: set[str],
+) -> dict[str, list[str]]:
+    """
+    accepts_pushed_record_filter 병합 바로 뒤에 일렬로 이어진 "per_record" 필터를 찾는다.
+
+    필터 판정 함수는 build_record_transform 으로 만들므로 supports_record_fusion 필터만 대상이다.
+    중간 결과를 다른 태스크가 봐야 하는 경우(소비자 2개 이상, 중복 태스크의 대표, 출력 태스크)는
+    거기서 끊는다.
+    """
+    consumers = _build_consumers(config.tasks)
+    shared_task_names = set(duplicate_of.values())
+    merge_filters: dict[str, list[str]] = {}
+
+    for merge_name in execution_order:
+        merge_class = MANIPULATOR_REGISTRY.get(config.tasks[merge_name].operator)
+        if (
+            merge_class is None
+            or not merge_class.accepts_pushed_record_filter
+            or merge_name in duplicate_of
+            or merge_name in shared_task_names
+            or merge_name in output_task_names
+        ):
+            continue
+        filter_names: list[str] = []
+        current_name = merge_name
+        while current_name == merge_name or current_name not in shared_task_names:
+            next_names = consumers.get(current_name, [])
+            if len(next_names) != 1:
+                break
+            next_name = next_names[0]
+            next_config = config.tasks[next_name]
+            next_class = MANIPULATOR_REGISTRY.get(next_config.operator)
+            if (
+                next_class is None
+                or next_class.record_selection != "per_record"
+                or not next_class.supports_record_fusion
+                or next_config.inputs != [current_name]
+                or next_name in duplicate_of
+            ):
+                break
+            filter_names.append(next_name)
+            current_name = next_name
+            if current_name in output_task_names:
+                break
+        if filter_names:
+            merge_filters[merge_name] = filter_names
+
+    return merge_filters
+
+
+def _build_consumers(tasks: dict[str, TaskConfig]) -> dict[str, list[str]]:
+    """태스크명 → 그 결과를 입력으로 쓰는 태스크명 목록."""
+    consumers: dict[str, list[str]] = {}
+    for task_name, task_config in tasks.items():
+        for ref in task_config.inputs:
+            if not ref.startswith("source:"):
+                consumers.setdefault(ref, []).append(task_name)
+    return consumers
+
+
+def _task_signature(
+    config: PipelineConfig,
+    task_name: str,
+    duplicate_of: dict[str, str],
+) -> str | None:
+    """
+    중복 판정용 태스크 시그니처. 공유할 수 없는 태스크면 None.
+
+    inputs 순서는 유지한다 (merge 는 입력 순서대로 레코드를 합친다).
+    """
+    task_config = config.tasks[task_name]
+    manipulator_class = MANIPULATOR_REGISTRY.get(task_config.operator)
+    if manipulator_class is None:
+        return None
+    if not manipulator_class().is_deterministic(task_config.params):
+        return None
+    return json.dumps(
+        {
+            "operator": task_config.operator,
+            "params": task_config.params,
+            "inputs": [duplicate_of.get(ref, ref) for ref in task_config.inputs],
+        },
+        sort_keys=True,
+        default=str,
+    )
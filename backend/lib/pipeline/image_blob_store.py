@@ -0,0 +1,249 @@
+"""
+content-addressed 이미지 blob 저장소 — 같은 바이트의 이미지는 버전이 달라도 한 번만 저장한다.
+
+파일 구조:
+    <root>/<digest 앞 2자리>/<digest>   blob (digest = 이미지 바이트의 sha256 hex)
+    <root>/.sources/<경로 해시>           소스 버전 이미지의 digest 색인 (.image_refs 와 같은 형식)
+    <버전 루트>/.image_refs               그 버전이 참조하는 blob 목록
+                                          ("<digest>\\t<버전 루트 기준 상대경로>" 한 줄씩)
+
+버전의 images/ 파일은 blob 의 hardlink 다. 그래서 annotation 파서 / 이미지 서빙 / 실체화 등
+기존 코드는 경로를 그대로 쓰고, blob 의 참조 수는 파일시스템 링크 수(st_nlink - 1)로 유지된다.
+버전 디렉토리를 지우면(rmtree) 참조 수가 저절로 줄어든다.
+
+  - adopt: 파일을 저장소에 넣는다. 같은 바이트의 blob 이 이미 있으면 파일을 그 blob 의
+    hardlink 로 바꿔(원자적 교체) 중복을 없앤다. 없으면 파일 자체를 blob 으로 링크한다 (복사 없음).
+    파일을 교체하므로 실행이 만드는 출력 버전의 파일에만 쓴다 — 입력(소스) 버전은 불변이다.
+  - read_source_refs / write_source_refs: 소스 버전은 바꾸지 않으므로 소스 이미지의 digest 는
+    버전 디렉토리가 아니라 저장소 안의 색인에 남긴다 (다음 실행은 해시하지 않고 blob 을 링크한다).
+  - link: blob 을 새 버전의 경로에 hardlink 한다.
+  - release: 지운 버전이 참조하던 blob 중 더 이상 참조가 없는 것을 바로 지운다.
+  - collect_garbage: 저장소 전체에서 참조가 없는 blob 을 지운다. adopt 직후 아직 링크되지 않은
+    blob 을 지우지 않도록 ctime(마지막 링크 변경 시각)이 유예 시간보다 오래된 것만 지운다.
+
+blob 저장소는 버전 디렉토리와 같은 파일시스템에 있어야 한다 (hardlink).
+여러 worker 가 같은 저장소를 공유해도 되도록 blob 생성은 임시 파일 → os.link 로 하고,
+이미 같은 blob 이 있으면(FileExistsError) 그것을 쓴다.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+IMAGE_REFS_FILENAME = ".image_refs"
+
+# 파일 해시 계산 시 한 번에 읽는 크기
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+# 저장소 안의 소스 버전 digest 색인 디렉토리 ("." 으로 시작해 blob prefix 디렉토리와 구분한다)
+_SOURCE_INDEX_DIRNAME = ".sources"
+
+
+@dataclass
+class BlobGcResult:
+    """
+    blob 정리 결과.
+
+    scanned: 확인한 blob 수
+    removed: 참조가 없어 지운 blob 수
+    freed_bytes: 지운 blob 의 바이트 수
+    """
+    scanned: int = 0
+    removed: int = 0
+    freed_bytes: int = 0
+
+
+class ImageBlobStore:
+    """
+    root 아래의 content-addressed 이미지 blob 저장소.
+
+    Args:
+        root: blob 저장소 디렉토리 (버전 디렉토리와 같은 파일시스템)
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def reference_count(self, digest: str) -> int:
+        """blob 을 hardlink 로 참조하는 버전 파일 수. blob 이 없으면 0."""
+        try:
+            return self.blob_path(digest).stat().st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def adopt(self, path: Path) -> str:
+        """
+        path 의 파일을 저장소에 넣고 digest 를 돌려준다.
+
+        같은 바이트의 blob 이 있으면 path 를 그 blob 의 hardlink 로 바꾼다 (내용은 같다).
+        없으면 path 를 blob 으로 링크한다. path 가 없으면 FileNotFoundError.
+        path 를 교체할 수 있으므로 이번 실행이 쓴 출력 파일에만 부른다.
+        """
+        digest = file_digest(path)
+        blob_path = self.blob_path(digest)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(path, blob_path)
+            return digest
+        except FileExistsError:
+            pass
+        if os.path.samefile(path, blob_path):
+            return digest
+        # 같은 디렉토리의 임시 이름에 blob 을 링크한 뒤 path 를 원자적으로 교체한다
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.blob")
+        temp_path.unlink(missing_ok=True)
+        os.link(blob_path, temp_path)
+        os.replace(temp_path, path)
+        return digest
+
+    def source_index_path(self, version_root: Path) -> Path:
+        """소스 버전의 digest 색인 파일 경로 (버전 루트 경로의 sha256)."""
+        key = hashlib.sha256(os.fspath(version_root).encode("utf-8")).hexdigest()
+        return self.root / _SOURCE_INDEX_DIRNAME / key
+
+    def read_source_refs(self, version_root: Path) -> dict[str, str]:
+        """소스 버전의 digest 색인을 {버전 루트 기준 상대경로: digest} 로 읽는다. 없으면 {}."""
+        return _read_refs_file(self.source_index_path(version_root))
+
+    def write_source_refs(self, version_root: Path, refs: dict[str, str]) -> bool:
+        """소스 버전의 digest 색인에 refs 를 합쳐 기록한다. 소스 버전 디렉토리는 건드리지 않는다."""
+        index_path = self.source_index_path(version_root)
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError as mkdir_error:
+            logger.warning("소스 digest 색인 기록 실패 — 무시: %s (%s)", version_root, mkdir_error)
+            return False
+        return _write_refs_file(index_path, refs)
+
+    def forget_source_refs(self, version_root: Path) -> None:
+        """버전을 지울 때 소스 digest 색인도 지운다 (같은 경로에 새 버전이 생길 수 있다)."""
+        self.source_index_path(version_root).unlink(missing_ok=True)
+
+    def link(self, digest: str, dst_path: Path) -> None:
+        """
+        blob 을 dst_path 에 hardlink 한다 (dst_path 가 있으면 지우고).
+
+        blob 이 없으면 FileNotFoundError.
+        """
+        dst_path.unlink(missing_ok=True)
+        os.link(self.blob_path(digest), dst_path)
+
+    def release(self, digests: Iterable[str]) -> BlobGcResult:
+        """digests 중 더 이상 참조가 없는 blob 을 지운다 (버전 디렉토리 삭제 직후에 부른다)."""
+        result = BlobGcResult()
+        for digest in set(digests):
+            result.scanned += 1
+            self._remove_if_unreferenced(self.blob_path(digest), result, grace_seconds=None)
+        return result
+
+    def collect_garbage(self, grace_seconds: float = 3600.0) -> BlobGcResult:
+        """
+        저장소 전체에서 참조가 없는 blob 을 지운다.
+
+        ctime 이 grace_seconds 보다 최근인 blob 은 남긴다 (adopt 와 link 사이의 blob 보호).
+        """
+        result = BlobGcResult()
+        if not self.root.is_dir():
+            return result
+        for prefix_dir in self.root.iterdir():
+            if not prefix_dir.is_dir() or prefix_dir.name.startswith("."):
+                continue
+            for blob_path in prefix_dir.iterdir():
+                result.scanned += 1
+                self._remove_if_unreferenced(blob_path, result, grace_seconds=grace_seconds)
+        logger.info(
+            "이미지 blob 정리 완료: scanned=%d, removed=%d, freed_bytes=%d",
+            result.scanned, result.removed, result.freed_bytes,
+        )
+        return result
+
+    def _remove_if_unreferenced(
+        self,
+        blob_path: Path,
+        result: BlobGcResult,
+        grace_seconds: float | None,
+    ) -> None:
+        try:
+            blob_stat = blob_path.stat()
+        except FileNotFoundError:
+            return
+        if blob_stat.st_nlink > 1:
+            return
+        if grace_seconds is not None and time.time() - blob_stat.st_ctime < grace_seconds:
+            return
+        try:
+            blob_path.unlink()
+        except OSError as unlink_error:
+            logger.warning("이미지 blob 삭제 실패 — 무시: %s (%s)", blob_path, unlink_error)
+            return
+        result.removed += 1
+        result.freed_bytes += blob_stat.st_size
+
+
+def file_digest(path: Path) -> str:
+    """파일 바이트의 sha256 hex."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_image_refs(version_root: Path) -> dict[str, str]:
+    """버전의 .image_refs 를 {버전 루트 기준 상대경로: digest} 로 읽는다. 없거나 못 읽으면 {}."""
+    return _read_refs_file(version_root / IMAGE_REFS_FILENAME)
+
+
+def write_image_refs(version_root: Path, refs: dict[str, str]) -> bool:
+    """
+    기존 .image_refs 에 refs 를 합쳐 원자적으로 기록한다 (임시 파일 → os.replace).
+
+    실패해도 예외를 올리지 않는다 (참조 목록이 없으면 release 대신 collect_garbage 가 정리한다).
+    """
+    return _write_refs_file(version_root / IMAGE_REFS_FILENAME, refs)
+
+
+def _read_refs_file(refs_path: Path) -> dict[str, str]:
+    refs: dict[str, str] = {}
+    try:
+        with open(refs_path, encoding="utf-8") as refs_file:
+            for line in refs_file:
+                digest, separator, relative_path = line.rstrip("\n").partition("\t")
+                if separator:
+                    refs[relative_path] = digest
+    except FileNotFoundError:
+        return {}
+    except OSError as read_error:
+        logger.warning("이미지 참조 목록 읽기 실패 — 무시: %s (%s)", refs_path, read_error)
+        return {}
+    return refs
+
+
+def _write_refs_file(refs_path: Path, refs: dict[str, str]) -> bool:
+    merged_refs = {**_read_refs_file(refs_path), **refs}
+    temp_path: str | None = None
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f"{refs_path.name}.", suffix=".tmp", dir=refs_path.parent,
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as refs_file:
+            for relative_path, digest in sorted(merged_refs.items()):
+                refs_file.write(f"{digest}\t{relative_path}\n")
+        os.replace(temp_path, refs_path)
+    except OSError as write_error:
+        logger.warning("이미지 참조 목록 기록 실패 — 무시: %s (%s)", refs_path, write_error)
+        if temp_path is not None:
+            Path(temp_path).unlink(missing_ok=True)
+        return False
+    return True
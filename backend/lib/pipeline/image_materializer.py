@@ -6,24 +6,92 @@ ImagePlan 리스트를 받아서 실제 이미지 파일을 복사/변환하여
 
 설계 원칙:
   - annotation 처리(Phase A) 완료 후에만 호출 (Phase B: 이미지 실체화)
-  - ImagePlan.is_copy_only이면 shutil.copy2
-  - ImageManipulationSpec이 있으면 해당 operation 실행
+  - ImagePlan.is_copy_only이면 link_strategy 부터 차례로 배치 (place_file):
+      hardlink → reflink(FICLONE) → copy_file_range(커널 내 복사) → copy(shutil.copy2)
+    기본 link_strategy 는 "copy" (바이트 복사). 데이터셋 버전은 불변이므로 같은 볼륨이면
+    hardlink 로 바이트를 공유해도 된다.
+    실제로 쓴 방식과 실패해 넘어간 방식은 MaterializeResult 에 남긴다.
+  - ImagePlan.reuse_existing이면 hardlink 부터 배치 (다른 파일시스템 등으로 실패하면 다음 방식)
+  - clone_directory: passthrough 복제 — images 디렉토리의 파일을 통째로 hardlink 부터 배치
+  - ImageManipulationSpec이 있으면 spec 목록을 컴파일한 변환 체인으로 적용
+    (decode 1회, crop / 회전 / mask 각 1회 — image_transform_chain 참고)
   - 진행률 콜백 지원 (Celery 등에서 활용)
+  - journal(run checkpoint)이 있으면 끝난 이미지를 기록하고, 이전 시도에서 끝난 이미지는 건너뜀
+  - blob_store (content-addressed 이미지 저장소) 가 있으면 복사/재사용 이미지는 소스의 blob 을
+    hardlink 하고 (digest 를 모르면 출력에 배치한 뒤 출력 파일을 저장소에 넣는다), 변환 이미지는
+    저장 후 저장소에 넣는다. 출력 버전이 참조하는 blob 은 출력 버전 루트의 .image_refs 에, 소스
+    이미지의 digest 는 저장소의 소스 색인에 남긴다 — 소스 버전 디렉토리는 건드리지 않는다.
+  - 병렬 실체화 (io_workers / transform_workers > 1): 복사/hardlink 는 I/O thread pool,
+    변환은 CPU 코어 수만큼의 process pool 에서 실행한다. 결과 집계(journal 기록, 진행률 콜백,
+    스킵 목록)는 호출 스레드에서 하므로 MaterializeResult 는 순차 실행과 같다.
+    변환 이미지는 읽기(I/O) → 변환(메모리 안 decode/encode) → 쓰기(I/O) 3단계로 나눠 흘린다
+    (read-ahead / write-behind). 단계 사이 버퍼에 든 바이트가 buffer_bytes 를 넘으면 새 이미지를
+    읽지 않고 기다린다 (back-pressure).
+  - ImagePlan 은 (소스 디렉토리, inode) 순서로 처리한다 — NAS 에서 임의 접근을 순차 접근에 가깝게.
+    skipped_files 는 처리 순서와 상관없이 ImagePlan 순서다.
+  - 쓴 바이트 수는 배치 / 변환 중에 알게 된 값만 센다 (FilePlacement.size). 바이트를 공유하는
+    hardlink / reflink / blob 링크는 쓴 바이트가 없으므로 이미지마다 stat 하지 않는다.
 """
 from __future__ import annotations
 
+import errno
+import io
 import logging
+import multiprocessing
+import os
 import shutil
-from pathlib import Path
-from typing import Callable
-
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import IO, TYPE_CHECKING, Any, Literal
 
+from lib.pipeline.image_blob_store import ImageBlobStore, read_image_refs, write_image_refs
+from lib.pipeline.image_transform_chain import compile_transform_chain
 from lib.pipeline.pipeline_data_models import DatasetPlan, ImagePlan
+from lib.pipeline.run_checkpoint import MaterializeJournal
 from lib.pipeline.storage_protocol import StorageProtocol
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = logging.getLogger(__name__)
 
+TransformPoolMode = Literal["thread", "process"]
+_VALID_TRANSFORM_POOL_MODES = ("thread", "process")
+
+LinkStrategy = Literal["hardlink", "reflink", "copy_file_range", "copy"]
+# 파일 배치 방식 — 설정한 방식부터 시작해 실패하면 뒤의 방식으로 넘어간다
+LINK_STRATEGIES: tuple[LinkStrategy, ...] = ("hardlink", "reflink", "copy_file_range", "copy")
+
+# linux/fs.h FICLONE — dst fd 가 src fd 의 extent 를 공유하게 한다 (btrfs / XFS reflink 등)
+_FICLONE = 0x40049409
+
+# 파일이 아니라 파일시스템 / 커널이 그 방식을 지원하지 않을 때의 errno.
+# 같은 source 디렉토리에서는 그 방식을 다시 시도하지 않는다.
+_UNSUPPORTED_ERRNOS = frozenset({
+    errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EPERM,
+})
+
+# 병렬 실체화에서 worker 1개당 동시에 제출해 두는 ImagePlan 수 (대기 future 수 상한)
+_IN_FLIGHT_PER_WORKER = 4
+
+# 변환 이미지 읽기 → 변환 → 쓰기 단계 사이 버퍼 기본 상한
+DEFAULT_MATERIALIZE_BUFFER_BYTES = 256 * 1024 * 1024
+
+# 병렬 실체화의 변환 이미지 단계 (future 가 어느 단계인지)
+_STAGE_PLACE = "place"
+_STAGE_READ = "read"
+_STAGE_TRANSFORM = "transform"
+_STAGE_WRITE = "write"
+
 
 @dataclass
 class MaterializeResult:
@@ -32,15 +100,56 @@ class MaterializeResult:
 
     materialized_count: 성공적으로 복사/변환된 이미지 수
     skipped_files: 소스 파일이 존재하지 않아 건너뛴 파일명 리스트
+    reused_count: materialized_count 중 이전 출력 이미지를 재사용(hardlink)한 수
+    resumed_count: materialized_count 중 중단된 이전 시도에서 이미 만들어져 건너뛴 수
+    bytes_written: 이번 실행에서 쓴 이미지 바이트 수 — 변환 결과와 바이트 복사(copy_file_range /
+        copy). 바이트를 공유하는 hardlink / reflink / blob 링크와 resumed 는 제외
+    transform_counts: 이번 실행에서 적용한 이미지 변환 operation 별 횟수
+    link_counts: 이번 실행에서 복사/재사용 이미지를 배치한 방식별 수 (LINK_STRATEGIES, 변환 제외)
+    link_fallbacks: 배치 중 실패하거나 지원하지 않아 다음 방식으로 넘어간 방식별 횟수
     """
     materialized_count: int = 0
     skipped_files: list[str] = field(default_factory=list)
+    reused_count: int = 0
+    resumed_count: int = 0
+    bytes_written: int = 0
+    transform_counts: dict[str, int] = field(default_factory=dict)
+    link_counts: dict[str, int] = field(default_factory=dict)
+    link_fallbacks: dict[str, int] = field(default_factory=dict)
+
+    def add_placement(self, placement: FilePlacement) -> None:
+        """파일 1개의 배치 방식을 link_counts / link_fallbacks 에 누적한다 (변환 이미지 제외)."""
+        if placement.method is not None:
+            self.link_counts[placement.method] = self.link_counts.get(placement.method, 0) + 1
+        for failed_method in placement.fallbacks:
+            self.link_fallbacks[failed_method] = self.link_fallbacks.get(failed_method, 0) + 1
 
     @property
     def skipped_count(self) -> int:
         return len(self.skipped_files)
 
 
+@dataclass(frozen=True)
+class FilePlacement:
+    """
+    파일 1개를 배치한 결과.
+
+    method: 실제로 쓴 방식 (LINK_STRATEGIES 중 하나, blob 저장소에서 링크했으면 "blob").
+        blob 저장소에 넣은 변환 이미지면 None.
+    fallbacks: 실패하거나 지원하지 않아 건너뛴 방식 (시도 순서)
+    digest: blob 저장소를 쓰면 배치한 이미지의 blob digest
+    source_digest: 소스 이미지의 digest 를 이번에 처음 구했으면 그 digest
+        (저장소의 소스 색인에 추가)
+    size: 배치하며 쓴 바이트 수 (변환 결과 / 바이트 복사). 바이트를 공유하는 hardlink / reflink /
+        blob 링크는 None — 크기를 알려고 stat 하지 않는다.
+    """
+    method: str | None
+    fallbacks: tuple[LinkStrategy, ...] = ()
+    digest: str | None = None
+    source_digest: str | None = None
+    size: int | None = None
+
+
 class ImageMaterializer:
     """
     ImagePlan 리스트를 실체화하여 이미지 파일을 출력 경로에 생성한다.
@@ -48,15 +157,63 @@ class ImageMaterializer:
     Args:
         storage: StorageProtocol 구현체 (경로 해석용)
         progress_callback: 진행률 콜백 (processed_count, total_count) → None
+        journal: run checkpoint 의 실체화 journal. None 이면 기록하지 않는다.
+        io_workers: 복사/hardlink ImagePlan 을 실행할 thread 수 (NAS 지연을 겹치도록 코어 수보다
+            크게 잡는다). io_workers 와 transform_workers 가 모두 1 이면 순차 실행한다.
+        transform_workers: 변환 ImagePlan 을 실행할 worker 수. None 이면 CPU 코어 수.
+        transform_pool: 변환 worker 방식 — "process"(기본) | "thread".
+            daemon 프로세스(Celery prefork worker)는 자식 프로세스를 만들 수 없으므로
+            "process" 여도 thread pool 을 쓴다.
+        link_strategy: 복사만 하는 ImagePlan 을 배치할 첫 방식 (LINK_STRATEGIES).
+            실패하면 뒤의 방식으로 넘어간다. 기본 "copy" 는 바이트 복사만 한다.
+        blob_store: content-addressed 이미지 저장소. 있으면 이미지를 blob 의 hardlink 로 배치하고
+            출력 버전의 참조 목록(.image_refs)과 저장소의 소스 digest 색인을 남긴다.
+            blob 을 링크할 수 없으면 link_strategy 로 배치한다.
+        buffer_bytes: 병렬 실체화에서 읽었지만 아직 쓰지 않은 변환 이미지 바이트 상한
+            (소스 바이트 + 변환 결과). 넘으면 새 이미지를 읽지 않는다.
     """
 
     def __init__(
         self,
         storage: StorageProtocol,
         progress_callback: Callable[[int, int], None] | None = None,
+        journal: MaterializeJournal | None = None,
+        io_workers: int = 1,
+        transform_workers: int | None = 1,
+        transform_pool: TransformPoolMode = "process",
+        link_strategy: LinkStrategy = "copy",
+        blob_store: ImageBlobStore | None = None,
+        buffer_bytes: int = DEFAULT_MATERIALIZE_BUFFER_BYTES,
     ) -> None:
+        if transform_pool not in _VALID_TRANSFORM_POOL_MODES:
+            raise ValueError(
+                f"지원하지 않는 transform_pool: {transform_pool!r}. "
+                f"유효: {_VALID_TRANSFORM_POOL_MODES}"
+            )
+        if link_strategy not in LINK_STRATEGIES:
+            raise ValueError(
+                f"지원하지 않는 link_strategy: {link_strategy!r}. 유효: {LINK_STRATEGIES}"
+            )
         self.storage = storage
         self.progress_callback = progress_callback
+        self.journal = journal
+        self.io_workers = max(1, io_workers)
+        self.transform_workers = max(1, transform_workers or os.cpu_count() or 1)
+        self.transform_pool = transform_pool
+        self.link_strategy = link_strategy
+        self.blob_store = blob_store
+        self.buffer_bytes = max(1, buffer_bytes)
+        # 이미 만든 출력 디렉토리 (이미지마다 mkdir 하지 않는다)
+        self._created_dirs: set[Path] = set()
+        # (방식, source 디렉토리) — 지원하지 않아 이 materializer 에서는 다시 시도하지 않는 조합
+        self._unsupported_links: set[tuple[str, Path]] = set()
+        # 소스 버전 루트 → 아는 digest (소스 색인 + .image_refs).
+        # blob 저장소를 쓸 때 버전마다 처음 쓸 때 읽는다
+        self._source_refs: dict[Path, dict[str, str]] = {}
+        # 출력 버전 루트 → 이번에 새로 생긴 참조 (write_image_refs 에서 .image_refs 에 기록)
+        self._pending_refs: dict[Path, dict[str, str]] = {}
+        # 소스 버전 루트 → 이번에 처음 구한 digest (write_image_refs 에서 저장소의 소스 색인에 기록)
+        self._pending_source_refs: dict[Path, dict[str, str]] = {}
 
     def materialize(self, dataset_plan: DatasetPlan) -> MaterializeResult:
         """
@@ -78,29 +235,332 @@ class ImageMaterializer:
             total, dataset_plan.copy_only_count, dataset_plan.transform_count,
         )
 
-        materialized_count = 0
-        skipped_files: list[str] = []
+        result = MaterializeResult()
+        ordered_plans = self._order_by_locality(dataset_plan.image_plans)
+        if self.io_workers > 1 or self.transform_workers > 1:
+            self._materialize_parallel(ordered_plans, total, result)
+        else:
+            skipped_positions: dict[str, int] = {}
+            for plan_index, image_plan in ordered_plans:
+                if not self.materialize_one(image_plan, result):
+                    skipped_positions[result.skipped_files[-1]] = plan_index
+
+                processed_so_far = result.materialized_count + result.skipped_count
+                if self.progress_callback and processed_so_far % 100 == 0:
+                    self.progress_callback(processed_so_far, total)
+            # 처리 순서가 아니라 ImagePlan 순서로 보고한다
+            result.skipped_files.sort(key=skipped_positions.__getitem__)
+
+        if self.progress_callback:
+            self.progress_callback(result.materialized_count + result.skipped_count, total)
+
+        self.write_image_refs()
+        self.log_summary(result)
+        return result
+
+    def materialize_one(self, image_plan: ImagePlan, result: MaterializeResult) -> bool:
+        """
+        ImagePlan 1건을 실체화하고 result 에 누적한다.
+
+        streaming 실행에서 레코드가 하나씩 도착할 때 쓴다 (전체 DatasetPlan 을 만들지 않음).
+        요약 로그는 모든 이미지를 처리한 뒤 log_summary 로 남긴다.
 
-        for image_plan in dataset_plan.image_plans:
-            was_skipped = self._materialize_single_image(image_plan)
-            if was_skipped:
-                # dst_uri에서 파일명 추출 (이미 rename된 최종 파일명)
-                skipped_file_name = image_plan.dst_uri.rsplit("/", 1)[-1]
-                skipped_files.append(skipped_file_name)
+        Returns:
+            True 이면 실체화됨, False 이면 소스 파일이 없어 건너뜀
+        """
+        if self._is_resumed(image_plan):
+            result.materialized_count += 1
+            result.resumed_count += 1
+            return True
+        materialized = self._materialize_and_measure(image_plan)
+        if materialized is None:
+            result.skipped_files.append(_skipped_file_name(image_plan))
+            return False
+        self._record_materialized(image_plan, *materialized, result)
+        return True
+
+    def _order_by_locality(self, image_plans: list[ImagePlan]) -> list[tuple[int, ImagePlan]]:
+        """
+        ImagePlan 을 (소스 디렉토리, inode) 순서로 정렬해 (원래 순서 번호, ImagePlan) 로 돌려준다.
+
+        같은 디렉토리의 파일을 inode 순으로 읽으면 NAS 의 메타데이터 / 블록 접근이
+        대부분 순차가 된다.
+        inode 는 소스 디렉토리마다 scandir 1회로 얻는다 (파일마다 stat 하지 않음).
+        읽을 수 없는 디렉토리나 없는 파일은 inode 0 으로 둔다.
+        """
+        if len(image_plans) < 2:
+            return list(enumerate(image_plans))
+        source_paths = [self.storage.resolve_path(plan.src_uri) for plan in image_plans]
+        directory_inodes: dict[Path, dict[str, int]] = {}
+        for src_path in source_paths:
+            if src_path.parent not in directory_inodes:
+                directory_inodes[src_path.parent] = _scan_inodes(src_path.parent)
+
+        def _locality_key(plan_index: int) -> tuple[str, int]:
+            src_path = source_paths[plan_index]
+            return str(src_path.parent), directory_inodes[src_path.parent].get(src_path.name, 0)
+
+        return [
+            (plan_index, image_plans[plan_index])
+            for plan_index in sorted(range(len(image_plans)), key=_locality_key)
+        ]
+
+    def _materialize_parallel(
+        self,
+        ordered_plans: list[tuple[int, ImagePlan]],
+        total: int,
+        result: MaterializeResult,
+    ) -> None:
+        """
+        ImagePlan 을 I/O / 변환 pool 에 나눠 제출하고 끝나는 대로 result 에 누적한다.
+
+        복사/재사용 이미지는 I/O pool 에서 한 번에 배치한다. 변환 이미지는 I/O pool 에서 소스를
+        읽고(read-ahead) → 변환 pool 에서 메모리 안에서 변환하고 → I/O pool 에서 쓴다(write-behind).
+        단계 연결은 호출 스레드가 future 가 끝날 때마다 다음 단계를 제출하는 식으로 한다.
+
+        제출해 둔 future 수는 worker 수 × _IN_FLIGHT_PER_WORKER, 단계 사이 버퍼에 든 바이트는
+        buffer_bytes 로 제한한다 (넘으면 새 ImagePlan 을 제출하지 않고 기다린다). 아직 끝나지 않은
+        읽기는 지금까지 읽은 소스의 평균 크기(최소 1 바이트)만큼 버퍼를 미리 잡는다.
+        journal 기록과 진행률 콜백은 호출 스레드에서만 하고, skipped_files 는 끝난 순서가 아니라
+        ImagePlan 순서로 채운다.
+        """
+        # future → (단계, ImagePlan 순서 번호, ImagePlan, 그 future 가 잡고 있는 버퍼 바이트)
+        pending: dict[Future, tuple[str, int, ImagePlan, int]] = {}
+        skipped: list[tuple[int, str]] = []
+        processed_count = 0
+        buffered_bytes = 0
+        read_bytes_total = 0
+        read_count = 0
+
+        def _finish(plan_index: int, image_plan: ImagePlan, materialized) -> None:
+            nonlocal processed_count
+            if materialized is None:
+                skipped.append((plan_index, _skipped_file_name(image_plan)))
             else:
-                materialized_count += 1
+                self._record_materialized(image_plan, *materialized, result)
+            processed_count += 1
+            if self.progress_callback and processed_count % 100 == 0:
+                self.progress_callback(processed_count, total)
+
+        def _collect(done_futures: set[Future]) -> None:
+            nonlocal buffered_bytes, read_bytes_total, read_count
+            for future in done_futures:
+                stage, plan_index, image_plan, held_bytes = pending.pop(future)
+                buffered_bytes -= held_bytes
+                stage_output = future.result()
+                if stage == _STAGE_READ and stage_output is not None:
+                    buffered_bytes += len(stage_output)
+                    read_bytes_total += len(stage_output)
+                    read_count += 1
+                    next_future = transform_pool.submit(
+                        self._transform_bytes, stage_output,
+                        PurePosixPath(image_plan.src_uri).suffix,
+                        PurePosixPath(image_plan.dst_uri).suffix,
+                        image_plan.specs,
+                    )
+                    pending[next_future] = (
+                        _STAGE_TRANSFORM, plan_index, image_plan, len(stage_output),
+                    )
+                elif stage == _STAGE_TRANSFORM:
+                    buffered_bytes += len(stage_output)
+                    next_future = io_pool.submit(self._write_output, image_plan, stage_output)
+                    pending[next_future] = (_STAGE_WRITE, plan_index, image_plan, len(stage_output))
+                else:
+                    # 배치 / 쓰기 완료, 또는 읽기 단계에서 소스 파일이 없어 건너뜀
+                    _finish(plan_index, image_plan, stage_output)
+
+        max_in_flight = (self.io_workers + self.transform_workers) * _IN_FLIGHT_PER_WORKER
+        io_pool = ThreadPoolExecutor(
+            max_workers=self.io_workers, thread_name_prefix="materialize-io",
+        )
+        has_transform = any(
+            not (image_plan.reuse_existing or image_plan.is_copy_only)
+            for _, image_plan in ordered_plans
+        )
+        transform_pool = self._create_transform_pool() if has_transform else None
+        logger.info(
+            "병렬 이미지 실체화: io_workers=%d, transform_workers=%d (%s), buffer_bytes=%d",
+            self.io_workers, self.transform_workers, self._transform_pool_mode(),
+            self.buffer_bytes,
+        )
+        try:
+            for plan_index, image_plan in ordered_plans:
+                if self._is_resumed(image_plan):
+                    result.materialized_count += 1
+                    result.resumed_count += 1
+                    processed_count += 1
+                    if self.progress_callback and processed_count % 100 == 0:
+                        self.progress_callback(processed_count, total)
+                    continue
+                # back-pressure — 대기 future 나 버퍼가 상한이면 끝나는 것부터 정리한다
+                while pending and (
+                    len(pending) >= max_in_flight or buffered_bytes >= self.buffer_bytes
+                ):
+                    done_futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(done_futures)
+                # 출력 디렉토리는 호출 스레드에서 만든다 (worker 마다 mkdir 하지 않는다)
+                self._ensure_output_dir(self.storage.resolve_path(image_plan.dst_uri).parent)
+                if image_plan.reuse_existing or image_plan.is_copy_only:
+                    future = io_pool.submit(self._materialize_and_measure, image_plan)
+                    pending[future] = (_STAGE_PLACE, plan_index, image_plan, 0)
+                else:
+                    future = io_pool.submit(
+                        self._read_source, self.storage.resolve_path(image_plan.src_uri),
+                    )
+                    reserved_bytes = max(1, read_bytes_total // max(1, read_count))
+                    buffered_bytes += reserved_bytes
+                    pending[future] = (_STAGE_READ, plan_index, image_plan, reserved_bytes)
+            while pending:
+                done_futures, _ = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(done_futures)
+        finally:
+            # 실패하면 아직 시작하지 않은 ImagePlan 은 취소한다
+            io_pool.shutdown(wait=True, cancel_futures=True)
+            if transform_pool is not None:
+                transform_pool.shutdown(wait=True, cancel_futures=True)
+
+        skipped.sort()
+        result.skipped_files.extend(file_name for _, file_name in skipped)
+
+    def _transform_pool_mode(self) -> TransformPoolMode:
+        """실제로 쓸 변환 pool 방식 (daemon 프로세스에서는 process 대신 thread)."""
+        if self.transform_pool == "process" and multiprocessing.current_process().daemon:
+            return "thread"
+        return self.transform_pool
+
+    def _create_transform_pool(self) -> Executor:
+        if self._transform_pool_mode() == "process":
+            return ProcessPoolExecutor(max_workers=self.transform_workers)
+        return ThreadPoolExecutor(
+            max_workers=self.transform_workers, thread_name_prefix="materialize-transform",
+        )
 
-            processed_so_far = materialized_count + len(skipped_files)
-            if self.progress_callback and processed_so_far % 100 == 0:
-                self.progress_callback(processed_so_far, total)
+    def __getstate__(self) -> dict[str, Any]:
+        # process pool 에 넘길 때 호출 스레드 전용 상태(journal 파일, 콜백)는 빼고 보낸다
+        state = self.__dict__.copy()
+        state["progress_callback"] = None
+        state["journal"] = None
+        state["_created_dirs"] = set()
+        state["_unsupported_links"] = set()
+        state["_source_refs"] = {}
+        state["_pending_refs"] = {}
+        state["_pending_source_refs"] = {}
+        return state
+
+    def _is_resumed(self, image_plan: ImagePlan) -> bool:
+        """이전 시도에서 이미 실체화되어 건너뛸 이미지인지 여부 (journal 기준)."""
+        return self.journal is not None and self.journal.is_completed(
+            image_plan.dst_uri, self.storage.resolve_path(image_plan.dst_uri),
+        )
 
-        if self.progress_callback:
-            self.progress_callback(materialized_count + len(skipped_files), total)
+    def _materialize_and_measure(
+        self, image_plan: ImagePlan,
+    ) -> tuple[int | None, FilePlacement | None] | None:
+        """
+        ImagePlan 1건을 실체화하고 (쓴 바이트 수, 배치 결과) 를 돌려준다.
 
+        쓴 바이트 수는 배치 결과의 size 다 (링크면 None — 출력 파일을 stat 하지 않는다).
+        소스 파일이 없으면 None 을 돌려준다.
+        """
+        placement = self._materialize_single_image(image_plan)
+        if placement is None:
+            return None
+        return placement.size, placement
+
+    def _read_source(self, src_path: Path) -> bytes | None:
+        """변환할 소스 이미지 바이트를 읽는다 (read-ahead 단계). 소스 파일이 없으면 None."""
+        try:
+            return src_path.read_bytes()
+        except FileNotFoundError:
+            logger.warning("소스 이미지를 찾을 수 없어 건너뜀: src=%s", src_path)
+            return None
+
+    def _write_output(
+        self, image_plan: ImagePlan, image_bytes: bytes,
+    ) -> tuple[int, FilePlacement | None]:
+        """변환 결과를 출력 경로에 쓴다 (write-behind 단계). (쓴 크기, blob 배치) 를 돌려준다."""
+        dst_path = self.storage.resolve_path(image_plan.dst_uri)
+        # 이전 시도가 남긴 hardlink(blob 등)를 덮어쓰지 않도록 새 파일로 쓴다
+        dst_path.unlink(missing_ok=True)
+        with open(dst_path, "wb") as dst_file:
+            dst_file.write(image_bytes)
+        if self.blob_store is not None:
+            return len(image_bytes), FilePlacement(
+                None, digest=self.blob_store.adopt(dst_path), size=len(image_bytes),
+            )
+        return len(image_bytes), None
+
+    def _record_materialized(
+        self,
+        image_plan: ImagePlan,
+        written_size: int | None,
+        placement: FilePlacement | None,
+        result: MaterializeResult,
+    ) -> None:
+        """
+        실체화된 이미지 1건을 result 와 journal 에 누적한다.
+
+        written_size 가 None 이면 (링크 배치) 쓴 바이트가 없고, journal 에는 크기 없이 남긴다.
+        """
+        result.materialized_count += 1
+        if placement is not None:
+            result.add_placement(placement)
+            self._record_image_refs(image_plan, placement)
+        if image_plan.reuse_existing:
+            result.reused_count += 1
+        else:
+            for spec in image_plan.specs:
+                result.transform_counts[spec.operation] = (
+                    result.transform_counts.get(spec.operation, 0) + 1
+                )
+        result.bytes_written += written_size or 0
+        if self.journal is not None:
+            self.journal.record(image_plan.dst_uri, written_size)
+
+    def _record_image_refs(self, image_plan: ImagePlan, placement: FilePlacement) -> None:
+        """배치한 이미지의 blob 참조 / 처음 구한 소스 이미지 digest 를 모은다 (호출 스레드)."""
+        if placement.digest is not None:
+            dst_path = self.storage.resolve_path(image_plan.dst_uri)
+            self._pending_refs.setdefault(dst_path.parent.parent, {})[
+                _version_relative_path(dst_path)
+            ] = placement.digest
+        if placement.source_digest is not None:
+            src_path = self.storage.resolve_path(image_plan.src_uri)
+            self._pending_source_refs.setdefault(src_path.parent.parent, {})[
+                _version_relative_path(src_path)
+            ] = placement.source_digest
+
+    def write_image_refs(self) -> None:
+        """
+        모은 blob 참조를 출력 버전별 .image_refs 에, 소스 digest 를 저장소의 소스 색인에 합쳐
+        기록한다 (materialize 가 끝에 부른다).
+        """
+        for version_root, refs in self._pending_refs.items():
+            write_image_refs(version_root, refs)
+        if self.blob_store is not None:
+            for version_root, refs in self._pending_source_refs.items():
+                self.blob_store.write_source_refs(version_root, refs)
+        self._pending_source_refs = {}
+        if self._pending_refs:
+            logger.info(
+                "이미지 blob 참조 기록: versions=%d, refs=%d",
+                len(self._pending_refs), sum(len(refs) for refs in self._pending_refs.values()),
+            )
+        self._pending_refs = {}
+
+    def _ensure_output_dir(self, output_dir: Path) -> None:
+        """출력 디렉토리를 만든다 (이미 만든 디렉토리는 다시 mkdir 하지 않는다)."""
+        if output_dir not in self._created_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(output_dir)
+
+    def log_summary(self, result: MaterializeResult) -> None:
+        """실체화 완료 요약 로그 (스킵이 있으면 상위 20개 파일명 포함)."""
+        skipped_files = result.skipped_files
         if skipped_files:
             logger.warning(
                 "이미지 실체화 완료 (일부 스킵): materialized=%d, skipped=%d",
-                materialized_count, len(skipped_files),
+                result.materialized_count, len(skipped_files),
             )
             # 스킵된 파일 목록 상세 로깅 (최대 20개까지만 표시)
             display_files = skipped_files[:20]
@@ -110,181 +570,330 @@ class ImageMaterializer:
                 ", ".join(display_files),
             )
         else:
-            logger.info("이미지 실체화 완료: materialized=%d", materialized_count)
-
-        return MaterializeResult(
-            materialized_count=materialized_count,
-            skipped_files=skipped_files,
-        )
+            logger.info("이미지 실체화 완료: materialized=%d", result.materialized_count)
+        if result.link_counts:
+            logger.info(
+                "이미지 배치 방식: link_strategy=%s, used=%s, fallbacks=%s",
+                self.link_strategy, result.link_counts, result.link_fallbacks,
+            )
 
-    def _materialize_single_image(self, image_plan: ImagePlan) -> bool:
+    def _materialize_single_image(self, image_plan: ImagePlan) -> FilePlacement | None:
         """
-        단일 ImagePlan을 실체화 (복사 또는 변환).
+        단일 ImagePlan을 실체화 (배치 또는 변환).
 
-        소스 파일이 존재하지 않으면 건너뛰고 True를 반환한다.
+        소스 파일이 존재하지 않으면 건너뛰고 None을 반환한다.
+        존재 여부를 미리 stat 하지 않고 열 때 FileNotFoundError 로 판단한다
+        (source 이미지 인덱스가 로드 시 없는 레코드를 이미 뺐으므로 대부분 바로 성공한다).
+        없는 경로가 소스인지는 예외의 filename 으로 가린다. 출력 디렉토리는 바로 앞에서
+        만들었으므로 os.link 처럼 두 경로를 받는 호출이 소스 경로를 가리키면 소스가 없는 것이다.
 
         Returns:
-            True이면 스킵됨 (소스 파일 없음), False이면 정상 처리됨
+            배치 결과(FilePlacement) — 변환 이미지는 method 가 None (blob 저장소에 넣었으면 digest).
+            스킵됨 (소스 파일 없음) 이면 None
         """
         src_path = self.storage.resolve_path(image_plan.src_uri)
         dst_path = self.storage.resolve_path(image_plan.dst_uri)
 
-        # 소스 파일 존재 여부 확인 — 없으면 스킵
-        if not src_path.exists():
+        # 출력 디렉토리 생성
+        self._ensure_output_dir(dst_path.parent)
+
+        try:
+            if image_plan.reuse_existing or image_plan.is_copy_only:
+                # 이전 출력 이미지는 설정과 상관없이 hardlink 부터 시도한다
+                strategy = "hardlink" if image_plan.reuse_existing else self.link_strategy
+                if self.blob_store is not None:
+                    return self._place_from_blob_store(src_path, dst_path, strategy)
+                return self._place(src_path, dst_path, strategy)
+            # 변환이 있는 이미지: 소스를 PIL로 열어 변환 체인을 적용한 뒤 한 번만 저장
+            # 복사 + 재저장 대비 I/O 1회 절약
+            written_size = self._transform_and_save(src_path, dst_path, image_plan.specs)
+            if self.blob_store is not None:
+                # 같은 변환 결과가 이미 저장소에 있으면 그 blob 을 공유한다
+                return FilePlacement(
+                    None, digest=self.blob_store.adopt(dst_path), size=written_size,
+                )
+        except FileNotFoundError as not_found:
+            # 소스 파일이 없으면 스킵 (출력 쪽 경로가 없는 경우 등은 그대로 올린다)
+            if not_found.filename is None or (
+                os.fspath(not_found.filename) != os.fspath(src_path)
+            ):
+                raise
             logger.warning(
                 "소스 이미지를 찾을 수 없어 건너뜀: src=%s", src_path,
             )
-            return True
+            return None
 
-        # 출력 디렉토리 생성
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        return FilePlacement(None, size=written_size)
 
-        if image_plan.is_copy_only:
-            shutil.copy2(src_path, dst_path)
-        else:
-            # 변환이 있는 이미지: 소스를 PIL로 열어 변환 체인을 적용한 뒤 한 번만 저장
-            # 복사 + 재저장 대비 I/O 1회 절약
-            self._transform_and_save(src_path, dst_path, image_plan.specs)
+    def _place(self, src_path: Path, dst_path: Path, strategy: LinkStrategy) -> FilePlacement:
+        """place_file — 지원하지 않는 방식은 이 materializer 에서 기억해 다시 시도하지 않는다."""
+        return place_file(src_path, dst_path, strategy, self._unsupported_links)
 
-        return False
+    def _place_from_blob_store(
+        self,
+        src_path: Path,
+        dst_path: Path,
+        fallback_strategy: LinkStrategy,
+    ) -> FilePlacement:
+        """
+        소스 이미지의 blob 을 dst_path 에 hardlink 한다. 소스 버전(불변 입력)은 바꾸지 않는다.
+
+        digest 는 저장소의 소스 색인과 소스 버전의 .image_refs (이전 실행의 출력이면 있다) 에서
+        찾는다. 모르거나 그 blob 이 없으면 fallback_strategy 로 출력에 배치한 뒤 출력 파일을
+        저장소에 넣고 (해시 1회) digest 를 소스 색인에 남긴다.
+        blob 을 링크할 수 없으면 (다른 파일시스템 등) fallback_strategy 로 배치한다.
+        """
+        assert self.blob_store is not None
+        version_root = src_path.parent.parent
+        source_refs = self._source_refs.get(version_root)
+        if source_refs is None:
+            source_refs = {
+                **self.blob_store.read_source_refs(version_root), **read_image_refs(version_root),
+            }
+            self._source_refs[version_root] = source_refs
+        digest = source_refs.get(_version_relative_path(src_path))
+        if digest is not None:
+            try:
+                self.blob_store.link(digest, dst_path)
+                return FilePlacement("blob", digest=digest)
+            except FileNotFoundError:
+                # 색인의 blob 이 없다 (저장소를 옮긴 경우 등) — 출력 파일로 다시 넣는다
+                pass
+            except OSError as link_error:
+                logger.debug(
+                    "blob 링크 실패 — %s 로 배치: %s (%s)", fallback_strategy, dst_path, link_error,
+                )
+                return self._place(src_path, dst_path, fallback_strategy)
+
+        placement = self._place(src_path, dst_path, fallback_strategy)
+        try:
+            digest = self.blob_store.adopt(dst_path)
+        except OSError as adopt_error:
+            logger.debug("blob 저장 실패 — 저장소 없이 배치: %s (%s)", dst_path, adopt_error)
+            return placement
+        return FilePlacement(
+            placement.method, placement.fallbacks, digest=digest, source_digest=digest,
+            size=placement.size,
+        )
+
+    def clone_directory(self, src_dir: Path, dst_dir: Path) -> MaterializeResult:
+        """
+        src_dir 의 파일을 모두 dst_dir 에 hardlink 부터 배치한다 (place_file). passthrough 복제용.
+
+        annotation 레코드를 보지 않고 디렉토리에 있는 파일을 그대로 옮기므로 스킵이 없다.
+        src_dir 가 없으면 빈 결과를 돌려준다.
+        """
+        result = MaterializeResult()
+        try:
+            with os.scandir(src_dir) as entries:
+                source_entries = [entry for entry in entries if entry.is_file()]
+        except FileNotFoundError:
+            logger.warning("복제할 이미지 디렉토리가 없습니다: %s", src_dir)
+            return result
+
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        total = len(source_entries)
+        for entry in source_entries:
+            placement = self._place(Path(entry.path), dst_dir / entry.name, "hardlink")
+            result.add_placement(placement)
+            result.materialized_count += 1
+            result.bytes_written += placement.size or 0
+            if self.progress_callback and result.materialized_count % 100 == 0:
+                self.progress_callback(result.materialized_count, total)
+        if self.progress_callback:
+            self.progress_callback(result.materialized_count, total)
+
+        logger.info(
+            "이미지 디렉토리 복제 완료: files=%d, used=%s, fallbacks=%s, src=%s",
+            result.materialized_count, result.link_counts, result.link_fallbacks, src_dir,
+        )
+        return result
 
     def _transform_and_save(
         self,
         src_path: Path,
         dst_path: Path,
         specs: list,
-    ) -> None:
+    ) -> int:
         """
         소스 이미지를 열어 모든 변환 spec을 순차 적용한 뒤 한 번에 저장한다.
 
         복사 없이 바로 변환 → 저장하므로 I/O 비용을 절약한다.
-        원본 포맷(JPEG/PNG 등)과 EXIF 메타데이터를 유지한다.
+        원본 포맷(JPEG/PNG 등)과 EXIF 메타데이터를 유지한다. 쓴 바이트 수를 돌려준다.
         """
         from PIL import Image
 
-        with Image.open(src_path) as img:
-            # EXIF 정보 보존 (있으면)
-            exif_data = img.info.get("exif")
-
-            for spec in specs:
-                img = self._apply_image_operation(img, spec)
+        # 이전 시도가 남긴 hardlink(blob 등)를 덮어쓰지 않도록 새 파일로 쓴다
+        dst_path.unlink(missing_ok=True)
+        with Image.open(src_path) as img, open(dst_path, "wb") as dst_file:
+            try:
+                self._apply_and_save(
+                    img, dst_file, src_path.suffix, specs,
+                    image_format=Image.registered_extensions().get(dst_path.suffix.lower()),
+                )
+            except BaseException:
+                # 저장하다 만 파일을 남기지 않는다
+                dst_path.unlink(missing_ok=True)
+                raise
+            return dst_file.tell()
+
+    def _transform_bytes(
+        self,
+        source_bytes: bytes,
+        src_suffix: str,
+        dst_suffix: str,
+        specs: list,
+    ) -> bytes:
+        """
+        메모리의 소스 이미지 바이트에 변환 spec 을 적용해 인코딩한 바이트를 돌려준다.
 
-            # 원본 포맷으로 저장 — JPEG이면 quality 유지, PNG이면 그대로
-            save_kwargs: dict = {}
-            output_format = src_path.suffix.lower()
-            if output_format in (".jpg", ".jpeg"):
-                save_kwargs["quality"] = 95
-                save_kwargs["subsampling"] = 0  # 4:4:4 — 색상 손실 최소화
-            if exif_data:
-                save_kwargs["exif"] = exif_data
+        병렬 실체화의 변환 단계 (파일 I/O 없음). 저장 형식은 _transform_and_save 와 같다.
+        """
+        from PIL import Image
 
-            img.save(dst_path, **save_kwargs)
+        output = io.BytesIO()
+        with Image.open(io.BytesIO(source_bytes)) as img:
+            self._apply_and_save(
+                img, output, src_suffix, specs,
+                image_format=Image.registered_extensions().get(dst_suffix.lower()),
+            )
+        return output.getvalue()
 
-    def _apply_image_operation(self, img: 'Image.Image', spec: 'ImageManipulationSpec') -> 'Image.Image':
+    def _apply_and_save(
+        self,
+        img: Image.Image,
+        output: IO[bytes],
+        src_suffix: str,
+        specs: list,
+        image_format: str | None = None,
+    ) -> None:
         """
-        PIL Image에 단일 변환 operation을 적용하여 반환한다.
+        변환 spec 을 적용한 뒤 output 에 한 번 저장한다 (image_format 없으면 확장자로 판단).
 
-        지원 operation:
-          - rotate_image: 이미지를 지정 각도(90/180/270)로 시계 방향 회전
-          - crop_image_vertical: 상단 또는 하단에서 height 의 지정 비율(%)을 잘라냄
-          - mask_region: 지정 bbox 영역을 단색으로 채우기
+        spec 은 하나씩 적용하지 않고 컴파일한 체인(image_transform_chain)으로 한 번에 적용한다.
         """
-        if spec.operation == "rotate_image":
-            return self._apply_rotate(img, spec.params)
-        if spec.operation == "crop_image_vertical":
-            return self._apply_crop_vertical(img, spec.params)
-        if spec.operation == "mask_region":
-            return self._apply_mask_region(img, spec.params)
-
-        logger.warning(
-            "미지원 이미지 변환 operation: %s (건너뜀)", spec.operation,
-        )
-        return img
+        # EXIF 정보 보존 (있으면)
+        exif_data = img.info.get("exif")
 
-    def _apply_rotate(self, img: 'Image.Image', params: dict) -> 'Image.Image':
-        """PIL Image를 회전하여 반환한다."""
-        from PIL import Image
+        img = compile_transform_chain(specs).apply(img)
 
-        degrees = int(params.get("degrees", 180))
+        # 원본 포맷으로 저장 — JPEG이면 quality 유지, PNG이면 그대로
+        save_kwargs: dict = {}
+        output_format = src_suffix.lower()
+        if output_format in (".jpg", ".jpeg"):
+            save_kwargs["quality"] = 95
+            save_kwargs["subsampling"] = 0  # 4:4:4 — 색상 손실 최소화
+        if exif_data:
+            save_kwargs["exif"] = exif_data
 
-        # PIL transpose는 무손실 픽셀 재배치 (보간 없음)
-        if degrees == 90:
-            return img.transpose(Image.Transpose.ROTATE_270)   # 시계 90° = PIL 반시계 270°
-        elif degrees == 180:
-            return img.transpose(Image.Transpose.ROTATE_180)
-        elif degrees == 270:
-            return img.transpose(Image.Transpose.ROTATE_90)    # 시계 270° = PIL 반시계 90°
+        img.save(output, format=image_format, **save_kwargs)
 
-        logger.warning("지원하지 않는 회전 각도: %d (건너뜀)", degrees)
-        return img
 
-    def _apply_crop_vertical(self, img: 'Image.Image', params: dict) -> 'Image.Image':
-        """
-        이미지 상단 또는 하단에서 height 의 지정 비율(%)을 잘라낸다.
+def _scan_inodes(directory: Path) -> dict[str, int]:
+    """
+    디렉토리의 {파일명: inode}. 못 읽으면 {}.
 
-        params:
-            direction: "up" | "down" — "up" 이면 상단 영역, "down" 이면 하단 영역을 제거.
-            crop_pct:  int (1~99)    — 전체 height 중 잘라낼 비율.
-        """
-        direction = str(params.get("direction", "up"))
-        crop_pct = int(params.get("crop_pct", 30))
+    scandir 1회로 읽는다 (DirEntry.inode 는 stat 하지 않는다).
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.inode() for entry in entries}
+    except OSError:
+        return {}
 
-        if direction not in ("up", "down"):
-            logger.warning(
-                "미지원 crop direction: %s (건너뜀)", direction,
-            )
-            return img
-        if crop_pct < 1 or crop_pct > 99:
-            logger.warning(
-                "crop_pct 범위 밖: %d (건너뜀)", crop_pct,
-            )
-            return img
 
-        image_width, image_height = img.size
-        cut_rows = int(image_height * crop_pct / 100)
-        # 최소 1 픽셀은 남겨둔다 — crop_pct=99 + 작은 이미지에서도 0-height 방지.
-        cut_rows = max(0, min(cut_rows, image_height - 1))
+def _version_relative_path(image_path: Path) -> str:
+    """.image_refs 키 — 버전 루트 기준 상대경로 ("images/<파일명>")."""
+    return f"{image_path.parent.name}/{image_path.name}"
 
-        if direction == "up":
-            # 상단 영역을 제거 → upper 를 cut_rows 지점부터 시작.
-            return img.crop((0, cut_rows, image_width, image_height))
-        # direction == "down" — 하단 영역을 제거 → lower 를 height - cut_rows 로.
-        return img.crop((0, 0, image_width, image_height - cut_rows))
 
-    def _apply_mask_region(self, img: 'Image.Image', params: dict) -> 'Image.Image':
-        """
-        지정된 bbox 영역들을 단색으로 채워 마스킹한다.
+def _skipped_file_name(image_plan: ImagePlan) -> str:
+    """skipped_files 에 남길 파일명 — dst_uri 의 파일명 (이미 rename 된 최종 파일명)."""
+    return image_plan.dst_uri.rsplit("/", 1)[-1]
 
-        params:
-            bboxes: list[list[float]] — COCO [x, y, w, h] 형식 bbox 목록
-            fill_color: str — "black" | "white"
-            bbox_normalized: bool — True이면 0~1 정규화 좌표 (이미지 크기로 변환)
-        """
-        from PIL import ImageDraw
-
-        bboxes = params.get("bboxes", [])
-        fill_color_name = params.get("fill_color", "black")
-        bbox_normalized = params.get("bbox_normalized", False)
-
-        # RGB 이미지로 변환 — 그레이스케일(L), 팔레트(P) 등에서 tuple fill이 동작하도록
-        if img.mode not in ("RGB", "RGBA"):
-            img = img.convert("RGB")
-        fill_rgb = (0, 0, 0) if fill_color_name == "black" else (255, 255, 255)
-        draw = ImageDraw.Draw(img)
-        image_width, image_height = img.size
-
-        for bbox in bboxes:
-            bx, by, bw, bh = bbox
-            if bbox_normalized:
-                bx *= image_width
-                by *= image_height
-                bw *= image_width
-                bh *= image_height
-
-            # PIL rectangle은 (left, top, right, bottom)
-            draw.rectangle(
-                [int(bx), int(by), int(bx + bw), int(by + bh)],
-                fill=fill_rgb,
-            )
 
-        return img
+def place_file(
+    src_path: Path,
+    dst_path: Path,
+    strategy: LinkStrategy = "hardlink",
+    unsupported: set[tuple[str, Path]] | None = None,
+) -> FilePlacement:
+    """
+    src_path 를 dst_path 에 strategy 부터 LINK_STRATEGIES 순서로 시도해 배치한다.
+
+    데이터셋 버전은 불변이므로 hardlink / reflink 로 바이트를 공유해도 된다.
+    "copy" 는 항상 마지막 수단이다 (Linux 에서 shutil.copy2 는 sendfile 을 쓴다).
+    dst_path 가 이미 있으면 지우고 다시 만든다.
+    소스 파일이 없으면 FileNotFoundError 를 그대로 올린다.
+    바이트를 복사한 방식만 FilePlacement.size 에 쓴 바이트 수를 남긴다 (링크는 None).
+
+    unsupported 가 주어지면 파일시스템 / 커널이 지원하지 않아 실패한 (방식, source 디렉토리) 를
+    기록하고, 이후 같은 조합은 시도하지 않고 건너뛴다 (건너뛴 것도 fallbacks 에 남는다).
+    """
+    dst_path.unlink(missing_ok=True)
+    fallbacks: list[LinkStrategy] = []
+    for method in LINK_STRATEGIES[LINK_STRATEGIES.index(strategy):]:
+        if method == "copy":
+            shutil.copy2(src_path, dst_path)
+            # 파일 전체를 읽고 쓴 뒤라 방금 쓴 파일의 stat 1회는 복사 비용에 비해 무시할 만하다
+            return FilePlacement("copy", tuple(fallbacks), size=dst_path.stat().st_size)
+        unsupported_key = (method, src_path.parent)
+        if unsupported is not None and unsupported_key in unsupported:
+            fallbacks.append(method)
+            continue
+        try:
+            written_size = _PLACE_FUNCTIONS[method](src_path, dst_path)
+        except FileNotFoundError:
+            raise
+        except OSError as place_error:
+            # reflink / copy_file_range 가 중간에 실패하면 만들다 만 파일이 남는다
+            dst_path.unlink(missing_ok=True)
+            fallbacks.append(method)
+            if unsupported is not None and place_error.errno in _UNSUPPORTED_ERRNOS:
+                unsupported.add(unsupported_key)
+            logger.debug("%s 실패 — 다음 방식으로: %s (%s)", method, dst_path, place_error)
+            continue
+        return FilePlacement(method, tuple(fallbacks), size=written_size)
+    raise AssertionError("LINK_STRATEGIES 는 copy 로 끝난다")
+
+
+def _hardlink_file(src_path: Path, dst_path: Path) -> None:
+    os.link(src_path, dst_path)
+
+
+def _reflink_file(src_path: Path, dst_path: Path) -> None:
+    """FICLONE ioctl 로 dst 가 src 의 extent 를 공유하게 한다 (copy-on-write)."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(errno.ENOSYS, "reflink 미지원 플랫폼") from None
+    with open(src_path, "rb") as src_file, open(dst_path, "wb") as dst_file:
+        fcntl.ioctl(dst_file.fileno(), _FICLONE, src_file.fileno())
+    shutil.copystat(src_path, dst_path)
+
+
+def _kernel_copy_file(src_path: Path, dst_path: Path) -> int:
+    """
+    os.copy_file_range 로 커널 안에서 복사한다 (사용자 공간 버퍼 없음). 복사한 바이트 수를 돌려준다.
+
+    NFS 4.2 / SMB 등에서는 서버 측 복사로 처리되어 데이터가 네트워크를 오가지 않는다.
+    """
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "copy_file_range 미지원 플랫폼")
+    with open(src_path, "rb") as src_file, open(dst_path, "wb") as dst_file:
+        source_size = remaining = os.fstat(src_file.fileno()).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src_file.fileno(), dst_file.fileno(), remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    shutil.copystat(src_path, dst_path)
+    return source_size - remaining
+
+
+# 배치 함수 — 복사한 바이트 수 (바이트를 공유하는 링크는 None) 를 돌려준다
+_PLACE_FUNCTIONS: dict[str, Callable[[Path, Path], int | None]] = {
+    "hardlink": _hardlink_file,
+    "reflink": _reflink_file,
+    "copy_file_range": _kernel_copy_file,
+}
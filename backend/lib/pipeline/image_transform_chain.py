@@ -0,0 +1,271 @@
+"""
+이미지 변환 체인 컴파일러 — ImageManipulationSpec 목록을 이미지 1장당 픽셀 작업 1회로 합친다.
+
+spec 을 하나씩 적용하면 rotate(transpose) / crop / mask(ImageDraw) 마다
+전체 크기 이미지를 새로 만든다.
+지원 변환은 모두 픽셀 재배치 / 선택 / 단색 채우기라서 아래처럼 합쳐도 결과 픽셀이 같다.
+
+  - rotate_image / crop_image_vertical: "소스 좌표의 crop box 1개 + 90° 단위 시계 방향 회전 1회" 로
+    합친다. crop 은 그 시점 이미지 높이의 비율이라 box 는 소스 크기를 알 때 계산한다 (resolve).
+  - mask_region: 그 시점 좌표의 사각형을 이후 crop / rotate 를 거친 최종 좌표로 옮겨 두고,
+    최종 이미지에 한 번에 그린다 (이후 crop 으로 잘린 부분은 버린다).
+
+실행 순서: decode 1회 → crop 1회 → transpose 1회 → (mask 가 있으면) RGB 변환 + 사각형 채우기.
+
+합칠 수 없는 픽셀 변환(blur 등)은 PIXEL_OPERATIONS 에 operation 이름으로 등록한다. 체인은 그 변환을
+경계로 구간이 나뉘고, 구간마다 위처럼 합친 뒤 등록된 함수를 순서대로 부른다.
+
+compile_transform_chain 은 같은 spec 목록(operation + params)이면 캐시한 체인을 돌려주고,
+입력 크기별 resolve 결과도 캐시한다 (데이터셋 이미지 크기는 보통 몇 가지뿐이다).
+
+Pillow 는 JPEG / PNG 의 영역만 decode 할 수 없고 draft 는 축소 decode 라 픽셀이 달라지므로,
+decode 는 전체 1회로 하고 필요한 영역은 decode 직후 한 번만 잘라낸다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+    from lib.pipeline.pipeline_data_models import ImageManipulationSpec
+
+logger = logging.getLogger(__name__)
+
+# 캐시할 서로 다른 spec 목록 수 / (구간 steps, 입력 크기) 수
+_CHAIN_CACHE_SIZE = 256
+_RESOLVE_CACHE_SIZE = 1024
+
+# 시계 방향 회전 각도 → 90° 단위 회전 수
+_QUARTER_TURNS = {90: 1, 180: 2, 270: 3}
+# 시계 방향 90° 단위 회전 수 → PIL transpose (PIL 은 반시계 기준)
+_TRANSPOSE_NAMES = {1: "ROTATE_270", 2: "ROTATE_180", 3: "ROTATE_90"}
+
+# (left, top, right, bottom) — 양 끝 픽셀 포함 사각형 (PIL ImageDraw.rectangle 과 같은 규칙)
+PixelRect = tuple[int, int, int, int]
+RgbColor = tuple[int, int, int]
+
+# 합칠 수 없는 픽셀 변환 — operation → (이미지, params) → 이미지. 새 operation 은 여기에 등록한다.
+PIXEL_OPERATIONS: dict[str, Callable[[Image.Image, dict[str, Any]], Image.Image]] = {}
+
+
+@dataclass(frozen=True)
+class ResolvedTransform:
+    """
+    소스 크기가 정해진 변환 체인 — 이미지에 그대로 적용할 픽셀 작업.
+
+    crop_box: 소스 좌표의 (left, upper, right, lower). None 이면 자르지 않는다.
+    quarter_turns: crop 뒤 시계 방향 90° 회전 수 (0~3)
+    masks: 최종 좌표의 (사각형, 채울 색) 목록 (그리는 순서대로)
+    convert_rgb: mask 를 그리기 전에 RGB / RGBA 가 아닌 이미지를 RGB 로 바꿀지
+    """
+    crop_box: tuple[int, int, int, int] | None
+    quarter_turns: int
+    masks: tuple[tuple[PixelRect, RgbColor], ...]
+    convert_rgb: bool
+
+    def apply(self, img: Image.Image) -> Image.Image:
+        from PIL import Image, ImageDraw
+
+        if self.crop_box is not None:
+            img = img.crop(self.crop_box)
+        if self.quarter_turns:
+            img = img.transpose(Image.Transpose[_TRANSPOSE_NAMES[self.quarter_turns]])
+        if self.convert_rgb and img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGB")
+        if self.masks:
+            draw = ImageDraw.Draw(img)
+            for rect, fill_rgb in self.masks:
+                draw.rectangle(list(rect), fill=fill_rgb)
+        return img
+
+
+@dataclass(frozen=True)
+class TransformSegment:
+    """
+    합친 기하 / mask 단계 + (있으면) 그 뒤에 적용할 PIXEL_OPERATIONS 변환 1개.
+
+    steps 항목 (연속된 rotate 는 하나로 합친다):
+      ("rotate", quarter_turns)
+      ("crop", direction, crop_pct)
+      ("mask", bboxes, fill_rgb, bbox_normalized)
+    """
+    steps: tuple[tuple, ...]
+    pixel_operation: str | None = None
+    pixel_params: dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+    def resolve(self, size: tuple[int, int]) -> ResolvedTransform:
+        """입력 크기 (width, height) 에 대한 steps 의 픽셀 작업 (캐시)."""
+        return _resolve_steps(self.steps, size)
+
+
+@dataclass(frozen=True)
+class TransformChain:
+    """컴파일한 변환 체인. 적용할 수 없는 spec 은 컴파일할 때 경고하고 뺀다."""
+    segments: tuple[TransformSegment, ...]
+
+    def apply(self, img: Image.Image) -> Image.Image:
+        """img 에 체인을 적용한 이미지를 돌려준다 (구간마다 crop / transpose / mask 각 1회 이하)."""
+        for segment in self.segments:
+            if segment.steps:
+                img = segment.resolve(img.size).apply(img)
+            if segment.pixel_operation is not None:
+                img = PIXEL_OPERATIONS[segment.pixel_operation](img, segment.pixel_params)
+        return img
+
+
+def compile_transform_chain(specs: list[ImageManipulationSpec]) -> TransformChain:
+    """spec 목록을 TransformChain 으로 컴파일한다 (같은 operation + params 목록이면 캐시)."""
+    spec_key = tuple(
+        (spec.operation, json.dumps(spec.params, sort_keys=True, default=str))
+        for spec in specs
+    )
+    return _compile_chain(spec_key)
+
+
+@lru_cache(maxsize=_CHAIN_CACHE_SIZE)
+def _compile_chain(spec_key: tuple[tuple[str, str], ...]) -> TransformChain:
+    segments: list[TransformSegment] = []
+    steps: list[tuple] = []
+    for operation, params_json in spec_key:
+        params = json.loads(params_json)
+        if operation in PIXEL_OPERATIONS:
+            segments.append(TransformSegment(tuple(steps), operation, params))
+            steps = []
+            continue
+        step = _normalize_step(operation, params)
+        if step is None:
+            continue
+        if step[0] == "rotate" and steps and steps[-1][0] == "rotate":
+            quarter_turns = (steps.pop()[1] + step[1]) % 4
+            if quarter_turns:
+                steps.append(("rotate", quarter_turns))
+            continue
+        steps.append(step)
+    if steps:
+        segments.append(TransformSegment(tuple(steps)))
+    return TransformChain(tuple(segments))
+
+
+def _normalize_step(operation: str, params: dict[str, Any]) -> tuple | None:
+    """spec 1개를 정규화한 단계로. 적용하지 않는 spec 이면 경고 후 None."""
+    if operation == "rotate_image":
+        degrees = int(params.get("degrees", 180))
+        if degrees not in _QUARTER_TURNS:
+            logger.warning("지원하지 않는 회전 각도: %d (건너뜀)", degrees)
+            return None
+        return ("rotate", _QUARTER_TURNS[degrees])
+    if operation == "crop_image_vertical":
+        direction = str(params.get("direction", "up"))
+        crop_pct = int(params.get("crop_pct", 30))
+        if direction not in ("up", "down"):
+            logger.warning("미지원 crop direction: %s (건너뜀)", direction)
+            return None
+        if crop_pct < 1 or crop_pct > 99:
+            logger.warning("crop_pct 범위 밖: %d (건너뜀)", crop_pct)
+            return None
+        return ("crop", direction, crop_pct)
+    if operation == "mask_region":
+        fill_rgb = (0, 0, 0) if params.get("fill_color", "black") == "black" else (255, 255, 255)
+        bboxes = tuple(tuple(float(value) for value in bbox) for bbox in params.get("bboxes", []))
+        return ("mask", bboxes, fill_rgb, bool(params.get("bbox_normalized", False)))
+
+    logger.warning("미지원 이미지 변환 operation: %s (건너뜀)", operation)
+    return None
+
+
+@lru_cache(maxsize=_RESOLVE_CACHE_SIZE)
+def _resolve_steps(steps: tuple[tuple, ...], size: tuple[int, int]) -> ResolvedTransform:
+    source_width, source_height = size
+    # 현재 이미지 = crop box(소스 좌표) 를 잘라 시계 방향 quarter_turns × 90° 회전한 것
+    box_left, box_top, box_right, box_bottom = 0, 0, source_width, source_height
+    quarter_turns = 0
+    # 현재 좌표의 mask 사각형 — 단계마다 현재 좌표로 옮긴다
+    masks: list[tuple[PixelRect, RgbColor]] = []
+    has_mask = False
+
+    for step in steps:
+        frame_width, frame_height = _frame_size(
+            box_right - box_left, box_bottom - box_top, quarter_turns,
+        )
+        if step[0] == "rotate":
+            for _ in range(step[1]):
+                masks = [
+                    (_rotate_rect(rect, frame_width, frame_height), fill) for rect, fill in masks
+                ]
+                frame_width, frame_height = frame_height, frame_width
+            quarter_turns = (quarter_turns + step[1]) % 4
+        elif step[0] == "crop":
+            _, direction, crop_pct = step
+            cut_rows = int(frame_height * crop_pct / 100)
+            # 최소 1 픽셀은 남겨둔다 — crop_pct=99 + 작은 이미지에서도 0-height 방지.
+            cut_rows = max(0, min(cut_rows, frame_height - 1))
+            keep_top = cut_rows if direction == "up" else 0
+            keep_rect = (0, keep_top, frame_width - 1, keep_top + frame_height - cut_rows - 1)
+            # 현재 좌표의 남길 영역을 회전 전(crop box) 좌표로 되돌린다
+            box_rect, box_width, box_height = keep_rect, frame_width, frame_height
+            for _ in range((4 - quarter_turns) % 4):
+                box_rect = _rotate_rect(box_rect, box_width, box_height)
+                box_width, box_height = box_height, box_width
+            box_left, box_top, box_right, box_bottom = (
+                box_left + box_rect[0], box_top + box_rect[1],
+                box_left + box_rect[2] + 1, box_top + box_rect[3] + 1,
+            )
+            new_width, new_height = frame_width, frame_height - cut_rows
+            masks = [
+                (clipped, fill) for rect, fill in masks
+                if (clipped := _clip_rect(
+                    (rect[0], rect[1] - keep_top, rect[2], rect[3] - keep_top),
+                    new_width, new_height,
+                )) is not None
+            ]
+        else:
+            _, bboxes, fill_rgb, bbox_normalized = step
+            has_mask = True
+            for bx, by, bw, bh in bboxes:
+                if bbox_normalized:
+                    bx *= frame_width
+                    by *= frame_height
+                    bw *= frame_width
+                    bh *= frame_height
+                rect = _clip_rect(
+                    (int(bx), int(by), int(bx + bw), int(by + bh)), frame_width, frame_height,
+                )
+                if rect is not None:
+                    masks.append((rect, fill_rgb))
+
+    crop_box = (box_left, box_top, box_right, box_bottom)
+    return ResolvedTransform(
+        crop_box=None if crop_box == (0, 0, source_width, source_height) else crop_box,
+        quarter_turns=quarter_turns,
+        masks=tuple(masks),
+        convert_rgb=has_mask,
+    )
+
+
+def _frame_size(box_width: int, box_height: int, quarter_turns: int) -> tuple[int, int]:
+    if quarter_turns % 2:
+        return box_height, box_width
+    return box_width, box_height
+
+
+def _rotate_rect(rect: PixelRect, width: int, height: int) -> PixelRect:
+    """width × height 이미지의 사각형을 이미지를 시계 방향 90° 돌린 좌표로 옮긴다."""
+    left, top, right, bottom = rect
+    # 픽셀 (x, y) → (height - 1 - y, x)
+    return height - 1 - bottom, left, height - 1 - top, right
+
+
+def _clip_rect(rect: PixelRect, width: int, height: int) -> PixelRect | None:
+    """사각형을 width × height 안으로 자른다. 이미지 밖이면 None."""
+    left, top, right, bottom = rect
+    left, top = max(left, 0), max(top, 0)
+    right, bottom = min(right, width - 1), min(bottom, height - 1)
+    if left > right or top > bottom:
+        return None
+    return left, top, right, bottom
@@ -0,0 +1,287 @@
+"""
+증분 재실행 (incremental re-run) — 이전 출력 이미지 재사용.
+
+자동화 재실행은 상류 split 에 새 버전이 생길 때마다 파이프라인 전체를 다시 돌린다.
+source 1개에서 출력까지 레코드별 독립 변환(supports_record_fusion)만 이어진 파이프라인은
+출력 레코드 하나가 입력 레코드 하나로만 정해지므로, 이전 run 과 입력 레코드가 같으면
+출력 이미지도 같다. 이 경우 이미지 복사/변환 대신 이전 출력의 이미지 파일을 hardlink 한다.
+
+판정 근거:
+  - 파이프라인 fingerprint: (operator, params, manipulator 코드 버전) 체인 + 이미지 실체화기
+    코드 버전. 출력 루트의 INCREMENTAL_STATE_FILENAME 에 출력을 만든 source 버전과 함께 기록한다.
+  - 레코드 diff: 같은 file_name 의 레코드가 image_id 외에 모두 같고, 이미지 파일의
+    (크기, mtime_ns) 가 같으면(또는 같은 inode) 변경 없음. 실체화기는 shutil.copy2 로 복사하므로
+    버전 간 그대로 옮겨진 이미지는 mtime 이 보존된다.
+
+annotation 처리는 모든 레코드에 대해 그대로 수행한다 (메모리 안의 레코드별 변환이라 싸고,
+image_id / 순서가 전체 재실행과 같게 유지된다). 비싼 이미지 I/O 만 추가/변경 레코드로 줄인다.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+from dataclasses import dataclass, replace
+from typing import Any
+
+from lib.manipulators import MANIPULATOR_REGISTRY
+from lib.pipeline import image_materializer, image_transform_chain
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImagePlan, ImageRecord
+from lib.pipeline.storage_protocol import StorageProtocol
+from lib.pipeline.task_result_cache import manipulator_code_version
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_STATE_FILENAME = "incremental_state.json"
+# 상태 파일 구조 / 재사용 판정 규칙이 바뀌면 올린다.
+INCREMENTAL_STATE_SCHEMA_VERSION = 1
+
+# 상대경로 → (크기, mtime_ns, inode)
+ImageFileStats = dict[str, tuple[int, int, int]]
+
+
+@dataclass
+class SourceRecordDiff:
+    """이전 / 현재 source 버전의 레코드 비교 결과."""
+    unchanged_paths: set[str]
+    added_count: int
+    changed_count: int
+    removed_count: int
+
+
+@dataclass
+class IncrementalReusePlan:
+    """
+    run 1회의 이미지 재사용 계획.
+
+    attributes:
+        source_storage_uri: 현재 source 버전의 storage_uri
+        previous_output_storage_uri: 재사용할 이전 출력의 storage_uri
+        unchanged_source_paths: 이전 source 버전과 같은 레코드의 이미지 상대경로
+        previous_output_paths: 이전 출력에 실제로 있는 이미지 상대경로
+    """
+    source_storage_uri: str
+    previous_output_storage_uri: str
+    unchanged_source_paths: set[str]
+    previous_output_paths: set[str]
+
+    def apply(self, image_plan: ImagePlan, output_storage_uri: str) -> ImagePlan:
+        """
+        변경 없는 source 이미지에서 나온 ImagePlan 이면 이전 출력 이미지를 가리키는 재사용 계획으로
+        바꾼다. 출력 상대경로(rename 포함)는 이전 run 과 같다 (같은 fingerprint 의 레코드별 변환).
+        """
+        source_prefix = f"{self.source_storage_uri}/"
+        output_prefix = f"{output_storage_uri}/"
+        if not (
+            image_plan.src_uri.startswith(source_prefix)
+            and image_plan.dst_uri.startswith(output_prefix)
+        ):
+            return image_plan
+        source_path = image_plan.src_uri[len(source_prefix):]
+        output_path = image_plan.dst_uri[len(output_prefix):]
+        if (
+            source_path not in self.unchanged_source_paths
+            or output_path not in self.previous_output_paths
+        ):
+            return image_plan
+        return ImagePlan(
+            src_uri=f"{self.previous_output_storage_uri}/{output_path}",
+            dst_uri=image_plan.dst_uri,
+            reuse_existing=True,
+        )
+
+
+def incremental_fingerprint(config: PipelineConfig, images_dirname: str) -> str | None:
+    """
+    증분 재실행 판정용 파이프라인 fingerprint. 증분 실행할 수 없는 구성이면 None.
+
+    조건: 기본 출력 1개, source 1개, 모든 태스크가 단일 입력의 결정적인 per-record 변환.
+    (병합 / 샘플링은 다른 레코드에 따라 결과가 달라지므로 제외)
+    """
+    if config.is_passthrough or config.extra_outputs:
+        return None
+    if len(config.get_all_source_dataset_ids()) != 1:
+        return None
+
+    steps: list[list[Any]] = []
+    for task_name in config.topological_order():
+        task_config = config.tasks[task_name]
+        manipulator_class = MANIPULATOR_REGISTRY.get(task_config.operator)
+        if (
+            manipulator_class is None
+            or not manipulator_class.supports_record_fusion
+            or len(task_config.inputs) != 1
+            or not manipulator_class().is_deterministic(task_config.params)
+        ):
+            return None
+        code_version = manipulator_code_version(task_config.operator)
+        if code_version is None:
+            return None
+        steps.append([task_config.operator, task_config.params, code_version])
+
+    canonical = json.dumps(
+        {
+            "schema_version": INCREMENTAL_STATE_SCHEMA_VERSION,
+            "steps": steps,
+            "materializer": _image_materializer_code_version(),
+            "images_dirname": images_dirname,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def read_incremental_state(storage: StorageProtocol, storage_uri: str) -> dict[str, Any] | None:
+    """출력 루트의 증분 상태. 없거나 손상/스키마 불일치면 None."""
+    state_path = storage.resolve_path(storage_uri) / INCREMENTAL_STATE_FILENAME
+    try:
+        with open(state_path, encoding="utf-8") as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as read_error:
+        logger.warning("증분 상태 파일 읽기 실패 — 무시: %s (%s)", state_path, read_error)
+        return None
+    if (
+        not isinstance(state, dict)
+        or state.get("schema_version") != INCREMENTAL_STATE_SCHEMA_VERSION
+    ):
+        return None
+    return state
+
+
+def write_incremental_state(
+    storage: StorageProtocol,
+    storage_uri: str,
+    fingerprint: str,
+    source_dataset_id: str,
+) -> None:
+    """출력 루트에 증분 상태(fingerprint, 출력을 만든 source 버전)를 기록한다. 실패해도 계속."""
+    state_path = storage.resolve_path(storage_uri) / INCREMENTAL_STATE_FILENAME
+    try:
+        with open(state_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "schema_version": INCREMENTAL_STATE_SCHEMA_VERSION,
+                    "fingerprint": fingerprint,
+                    "source_dataset_id": source_dataset_id,
+                },
+                f,
+                indent=2,
+            )
+    except OSError as write_error:
+        logger.warning(
+            "증분 상태 파일 저장 실패 — 다음 run 은 전체 실행: %s (%s)", state_path, write_error,
+        )
+
+
+def scan_image_files(
+    storage: StorageProtocol,
+    storage_uri: str,
+    images_dirname: str,
+) -> ImageFileStats:
+    """
+    images 디렉토리의 파일을 한 번에 훑어 {"<images_dirname>/<파일명>": (크기, mtime_ns, inode)}.
+
+    레코드마다 stat 하는 대신 디렉토리 1회 순회로 모은다. 디렉토리가 없으면 빈 dict.
+    """
+    images_dir = storage.resolve_path(storage_uri) / images_dirname
+    file_stats: ImageFileStats = {}
+    try:
+        entries = list(os.scandir(images_dir))
+    except OSError:
+        return file_stats
+    for entry in entries:
+        try:
+            if not entry.is_file():
+                continue
+            stat_result = entry.stat()
+        except OSError:
+            continue
+        file_stats[f"{images_dirname}/{entry.name}"] = (
+            stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino,
+        )
+    return file_stats
+
+
+def record_image_path(record: ImageRecord, task_kind: str, images_dirname: str) -> str:
+    """
+    데이터셋 루트 기준 이미지 상대경로.
+
+    classification 레코드의 file_name 은 이미 "images/..." 상대경로다 (manifest_io 규약).
+    """
+    if task_kind == "CLASSIFICATION":
+        return record.file_name
+    return f"{images_dirname}/{record.file_name}"
+
+
+def diff_source_records(
+    previous_meta: DatasetMeta,
+    current_meta: DatasetMeta,
+    previous_image_stats: ImageFileStats,
+    current_image_stats: ImageFileStats,
+    images_dirname: str,
+) -> SourceRecordDiff:
+    """
+    이전 / 현재 source 버전의 레코드를 file_name 기준으로 비교한다.
+
+    image_id 는 버전마다 다시 매길 수 있으므로 비교에서 뺀다.
+    이미지 파일이 어느 쪽에든 없으면 변경으로 본다.
+    """
+    previous_records = {
+        record_image_path(record, previous_meta.task_kind, images_dirname): record
+        for record in previous_meta.image_records
+    }
+    unchanged_paths: set[str] = set()
+    added_count = changed_count = 0
+    for record in current_meta.image_records:
+        image_path = record_image_path(record, current_meta.task_kind, images_dirname)
+        previous_record = previous_records.pop(image_path, None)
+        if previous_record is None:
+            added_count += 1
+            continue
+        if (
+            replace(previous_record, image_id=record.image_id) == record
+            and _same_image_file(
+                previous_image_stats.get(image_path), current_image_stats.get(image_path),
+            )
+        ):
+            unchanged_paths.add(image_path)
+        else:
+            changed_count += 1
+    return SourceRecordDiff(
+        unchanged_paths=unchanged_paths,
+        added_count=added_count,
+        changed_count=changed_count,
+        removed_count=len(previous_records),
+    )
+
+
+def _same_image_file(
+    previous_stats: tuple[int, int, int] | None,
+    current_stats: tuple[int, int, int] | None,
+) -> bool:
+    if previous_stats is None or current_stats is None:
+        return False
+    previous_size, previous_mtime_ns, previous_ino = previous_stats
+    current_size, current_mtime_ns, current_ino = current_stats
+    if previous_size != current_size:
+        return False
+    return previous_ino == current_ino or previous_mtime_ns == current_mtime_ns
+
+
+def _image_materializer_code_version() -> str:
+    """
+    이미지 변환 구현이 바뀌면 이전 출력 이미지를 재사용하지 않는다.
+
+    실체화기(image_materializer)와 회전 / 크롭 / 마스킹 픽셀 처리를 담은 변환 체인
+    (image_transform_chain) 소스를 함께 해시한다.
+    """
+    code_hash = hashlib.sha256()
+    for module in (image_materializer, image_transform_chain):
+        code_hash.update(inspect.getsource(module).encode("utf-8"))
+    return code_hash.hexdigest()
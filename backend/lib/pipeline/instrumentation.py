@@ -0,0 +1,131 @@
+"""
+파이프라인 실행 단계 계측 (instrumentation).
+
+PipelineDagExecutor 는 run 동안 아래 단계마다 StageMetrics 를 만든다.
+    source_load       — source 1개의 annotation 로드/파싱
+    plan              — DAG 최적화, 출력별 ImagePlan 생성
+    task              — 작업 단위 1개의 manipulator 적용 (fusion 체인은 체인 전체가 한 단위)
+    materialize       — 출력 1개의 이미지 실체화
+                        (streaming 이면 streamed tail 계산 + annotation 기록 포함)
+    annotation_write  — 출력 1개의 annotation 파일 작성
+
+측정값:
+    wall_seconds: 경과 시간
+    cpu_seconds: 단계를 실행한 스레드의 CPU 시간
+        (time.thread_time — pool 에서 실행한 단계는 그 스레드 기준)
+    rss_mb / rss_delta_mb: 단계 종료 시점 RSS 와 시작 대비 증감
+    peak_rss_mb: 단계 중 프로세스 최대 RSS(ru_maxrss)가 올라갔으면 그 값 (아니면 None)
+    record_count / annotation_count: 단계가 내놓은 이미지 레코드 / annotation 수
+
+tracemalloc 은 할당마다 비용이 커서 쓰지 않고 RSS 표본만 쓴다 (memory_usage 모듈).
+병렬 모드에서 동시에 실행된 단계의 RSS 값은 서로의 할당을 포함한다.
+
+계측 결과는 InstrumentationHook.on_stage_end 로 넘긴다. hook 은 항상 run() 을 호출한
+스레드에서 불린다 (태스크 진행 콜백과 같다).
+"""
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from lib.pipeline.memory_usage import bytes_to_mb, current_rss_bytes, max_rss_bytes
+
+# StageMetrics.stage 값
+STAGE_SOURCE_LOAD = "source_load"
+STAGE_PLAN = "plan"
+STAGE_TASK = "task"
+STAGE_MATERIALIZE = "materialize"
+STAGE_ANNOTATION_WRITE = "annotation_write"
+
+
+@dataclass
+class StageMetrics:
+    """실행 단계 1개의 계측값 (필드 의미는 모듈 docstring 참고)."""
+    stage: str
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    rss_mb: float | None = None
+    rss_delta_mb: float | None = None
+    peak_rss_mb: float | None = None
+    record_count: int | None = None
+    annotation_count: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+class InstrumentationHook:
+    """계측 hook 기본 구현 (아무것도 하지 않음). 필요한 메서드만 오버라이드한다."""
+
+    def on_stage_end(self, metrics: StageMetrics) -> None:
+        """단계 하나가 끝날 때 불린다."""
+
+
+class StageMetricsCollector(InstrumentationHook):
+    """run 1회의 StageMetrics 를 모은다 (executor 내장 — task_progress / processing.log 용)."""
+
+    def __init__(self) -> None:
+        self.metrics: list[StageMetrics] = []
+
+    def on_stage_end(self, metrics: StageMetrics) -> None:
+        self.metrics.append(metrics)
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        return [metrics.as_dict() for metrics in self.metrics]
+
+    def summary_lines(self) -> list[str]:
+        return format_stage_summary(self.metrics)
+
+
+def format_stage_summary(stage_metrics: list[StageMetrics]) -> list[str]:
+    """wall 시간 내림차순 한 줄 요약 목록 (processing.log 용)."""
+    lines: list[str] = []
+    for metrics in sorted(stage_metrics, key=lambda item: item.wall_seconds, reverse=True):
+        line = (
+            f"{metrics.stage:<16} {metrics.name}: wall={metrics.wall_seconds:.3f}s "
+            f"cpu={metrics.cpu_seconds:.3f}s"
+        )
+        if metrics.rss_delta_mb is not None:
+            line += f" rss={metrics.rss_mb}MB ({metrics.rss_delta_mb:+.1f})"
+        if metrics.peak_rss_mb is not None:
+            line += f" peak_rss={metrics.peak_rss_mb}MB"
+        if metrics.record_count is not None:
+            line += f" records={metrics.record_count}"
+        if metrics.annotation_count is not None:
+            line += f" annotations={metrics.annotation_count}"
+        lines.append(line)
+    return lines
+
+
+@contextmanager
+def measure_stage(stage: str, name: str) -> Iterator[StageMetrics]:
+    """
+    with 블록을 한 단계로 계측한다. 블록 안에서 record_count / annotation_count 를 채운다.
+
+    블록이 예외로 끝나도 측정값은 채운다 (호출자가 기록 여부를 정한다).
+    """
+    metrics = StageMetrics(stage=stage, name=name)
+    rss_at_start = current_rss_bytes()
+    max_rss_at_start = max_rss_bytes()
+    wall_started = time.perf_counter()
+    cpu_started = time.thread_time()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_seconds = round(time.perf_counter() - wall_started, 4)
+        metrics.cpu_seconds = round(time.thread_time() - cpu_started, 4)
+        rss_at_end = current_rss_bytes()
+        metrics.rss_mb = bytes_to_mb(rss_at_end)
+        if rss_at_start is not None and rss_at_end is not None:
+            metrics.rss_delta_mb = bytes_to_mb(rss_at_end - rss_at_start)
+        max_rss_at_end = max_rss_bytes()
+        if (
+            max_rss_at_start is not None
+            and max_rss_at_end is not None
+            and max_rss_at_end > max_rss_at_start
+        ):
+            metrics.peak_rss_mb = bytes_to_mb(max_rss_at_end)
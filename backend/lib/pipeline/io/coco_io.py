@@ -11,9 +11,11 @@ COCO JSON ↔ DatasetMeta 변환을 담당하는 순수 함수 모듈.
 from __future__ import annotations
 
 import json
+import shutil
+import tempfile
 from collections import defaultdict
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from lib.pipeline.io.coco_yolo_class_mapping import NAME_TO_COCO_ID
 from lib.pipeline.pipeline_data_models import Annotation, DatasetMeta, ImageRecord
@@ -144,12 +146,110 @@ def write_coco_json(
     Returns:
         output_path (동일 경로 반환)
     """
-    # category_name → COCO ID 매핑 생성
+    name_to_assigned_id = _assign_coco_category_ids(meta.categories)
+
+    # images 배열 구성
+    coco_images = [_build_coco_image_entry(image_record) for image_record in meta.image_records]
+
+    # annotations 배열 구성 (id 자동 순차 생성)
+    coco_annotations: list[dict[str, Any]] = []
+    for image_record in meta.image_records:
+        coco_annotations.extend(_build_coco_annotation_entries(
+            image_record, name_to_assigned_id, len(coco_annotations) + 1,
+        ))
+
+    coco_output = {
+        "images": coco_images,
+        "annotations": coco_annotations,
+        "categories": _build_coco_categories(name_to_assigned_id),
+    }
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as file_handle:
+        json.dump(coco_output, file_handle, ensure_ascii=False, indent=2)
+
+    return output_path
+
+
+class CocoJsonStreamWriter:
+    """
+    ImageRecord 를 한 장씩 받아 COCO JSON 을 작성한다 (streaming 실행용).
+
+    write_coco_json 과 같은 ID 규칙·같은 바이트 출력을 내되 전체 images/annotations 배열을
+    메모리에 만들지 않는다. images 항목은 출력 파일에 바로 쓰고, annotations 항목은
+    같은 디렉토리의 임시 파일에 모아 두었다가 close() 에서 이어 붙인다.
+    categories 는 레코드와 무관하게 미리 확정되어 있어야 한다.
+
+    사용:
+        with CocoJsonStreamWriter(categories, output_path) as writer:
+            for record in records:
+                writer.write(record)
+    """
+
+    def __init__(self, categories: list[str], output_path: Path) -> None:
+        self.output_path = output_path
+        self.image_count = 0
+        self._name_to_assigned_id = _assign_coco_category_ids(categories)
+        self._annotation_count = 0
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._output_file = open(output_path, "w", encoding="utf-8")
+        self._annotation_spool = tempfile.TemporaryFile(
+            mode="w+", encoding="utf-8", dir=output_path.parent,
+        )
+        self._output_file.write('{\n  "images": [')
+
+    def write(self, image_record: ImageRecord) -> None:
+        """레코드 1장의 image 항목과 annotation 항목들을 기록한다."""
+        _write_json_array_item(
+            self._output_file, _build_coco_image_entry(image_record), self.image_count,
+        )
+        self.image_count += 1
+        for annotation_entry in _build_coco_annotation_entries(
+            image_record, self._name_to_assigned_id, self._annotation_count + 1,
+        ):
+            _write_json_array_item(self._annotation_spool, annotation_entry, self._annotation_count)
+            self._annotation_count += 1
+
+    def close(self) -> None:
+        """annotations / categories 배열을 이어 쓰고 파일을 닫는다."""
+        try:
+            _close_json_array(self._output_file, self.image_count)
+            self._output_file.write(',\n  "annotations": [')
+            self._annotation_spool.seek(0)
+            shutil.copyfileobj(self._annotation_spool, self._output_file)
+            _close_json_array(self._output_file, self._annotation_count)
+            self._output_file.write(',\n  "categories": [')
+            categories = _build_coco_categories(self._name_to_assigned_id)
+            for index, category_entry in enumerate(categories):
+                _write_json_array_item(self._output_file, category_entry, index)
+            _close_json_array(self._output_file, len(categories))
+            self._output_file.write("\n}")
+        finally:
+            self._discard()
+
+    def _discard(self) -> None:
+        self._annotation_spool.close()
+        self._output_file.close()
+
+    def __enter__(self) -> CocoJsonStreamWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            # 실패한 실행의 반쪽짜리 JSON 은 남기지 않는다
+            self._discard()
+            self.output_path.unlink(missing_ok=True)
+
+
+def _assign_coco_category_ids(categories: list[str]) -> dict[str, int]:
+    """category_name → COCO ID 매핑 (표준 80클래스는 표준 ID, 나머지는 91번부터)."""
     name_to_assigned_id: dict[str, int] = {}
     used_ids: set[int] = set()
 
     # 1단계: 표준 80클래스 매핑 적용
-    for category_name in meta.categories:
+    for category_name in categories:
         if category_name in NAME_TO_COCO_ID:
             assigned_id = NAME_TO_COCO_ID[category_name]
             name_to_assigned_id[category_name] = assigned_id
@@ -157,7 +257,7 @@ def write_coco_json(
 
     # 2단계: 표준에 없는 클래스는 91번부터 할당
     next_custom_id = 91
-    for category_name in meta.categories:
+    for category_name in categories:
         if category_name not in name_to_assigned_id:
             while next_custom_id in used_ids:
                 next_custom_id += 1
@@ -165,74 +265,88 @@ def write_coco_json(
             used_ids.add(next_custom_id)
             next_custom_id += 1
 
-    # categories 배열 구성 (ID 오름차순)
-    coco_categories = sorted(
+    return name_to_assigned_id
+
+
+def _build_coco_categories(name_to_assigned_id: dict[str, int]) -> list[dict[str, Any]]:
+    """categories 배열 구성 (ID 오름차순)."""
+    return sorted(
         [{"id": cid, "name": name} for name, cid in name_to_assigned_id.items()],
         key=lambda c: c["id"],
     )
 
-    # images 배열 구성
-    coco_images = []
-    for image_record in meta.image_records:
-        image_entry: dict[str, Any] = {
-            "id": image_record.image_id,
-            "file_name": image_record.file_name,
-        }
-        if image_record.width is not None:
-            image_entry["width"] = image_record.width
-        if image_record.height is not None:
-            image_entry["height"] = image_record.height
-        coco_images.append(image_entry)
 
-    # annotations 배열 구성 (id 자동 순차 생성)
-    coco_annotations = []
-    annotation_id_counter = 1
+def _build_coco_image_entry(image_record: ImageRecord) -> dict[str, Any]:
+    image_entry: dict[str, Any] = {
+        "id": image_record.image_id,
+        "file_name": image_record.file_name,
+    }
+    if image_record.width is not None:
+        image_entry["width"] = image_record.width
+    if image_record.height is not None:
+        image_entry["height"] = image_record.height
+    return image_entry
+
+
+def _build_coco_annotation_entries(
+    image_record: ImageRecord,
+    name_to_assigned_id: dict[str, int],
+    first_annotation_id: int,
+) -> list[dict[str, Any]]:
+    """레코드 1장의 annotation 항목 목록. annotation id 는 first_annotation_id 부터 순차 부여."""
+    annotation_entries: list[dict[str, Any]] = []
+    annotation_id_counter = first_annotation_id
+
+    for annotation in image_record.annotations:
+        assigned_category_id = name_to_assigned_id.get(
+            annotation.category_name, 0
+        )
 
-    for image_record in meta.image_records:
-        for annotation in image_record.annotations:
-            assigned_category_id = name_to_assigned_id.get(
-                annotation.category_name, 0
-            )
-
-            annotation_entry: dict[str, Any] = {
-                "id": annotation_id_counter,
-                "image_id": image_record.image_id,
-                "category_id": assigned_category_id,
-            }
-
-            if annotation.bbox is not None:
-                annotation_entry["bbox"] = annotation.bbox
-                # area 계산: extra에 있으면 사용, 없으면 w*h
-                if "area" in annotation.extra:
-                    annotation_entry["area"] = annotation.extra["area"]
-                else:
-                    annotation_entry["area"] = annotation.bbox[2] * annotation.bbox[3]
+        annotation_entry: dict[str, Any] = {
+            "id": annotation_id_counter,
+            "image_id": image_record.image_id,
+            "category_id": assigned_category_id,
+        }
+
+        if annotation.bbox is not None:
+            annotation_entry["bbox"] = annotation.bbox
+            # area 계산: extra에 있으면 사용, 없으면 w*h
+            if "area" in annotation.extra:
+                annotation_entry["area"] = annotation.extra["area"]
             else:
-                annotation_entry["area"] = annotation.extra.get("area", 0)
+                annotation_entry["area"] = annotation.bbox[2] * annotation.bbox[3]
+        else:
+            annotation_entry["area"] = annotation.extra.get("area", 0)
 
-            # segmentation 복원
-            if annotation.segmentation is not None:
-                annotation_entry["segmentation"] = annotation.segmentation
+        # segmentation 복원
+        if annotation.segmentation is not None:
+            annotation_entry["segmentation"] = annotation.segmentation
 
-            # iscrowd 복원
-            annotation_entry["iscrowd"] = annotation.extra.get("iscrowd", 0)
+        # iscrowd 복원
+        annotation_entry["iscrowd"] = annotation.extra.get("iscrowd", 0)
 
-            # extra의 나머지 필드도 복원 (area, iscrowd 제외 — 이미 처리됨)
-            for key, value in annotation.extra.items():
-                if key not in ("area", "iscrowd") and key not in annotation_entry:
-                    annotation_entry[key] = value
+        # extra의 나머지 필드도 복원 (area, iscrowd 제외 — 이미 처리됨)
+        for key, value in annotation.extra.items():
+            if key not in ("area", "iscrowd") and key not in annotation_entry:
+                annotation_entry[key] = value
 
-            coco_annotations.append(annotation_entry)
-            annotation_id_counter += 1
+        annotation_entries.append(annotation_entry)
+        annotation_id_counter += 1
 
-    coco_output = {
-        "images": coco_images,
-        "annotations": coco_annotations,
-        "categories": coco_categories,
-    }
+    return annotation_entries
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as file_handle:
-        json.dump(coco_output, file_handle, ensure_ascii=False, indent=2)
 
-    return output_path
+# json.dump(indent=2) 에서 최상위 dict 값 배열의 원소가 들어가는 들여쓰기
+_ARRAY_ITEM_INDENT = " " * 4
+
+
+def _write_json_array_item(file_handle: IO[str], item: Any, index: int) -> None:
+    """json.dump(..., indent=2) 와 같은 모양으로 최상위 배열 원소 1개를 이어 쓴다."""
+    item_text = json.dumps(item, ensure_ascii=False, indent=2)
+    file_handle.write(",\n" if index else "\n")
+    file_handle.write(_ARRAY_ITEM_INDENT)
+    file_handle.write(item_text.replace("\n", "\n" + _ARRAY_ITEM_INDENT))
+
+
+def _close_json_array(file_handle: IO[str], item_count: int) -> None:
+    file_handle.write("\n  ]" if item_count else "]")
@@ -0,0 +1,156 @@
+"""
+파싱된 DatasetMeta 사이드카 캐시.
+
+READY 데이터셋 버전은 내용이 바뀌지 않으므로, annotation 파일(COCO JSON / YOLO txt /
+manifest.jsonl)을 매번 파싱하는 대신 파싱 결과(통일포맷 DatasetMeta)를 pickle 로
+데이터셋 루트에 저장해 두고 재사용한다. Celery worker 와 API 프로세스가 같은 파일을 공유한다.
+
+파일 구조 (META_CACHE_FILENAME):
+    pickle #1 — 캐시 키 dict (schema_version, dataset_id, annotation_format, 파일 fingerprint)
+    pickle #2 — DatasetMeta
+
+키가 현재 파일 상태와 다르면(메타 파일 교체, 포맷 변경, 파서 스키마 변경) 캐시를 무시한다.
+키만 먼저 읽으므로 불일치 시 본문을 역직렬화하지 않는다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.storage_protocol import StorageProtocol
+
+logger = logging.getLogger(__name__)
+
+META_CACHE_FILENAME = "dataset_meta.cache"
+# 파서 출력(DatasetMeta 구조 / 파싱 규칙)이 바뀌면 올린다.
+META_CACHE_SCHEMA_VERSION = 1
+
+
+def _file_fingerprint(path: Path) -> tuple[str, int | None, int | None]:
+    """(파일명, 크기, mtime_ns). 파일이 없으면 크기/mtime 은 None."""
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return (path.name, None, None)
+    return (path.name, stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def build_meta_cache_key(
+    storage: StorageProtocol,
+    storage_uri: str,
+    annotation_format: str,
+    annotation_files: list[str],
+    annotation_meta_file: str | None,
+    dataset_id: str,
+) -> dict[str, Any]:
+    """
+    캐시 유효성 판단용 키를 만든다.
+
+    파서가 읽는 파일들의 크기/mtime 을 포함하므로, 파일이 교체되면 키가 달라진다.
+    YOLO 는 label 디렉토리를 통째로 읽으므로 annotations/ 디렉토리 자체의 mtime 도 포함한다.
+    """
+    format_upper = annotation_format.upper()
+    dataset_root = storage.resolve_path(storage_uri)
+    annotations_dir = storage.get_annotations_dir(storage_uri)
+
+    if format_upper == "CLS_MANIFEST":
+        # manifest.jsonl / head_schema.json 은 데이터셋 루트 기준 상대경로
+        tracked_paths = [dataset_root / name for name in annotation_files]
+    else:
+        tracked_paths = [annotations_dir / name for name in annotation_files]
+    if format_upper == "YOLO":
+        tracked_paths.append(annotations_dir)
+    if annotation_meta_file:
+        tracked_paths.append(dataset_root / annotation_meta_file)
+
+    return {
+        "schema_version": META_CACHE_SCHEMA_VERSION,
+        "dataset_id": dataset_id,
+        "annotation_format": format_upper,
+        "annotation_meta_file": annotation_meta_file,
+        "files": [_file_fingerprint(path) for path in tracked_paths],
+    }
+
+
+def read_meta_cache(
+    storage: StorageProtocol,
+    storage_uri: str,
+    cache_key: dict[str, Any],
+) -> DatasetMeta | None:
+    """
+    키가 일치하는 캐시가 있으면 DatasetMeta 를 반환한다. 없거나 불일치/손상이면 None.
+    """
+    cache_path = storage.resolve_path(storage_uri) / META_CACHE_FILENAME
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key = pickle.load(f)
+            if cached_key != cache_key:
+                logger.info(
+                    "DatasetMeta 캐시 키 불일치 — 무시: dataset_id=%s",
+                    cache_key.get("dataset_id"),
+                )
+                return None
+            meta = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as read_error:
+        logger.warning("DatasetMeta 캐시 읽기 실패 — 무시: %s (%s)", cache_path, read_error)
+        return None
+
+    if not isinstance(meta, DatasetMeta):
+        logger.warning("DatasetMeta 캐시 내용이 올바르지 않음 — 무시: %s", cache_path)
+        return None
+    return meta
+
+
+def write_meta_cache(
+    storage: StorageProtocol,
+    storage_uri: str,
+    cache_key: dict[str, Any],
+    meta: DatasetMeta,
+) -> Path | None:
+    """
+    캐시를 원자적으로 기록한다 (임시 파일 → os.replace).
+
+    여러 worker 가 동시에 써도 읽는 쪽은 완전한 파일만 본다. 실패해도 예외를 올리지 않는다.
+
+    Returns:
+        기록된 캐시 파일 경로. 실패 시 None.
+    """
+    dataset_root = storage.resolve_path(storage_uri)
+    cache_path = dataset_root / META_CACHE_FILENAME
+    temp_path: str | None = None
+    try:
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{META_CACHE_FILENAME}.", suffix=".tmp", dir=dataset_root,
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(cache_key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except Exception as write_error:
+        logger.warning(
+            "DatasetMeta 캐시 저장 실패 — 캐시 없이 계속: %s (%s)", cache_path, write_error,
+        )
+        if temp_path is not None:
+            Path(temp_path).unlink(missing_ok=True)
+        return None
+
+    logger.info("DatasetMeta 캐시 저장 완료: %s", cache_path)
+    return cache_path
+
+
+def invalidate_meta_cache(storage: StorageProtocol, storage_uri: str) -> bool:
+    """캐시 파일을 삭제한다. 삭제했으면 True."""
+    cache_path = storage.resolve_path(storage_uri) / META_CACHE_FILENAME
+    try:
+        cache_path.unlink()
+    except FileNotFoundError:
+        return False
+    logger.info("DatasetMeta 캐시 삭제: %s", cache_path)
+    return True
@@ -448,55 +448,97 @@ def write_yolo_dir(
         ValueError: ImageRecord에 width/height가 없어 좌표 변환이 불가능할 때
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-
-    # category_name → 0-based sequential index 매핑
-    sorted_category_names = sorted(meta.categories)
-    name_to_yolo_index: dict[str, int] = {
-        name: index for index, name in enumerate(sorted_category_names)
-    }
+    name_to_yolo_index = _build_yolo_index_map(meta.categories)
 
     for image_record in meta.image_records:
-        # width/height 검증 (normalized 좌표 계산에 필수)
-        if image_record.width is None or image_record.height is None:
-            raise ValueError(
-                f"YOLO 좌표 변환에 이미지 크기가 필요합니다: "
-                f"{image_record.file_name} (width={image_record.width}, "
-                f"height={image_record.height})"
-            )
-
-        # 이미지 basename으로 .txt 파일명 결정
-        image_stem = Path(image_record.file_name).stem
-        label_file_path = output_dir / f"{image_stem}.txt"
-
-        lines: list[str] = []
-        for annotation in image_record.annotations:
-            if annotation.bbox is None:
-                continue
-
-            # category_name → 0-based index
-            yolo_class_id = name_to_yolo_index.get(
-                annotation.category_name, 0,
-            )
-
-            center_x, center_y, width_norm, height_norm = _convert_absolute_bbox_to_yolo(
-                annotation.bbox[0], annotation.bbox[1],
-                annotation.bbox[2], annotation.bbox[3],
-                image_record.width, image_record.height,
-            )
-            lines.append(
-                f"{yolo_class_id} "
-                f"{center_x:.6f} {center_y:.6f} "
-                f"{width_norm:.6f} {height_norm:.6f}"
-            )
-
-        with open(label_file_path, "w", encoding="utf-8") as file_handle:
-            file_handle.write("\n".join(lines))
-            if lines:
-                file_handle.write("\n")
+        _write_yolo_label_file(image_record, output_dir, name_to_yolo_index)
 
     return output_dir
 
 
+class YoloLabelStreamWriter:
+    """
+    ImageRecord 를 한 장씩 받아 YOLO 라벨 파일을 작성한다 (streaming 실행용).
+
+    write_yolo_dir 과 같은 파일을 만든다. 라벨 파일이 이미지 1장당 1개라
+    레코드를 모아 둘 필요가 없다. categories 는 미리 확정되어 있어야 한다.
+    """
+
+    def __init__(self, categories: list[str], output_dir: Path) -> None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.output_dir = output_dir
+        self.image_count = 0
+        self._name_to_yolo_index = _build_yolo_index_map(categories)
+
+    def write(self, image_record: ImageRecord) -> None:
+        _write_yolo_label_file(image_record, self.output_dir, self._name_to_yolo_index)
+        self.image_count += 1
+
+    def close(self) -> None:
+        """라벨 파일은 write() 에서 바로 닫으므로 할 일이 없다 (CocoJsonStreamWriter 와 맞춤)."""
+
+    def __enter__(self) -> YoloLabelStreamWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _build_yolo_index_map(categories: list[str]) -> dict[str, int]:
+    """category_name → 0-based sequential index 매핑 (이름 정렬 순)."""
+    return {name: index for index, name in enumerate(sorted(categories))}
+
+
+def _write_yolo_label_file(
+    image_record: ImageRecord,
+    output_dir: Path,
+    name_to_yolo_index: dict[str, int],
+) -> None:
+    """
+    레코드 1장의 YOLO 라벨 파일을 작성한다.
+
+    Raises:
+        ValueError: ImageRecord에 width/height가 없어 좌표 변환이 불가능할 때
+    """
+    # width/height 검증 (normalized 좌표 계산에 필수)
+    if image_record.width is None or image_record.height is None:
+        raise ValueError(
+            f"YOLO 좌표 변환에 이미지 크기가 필요합니다: "
+            f"{image_record.file_name} (width={image_record.width}, "
+            f"height={image_record.height})"
+        )
+
+    # 이미지 basename으로 .txt 파일명 결정
+    image_stem = Path(image_record.file_name).stem
+    label_file_path = output_dir / f"{image_stem}.txt"
+
+    lines: list[str] = []
+    for annotation in image_record.annotations:
+        if annotation.bbox is None:
+            continue
+
+        # category_name → 0-based index
+        yolo_class_id = name_to_yolo_index.get(
+            annotation.category_name, 0,
+        )
+
+        center_x, center_y, width_norm, height_norm = _convert_absolute_bbox_to_yolo(
+            annotation.bbox[0], annotation.bbox[1],
+            annotation.bbox[2], annotation.bbox[3],
+            image_record.width, image_record.height,
+        )
+        lines.append(
+            f"{yolo_class_id} "
+            f"{center_x:.6f} {center_y:.6f} "
+            f"{width_norm:.6f} {height_norm:.6f}"
+        )
+
+    with open(label_file_path, "w", encoding="utf-8") as file_handle:
+        file_handle.write("\n".join(lines))
+        if lines:
+            file_handle.write("\n")
+
+
 def _write_yolo_data_yaml(
     category_names: list[str],
     output_dir: Path,
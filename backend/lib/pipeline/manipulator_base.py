@@ -6,14 +6,42 @@ UnitManipulator 추상 베이스 클래스.
   - 기존 코드 수정 없음
   - transform_annotation: annotation 레벨만 처리, 이미지 파일 I/O 절대 금지
   - build_image_manipulation: 이미지에 적용할 변환 명세만 반환
+  - 레코드 단위로 독립적인 변환(필터/이름 변경/회전 등)은 supports_record_fusion=True 로
+    선언하고 build_record_transform 을 구현한다. executor 가 연속된 per-record 태스크를
+    레코드당 1회 순회로 합쳐 실행한다 (operator fusion).
+  - 필터/샘플링과 이미지 변환·병합 사이의 교환 법칙은 클래스 속성으로 선언한다
+    (record_selection / commutes_with_record_selection / accepts_pushed_record_filter).
+    DAG optimizer 가 이를 보고 필터를 비싼 단계 앞으로 옮긴다 (predicate pushdown).
 """
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Literal
 
 from lib.pipeline.pipeline_data_models import DatasetMeta, ImageManipulationSpec, ImageRecord
 
+# UnitManipulator.record_selection 값
+RecordSelection = Literal["per_record", "whole_dataset"]
+
+
+@dataclass
+class RecordTransform:
+    """
+    per-record manipulator 의 변환 단위 (build_record_transform 반환값).
+
+    attributes:
+        output_meta: image_records 를 제외하고 확정된 출력 DatasetMeta
+                     (categories / head_schema / extra 등). image_records 는 빈 리스트.
+        apply: 입력 레코드 → 출력 레코드. None 이면 해당 이미지를 제거한다.
+               입력 레코드는 수정하지 않는다 (copy-on-write 규약).
+        finish: 모든 레코드 처리 후 (입력 이미지 수, 출력 이미지 수) 로 호출 — 요약 로그용.
+    """
+    output_meta: DatasetMeta
+    apply: Callable[[ImageRecord], ImageRecord | None]
+    finish: Callable[[int, int], None] | None = None
+
 
 class UnitManipulator(ABC):
     """
@@ -25,6 +53,23 @@ class UnitManipulator(ABC):
     2. build_image_manipulation: 이미지 변환 명세 생성 (실제 I/O는 ImageMaterializer가 수행)
     """
 
+    # True 면 레코드별 독립 변환이며 build_record_transform 을 구현한다 (operator fusion 대상).
+    supports_record_fusion: bool = False
+
+    # ── 교환 법칙 선언 (DAG optimizer 의 predicate pushdown 용) ──
+    # record_selection: 이미지를 통째로 남기거나 빼기만 하는 태스크의 선택 방식.
+    #   "per_record"    — 레코드마다 annotation / labels 만 보고 판정 (필터).
+    #                     레코드 내용과 categories / head_schema / extra 는 바꾸지 않는다.
+    #   "whole_dataset" — 레코드 목록의 길이·순서만으로 고른다 (시드 고정 샘플링).
+    record_selection: RecordSelection | None = None
+    # True 면 레코드를 1:1·순서 유지로 변환하고 annotation 라벨은 바꾸지 않는다 (이미지 변환).
+    # record_selection 태스크를 이 태스크 앞으로 옮겨도 결과가 같다.
+    commutes_with_record_selection: bool = False
+    # True 면 병합 중에 "per_record" 필터를 적용할 수 있다 — context["record_filter"] 로
+    # 받은 판정 함수를 입력 레코드에 적용하되, 파일명 충돌 판정과 image_id 번호는
+    # 걸러지기 전 전체 레코드 기준으로 유지한다. categories 는 입력 순서대로 union 한다.
+    accepts_pushed_record_filter: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -76,3 +121,46 @@ class UnitManipulator(ABC):
             ImageManipulationSpec 리스트. 비어있으면 단순 copy.
         """
         return []
+
+    def is_deterministic(self, params: dict[str, Any]) -> bool:
+        """
+        같은 입력 + 같은 params 에 항상 같은 출력을 내는지 여부.
+
+        DAG optimizer 는 결정적인 태스크만 중복 제거(공통 부분식 공유) 대상으로 삼는다.
+        기본 True. 난수를 쓰는 manipulator 는 시드가 고정되지 않은 경우 False 를 반환한다.
+        """
+        return True
+
+    def build_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> RecordTransform:
+        """
+        레코드 단위 변환을 준비한다 (supports_record_fusion=True 인 manipulator 만 구현).
+
+        params 파싱/검증과 categories 등 메타 레벨 변경은 여기서 한 번만 수행한다.
+        input_meta.image_records 는 읽지 않는다 — fusion 시 앞 단계의 출력 메타가
+        레코드 없이 전달되기 때문이다.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} 는 per-record 변환(build_record_transform)을 지원하지 않습니다."
+        )
+
+    def apply_record_transform(
+        self,
+        input_meta: DatasetMeta | list[DatasetMeta],
+        params: dict[str, Any],
+    ) -> DatasetMeta:
+        """build_record_transform 을 단독 실행한다 (per-record 의 transform_annotation 구현)."""
+        record_transform = self.build_record_transform(input_meta, params)
+        output_meta = record_transform.output_meta
+        output_records: list[ImageRecord] = []
+        for record in input_meta.image_records:
+            output_record = record_transform.apply(record)
+            if output_record is not None:
+                output_records.append(output_record)
+        output_meta.image_records = output_records
+        if record_transform.finish is not None:
+            record_transform.finish(len(input_meta.image_records), len(output_records))
+        return output_meta
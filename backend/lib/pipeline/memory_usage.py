@@ -0,0 +1,73 @@
+"""
+파이프라인 실행 중 프로세스 메모리(RSS) 측정.
+
+Celery worker 는 여러 run 을 같은 프로세스에서 처리하므로 getrusage 의 ru_maxrss
+(프로세스 생애 최대값)만으로는 이번 run 의 최대값을 알 수 없다.
+RunPeakRss 는 run 동안 현재 RSS 를 표본으로 모으고, run 중에 ru_maxrss 가 올라갔으면
+그 값(= 이번 run 안에서 찍은 최대값)을 쓴다.
+
+/proc 가 없는 플랫폼(macOS 등)은 ru_maxrss 만, resource 모듈이 없는 플랫폼(Windows)은
+측정값 없이(None) 동작한다.
+"""
+from __future__ import annotations
+
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def current_rss_bytes() -> int | None:
+    """현재 프로세스 RSS (bytes). 측정할 수 없으면 None."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm_file:
+            resident_pages = int(statm_file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def max_rss_bytes() -> int | None:
+    """프로세스 생애 최대 RSS (bytes, getrusage). 측정할 수 없으면 None."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 bytes 단위
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def bytes_to_mb(value: int | None) -> float | None:
+    return None if value is None else round(value / _BYTES_PER_MB, 1)
+
+
+class RunPeakRss:
+    """run 1회의 최대 RSS 추적기. 태스크 완료 등 주요 시점마다 sample() 을 부른다."""
+
+    def __init__(self) -> None:
+        self._max_rss_at_start = max_rss_bytes()
+        self._sampled_peak: int | None = None
+        self.sample()
+
+    def sample(self) -> int | None:
+        """현재 RSS 를 표본으로 기록하고 반환한다."""
+        rss = current_rss_bytes()
+        if rss is not None and (self._sampled_peak is None or rss > self._sampled_peak):
+            self._sampled_peak = rss
+        return rss
+
+    def peak_bytes(self) -> int | None:
+        """이번 run 의 최대 RSS. 표본 사이의 순간 최대값은 ru_maxrss 가 올라간 경우에만 반영된다."""
+        self.sample()
+        max_rss_now = max_rss_bytes()
+        if (
+            max_rss_now is not None
+            and self._max_rss_at_start is not None
+            and max_rss_now > self._max_rss_at_start
+        ):
+            return max(max_rss_now, self._sampled_peak or 0)
+        return self._sampled_peak
@@ -0,0 +1,252 @@
+"""
+run 성능 보고서 (perf.json) 와 run 간 성능 비교.
+
+PipelineDagExecutor 는 run 마다 기본 출력 디렉토리에 processing.log 와 함께 perf.json 을 쓰고
+(PipelineResult.perf_report 로도 돌려준다), 서비스 레이어는 같은 내용을 PipelineRun.perf_report 에
+저장한다. 보고서 구성:
+
+    wall_seconds     run 전체 경과 시간
+    phases           {"phase_a": 태스크 계산까지, "phase_b": 이미지 실체화 + annotation 작성}
+    stages           계측 단계 종류별 wall 시간 합 (instrumentation 모듈의 stage 값)
+    tasks            작업 단위별 {wall_seconds, cpu_seconds, record_count} (fusion 체인은 "a → b")
+    materialize      전체 출력의 {images, skipped, reused, resumed, bytes_written, seconds,
+                     images_per_second, mb_per_second}
+    outputs          출력별 materialize 값 (+ output_split)
+    transforms       이미지 변환 operation 별 적용 횟수
+    cache            태스크 결과 캐시 {hits, misses, hit_ratio} (캐시를 안 쓰면 null)
+    peak_rss_mb      run 최대 RSS
+
+compare_perf_reports 는 같은 PipelineVersion 의 두 보고서를 비교해 느려진 태스크 / 단계와
+떨어진 실체화 처리량을 찾는다. 짧은 단계는 잡음이 커서 min_seconds 미만이면 비교하지 않는다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from lib.pipeline.image_materializer import MaterializeResult
+from lib.pipeline.instrumentation import STAGE_TASK, StageMetrics
+
+logger = logging.getLogger(__name__)
+
+PERF_REPORT_FILENAME = "perf.json"
+# 보고서 구조가 바뀌면 올린다.
+PERF_REPORT_SCHEMA_VERSION = 1
+
+
+@dataclass
+class OutputPerf:
+    """출력 1개의 이미지 실체화 성능."""
+    output_split: str
+    materialize_result: MaterializeResult
+    seconds: float
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"output_split": self.output_split, **_materialize_summary(
+            [self.materialize_result], self.seconds,
+        )}
+
+
+class RunPerfTracker:
+    """run 1회의 phase 경계와 출력별 실체화 성능을 모은다 (executor 의 run 동안만 존재)."""
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.phase_b_started_at: float | None = None
+        self.outputs: list[OutputPerf] = []
+
+    def mark_phase_b(self) -> None:
+        """첫 출력의 Phase B 가 시작될 때 부른다 (이후 호출은 무시)."""
+        if self.phase_b_started_at is None:
+            self.phase_b_started_at = time.perf_counter()
+
+    def add_output(
+        self, output_split: str, materialize_result: MaterializeResult, seconds: float,
+    ) -> None:
+        self.outputs.append(OutputPerf(output_split, materialize_result, seconds))
+
+    def build_report(
+        self,
+        pipeline_name: str,
+        stage_metrics: list[StageMetrics],
+        cache_counts: dict[str, int] | None,
+        peak_rss_mb: float | None,
+    ) -> dict[str, Any]:
+        finished_at = time.perf_counter()
+        phase_b_started_at = self.phase_b_started_at or finished_at
+
+        stage_seconds: dict[str, float] = {}
+        tasks: dict[str, dict[str, Any]] = {}
+        for metrics in stage_metrics:
+            stage_seconds[metrics.stage] = (
+                stage_seconds.get(metrics.stage, 0.0) + metrics.wall_seconds
+            )
+            if metrics.stage == STAGE_TASK:
+                tasks[metrics.name] = {
+                    "wall_seconds": metrics.wall_seconds,
+                    "cpu_seconds": metrics.cpu_seconds,
+                    "record_count": metrics.record_count,
+                }
+
+        transforms: dict[str, int] = {}
+        for output in self.outputs:
+            for operation, count in output.materialize_result.transform_counts.items():
+                transforms[operation] = transforms.get(operation, 0) + count
+
+        cache: dict[str, Any] | None = None
+        if cache_counts is not None:
+            looked_up = cache_counts["hits"] + cache_counts["misses"]
+            cache = {
+                **cache_counts,
+                "hit_ratio": round(cache_counts["hits"] / looked_up, 4) if looked_up else None,
+            }
+
+        return {
+            "schema_version": PERF_REPORT_SCHEMA_VERSION,
+            "pipeline_name": pipeline_name,
+            "wall_seconds": round(finished_at - self.started_at, 4),
+            "phases": {
+                "phase_a": round(phase_b_started_at - self.started_at, 4),
+                "phase_b": round(finished_at - phase_b_started_at, 4),
+            },
+            "stages": {stage: round(seconds, 4) for stage, seconds in stage_seconds.items()},
+            "tasks": tasks,
+            "materialize": _materialize_summary(
+                [output.materialize_result for output in self.outputs],
+                sum(output.seconds for output in self.outputs),
+            ),
+            "outputs": [output.as_dict() for output in self.outputs],
+            "transforms": transforms,
+            "cache": cache,
+            "peak_rss_mb": peak_rss_mb,
+        }
+
+
+def _materialize_summary(results: list[MaterializeResult], seconds: float) -> dict[str, Any]:
+    images = sum(result.materialized_count for result in results)
+    bytes_written = sum(result.bytes_written for result in results)
+    link_counts: dict[str, int] = {}
+    link_fallbacks: dict[str, int] = {}
+    for result in results:
+        for method, count in result.link_counts.items():
+            link_counts[method] = link_counts.get(method, 0) + count
+        for method, count in result.link_fallbacks.items():
+            link_fallbacks[method] = link_fallbacks.get(method, 0) + count
+    return {
+        "images": images,
+        "skipped": sum(result.skipped_count for result in results),
+        "reused": sum(result.reused_count for result in results),
+        "resumed": sum(result.resumed_count for result in results),
+        "bytes_written": bytes_written,
+        "links": link_counts,
+        "link_fallbacks": link_fallbacks,
+        "seconds": round(seconds, 4),
+        "images_per_second": round(images / seconds, 2) if seconds > 0 else None,
+        "mb_per_second": (
+            round(bytes_written / (1024 * 1024) / seconds, 2) if seconds > 0 else None
+        ),
+    }
+
+
+def write_perf_report(output_dir: Path, report: dict[str, Any]) -> None:
+    """출력 디렉토리에 perf.json 을 쓴다. 실패해도 경고만 남긴다 (run 결과에는 영향 없음)."""
+    report_path = output_dir / PERF_REPORT_FILENAME
+    try:
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    except OSError as write_error:
+        logger.warning("perf.json 작성 실패 (파이프라인 결과에는 영향 없음): %s", write_error)
+        return
+    logger.info("perf.json 작성 완료: %s", report_path)
+
+
+# ─── run 간 비교 ───
+
+@dataclass
+class PerfRegression:
+    """
+    느려진 항목 1개.
+
+    kind: "task" | "phase" | "throughput"
+    ratio: 느려진 배율 (시간은 current / baseline, 처리량은 baseline / current)
+    """
+    kind: str
+    name: str
+    baseline: float
+    current: float
+    ratio: float
+
+
+@dataclass
+class PerfComparison:
+    regressions: list[PerfRegression] = field(default_factory=list)
+    # 비교한 태스크 중 한쪽에만 있는 것 (DAG 구성 / fusion 이 바뀐 경우)
+    unmatched_tasks: list[str] = field(default_factory=list)
+
+
+def compare_perf_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    slowdown_ratio: float = 1.5,
+    min_seconds: float = 1.0,
+) -> PerfComparison:
+    """
+    current 가 baseline 보다 slowdown_ratio 배 이상 느려진 태스크 / phase / 처리량을 찾는다.
+
+    시간 항목은 둘 중 하나라도 min_seconds 이상일 때만, 처리량은 두 run 모두
+    실체화 시간이 min_seconds 이상일 때만 비교한다.
+    """
+    comparison = PerfComparison()
+
+    def _check_duration(kind: str, name: str, baseline_value: Any, current_value: Any) -> None:
+        if not all(isinstance(value, (int, float)) for value in (baseline_value, current_value)):
+            return
+        if max(baseline_value, current_value) < min_seconds or baseline_value <= 0:
+            return
+        ratio = current_value / baseline_value
+        if ratio >= slowdown_ratio:
+            comparison.regressions.append(PerfRegression(
+                kind=kind, name=name, baseline=baseline_value, current=current_value,
+                ratio=round(ratio, 2),
+            ))
+
+    baseline_tasks = baseline.get("tasks") or {}
+    current_tasks = current.get("tasks") or {}
+    for task_name in sorted(set(baseline_tasks) | set(current_tasks)):
+        if task_name not in baseline_tasks or task_name not in current_tasks:
+            comparison.unmatched_tasks.append(task_name)
+            continue
+        _check_duration(
+            "task", task_name,
+            baseline_tasks[task_name].get("wall_seconds"),
+            current_tasks[task_name].get("wall_seconds"),
+        )
+    for phase_name, baseline_seconds in (baseline.get("phases") or {}).items():
+        _check_duration(
+            "phase", phase_name, baseline_seconds, (current.get("phases") or {}).get(phase_name),
+        )
+
+    baseline_materialize = baseline.get("materialize") or {}
+    current_materialize = current.get("materialize") or {}
+    if (
+        (baseline_materialize.get("seconds") or 0) >= min_seconds
+        and (current_materialize.get("seconds") or 0) >= min_seconds
+    ):
+        for throughput_name in ("images_per_second", "mb_per_second"):
+            baseline_value = baseline_materialize.get(throughput_name)
+            current_value = current_materialize.get(throughput_name)
+            if not baseline_value or not current_value:
+                continue
+            ratio = baseline_value / current_value
+            if ratio >= slowdown_ratio:
+                comparison.regressions.append(PerfRegression(
+                    kind="throughput", name=throughput_name,
+                    baseline=baseline_value, current=current_value, ratio=round(ratio, 2),
+                ))
+
+    comparison.regressions.sort(key=lambda regression: regression.ratio, reverse=True)
+    return comparison
@@ -18,11 +18,23 @@
 
 task_kind 는 DatasetMeta.head_schema 의 존재 여부로 판별한다 — executor 는 이 값을 근거로
 detection 경로(categories/annotations)와 classification 경로(head_schema/labels) 를 분기한다.
+
+Copy-on-write 규약:
+  - manipulator 입력으로 받은 DatasetMeta / ImageRecord / Annotation (및 그 list/dict 필드)은
+    읽기 전용이다. 제자리 수정하지 않는다.
+  - 출력은 derive_dataset_meta() 로 새 DatasetMeta 껍데기를 만들고, 변경 없는 ImageRecord 는
+    입력과 같은 객체를 그대로 공유한다. 바꿔야 하는 레코드/annotation 만
+    dataclasses.replace() 로 새 객체를 만든다 (extra 등 컨테이너 필드도 새로 만들어 넘긴다).
+  - 따라서 태스크 출력끼리, 그리고 source DatasetMeta 와 레코드를 공유해도 안전하며,
+    메모리/CPU 는 데이터셋 크기가 아니라 실제 변경된 레코드 수에 비례한다.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from lib.pipeline.source_image_index import SourceImageIndex
 
 TaskKind = Literal["DETECTION", "CLASSIFICATION"]
 
@@ -115,6 +127,9 @@ class DatasetMeta:
     # ── Classification 전용 ──
     head_schema: list[HeadSchema] | None = None
     extra: dict[str, Any] = field(default_factory=dict)
+    # source 로드 시 만든 images 디렉토리 인덱스 (source_image_index 모듈).
+    # source meta 에만 붙는다 — derive_dataset_meta / manipulator 출력으로는 옮기지 않는다.
+    image_index: SourceImageIndex | None = field(default=None, repr=False, compare=False)
 
     @property
     def image_count(self) -> int:
@@ -126,6 +141,26 @@ class DatasetMeta:
         return "CLASSIFICATION" if self.head_schema is not None else "DETECTION"
 
 
+def derive_dataset_meta(meta: DatasetMeta, **changes: Any) -> DatasetMeta:
+    """
+    입력 DatasetMeta 로부터 출력용 새 DatasetMeta 를 만든다 (copy-on-write).
+
+    image_records / categories / head_schema / extra 는 새 컨테이너로 만들되,
+    담긴 ImageRecord / HeadSchema 객체는 공유한다. changes 로 필드를 바로 교체할 수 있다.
+    반환값의 list/dict 는 호출자 소유이므로 자유롭게 재할당/수정해도 입력에 영향이 없다.
+    """
+    fields: dict[str, Any] = {
+        "dataset_id": meta.dataset_id,
+        "storage_uri": meta.storage_uri,
+        "categories": list(meta.categories),
+        "image_records": list(meta.image_records),
+        "head_schema": list(meta.head_schema) if meta.head_schema is not None else None,
+        "extra": dict(meta.extra),
+    }
+    fields.update(changes)
+    return DatasetMeta(**fields)
+
+
 @dataclass
 class ImageManipulationSpec:
     """
@@ -145,6 +180,8 @@ class ImagePlan:
     src_uri: str             # 원본 이미지 상대경로
     dst_uri: str             # 출력 이미지 상대경로
     specs: list[ImageManipulationSpec] = field(default_factory=list)
+    # True 면 src 가 이미 완성된 출력 이미지 (증분 재실행에서 이전 출력 재사용) — hardlink
+    reuse_existing: bool = False
 
     @property
     def is_copy_only(self) -> bool:
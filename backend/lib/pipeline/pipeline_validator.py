@@ -21,7 +21,8 @@ from enum import Enum
 from typing import Any
 
 from lib.manipulators import MANIPULATOR_REGISTRY
-from lib.pipeline.config import PipelineConfig
+from lib.pipeline.config import OutputConfig, PipelineConfig
+from lib.pipeline.dag_optimizer import optimize_pipeline_config
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +132,7 @@ def validate_pipeline_config_static(config: PipelineConfig) -> PipelineValidatio
       6. 단일 입력 전용 operator에 다중 입력이 주어지지 않았는지
       7. required params 누락 검사
       8. cls_add_head head_name 이 upstream cls_add_head 체인과 중복되지 않는지
+      9. 최종 출력 태스크를 정할 수 있는지 + 최종 출력에 도달하지 않는 태스크 경고
 
     Args:
         config: 검증할 파이프라인 설정
@@ -164,6 +166,9 @@ def validate_pipeline_config_static(config: PipelineConfig) -> PipelineValidatio
     # (8) cls_add_head head_name 중복 (파이프라인 내부 chain 기준)
     _validate_cls_add_head_duplicates(config, result)
 
+    # (9) 최종 출력 태스크 / 미연결 분기
+    _validate_terminal_task(config, result)
+
     return result
 
 
@@ -196,41 +201,54 @@ def _validate_output_dataset_type(
         )
 
 
+def _iter_output_configs(config: PipelineConfig) -> list[tuple[str, OutputConfig]]:
+    """(issue_field prefix, OutputConfig) — 기본 출력 + 추가 출력(extra_outputs)."""
+    return [
+        ("output", config.output),
+        *(
+            (f"extra_outputs.{index}.output", extra_output.output)
+            for index, extra_output in enumerate(config.extra_outputs)
+        ),
+    ]
+
+
 def _validate_output_split(
     config: PipelineConfig,
     result: PipelineValidationResult,
 ) -> None:
-    """output.split이 허용된 값인지 검증한다."""
-    split_upper = config.output.split.upper()
-    if split_upper not in VALID_SPLIT_VALUES:
-        result.add_error(
-            code="INVALID_SPLIT",
-            message=(
-                f"output.split '{config.output.split}'은(는) "
-                f"허용되지 않는 값입니다. "
-                f"사용 가능한 값: {', '.join(sorted(VALID_SPLIT_VALUES))}"
-            ),
-            issue_field="output.split",
-        )
+    """출력별 split 이 허용된 값인지 검증한다."""
+    for field_prefix, output_config in _iter_output_configs(config):
+        split_upper = output_config.split.upper()
+        if split_upper not in VALID_SPLIT_VALUES:
+            result.add_error(
+                code="INVALID_SPLIT",
+                message=(
+                    f"{field_prefix}.split '{output_config.split}'은(는) "
+                    f"허용되지 않는 값입니다. "
+                    f"사용 가능한 값: {', '.join(sorted(VALID_SPLIT_VALUES))}"
+                ),
+                issue_field=f"{field_prefix}.split",
+            )
 
 
 def _validate_output_annotation_format(
     config: PipelineConfig,
     result: PipelineValidationResult,
 ) -> None:
-    """output.annotation_format이 유효한 값인지 검증한다."""
-    annotation_format = config.output.annotation_format
-    format_upper = annotation_format.upper()
-    if format_upper not in VALID_ANNOTATION_FORMATS:
-        result.add_error(
-            code="INVALID_ANNOTATION_FORMAT",
-            message=(
-                f"output.annotation_format '{annotation_format}'은(는) "
-                f"허용되지 않는 값입니다. "
-                f"사용 가능한 값: {', '.join(sorted(VALID_ANNOTATION_FORMATS))}"
-            ),
-            issue_field="output.annotation_format",
-        )
+    """출력별 annotation_format 이 유효한 값인지 검증한다."""
+    for field_prefix, output_config in _iter_output_configs(config):
+        annotation_format = output_config.annotation_format
+        format_upper = annotation_format.upper()
+        if format_upper not in VALID_ANNOTATION_FORMATS:
+            result.add_error(
+                code="INVALID_ANNOTATION_FORMAT",
+                message=(
+                    f"{field_prefix}.annotation_format '{annotation_format}'은(는) "
+                    f"허용되지 않는 값입니다. "
+                    f"사용 가능한 값: {', '.join(sorted(VALID_ANNOTATION_FORMATS))}"
+                ),
+                issue_field=f"{field_prefix}.annotation_format",
+            )
 
 
 def _validate_operators_registered(
@@ -391,3 +409,37 @@ def _validate_single_input_operators(
                 ),
                 issue_field=f"tasks.{task_name}.inputs",
             )
+
+
+def _validate_terminal_task(
+    config: PipelineConfig,
+    result: PipelineValidationResult,
+) -> None:
+    """
+    최종 출력 태스크를 정할 수 있는지 검증한다.
+
+    terminal_task 미지정 시 sink 노드가 2개 이상이면 실행 불가 (ERROR).
+    terminal_task 가 지정되어 있으면 거기에 도달하지 않는 태스크는 실행되지 않으므로 경고한다.
+    """
+    if config.is_passthrough:
+        return
+
+    try:
+        plan = optimize_pipeline_config(config)
+    except ValueError as terminal_error:
+        result.add_error(
+            code="AMBIGUOUS_TERMINAL_TASK",
+            message=str(terminal_error),
+            issue_field="terminal_task",
+        )
+        return
+
+    if plan.removed_tasks:
+        result.add_warning(
+            code="UNREACHABLE_TASKS",
+            message=(
+                f"최종 출력 태스크 '{', '.join(plan.output_task_names)}'에 연결되지 않은 태스크는 "
+                f"실행되지 않습니다: {', '.join(plan.removed_tasks)}"
+            ),
+            issue_field="tasks",
+        )
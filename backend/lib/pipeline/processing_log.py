@@ -0,0 +1,123 @@
+"""
+processing.log 상세 실행 로그 수집 — 출력 디렉토리의 spool 파일에 바로 쓴다.
+
+PipelineDagExecutor 는 run 동안 "lib" logger 트리의 로그를 ProcessingLogSpoolHandler 로
+기본 출력 디렉토리의 .processing.log.spool 에 한 줄씩 쓴다 (메모리에 모아 두지 않는다).
+출력마다 processing.log 를 쓸 때 헤더 / 요약 뒤에 그 시점까지의 spool 내용을 이어 붙인다.
+
+크기 상한 (max_bytes):
+    spool 은 max_bytes / 2 크기의 세그먼트 2개(현재 + 직전 ".1")로 돈다. 현재 세그먼트가 차면
+    직전 세그먼트를 버리고 현재 세그먼트를 ".1" 로 옮긴다. 따라서 디스크 사용량은 max_bytes
+    안팎이고, processing.log 에는 마지막 max_bytes / 2 ~ max_bytes 분량의 로그만 남는다
+    (앞부분을 버렸으면 그 바이트 수를 적는다). max_bytes <= 0 이면 상한 없음.
+
+run 이 성공하면 spool 을 지운다. 실패하거나 worker 가 죽으면 spool 이 출력 디렉토리에 남으므로
+그대로 읽어 원인을 볼 수 있고, run(resume=True) 는 이어서 쓴다.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import IO, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+PROCESSING_LOG_FILENAME = "processing.log"
+PROCESSING_LOG_SPOOL_FILENAME = ".processing.log.spool"
+DEFAULT_PROCESSING_LOG_MAX_BYTES = 64 * 1024 * 1024
+_COPY_CHUNK_CHARS = 1024 * 1024
+
+
+class ProcessingLogSpoolHandler(logging.Handler):
+    """
+    포맷된 로그를 spool 파일에 한 줄씩 쓰는 핸들러 (크기 상한 / 세그먼트 회전).
+
+    spool 파일을 열 수 없으면 경고만 남기고 로그를 버린다 (run 결과에는 영향 없음).
+    """
+
+    def __init__(
+        self,
+        spool_path: Path,
+        max_bytes: int = DEFAULT_PROCESSING_LOG_MAX_BYTES,
+        append: bool = False,
+    ) -> None:
+        super().__init__()
+        self.spool_path = spool_path
+        self.rotated_path = spool_path.with_name(spool_path.name + ".1")
+        self._segment_max_bytes = max_bytes // 2 if max_bytes > 0 else 0
+        # 회전으로 버린 바이트 수 (processing.log 에 적는다)
+        self.dropped_bytes = 0
+        self._segment_bytes = 0
+        self._spool_file: BinaryIO | None = None
+        try:
+            if not append:
+                self.rotated_path.unlink(missing_ok=True)
+            self._spool_file = open(spool_path, "ab" if append else "wb")
+            self._segment_bytes = self._spool_file.tell()
+        except OSError as open_error:
+            logger.warning(
+                "processing.log spool 을 열 수 없어 상세 실행 로그를 남기지 않습니다: %s",
+                open_error,
+            )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._spool_file is None:
+            return
+        try:
+            encoded_line = (self.format(record) + "\n").encode("utf-8")
+            if (
+                self._segment_max_bytes
+                and self._segment_bytes
+                and self._segment_bytes + len(encoded_line) > self._segment_max_bytes
+            ):
+                self._rotate()
+            self._spool_file.write(encoded_line)
+            self._segment_bytes += len(encoded_line)
+        except Exception:
+            self.handleError(record)
+
+    def _rotate(self) -> None:
+        """현재 세그먼트를 .1 로 옮기고 (직전 .1 은 버림) 새 세그먼트를 연다."""
+        self._spool_file.close()
+        if self.rotated_path.exists():
+            self.dropped_bytes += self.rotated_path.stat().st_size
+        os.replace(self.spool_path, self.rotated_path)
+        self._spool_file = open(self.spool_path, "wb")
+        self._segment_bytes = 0
+
+    def copy_to(self, log_file: IO[str]) -> None:
+        """지금까지의 spool 내용을 log_file(텍스트)에 이어 쓴다. 쓰는 동안 회전을 막는다."""
+        self.acquire()
+        try:
+            if self._spool_file is None:
+                return
+            self._spool_file.flush()
+            if self.dropped_bytes:
+                log_file.write(
+                    f"... (앞부분 {self.dropped_bytes} bytes 생략 — processing.log 크기 상한)\n"
+                )
+            for segment_path in (self.rotated_path, self.spool_path):
+                if not segment_path.exists():
+                    continue
+                with open(segment_path, encoding="utf-8", errors="replace") as segment_file:
+                    while chunk := segment_file.read(_COPY_CHUNK_CHARS):
+                        log_file.write(chunk)
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._spool_file is not None:
+                self._spool_file.close()
+                self._spool_file = None
+        finally:
+            self.release()
+        super().close()
+
+    def discard(self) -> None:
+        """핸들러를 닫고 spool 파일을 지운다 (run 성공 시)."""
+        self.close()
+        self.spool_path.unlink(missing_ok=True)
+        self.rotated_path.unlink(missing_ok=True)
@@ -0,0 +1,259 @@
+"""
+파이프라인 run checkpoint — 실패/중단된 run 을 이어서 실행하기 위한 출력 디렉토리 내 기록.
+
+구성 (<기본 출력 storage_uri>/.checkpoint/):
+    phase_a.pkl — Phase A 결과 (출력별 최종 DatasetMeta + 이미지 소스 경로).
+                  pickle #1 헤더 dict (schema_version, key), pickle #2 PhaseACheckpoint.
+    materialize.journal — 첫 줄 "#<key>", 이후 실체화가 끝난 이미지 "<dst_uri>\\t<크기>" 한 줄씩
+                          (append-only). 링크로 배치해 크기를 재지 않은 이미지는 크기 자리가 "-".
+
+key 는 (resolve 된 config, 출력 버전, images_dirname) 의 해시라 같은 run 을 다시 실행할 때만
+checkpoint 를 쓴다. journal 은 일정 건수마다 flush 하므로 worker 가 죽으면 마지막 몇 건은
+다시 실체화된다. 이어서 실행할 때는 journal 의 크기와 실제 파일 크기가 같은 이미지만 건너뛴다
+(쓰다 만 파일은 다시 만든다). 크기가 "-" 인 이미지(링크 — 쓰다 만 상태가 없다)는 파일이 있으면
+건너뛴다. run 이 성공하면 checkpoint 디렉토리를 지운다.
+
+기록 실패는 경고만 남기고 계속한다 (checkpoint 없이도 run 자체는 정상 완료된다).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.storage_protocol import StorageProtocol
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIRNAME = ".checkpoint"
+# checkpoint 구조가 바뀌면 올린다.
+RUN_CHECKPOINT_SCHEMA_VERSION = 2
+_PHASE_A_FILENAME = "phase_a.pkl"
+_JOURNAL_FILENAME = "materialize.journal"
+# journal flush 간격 (이미지 수)
+_JOURNAL_FLUSH_INTERVAL = 100
+# journal 의 크기 자리 — 링크로 배치해 크기를 재지 않은 이미지
+_UNMEASURED_SIZE = "-"
+
+
+@dataclass
+class PhaseACheckpoint:
+    """
+    Phase A 결과 — 이어서 실행할 때 태스크를 다시 계산하지 않고 Phase B 로 바로 넘어간다.
+
+    attributes:
+        output_meta: 기본 출력의 최종 DatasetMeta
+        source_storage_uris: 기본 출력 이미지의 source storage_uri 목록
+        extra_output_metas: 추가 출력별 최종 DatasetMeta (config.extra_outputs 순서)
+        extra_source_storage_uris: 추가 출력별 source storage_uri 목록
+        missing_source_images: source dataset_id → 이미지 파일이 없어 로드 시 뺀 파일명
+    """
+    output_meta: DatasetMeta
+    source_storage_uris: list[str]
+    extra_output_metas: list[DatasetMeta] = field(default_factory=list)
+    extra_source_storage_uris: list[list[str]] = field(default_factory=list)
+    missing_source_images: dict[str, list[str]] = field(default_factory=dict)
+
+
+def build_checkpoint_key(
+    config_dict: dict[str, Any],
+    target_version: str,
+    extra_target_versions: list[str],
+    images_dirname: str,
+) -> str:
+    """같은 run 인지 판정하는 checkpoint 키 (sha256 hex)."""
+    canonical = json.dumps(
+        {
+            "schema_version": RUN_CHECKPOINT_SCHEMA_VERSION,
+            "config": config_dict,
+            "target_version": target_version,
+            "extra_target_versions": extra_target_versions,
+            "images_dirname": images_dirname,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class MaterializeJournal:
+    """
+    이미지 실체화 journal.
+
+    completed 는 이전 시도에서 기록된 {dst_uri: 크기} (링크로 배치한 이미지는 None).
+    record 는 새로 끝난 이미지를 덧붙인다.
+    """
+
+    def __init__(
+        self, journal_path: Path, completed: dict[str, int | None], key: str,
+    ) -> None:
+        self.journal_path = journal_path
+        self.completed = completed
+        self.key = key
+        self._file: IO[str] | None = None
+        self._pending_count = 0
+
+    def is_completed(self, dst_uri: str, dst_path: Path) -> bool:
+        """
+        이전 시도에서 끝났고 파일 크기도 기록과 같으면 True.
+
+        크기 없이 기록된 파일(링크)은 파일이 있기만 하면 True.
+        """
+        if dst_uri not in self.completed:
+            return False
+        recorded_size = self.completed[dst_uri]
+        try:
+            dst_size = dst_path.stat().st_size
+        except OSError:
+            return False
+        return recorded_size is None or dst_size == recorded_size
+
+    def record(self, dst_uri: str, size: int | None) -> None:
+        try:
+            if self._file is None:
+                self._file = open(self.journal_path, "a", encoding="utf-8")
+                if self._file.tell() == 0:
+                    self._file.write(f"#{self.key}\n")
+            size_text = _UNMEASURED_SIZE if size is None else str(size)
+            self._file.write(f"{dst_uri}\t{size_text}\n")
+            self._pending_count += 1
+            if self._pending_count >= _JOURNAL_FLUSH_INTERVAL:
+                self.flush()
+        except OSError as write_error:
+            logger.warning(
+                "실체화 journal 기록 실패 — 무시: %s (%s)", self.journal_path, write_error,
+            )
+
+    def flush(self) -> None:
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending_count = 0
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self.flush()
+            self._file.close()
+        except OSError as close_error:
+            logger.warning(
+                "실체화 journal 닫기 실패 — 무시: %s (%s)", self.journal_path, close_error,
+            )
+        self._file = None
+
+
+class RunCheckpoint:
+    """
+    기본 출력 디렉토리 아래의 run checkpoint.
+
+    Args:
+        storage: StorageProtocol 구현체
+        output_storage_uri: 기본 출력 storage_uri
+        key: build_checkpoint_key 결과
+    """
+
+    def __init__(self, storage: StorageProtocol, output_storage_uri: str, key: str) -> None:
+        self.checkpoint_dir = storage.resolve_path(output_storage_uri) / CHECKPOINT_DIRNAME
+        self.key = key
+
+    def save_phase_a(self, phase_a: PhaseACheckpoint) -> bool:
+        """Phase A 결과를 원자적으로 기록한다. 실패하면 경고 후 False."""
+        phase_a_path = self.checkpoint_dir / _PHASE_A_FILENAME
+        temp_path: str | None = None
+        try:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=".phase_a.", suffix=".tmp", dir=self.checkpoint_dir,
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {"schema_version": RUN_CHECKPOINT_SCHEMA_VERSION, "key": self.key},
+                    f, protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                pickle.dump(phase_a, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, phase_a_path)
+        except Exception as write_error:
+            logger.warning(
+                "Phase A checkpoint 저장 실패 — 무시: %s (%s)", phase_a_path, write_error,
+            )
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+            return False
+        logger.info("Phase A checkpoint 저장: %s", phase_a_path)
+        return True
+
+    def load_phase_a(self) -> PhaseACheckpoint | None:
+        """같은 키의 Phase A 결과. 없거나 손상/키 불일치면 None."""
+        phase_a_path = self.checkpoint_dir / _PHASE_A_FILENAME
+        try:
+            with open(phase_a_path, "rb") as f:
+                header = pickle.load(f)
+                if (
+                    not isinstance(header, dict)
+                    or header.get("schema_version") != RUN_CHECKPOINT_SCHEMA_VERSION
+                    or header.get("key") != self.key
+                ):
+                    logger.info("Phase A checkpoint 가 이 run 과 다름 — 무시: %s", phase_a_path)
+                    return None
+                phase_a = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as read_error:
+            logger.warning("Phase A checkpoint 읽기 실패 — 무시: %s (%s)", phase_a_path, read_error)
+            return None
+        if not isinstance(phase_a, PhaseACheckpoint):
+            logger.warning("Phase A checkpoint 내용이 올바르지 않음 — 무시: %s", phase_a_path)
+            return None
+        return phase_a
+
+    def open_journal(self, resume: bool) -> MaterializeJournal:
+        """
+        실체화 journal. resume 이고 같은 키의 기록이 있으면 읽어 이어 쓰고, 아니면 새로 시작한다.
+
+        잘린 마지막 줄(기록 중 중단)은 무시한다.
+        """
+        journal_path = self.checkpoint_dir / _JOURNAL_FILENAME
+        completed: dict[str, int | None] = {}
+        try:
+            self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+            previous = (
+                self._read_journal(journal_path) if resume and journal_path.exists() else None
+            )
+            if previous is None:
+                journal_path.unlink(missing_ok=True)
+            else:
+                completed = previous
+        except OSError as read_error:
+            logger.warning("실체화 journal 읽기 실패 — 처음부터: %s (%s)", journal_path, read_error)
+            journal_path.unlink(missing_ok=True)
+            completed = {}
+        return MaterializeJournal(journal_path, completed, self.key)
+
+    def _read_journal(self, journal_path: Path) -> dict[str, int | None] | None:
+        """{dst_uri: 크기 (링크면 None)}. 다른 run 의 journal 이면 None."""
+        completed: dict[str, int | None] = {}
+        with open(journal_path, encoding="utf-8") as f:
+            if f.readline().rstrip("\n") != f"#{self.key}":
+                logger.info("실체화 journal 이 이 run 과 다름 — 무시: %s", journal_path)
+                return None
+            for line in f:
+                dst_uri, separator, size_text = line.rstrip("\n").rpartition("\t")
+                if separator and size_text.isdigit():
+                    completed[dst_uri] = int(size_text)
+                elif separator and size_text == _UNMEASURED_SIZE:
+                    completed[dst_uri] = None
+        return completed
+
+    def clear(self) -> None:
+        """run 성공 후 checkpoint 를 지운다."""
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
@@ -0,0 +1,89 @@
+"""
+source 이미지 디렉토리 인덱스 — 없는 이미지를 Phase A 전에 찾아 뺀다.
+
+source 를 로드할 때 images 디렉토리를 scandir 1회로 훑어 파일명 집합을 만들고
+(DatasetMeta.image_index), 실제 파일이 없는 레코드를 manipulator 적용 전에 제외한다.
+이렇게 하면 Phase B 는 이미지마다 존재 여부를 확인(stat)하지 않아도 된다 — NAS 에서는
+파일당 stat 지연이 복사만 하는 run 의 대부분을 차지한다.
+
+인덱스로 판단할 수 없는 레코드(images 디렉토리 밖의 경로)는 그대로 둔다.
+디렉토리를 읽을 수 없으면 인덱스를 만들지 않는다 (Phase B 에서 파일을 열 때 없으면 건너뛴다).
+"""
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImageRecord, derive_dataset_meta
+from lib.pipeline.storage_protocol import StorageProtocol
+
+logger = logging.getLogger(__name__)
+
+# 로그에 보여줄 없는 이미지 파일명 최대 수
+_MISSING_LOG_LIMIT = 20
+
+
+@dataclass
+class SourceImageIndex:
+    """
+    source 1개의 images 디렉토리 파일명 집합.
+
+    missing_files: 로드 시 실제 파일이 없어 제외한 이미지 파일명 (레코드 순서, 디렉토리 제외 —
+        MaterializeResult.skipped_files 와 같은 형식)
+    """
+    images_dirname: str
+    file_names: frozenset[str]
+    missing_files: list[str] = field(default_factory=list)
+
+    def contains(self, record: ImageRecord) -> bool | None:
+        """레코드의 이미지 파일이 있으면 True, 없으면 False, 인덱스로 알 수 없으면 None."""
+        dirname, separator, base_name = record.file_name.rpartition("/")
+        if not separator:
+            # detection — file_name 은 images 디렉토리 안의 파일명
+            return record.file_name in self.file_names
+        if dirname == self.images_dirname:
+            # classification — file_name 은 "images/{basename}" (storage_uri 기준 상대경로)
+            return base_name in self.file_names
+        return None
+
+
+def build_source_image_index(
+    storage: StorageProtocol,
+    storage_uri: str,
+    images_dirname: str,
+) -> SourceImageIndex | None:
+    """images 디렉토리를 scandir 1회로 훑어 인덱스를 만든다. 읽을 수 없으면 None."""
+    images_dir = storage.resolve_path(storage_uri) / images_dirname
+    try:
+        with os.scandir(images_dir) as entries:
+            file_names = frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError as scan_error:
+        logger.info("source 이미지 디렉토리 인덱스 생략: %s (%s)", images_dir, scan_error)
+        return None
+    return SourceImageIndex(images_dirname=images_dirname, file_names=file_names)
+
+
+def prune_missing_images(meta: DatasetMeta, index: SourceImageIndex) -> DatasetMeta:
+    """
+    이미지 파일이 없는 레코드를 뺀 새 DatasetMeta (image_index=index) 를 돌려준다.
+
+    입력 meta 는 바꾸지 않는다 (로더가 같은 객체를 다시 돌려줄 수 있다).
+    제외한 파일명은 index.missing_files 에 남긴다.
+    """
+    kept_records: list[ImageRecord] = []
+    missing_files: list[str] = []
+    for record in meta.image_records:
+        if index.contains(record) is False:
+            missing_files.append(record.file_name.rsplit("/", 1)[-1])
+        else:
+            kept_records.append(record)
+    index.missing_files = missing_files
+    if missing_files:
+        logger.warning(
+            "소스 이미지 파일 없음 — 로드 시 제외: dataset_id=%s, missing=%d%s: %s",
+            meta.dataset_id, len(missing_files),
+            f" (상위 {_MISSING_LOG_LIMIT}개)" if len(missing_files) > _MISSING_LOG_LIMIT else "",
+            ", ".join(missing_files[:_MISSING_LOG_LIMIT]),
+        )
+    return derive_dataset_meta(meta, image_records=kept_records, image_index=index)
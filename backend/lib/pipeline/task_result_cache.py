@@ -0,0 +1,262 @@
+"""
+run 간 태스크 결과 memoization (content-addressed 디스크 캐시).
+
+태스크의 출력 DatasetMeta 는 (operator, params, manipulator 코드 버전, 입력 fingerprint) 만으로
+정해진다. source 입력의 fingerprint 는 불변인 DatasetVersion id 이고, 태스크 입력의
+fingerprint 는 그 태스크의 캐시 키다. 그래서 키가 같으면 어느 파이프라인의 어느 run 이든
+같은 결과를 재사용할 수 있다 — 공통 prefix(같은 source 에 같은 필터/변환)를 다시 계산하지 않는다.
+
+파일 구조 (<cache_dir>/<키 앞 2자리>/<키>.pkl):
+    pickle #1 — 헤더 dict (schema_version, key, task_stats)
+    pickle #2 — DatasetMeta
+
+task_stats 는 {태스크 캐시 키: {"input_images", "output_images", "category_count"}} 로,
+fusion 체인을 한 번에 계산해 저장한 경우 체인 구성 태스크의 진행 통계를 모두 담는다.
+헤더만 먼저 읽으므로 통계 조회는 본문을 역직렬화하지 않는다.
+
+크기 제한: 저장할 때마다 전체 크기가 max_bytes 를 넘으면 mtime 이 오래된 항목부터 지운다.
+조회에 성공하면 mtime 을 갱신하므로 LRU 순서가 된다. 여러 worker 가 같은 디렉토리를
+공유해도 되도록 기록은 원자적(임시 파일 → os.replace)이고, 읽기/쓰기 실패는 경고만 남기고
+캐시 없이 계속한다.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from lib.manipulators import MANIPULATOR_REGISTRY
+from lib.pipeline.pipeline_data_models import DatasetMeta
+
+logger = logging.getLogger(__name__)
+
+# 캐시 항목 구조 / executor 의 계산 규칙(다중 입력 병합 등)이 바뀌면 올린다.
+TASK_RESULT_CACHE_SCHEMA_VERSION = 1
+_ENTRY_SUFFIX = ".pkl"
+
+
+@cache
+def manipulator_code_version(operator_name: str) -> str | None:
+    """
+    manipulator 구현 코드의 버전 (클래스 MRO 중 lib/ 모듈 소스 파일의 해시).
+
+    manipulator 코드가 바뀌면 키가 달라져 이전 결과를 쓰지 않는다.
+    등록되지 않은 operator 거나 소스를 읽을 수 없으면 None.
+    """
+    manipulator_class = MANIPULATOR_REGISTRY.get(operator_name)
+    if manipulator_class is None:
+        return None
+    digest = hashlib.sha256()
+    for klass in manipulator_class.__mro__:
+        if not klass.__module__.startswith("lib."):
+            continue
+        try:
+            source_path = inspect.getsourcefile(klass)
+            with open(source_path, "rb") as source_file:
+                digest.update(source_file.read())
+        except (OSError, TypeError):
+            return None
+    return digest.hexdigest()
+
+
+def build_task_cache_key(
+    operator_name: str,
+    params: dict[str, Any],
+    input_fingerprints: list[Any],
+) -> str | None:
+    """
+    태스크 캐시 키 (sha256 hex). 코드 버전을 알 수 없는 operator 면 None.
+
+    input_fingerprints 는 inputs 순서대로 둔다 (병합은 입력 순서대로 레코드를 합친다).
+    """
+    code_version = manipulator_code_version(operator_name)
+    if code_version is None:
+        return None
+    canonical = json.dumps(
+        {
+            "schema_version": TASK_RESULT_CACHE_SCHEMA_VERSION,
+            "operator": operator_name,
+            "params": params,
+            "code_version": code_version,
+            "inputs": input_fingerprints,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class TaskResultCache:
+    """
+    태스크 결과 디스크 캐시 (크기 제한 LRU).
+
+    Args:
+        cache_dir: 캐시 루트 디렉토리 (없으면 만든다)
+        max_bytes: 캐시 전체 크기 상한. 항목 하나가 이보다 크면 저장하지 않는다.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max(0, max_bytes)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # 진행 보고/테스트용 누계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def read_stats(self, key: str) -> dict[str, dict[str, int]] | None:
+        """항목의 task_stats 만 읽는다 (본문 역직렬화 없음). 없거나 손상이면 None."""
+        header = self._read_entry(key, with_meta=False)
+        return None if header is None else header[0]
+
+    def get(self, key: str) -> tuple[DatasetMeta, dict[str, dict[str, int]]] | None:
+        """
+        키에 해당하는 (DatasetMeta, task_stats). 없거나 손상이면 None.
+
+        찾으면 mtime 을 갱신해 LRU 에서 가장 최근 항목이 되게 한다.
+        """
+        entry = self._read_entry(key, with_meta=True)
+        if entry is None:
+            self.misses += 1
+            return None
+        task_stats, meta = entry
+        try:
+            os.utime(self._entry_path(key))
+        except OSError:
+            pass
+        self.hits += 1
+        return meta, task_stats
+
+    def put(
+        self,
+        key: str,
+        meta: DatasetMeta,
+        task_stats: dict[str, dict[str, int]],
+    ) -> bool:
+        """
+        항목을 원자적으로 기록하고 상한을 넘으면 오래된 항목을 지운다.
+
+        실패해도 예외를 올리지 않는다.
+
+        Returns:
+            저장했으면 True
+        """
+        entry_path = self._entry_path(key)
+        temp_path: str | None = None
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                prefix=f".{key[:16]}.", suffix=".tmp", dir=entry_path.parent,
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(
+                    {
+                        "schema_version": TASK_RESULT_CACHE_SCHEMA_VERSION,
+                        "key": key,
+                        "task_stats": task_stats,
+                    },
+                    f, protocol=pickle.HIGHEST_PROTOCOL,
+                )
+                pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+            entry_size = os.path.getsize(temp_path)
+            if entry_size > self.max_bytes:
+                logger.info(
+                    "태스크 결과 캐시 저장 생략 (상한 초과): key=%s, size=%d, max_bytes=%d",
+                    key[:12], entry_size, self.max_bytes,
+                )
+                Path(temp_path).unlink(missing_ok=True)
+                return False
+            os.replace(temp_path, entry_path)
+        except Exception as write_error:
+            logger.warning(
+                "태스크 결과 캐시 저장 실패 — 캐시 없이 계속: %s (%s)", entry_path, write_error,
+            )
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+            return False
+
+        self._evict_to_limit()
+        return True
+
+    def total_bytes(self) -> int:
+        return sum(size for _, size, _ in self._scan_entries())
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{_ENTRY_SUFFIX}"
+
+    def _read_entry(
+        self,
+        key: str,
+        with_meta: bool,
+    ) -> tuple[dict[str, dict[str, int]], DatasetMeta | None] | None:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as f:
+                header = pickle.load(f)
+                if (
+                    not isinstance(header, dict)
+                    or header.get("schema_version") != TASK_RESULT_CACHE_SCHEMA_VERSION
+                    or header.get("key") != key
+                ):
+                    logger.info("태스크 결과 캐시 헤더 불일치 — 무시: %s", entry_path)
+                    return None
+                meta = pickle.load(f) if with_meta else None
+        except FileNotFoundError:
+            return None
+        except Exception as read_error:
+            logger.warning("태스크 결과 캐시 읽기 실패 — 무시: %s (%s)", entry_path, read_error)
+            return None
+
+        if with_meta and not isinstance(meta, DatasetMeta):
+            logger.warning("태스크 결과 캐시 내용이 올바르지 않음 — 무시: %s", entry_path)
+            return None
+        return header["task_stats"], meta
+
+    def _scan_entries(self) -> list[tuple[Path, int, int]]:
+        """(경로, 크기, mtime_ns) 목록. 다른 worker 가 지운 항목은 건너뛴다."""
+        entries: list[tuple[Path, int, int]] = []
+        try:
+            shard_dirs = [entry for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+        except OSError:
+            return entries
+        for shard_dir in shard_dirs:
+            try:
+                shard_entries = list(os.scandir(shard_dir.path))
+            except OSError:
+                continue
+            for entry in shard_entries:
+                if not entry.name.endswith(_ENTRY_SUFFIX):
+                    continue
+                try:
+                    stat_result = entry.stat()
+                except OSError:
+                    continue
+                entries.append((Path(entry.path), stat_result.st_size, stat_result.st_mtime_ns))
+        return entries
+
+    def _evict_to_limit(self) -> None:
+        entries = self._scan_entries()
+        total_bytes = sum(size for _, size, _ in entries)
+        if total_bytes <= self.max_bytes:
+            return
+        entries.sort(key=lambda entry: entry[2])
+        for entry_path, size, _ in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                entry_path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as unlink_error:
+                logger.warning("태스크 결과 캐시 삭제 실패: %s (%s)", entry_path, unlink_error)
+                continue
+            total_bytes -= size
+            self.evictions += 1
+            logger.info("태스크 결과 캐시 삭제 (LRU): %s", entry_path.name)
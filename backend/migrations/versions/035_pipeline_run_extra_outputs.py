@@ -0,0 +1,48 @@
+"""PipelineRun.extra_output_dataset_ids 추가 — multi-output 파이프라인
+
+Revision ID: 035_pipeline_run_extra_outputs
+Revises: 034_pipeline_version_description
+Create Date: 2026-10-17
+
+배경:
+    PipelineConfig.extra_outputs 로 한 run 이 공통 상류 태스크를 1회만 계산하고
+    여러 출력(같은 DatasetGroup 의 다른 split)을 만들 수 있게 되었다. 기본 출력은
+    기존대로 output_dataset_id (NOT NULL FK) 가 가리키고, 추가 출력의
+    DatasetVersion 은 submit 시점에 미리 만들어 id 를 run 에 기록한다 — Celery
+    태스크가 성공/실패 시 상태를 갱신하고 lineage 엣지를 만들 대상.
+
+변경 내용:
+    - pipeline_runs.extra_output_dataset_ids JSONB NULL — transform_config.extra_outputs
+      순서의 DatasetVersion.id 목록. 백필 없음 (기존 run 은 모두 단일 출력).
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "035_pipeline_run_extra_outputs"
+down_revision: str | None = "034_pipeline_version_description"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pipeline_runs",
+        sa.Column(
+            "extra_output_dataset_ids",
+            postgresql.JSONB(),
+            nullable=True,
+            comment=(
+                "multi-output run 의 추가 출력 DatasetVersion.id 목록"
+                " (transform_config.extra_outputs 순서). 단일 출력 run 은 NULL"
+            ),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "extra_output_dataset_ids")
@@ -0,0 +1,43 @@
+"""PipelineRun.perf_report 추가 — run 성능 보고서 / run 간 비교
+
+Revision ID: 036_pipeline_run_perf_report
+Revises: 035_pipeline_run_extra_outputs
+Create Date: 2026-10-17
+
+배경:
+    executor 가 run 마다 기본 출력 디렉토리에 perf.json (phase / 태스크별 시간, 실체화
+    images/s · MB/s, 변환 횟수, 캐시 hit 비율) 을 남긴다. 같은 PipelineVersion 의 run 끼리
+    느려진 태스크를 찾으려면 출력 디렉토리를 읽지 않고 DB 에서 바로 비교할 수 있어야 한다.
+
+변경 내용:
+    - pipeline_runs.perf_report JSONB NULL — 성공한 run 의 perf.json 내용.
+      백필 없음 (기존 run 은 비교 대상에서 빠진다).
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "036_pipeline_run_perf_report"
+down_revision: str | None = "035_pipeline_run_extra_outputs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pipeline_runs",
+        sa.Column(
+            "perf_report",
+            postgresql.JSONB(),
+            nullable=True,
+            comment="성공한 run 의 성능 보고서 (출력 디렉토리 perf.json 과 같은 내용)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "perf_report")
@@ -0,0 +1,60 @@
+"""PipelineRun.config_hash / reused_from_run_id 추가 — 같은 입력 run 의 출력 재사용
+
+Revision ID: 037_pipeline_run_config_hash
+Revises: 036_pipeline_run_perf_report
+Create Date: 2026-10-17
+
+배경:
+    자동화 / 수동 재제출이 이전 DONE run 과 (pipeline_version_id, resolved_input_versions,
+    transform_config) 가 똑같은 run 을 자주 만든다. 제출 시 정규화 해시로 이전 run 을 찾아
+    worker 를 띄우지 않고 그 출력 DatasetVersion 을 가리키는 REUSED run 으로 대신한다.
+
+변경 내용:
+    - pipeline_runs.config_hash VARCHAR(64) NULL + 인덱스 — 제출 시 계산한 정규화 sha256.
+      백필 없음 (기존 run 은 재사용 대상에서 빠진다).
+    - pipeline_runs.reused_from_run_id UUID NULL — REUSED run 이 가리키는 원래 run.
+    - status 값 REUSED 추가 (VARCHAR 이므로 스키마 변경 없음).
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "037_pipeline_run_config_hash"
+down_revision: str | None = "036_pipeline_run_perf_report"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pipeline_runs",
+        sa.Column(
+            "config_hash",
+            sa.String(64),
+            nullable=True,
+            comment=(
+                "(pipeline_version_id, resolved_input_versions, transform_config) 정규화 sha256 — "
+                "같은 입력의 DONE run 출력 재사용 판정용"
+            ),
+        ),
+    )
+    op.create_index("ix_pipeline_runs_config_hash", "pipeline_runs", ["config_hash"])
+    op.add_column(
+        "pipeline_runs",
+        sa.Column(
+            "reused_from_run_id",
+            postgresql.UUID(as_uuid=False),
+            nullable=True,
+            comment="REUSED run 이 출력을 가리키는 원래 DONE run id (그 외 NULL)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "reused_from_run_id")
+    op.drop_index("ix_pipeline_runs_config_hash", table_name="pipeline_runs")
+    op.drop_column("pipeline_runs", "config_hash")
@@ -0,0 +1,43 @@
+"""PipelineRun.incremental 추가 — resume 시 제출 당시의 증분 실행 여부 유지
+
+Revision ID: 038_pipeline_run_incremental
+Revises: 037_pipeline_run_config_hash
+Create Date: 2026-10-17
+
+배경:
+    incremental 은 run_pipeline Celery 인자로만 전달되고 DB 에 남지 않아, 실패 run 을
+    resume_pipeline 으로 이어서 실행하면 항상 전체 실행 모드로 돌아갔다. 증분으로 제출한
+    run 이 resume 후 이전 출력 재사용 없이 전체 이미지를 다시 실체화하는 문제.
+
+변경 내용:
+    - pipeline_runs.incremental BOOLEAN NOT NULL DEFAULT false — 제출 시 incremental 여부.
+      기존 run 은 false (전체 실행) 로 채워진다.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "038_pipeline_run_incremental"
+down_revision: str | None = "037_pipeline_run_config_hash"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "pipeline_runs",
+        sa.Column(
+            "incremental",
+            sa.Boolean,
+            nullable=False,
+            server_default="false",
+            comment="증분 실행으로 제출됐는지 — resume 시 같은 모드로 이어서 실행",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipeline_runs", "incremental")
@@ -6,16 +6,28 @@ COCO와 YOLO 양쪽으로 동일한 데이터를 표현한다.
 
 통일포맷: 내부 모델은 category_name(문자열)으로 클래스를 식별.
 annotation_format, category_id 필드 없음.
+
+PipelineDagExecutor 통합 테스트 공용: tmp_path 실파일 StorageProtocol(FileStorage),
+소스를 메모리 / SourceDescriptor 로 주는 executor, 더미 이미지 소스(make_source),
+실행 → 출력 읽기 fixture(run_in_memory).
 """
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
 from app.pipeline.pipeline_data_models import Annotation, DatasetMeta, ImageRecord
-
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import (
+    PipelineDagExecutor,
+    PipelineResult,
+    SourceDescriptor,
+    load_source_meta_from_descriptor,
+)
 
 # =============================================================================
 # 장난감 데이터 상수
@@ -304,3 +316,198 @@ def sample_dataset_meta_yolo() -> DatasetMeta:
             ),
         ],
     )
+
+
+# =============================================================================
+# PipelineDagExecutor 통합 테스트 공용
+# =============================================================================
+
+class FileStorage:
+    """tmp_path 아래 실제 디렉토리를 쓰는 StorageProtocol 구현."""
+
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = base_path
+
+    def resolve_path(self, relative_path: str) -> Path:
+        return self.base_path / relative_path
+
+    def exists(self, relative_path: str) -> bool:
+        return self.resolve_path(relative_path).exists()
+
+    def makedirs(self, relative_path: str) -> None:
+        self.resolve_path(relative_path).mkdir(parents=True, exist_ok=True)
+
+    def build_dataset_uri(
+        self, dataset_type: str, name: str, split: str, version: str
+    ) -> str:
+        return f"{dataset_type.lower()}/{name}/{split.lower()}/{version}"
+
+    def get_images_dir(self, storage_uri: str) -> Path:
+        return self.base_path / storage_uri / "images"
+
+    def get_annotations_dir(self, storage_uri: str) -> Path:
+        return self.base_path / storage_uri / "annotations"
+
+
+class InMemorySourceExecutor(PipelineDagExecutor):
+    """소스 DatasetMeta 를 메모리에서 돌려주는 executor. 로드 스레드를 기록한다."""
+
+    def __init__(
+        self,
+        storage: FileStorage,
+        source_metas: dict[str, DatasetMeta],
+        **kwargs,
+    ) -> None:
+        super().__init__(storage, **kwargs)
+        self._source_metas = source_metas
+        self.load_thread_names: list[str] = []
+
+    def _load_source_meta(self, dataset_id: str) -> DatasetMeta:
+        self.load_thread_names.append(threading.current_thread().name)
+        source_meta = self._source_metas[dataset_id]
+        # 실제 로더처럼 매번 새 객체를 돌려준다.
+        return DatasetMeta(
+            dataset_id=source_meta.dataset_id,
+            storage_uri=source_meta.storage_uri,
+            categories=list(source_meta.categories),
+            image_records=[
+                ImageRecord(
+                    image_id=record.image_id,
+                    file_name=record.file_name,
+                    width=record.width,
+                    height=record.height,
+                    annotations=[
+                        Annotation(
+                            annotation_type=ann.annotation_type,
+                            category_name=ann.category_name,
+                            bbox=list(ann.bbox) if ann.bbox else None,
+                        )
+                        for ann in record.annotations
+                    ],
+                )
+                for record in source_meta.image_records
+            ],
+            extra=dict(source_meta.extra),
+        )
+
+
+class DescribedSourceExecutor(PipelineDagExecutor):
+    """SourceDescriptor 로 source 를 파일에서 로드하는 executor (앱의 DB 조회 대신 dict)."""
+
+    def __init__(
+        self,
+        storage: FileStorage,
+        descriptors: dict[str, SourceDescriptor],
+        **kwargs,
+    ) -> None:
+        super().__init__(storage, **kwargs)
+        self._descriptors = descriptors
+
+    def _describe_source(self, dataset_id: str) -> SourceDescriptor:
+        return self._descriptors[dataset_id]
+
+    def _load_source_meta(self, dataset_id: str) -> DatasetMeta:
+        return load_source_meta_from_descriptor(self.storage, self._descriptors[dataset_id])
+
+
+def make_source(
+    storage: FileStorage,
+    dataset_id: str,
+    dataset_name: str,
+    file_names: list[str],
+) -> DatasetMeta:
+    """images/ 에 더미 파일을 만들고, person/car annotation 을 번갈아 가진 소스를 만든다."""
+    storage_uri = f"source/{dataset_name}/train/v1.0.0"
+    images_dir = storage.get_images_dir(storage_uri)
+    images_dir.mkdir(parents=True, exist_ok=True)
+
+    records: list[ImageRecord] = []
+    for idx, file_name in enumerate(file_names, start=1):
+        (images_dir / file_name).write_bytes(f"{dataset_name}:{file_name}".encode())
+        category_name = "person" if idx % 2 else "car"
+        records.append(
+            ImageRecord(
+                image_id=idx,
+                file_name=file_name,
+                width=640,
+                height=480,
+                annotations=[
+                    Annotation(
+                        annotation_type="BBOX",
+                        category_name=category_name,
+                        bbox=[10.0 * idx, 20.0, 30.0, 40.0],
+                    ),
+                ],
+            )
+        )
+    return DatasetMeta(
+        dataset_id=dataset_id,
+        storage_uri=storage_uri,
+        categories=["person", "car"],
+        image_records=records,
+        extra={"dataset_name": dataset_name},
+    )
+
+
+def branch_fusion_config(name: str) -> PipelineConfig:
+    """source 3개 × (filter → remap) 분기가 det_merge_datasets 로 합쳐지는 DAG."""
+    tasks: dict[str, dict] = {}
+    for branch in ("a", "b", "c"):
+        tasks[f"keep_{branch}"] = {
+            "operator": "det_filter_keep_images_containing_class_name",
+            "inputs": [f"source:dataset_version:ds-{branch}"],
+            "params": {"class_names": ["person"]},
+        }
+        tasks[f"remap_{branch}"] = {
+            "operator": "det_remap_class_name",
+            "inputs": [f"keep_{branch}"],
+            "params": {"mapping": {"person": f"person_{branch}"}},
+        }
+    tasks["merge"] = {
+        "operator": "det_merge_datasets",
+        "inputs": ["remap_a", "remap_b", "remap_c"],
+        "params": {},
+    }
+    return PipelineConfig(
+        name=name,
+        output={"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"},
+        tasks=tasks,
+    )
+
+
+def read_output_coco(storage: FileStorage, output_storage_uri: str) -> dict:
+    """COCO 출력의 instances.json dict."""
+    output_dir = storage.resolve_path(output_storage_uri)
+    with open(output_dir / "annotations" / "instances.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_output(storage: FileStorage, output_storage_uri: str) -> tuple[dict, dict[str, Path]]:
+    """COCO 출력의 (instances.json dict, {이미지 파일명: 경로}). 경로는 파일명 순."""
+    images_dir = storage.get_images_dir(output_storage_uri)
+    images = (
+        {path.name: path for path in sorted(images_dir.iterdir())} if images_dir.is_dir() else {}
+    )
+    return read_output_coco(storage, output_storage_uri), images
+
+
+RunInMemory = Callable[..., tuple[PipelineResult, dict, dict[str, Path]]]
+
+
+@pytest.fixture
+def run_in_memory() -> RunInMemory:
+    """
+    InMemorySourceExecutor(storage, source_metas, **executor_kwargs).run(config) 후
+    (PipelineResult, instances.json dict, {이미지 파일명: 경로}) 를 돌려주는 함수.
+    """
+    def _run(
+        storage: FileStorage,
+        source_metas: dict[str, DatasetMeta],
+        config: PipelineConfig,
+        **executor_kwargs,
+    ) -> tuple[PipelineResult, dict, dict[str, Path]]:
+        result = InMemorySourceExecutor(storage, source_metas, **executor_kwargs).run(config)
+        coco, images = read_output(storage, result.output_storage_uri)
+        return result, coco, images
+
+    return _run
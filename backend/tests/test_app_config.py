@@ -0,0 +1,96 @@
+"""
+config.ini [pipeline] executor 설정 테스트.
+
+테스트 영역:
+  1. AppConfig.pipeline_executor_options — [pipeline] 값 읽기, MB → byte 변환, 0 → None
+  2. PipelineExecutorOptions.to_executor_kwargs — PipelineDagExecutor 생성자에 그대로 전달
+"""
+from __future__ import annotations
+
+import configparser
+from pathlib import Path
+
+from app.core.config import AppConfig, PipelineExecutorOptions
+from lib.pipeline.dag_executor import PipelineDagExecutor
+from tests.conftest import FileStorage
+
+
+def _app_config(pipeline_section: dict[str, str]) -> AppConfig:
+    """주어진 [pipeline] 값만 가진 AppConfig (config.ini 파일 대신)."""
+    app_config = AppConfig()
+    ini = configparser.ConfigParser()
+    ini.read_dict({"pipeline": pipeline_section})
+    app_config._ini = ini
+    return app_config
+
+
+# ─────────────────────────────────────────────────────────────────
+# AppConfig.pipeline_executor_options
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPipelineExecutorOptions:
+    def test_reads_pipeline_section(self) -> None:
+        options = _app_config({
+            "execution_mode": "thread",
+            "max_workers": "3",
+            "stream_records": "true",
+            "spill_dir": "/tmp/spill",
+            "materialize_io_workers": "8",
+            "materialize_transform_pool": "thread",
+            "materialize_link_strategy": "hardlink",
+            "materialize_buffer_mb": "16",
+            "processing_log_max_mb": "2",
+            "clone_passthrough": "false",
+        }).pipeline_executor_options
+
+        assert options.execution_mode == "thread"
+        assert options.max_workers == 3
+        assert options.stream_records is True
+        assert options.spill_dir == "/tmp/spill"
+        assert options.materialize_io_workers == 8
+        assert options.materialize_transform_pool == "thread"
+        assert options.materialize_link_strategy == "hardlink"
+        assert options.materialize_buffer_bytes == 16 * 1024 * 1024
+        assert options.processing_log_max_bytes == 2 * 1024 * 1024
+        assert options.clone_passthrough is False
+
+    def test_defaults_when_section_empty(self) -> None:
+        options = _app_config({}).pipeline_executor_options
+
+        assert options.execution_mode == "serial"
+        assert options.max_workers is None
+        assert options.spill_dir is None
+        assert options.checkpoint is False
+        assert options.index_source_images is True
+        assert options.materialize_transform_workers == 1
+
+    def test_zero_workers_means_default_pool(self) -> None:
+        options = _app_config({
+            "max_workers": "0",
+            "materialize_transform_workers": "0",
+        }).pipeline_executor_options
+
+        assert options.max_workers is None
+        assert options.materialize_transform_workers is None
+
+
+# ─────────────────────────────────────────────────────────────────
+# PipelineExecutorOptions.to_executor_kwargs
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestToExecutorKwargs:
+    def test_kwargs_build_executor(self, tmp_path: Path) -> None:
+        options: PipelineExecutorOptions = _app_config({
+            "execution_mode": "thread",
+            "source_load_workers": "2",
+            "materialize_buffer_mb": "4",
+        }).pipeline_executor_options
+
+        executor = PipelineDagExecutor(FileStorage(tmp_path), **options.to_executor_kwargs())
+
+        assert executor.execution_mode == "thread"
+        assert executor.source_load_workers == 2
+        assert executor.materialize_buffer_bytes == 4 * 1024 * 1024
+        assert executor.processing_log_max_bytes == options.processing_log_max_bytes
@@ -0,0 +1,159 @@
+"""
+DatasetMeta copy-on-write 규약 테스트.
+
+테스트 영역:
+  1. derive_dataset_meta — 컨테이너는 새로, 레코드는 공유
+  2. 각 manipulator 가 입력 DatasetMeta 를 변경하지 않음
+  3. 변경 없는 레코드는 입력과 같은 객체를 공유 (메모리/CPU 가 변경 레코드 수에 비례)
+"""
+from __future__ import annotations
+
+import copy
+
+import pytest
+
+from lib.manipulators import MANIPULATOR_REGISTRY
+from lib.pipeline.pipeline_data_models import (
+    Annotation,
+    DatasetMeta,
+    HeadSchema,
+    ImageRecord,
+    derive_dataset_meta,
+)
+
+
+def _detection_meta() -> DatasetMeta:
+    """person 이미지 2장 + car 이미지 2장. 일부는 이전 단계 spec 을 가진다."""
+    records = []
+    for idx, category_name in enumerate(["person", "car", "person", "car"], start=1):
+        records.append(
+            ImageRecord(
+                image_id=idx,
+                file_name=f"{idx:03d}.jpg",
+                width=640,
+                height=480,
+                annotations=[
+                    Annotation(
+                        annotation_type="BBOX",
+                        category_name=category_name,
+                        bbox=[10.0, 20.0, 30.0, 40.0],
+                        extra={"area": 1200.0},
+                    ),
+                ],
+                extra={"image_manipulation_specs": [{"operation": "mask_region", "params": {}}]}
+                if idx == 1 else {},
+            )
+        )
+    return DatasetMeta(
+        dataset_id="ds",
+        storage_uri="source/x/train/v1.0.0",
+        categories=["person", "car"],
+        image_records=records,
+        extra={"dataset_name": "x"},
+    )
+
+
+def _classification_meta() -> DatasetMeta:
+    return DatasetMeta(
+        dataset_id="cls",
+        storage_uri="source/cls/train/v1.0.0",
+        categories=[],
+        image_records=[
+            ImageRecord(
+                image_id=idx,
+                file_name=f"images/{idx:03d}.jpg",
+                width=100,
+                height=200,
+                labels={"color": ["red"]},
+            )
+            for idx in range(1, 5)
+        ],
+        head_schema=[HeadSchema(name="color", multi_label=False, classes=["red", "blue"])],
+    )
+
+
+# (operator, params, 변경 없이 출력과 공유돼야 하는 입력 레코드 index)
+_DETECTION_CASES = [
+    ("det_filter_keep_images_containing_class_name", {"class_names": ["person"]}, [0, 2]),
+    ("det_filter_remove_images_containing_class_name", {"class_names": ["car"]}, [0, 2]),
+    ("det_filter_remain_selected_class_names_only_in_annotation",
+     {"keep_class_names": ["person"]}, [0, 2]),
+    ("det_remap_class_name", {"mapping": {"car": "vehicle"}}, [0, 2]),
+    ("det_mask_region_by_class", {"class_names": "car", "fill_color": "black"}, [0, 2]),
+    ("det_sample_n_images", {"n": 10}, [0, 1, 2, 3]),
+    ("det_format_convert_to_yolo", {}, [0, 1, 2, 3]),
+    ("det_rotate_image", {"degrees": 90}, []),
+]
+
+_CLASSIFICATION_CASES = [
+    ("cls_sample_n_images", {"n": 2, "seed": 1}),
+    ("cls_rotate_image", {"degrees": 90}),
+    ("cls_crop_image", {"direction": "상단", "crop_pct": 30}),
+]
+
+
+class TestDeriveDatasetMeta:
+
+    def test_containers_are_new_records_shared(self):
+        meta = _detection_meta()
+        derived = derive_dataset_meta(meta)
+
+        assert derived == meta
+        assert derived is not meta
+        assert derived.image_records is not meta.image_records
+        assert derived.categories is not meta.categories
+        assert derived.extra is not meta.extra
+        assert all(a is b for a, b in zip(derived.image_records, meta.image_records, strict=True))
+
+    def test_changes_override_fields(self):
+        meta = _detection_meta()
+        derived = derive_dataset_meta(meta, categories=["person"])
+
+        assert derived.categories == ["person"]
+        assert meta.categories == ["person", "car"]
+
+
+class TestManipulatorsDoNotMutateInput:
+
+    @pytest.mark.parametrize("operator_name, params, shared_indices", _DETECTION_CASES)
+    def test_detection(self, operator_name, params, shared_indices):
+        input_meta = _detection_meta()
+        snapshot = copy.deepcopy(input_meta)
+
+        output_meta = MANIPULATOR_REGISTRY[operator_name]().transform_annotation(
+            input_meta, params,
+        )
+
+        assert input_meta == snapshot
+        assert output_meta is not input_meta
+        output_record_ids = {id(record) for record in output_meta.image_records}
+        for index in shared_indices:
+            assert id(input_meta.image_records[index]) in output_record_ids
+
+    @pytest.mark.parametrize("operator_name, params", _CLASSIFICATION_CASES)
+    def test_classification(self, operator_name, params):
+        input_meta = _classification_meta()
+        snapshot = copy.deepcopy(input_meta)
+
+        output_meta = MANIPULATOR_REGISTRY[operator_name]().transform_annotation(
+            input_meta, params,
+        )
+
+        assert input_meta == snapshot
+        assert output_meta is not input_meta
+
+    def test_rotate_appends_spec_without_touching_input(self):
+        input_meta = _detection_meta()
+        output_meta = MANIPULATOR_REGISTRY["det_rotate_image"]().transform_annotation(
+            input_meta, {"degrees": 90},
+        )
+
+        assert output_meta.image_records[0].extra["image_manipulation_specs"] == [
+            {"operation": "mask_region", "params": {}},
+            {"operation": "rotate_image", "params": {"degrees": 90}},
+        ]
+        assert input_meta.image_records[0].extra["image_manipulation_specs"] == [
+            {"operation": "mask_region", "params": {}},
+        ]
+        output_record = output_meta.image_records[0]
+        assert (output_record.width, output_record.height) == (480, 640)
@@ -0,0 +1,207 @@
+"""
+비용 추정 (dry-run) 테스트.
+
+테스트 영역:
+  1. estimate_dataset_plan — 이미지 수 / 바이트 / 변환 수 / 소스 없는 이미지
+  2. PipelineDagExecutor.estimate — 이미지를 쓰지 않음, 실제 run 과 같은 이미지 수 / 바이트,
+     multi-output / passthrough, 표본 추출 후 비율 확대
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.cost_estimate import FileSizeIndex, estimate_dataset_plan
+from lib.pipeline.image_materializer import ImageMaterializer
+from lib.pipeline.pipeline_data_models import (
+    DatasetMeta,
+    DatasetPlan,
+    ImageManipulationSpec,
+    ImagePlan,
+)
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+_REMOVE_CAR = {
+    "operator": "det_filter_remove_images_containing_class_name",
+    "inputs": ["source:dataset_version:ds-a"],
+    "params": {"class_names": ["car"]},
+}
+
+
+def _filter_config(name: str) -> PipelineConfig:
+    """ds-a → remove_car (복사만)"""
+    return PipelineConfig.model_validate({
+        "name": name,
+        "output": _OUTPUT,
+        "tasks": {"remove_car": _REMOVE_CAR},
+    })
+
+
+def _rotate_config(name: str, **extra) -> PipelineConfig:
+    """ds-a → remove_car → rotate"""
+    return PipelineConfig.model_validate({
+        "name": name,
+        "output": _OUTPUT,
+        "tasks": {
+            "remove_car": _REMOVE_CAR,
+            "rotate": {
+                "operator": "det_rotate_image",
+                "inputs": ["remove_car"],
+                "params": {"degrees": 90},
+            },
+        },
+        **extra,
+    })
+
+
+@pytest.fixture
+def source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_metas = {
+        "ds-a": make_source(
+            storage, "ds-a", "alpha", [f"{idx:03d}.jpg" for idx in range(1, 41)],
+        ),
+    }
+    return storage, source_metas
+
+
+def _image_bytes(storage: FileStorage, storage_uri: str) -> int:
+    images_dir = storage.get_images_dir(storage_uri)
+    return sum(path.stat().st_size for path in images_dir.iterdir())
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. estimate_dataset_plan
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestEstimateDatasetPlan:
+
+    def test_counts_bytes_and_transforms(self, tmp_path: Path):
+        storage = FileStorage(tmp_path)
+        images_dir = storage.get_images_dir("src")
+        images_dir.mkdir(parents=True)
+        (images_dir / "a.jpg").write_bytes(b"x" * 10)
+        (images_dir / "b.jpg").write_bytes(b"x" * 20)
+        rotate = ImageManipulationSpec(operation="rotate_image", params={"degrees": 90})
+        mask = ImageManipulationSpec(operation="mask_region", params={})
+        dataset_plan = DatasetPlan(
+            output_meta=DatasetMeta(dataset_id="out", storage_uri="out"),
+            image_plans=[
+                ImagePlan(src_uri="src/images/a.jpg", dst_uri="out/images/a.jpg"),
+                ImagePlan(
+                    src_uri="src/images/b.jpg", dst_uri="out/images/b.jpg", specs=[rotate, mask],
+                ),
+                ImagePlan(src_uri="src/images/c.jpg", dst_uri="out/images/c.jpg", specs=[rotate]),
+            ],
+        )
+
+        estimate = estimate_dataset_plan(storage, dataset_plan, "TRAIN", FileSizeIndex())
+
+        assert estimate.image_count == 3
+        assert estimate.copy_only_count == 1
+        assert estimate.transform_count == 1
+        assert estimate.transform_operations == {"rotate_image": 1, "mask_region": 1}
+        assert estimate.bytes_to_copy == 30
+        assert estimate.missing_image_count == 1
+
+    def test_scale(self, tmp_path: Path):
+        storage = FileStorage(tmp_path)
+        images_dir = storage.get_images_dir("src")
+        images_dir.mkdir(parents=True)
+        (images_dir / "a.jpg").write_bytes(b"x" * 10)
+        dataset_plan = DatasetPlan(
+            output_meta=DatasetMeta(dataset_id="out", storage_uri="out"),
+            image_plans=[ImagePlan(src_uri="src/images/a.jpg", dst_uri="out/images/a.jpg")],
+        )
+
+        estimate = estimate_dataset_plan(storage, dataset_plan, "TRAIN", FileSizeIndex(), 4.0)
+
+        assert (estimate.image_count, estimate.bytes_to_copy) == (4, 40)
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. PipelineDagExecutor.estimate
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorEstimate:
+
+    def test_matches_real_run_without_writing(self, source_storage, monkeypatch):
+        storage, source_metas = source_storage
+        config = _filter_config("est")
+        materialize_calls: list[str] = []
+        original = ImageMaterializer.materialize
+
+        def _materialize(self, dataset_plan):
+            materialize_calls.append(dataset_plan.output_meta.dataset_id)
+            return original(self, dataset_plan)
+
+        monkeypatch.setattr(ImageMaterializer, "materialize", _materialize)
+
+        estimate = InMemorySourceExecutor(storage, source_metas).estimate(
+            config, target_version="1.0",
+        )
+
+        assert materialize_calls == []
+        assert not storage.resolve_path("fusion/est/train/1.0").exists()
+        result = InMemorySourceExecutor(storage, source_metas).run(config, target_version="1.0")
+        assert not estimate.is_sampled
+        assert estimate.total_images == result.image_count == 20
+        assert estimate.total_transforms == 0
+        assert estimate.total_bytes == _image_bytes(storage, result.output_storage_uri)
+
+    def test_counts_accumulated_transforms(self, source_storage):
+        storage, source_metas = source_storage
+
+        estimate = InMemorySourceExecutor(storage, source_metas).estimate(_rotate_config("est"))
+
+        assert estimate.total_transforms == 20
+        assert estimate.outputs[0].transform_operations == {"rotate_image": 20}
+
+    def test_multi_output(self, source_storage):
+        storage, source_metas = source_storage
+        config = _rotate_config("est_multi", extra_outputs=[
+            {
+                "terminal_task": "remove_car",
+                "output": {**_OUTPUT, "split": "VAL"},
+            },
+        ])
+
+        estimate = InMemorySourceExecutor(storage, source_metas).estimate(config)
+
+        assert [output.output_split for output in estimate.outputs] == ["TRAIN", "VAL"]
+        assert [output.transform_count for output in estimate.outputs] == [20, 0]
+        assert estimate.total_images == 40
+
+    def test_passthrough(self, source_storage):
+        storage, source_metas = source_storage
+        config = PipelineConfig.model_validate({
+            "name": "est_pass",
+            "output": _OUTPUT,
+            "tasks": {},
+            "passthrough_source_split_id": "split-a",
+            "passthrough_source_dataset_id": "ds-a",
+        })
+
+        estimate = InMemorySourceExecutor(storage, source_metas).estimate(config)
+
+        assert estimate.total_images == 40
+        assert estimate.total_transforms == 0
+
+    def test_sampled_estimate_scaled(self, source_storage):
+        storage, source_metas = source_storage
+
+        estimate = InMemorySourceExecutor(storage, source_metas).estimate(
+            _rotate_config("est_sample"), max_source_images=10,
+        )
+
+        assert estimate.is_sampled
+        assert (estimate.source_image_count, estimate.sampled_source_image_count) == (40, 10)
+        # 4장 간격 표본 (001, 005, ...) 은 모두 person 이미지 → 40장으로 확대
+        assert estimate.total_images == 40
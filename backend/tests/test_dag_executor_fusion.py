@@ -0,0 +1,249 @@
+"""
+PipelineDagExecutor operator fusion (per-record manipulator 체인 1회 순회) 테스트.
+
+테스트 영역:
+  1. 체인 탐지 — 단일 입력·단일 소비자 구간만 묶고, 분기점/merge/비대상 operator 에서 끊음
+  2. fused 계산 결과가 manipulator 를 하나씩 적용한 결과와 동일
+  3. 실행 모드별 fused / unfused 출력 동일
+  4. 체인 구성 태스크마다 RUNNING/DONE 콜백과 input/output 이미지 수 보고
+"""
+from __future__ import annotations
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from lib.manipulators import MANIPULATOR_REGISTRY
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import PipelineDagExecutor
+from tests.conftest import FileStorage, InMemorySourceExecutor, branch_fusion_config, make_source
+from tests.test_copy_on_write import _classification_meta, _detection_meta
+
+# keep → remap → remain_selected → mask → rotate (모두 per-record)
+_DETECTION_CHAIN = [
+    ("det_filter_keep_images_containing_class_name", {"class_names": ["person", "car"]}),
+    ("det_remap_class_name", {"mapping": {"car": "vehicle"}}),
+    ("det_filter_remain_selected_class_names_only_in_annotation",
+     {"keep_class_names": ["vehicle"]}),
+    ("det_mask_region_by_class", {"class_names": "vehicle", "fill_color": "white"}),
+    ("det_rotate_image", {"degrees": 90}),
+    ("det_format_convert_to_coco", {}),
+]
+
+_CLASSIFICATION_CHAIN = [
+    ("cls_rotate_image", {"degrees": 90}),
+    ("cls_crop_image", {"direction": "하단", "crop_pct": 20}),
+]
+
+
+def _linear_chain_config(name: str) -> PipelineConfig:
+    """source → keep → remap → remain_selected → convert (annotation 만 바꾸는 선형 체인)."""
+    return PipelineConfig(
+        name=name,
+        output={"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"},
+        tasks={
+            "keep": {
+                "operator": "det_filter_keep_images_containing_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"class_names": ["person"]},
+            },
+            "remap": {
+                "operator": "det_remap_class_name",
+                "inputs": ["keep"],
+                "params": {"mapping": {"person": "pedestrian"}},
+            },
+            "remain": {
+                "operator": "det_filter_remain_selected_class_names_only_in_annotation",
+                "inputs": ["remap"],
+                "params": {"keep_class_names": ["pedestrian"]},
+            },
+            "convert": {
+                "operator": "det_format_convert_to_coco",
+                "inputs": ["remain"],
+                "params": {},
+            },
+        },
+    )
+
+
+def _apply_one_by_one(steps, input_meta):
+    meta = input_meta
+    for operator_name, params in steps:
+        meta = MANIPULATOR_REGISTRY[operator_name]().transform_annotation(meta, params)
+    return meta
+
+
+@pytest.fixture
+def single_source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(
+            storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg", "004.jpg", "005.jpg"],
+        ),
+    }
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 체인 탐지
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPlanFusedChains:
+
+    def test_linear_chain_is_one_chain(self, tmp_path: Path):
+        executor = PipelineDagExecutor(FileStorage(tmp_path))
+        chains = executor._plan_fused_chains(_linear_chain_config("plan_linear"))
+
+        assert chains == {"keep": ["keep", "remap", "remain", "convert"]}
+
+    def test_chain_stops_before_merge(self, tmp_path: Path):
+        executor = PipelineDagExecutor(FileStorage(tmp_path))
+        chains = executor._plan_fused_chains(branch_fusion_config("plan_branch"))
+
+        assert chains == {
+            "keep_a": ["keep_a", "remap_a"],
+            "keep_b": ["keep_b", "remap_b"],
+            "keep_c": ["keep_c", "remap_c"],
+        }
+
+    def test_branch_point_is_not_fused(self, tmp_path: Path):
+        """중간 결과를 두 태스크가 소비하면 그 태스크 뒤에서 체인을 끊는다."""
+        config = PipelineConfig(
+            name="plan_fanout",
+            output={"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"},
+            tasks={
+                "keep": {
+                    "operator": "det_filter_keep_images_containing_class_name",
+                    "inputs": ["source:dataset_version:ds-a"],
+                    "params": {"class_names": ["person"]},
+                },
+                "remap_x": {
+                    "operator": "det_remap_class_name",
+                    "inputs": ["keep"],
+                    "params": {"mapping": {"person": "x"}},
+                },
+                "remap_y": {
+                    "operator": "det_remap_class_name",
+                    "inputs": ["keep"],
+                    "params": {"mapping": {"person": "y"}},
+                },
+                "merge": {
+                    "operator": "det_merge_datasets",
+                    "inputs": ["remap_x", "remap_y"],
+                    "params": {},
+                },
+            },
+        )
+        executor = PipelineDagExecutor(FileStorage(tmp_path))
+
+        assert executor._plan_fused_chains(config) == {}
+
+    def test_sampling_breaks_chain(self, tmp_path: Path):
+        config = _linear_chain_config("plan_sample")
+        config.tasks["remap"].operator = "det_sample_n_images"
+        config.tasks["remap"].params = {"n": 2}
+        executor = PipelineDagExecutor(FileStorage(tmp_path))
+
+        assert executor._plan_fused_chains(config) == {"remain": ["remain", "convert"]}
+
+    def test_disabled(self, tmp_path: Path):
+        executor = PipelineDagExecutor(FileStorage(tmp_path), fuse_record_operators=False)
+
+        assert executor._plan_fused_chains(_linear_chain_config("plan_off")) == {}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. fused 계산 == 단계별 적용
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestFusedChainOutput:
+
+    @pytest.mark.parametrize(
+        "steps, meta_factory",
+        [(_DETECTION_CHAIN, _detection_meta), (_CLASSIFICATION_CHAIN, _classification_meta)],
+        ids=["detection", "classification"],
+    )
+    def test_matches_one_by_one(self, tmp_path: Path, steps, meta_factory):
+        input_meta = meta_factory()
+        snapshot = copy.deepcopy(input_meta)
+        executor = PipelineDagExecutor(FileStorage(tmp_path))
+
+        fused_meta, step_stats = executor._compute_fused_chain_output(steps, input_meta)
+
+        assert fused_meta == _apply_one_by_one(steps, meta_factory())
+        assert input_meta == snapshot
+        assert len(step_stats) == len(steps)
+
+    def test_step_stats_follow_dropped_records(self, tmp_path: Path):
+        steps = [
+            ("det_filter_keep_images_containing_class_name", {"class_names": ["person"]}),
+            ("det_remap_class_name", {"mapping": {"person": "pedestrian"}}),
+            ("det_filter_remove_images_containing_class_name", {"class_names": ["pedestrian"]}),
+            ("det_format_convert_to_yolo", {}),
+        ]
+        executor = PipelineDagExecutor(FileStorage(tmp_path))
+
+        fused_meta, step_stats = executor._compute_fused_chain_output(steps, _detection_meta())
+
+        assert fused_meta.image_records == []
+        assert [(s.input_images, s.output_images) for s in step_stats] == [
+            (4, 2), (2, 2), (2, 0), (0, 0),
+        ]
+        assert step_stats[1].category_count == 2
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3~4. 실행 경로
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestFusedExecution:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    def test_same_output_as_unfused(self, single_source_storage, run_in_memory, execution_mode):
+        storage, source_metas = single_source_storage
+
+        _, fused_coco, fused_images = run_in_memory(
+            storage, source_metas, _linear_chain_config(f"fused_{execution_mode}"),
+            execution_mode=execution_mode,
+        )
+        _, unfused_coco, unfused_images = run_in_memory(
+            storage, source_metas, _linear_chain_config(f"unfused_{execution_mode}"),
+            execution_mode=execution_mode, fuse_record_operators=False,
+        )
+
+        assert fused_coco["images"] == unfused_coco["images"]
+        assert fused_coco["annotations"] == unfused_coco["annotations"]
+        assert fused_coco["categories"] == unfused_coco["categories"]
+        assert list(fused_images) == list(unfused_images) == ["001.jpg", "003.jpg", "005.jpg"]
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    def test_progress_reported_per_task(self, single_source_storage, execution_mode):
+        storage, source_metas = single_source_storage
+        events: list[tuple[str, str, dict]] = []
+
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        )
+        config = _linear_chain_config(f"progress_{execution_mode}")
+        executor.run(config)
+
+        for task_name in config.tasks:
+            statuses = [status for name, status, _ in events if name == task_name]
+            assert statuses == ["PENDING", "RUNNING", "DONE"], task_name
+
+        done_counts = {
+            name: (detail["input_images"], detail["output_images"])
+            for name, status, detail in events
+            if status == "DONE" and name in config.tasks
+        }
+        assert done_counts == {
+            "keep": (5, 3),
+            "remap": (3, 3),
+            "remain": (3, 3),
+            "convert": (3, 3),
+        }
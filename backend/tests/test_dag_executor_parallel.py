@@ -0,0 +1,152 @@
+"""
+PipelineDagExecutor 병렬 실행 (execution_mode) 통합 테스트.
+
+테스트 영역:
+  1. serial / thread / process 모드의 출력(annotation + 이미지)이 동일
+  2. 병렬 모드에서도 태스크 진행 콜백(PENDING → RUNNING → DONE)이 모든 태스크에 전달
+  3. 병렬 level 의 태스크가 실패하면 예외가 그대로 전파
+  4. 잘못된 execution_mode 거부
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.dag_executor import PipelineDagExecutor
+from lib.pipeline.pipeline_data_models import DatasetMeta
+from tests.conftest import (
+    FileStorage,
+    InMemorySourceExecutor,
+    RunInMemory,
+    branch_fusion_config,
+    make_source,
+)
+
+
+@pytest.fixture
+def fusion_storage(tmp_path: Path) -> tuple[FileStorage, dict[str, DatasetMeta]]:
+    storage = FileStorage(tmp_path)
+    # 파일명 일부가 소스 간 충돌 → merge rename 경로도 함께 검증
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["001.jpg", "010.jpg", "011.jpg"]),
+        "ds-c": make_source(storage, "ds-c", "gamma", ["020.jpg", "003.jpg", "021.jpg"]),
+    }
+    return storage, source_metas
+
+
+def _run_and_snapshot(
+    run_in_memory: RunInMemory,
+    storage: FileStorage,
+    source_metas: dict[str, DatasetMeta],
+    execution_mode: str,
+) -> tuple[dict, dict[str, bytes]]:
+    """모드별로 실행하고 (instances.json, {이미지 파일명: 내용}) 스냅샷을 반환한다."""
+    _, coco, images = run_in_memory(
+        storage, source_metas, branch_fusion_config(f"fusion_{execution_mode}"),
+        execution_mode=execution_mode, max_workers=3,
+    )
+    return coco, {name: path.read_bytes() for name, path in images.items()}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 모드별 출력 동일성
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestParallelOutputIdentical:
+    """병렬 실행 결과가 직렬 실행과 동일해야 한다."""
+
+    @pytest.mark.parametrize("execution_mode", ["thread", "process"])
+    def test_same_output_as_serial(self, fusion_storage, run_in_memory, execution_mode):
+        storage, source_metas = fusion_storage
+
+        serial_coco, serial_images = _run_and_snapshot(
+            run_in_memory, storage, source_metas, "serial",
+        )
+        parallel_coco, parallel_images = _run_and_snapshot(
+            run_in_memory, storage, source_metas, execution_mode,
+        )
+
+        assert parallel_coco["images"] == serial_coco["images"]
+        assert parallel_coco["annotations"] == serial_coco["annotations"]
+        assert parallel_coco["categories"] == serial_coco["categories"]
+        assert parallel_images == serial_images
+        # person 만 유지 → 소스당 2장, 총 6장
+        assert len(serial_images) == 6
+
+    def test_sources_loaded_on_calling_thread(self, fusion_storage):
+        """source 로드는 DB 세션 안전을 위해 항상 run() 호출 스레드에서 수행."""
+        storage, source_metas = fusion_storage
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode="thread", max_workers=3,
+        )
+        executor.run(branch_fusion_config("fusion_thread_loader"))
+
+        assert len(executor.load_thread_names) == 3
+        assert set(executor.load_thread_names) == {threading.current_thread().name}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 진행 콜백
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestParallelProgressCallback:
+    """병렬 모드의 on_task_progress 동작."""
+
+    def test_every_task_reaches_done(self, fusion_storage):
+        storage, source_metas = fusion_storage
+        events: list[tuple[str, str, dict]] = []
+        callback_threads: set[str] = set()
+
+        def _on_progress(task_name: str, status: str, detail: dict) -> None:
+            callback_threads.add(threading.current_thread().name)
+            events.append((task_name, status, detail))
+
+        executor = InMemorySourceExecutor(
+            storage, source_metas,
+            execution_mode="thread", max_workers=3,
+            on_task_progress=_on_progress,
+        )
+        config = branch_fusion_config("fusion_progress")
+        executor.run(config)
+
+        for task_name in config.tasks:
+            statuses = [status for name, status, _ in events if name == task_name]
+            assert statuses == ["PENDING", "RUNNING", "DONE"], task_name
+
+        done_detail = next(
+            detail for name, status, detail in events
+            if name == "keep_a" and status == "DONE"
+        )
+        assert done_detail["input_images"] == 3
+        assert done_detail["output_images"] == 2
+        assert callback_threads == {threading.current_thread().name}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. 실패 전파 / 설정 검증
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestParallelFailure:
+    """병렬 level 실패 처리."""
+
+    def test_task_error_propagates(self, fusion_storage):
+        storage, source_metas = fusion_storage
+        config = branch_fusion_config("fusion_failure")
+        # remap_b 에 빈 mapping → ValueError
+        config.tasks["remap_b"].params = {"mapping": {}}
+
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode="thread", max_workers=3,
+        )
+        with pytest.raises(ValueError, match="mapping"):
+            executor.run(config)
+
+    def test_invalid_execution_mode_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="execution_mode"):
+            PipelineDagExecutor(FileStorage(tmp_path), execution_mode="gpu")  # type: ignore[arg-type]
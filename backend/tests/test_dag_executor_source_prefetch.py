@@ -0,0 +1,185 @@
+"""
+PipelineDagExecutor source 선행 로드(prefetch) + run 단위 memoization 테스트.
+
+테스트 영역:
+  1. 같은 source 를 여러 태스크가 참조해도 run 당 1회만 로드
+  2. 소비 태스크끼리 source 를 공유해도 한 분기의 변경이 다른 분기에 보이지 않음
+  3. _describe_source 구현 시 파싱은 source-load thread pool, 조회는 호출 스레드
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+import lib.pipeline.dag_executor as dag_executor_module
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import PipelineDagExecutor, SourceDescriptor
+from lib.pipeline.io.coco_io import write_coco_json
+from lib.pipeline.pipeline_data_models import DatasetMeta
+from tests.conftest import (
+    FileStorage,
+    InMemorySourceExecutor,
+    branch_fusion_config,
+    make_source,
+    read_output_coco,
+)
+
+
+def _shared_source_config(name: str) -> PipelineConfig:
+    """ds-a 를 remap 분기와 keep 분기가 동시에 참조한 뒤 merge 하는 DAG."""
+    return PipelineConfig(
+        name=name,
+        output={"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"},
+        tasks={
+            "remap_a": {
+                "operator": "det_remap_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"mapping": {"person": "pedestrian"}},
+            },
+            "keep_a": {
+                "operator": "det_filter_keep_images_containing_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"class_names": ["person"]},
+            },
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["remap_a", "keep_a"],
+                "params": {},
+            },
+        },
+    )
+
+
+class _DescriptorSourceExecutor(PipelineDagExecutor):
+    """source 를 COCO 파일로 두고 _describe_source 만 구현한 executor."""
+
+    def __init__(
+        self, storage: FileStorage, source_metas: dict[str, DatasetMeta], **kwargs,
+    ) -> None:
+        super().__init__(storage, **kwargs)
+        self.describe_thread_names: list[str] = []
+        for source_meta in source_metas.values():
+            annotations_dir = storage.get_annotations_dir(source_meta.storage_uri)
+            annotations_dir.mkdir(parents=True, exist_ok=True)
+            write_coco_json(source_meta, annotations_dir / "instances.json")
+        self._source_metas = source_metas
+
+    def _describe_source(self, dataset_id: str) -> SourceDescriptor:
+        self.describe_thread_names.append(threading.current_thread().name)
+        source_meta = self._source_metas[dataset_id]
+        return SourceDescriptor(
+            dataset_id=dataset_id,
+            storage_uri=source_meta.storage_uri,
+            annotation_format="COCO",
+            annotation_files=["instances.json"],
+            extra=dict(source_meta.extra),
+        )
+
+
+@pytest.fixture
+def fusion_storage(tmp_path: Path) -> tuple[FileStorage, dict[str, DatasetMeta]]:
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["001.jpg", "010.jpg", "011.jpg"]),
+        "ds-c": make_source(storage, "ds-c", "gamma", ["020.jpg", "003.jpg", "021.jpg"]),
+    }
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1~2. run 단위 memoization / 소비자 격리
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestSourceMemoization:
+    """같은 source 를 참조하는 여러 태스크."""
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    def test_shared_source_loaded_once(self, fusion_storage, execution_mode):
+        storage, source_metas = fusion_storage
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode, max_workers=2,
+        )
+        executor.run(_shared_source_config(f"shared_{execution_mode}"))
+
+        assert len(executor.load_thread_names) == 1
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    def test_consumers_are_isolated(self, fusion_storage, execution_mode):
+        """remap 분기의 변경이 keep 분기 입력에 새면 keep 결과가 0장이 된다."""
+        storage, source_metas = fusion_storage
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode, max_workers=2,
+        )
+        result = executor.run(_shared_source_config(f"isolated_{execution_mode}"))
+
+        coco = read_output_coco(storage, result.output_storage_uri)
+        category_names = {category["name"] for category in coco["categories"]}
+        assert category_names == {"pedestrian", "car", "person"}
+        # remap 분기 3장 + keep 분기 2장 (person 포함 이미지)
+        assert len(coco["images"]) == 5
+        # 원본 테스트 데이터는 건드리지 않는다
+        assert source_metas["ds-a"].image_records[0].annotations[0].category_name == "person"
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. descriptor 기반 병렬 파싱
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestDescriptorPrefetch:
+    """_describe_source 구현 시 파싱은 pool 에서 동시에 수행."""
+
+    def test_parse_runs_in_pool_and_matches_in_memory(self, fusion_storage, monkeypatch):
+        storage, source_metas = fusion_storage
+        parse_thread_names: list[str] = []
+        original_loader = dag_executor_module.load_source_meta_from_storage
+
+        def _recording_loader(*args, **kwargs):
+            parse_thread_names.append(threading.current_thread().name)
+            return original_loader(*args, **kwargs)
+
+        monkeypatch.setattr(
+            dag_executor_module, "load_source_meta_from_storage", _recording_loader,
+        )
+
+        descriptor_executor = _DescriptorSourceExecutor(
+            storage, source_metas, execution_mode="thread", max_workers=3,
+            source_load_workers=3,
+        )
+        descriptor_result = descriptor_executor.run(branch_fusion_config("fusion_descriptor"))
+
+        assert descriptor_executor.describe_thread_names == [
+            threading.current_thread().name
+        ] * 3
+        assert len(parse_thread_names) == 3
+        assert all(name.startswith("source-load") for name in parse_thread_names)
+
+        memory_executor = InMemorySourceExecutor(storage, source_metas)
+        memory_result = memory_executor.run(branch_fusion_config("fusion_memory"))
+
+        descriptor_coco = read_output_coco(storage, descriptor_result.output_storage_uri)
+        memory_coco = read_output_coco(storage, memory_result.output_storage_uri)
+        assert descriptor_coco["images"] == memory_coco["images"]
+        assert descriptor_coco["annotations"] == memory_coco["annotations"]
+
+    def test_single_worker_parses_on_calling_thread(self, fusion_storage, monkeypatch):
+        storage, source_metas = fusion_storage
+        parse_thread_names: list[str] = []
+        original_loader = dag_executor_module.load_source_meta_from_storage
+
+        def _recording_loader(*args, **kwargs):
+            parse_thread_names.append(threading.current_thread().name)
+            return original_loader(*args, **kwargs)
+
+        monkeypatch.setattr(
+            dag_executor_module, "load_source_meta_from_storage", _recording_loader,
+        )
+
+        executor = _DescriptorSourceExecutor(storage, source_metas, source_load_workers=1)
+        executor.run(branch_fusion_config("fusion_sequential"))
+
+        assert parse_thread_names == [threading.current_thread().name] * 3
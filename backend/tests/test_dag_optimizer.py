@@ -0,0 +1,215 @@
+"""
+DAG 최적화 패스(lib.pipeline.dag_optimizer) + executor 적용 테스트.
+
+테스트 영역:
+  1. dead branch 제거 — terminal_task 에 도달하지 않는 태스크 제외
+  2. 공통 부분식 공유 — 같은 operator/params/inputs 태스크는 대표 1개만 계산, 체인 단위로 전파
+  3. 시드 없는 샘플링처럼 비결정적인 태스크는 공유하지 않음
+  4. executor — 제거된 태스크 SKIPPED 보고 / source 미로드, 중복 태스크는 1회 계산하되 출력 동일
+"""
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import PipelineDagExecutor
+from lib.pipeline.dag_optimizer import optimize_pipeline_config
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source, read_output
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _keep(source: str, class_name: str = "person") -> dict:
+    return {
+        "operator": "det_filter_keep_images_containing_class_name",
+        "inputs": [f"source:dataset_version:{source}"],
+        "params": {"class_names": [class_name]},
+    }
+
+
+def _remap(input_name: str, mapping: dict[str, str]) -> dict:
+    return {
+        "operator": "det_remap_class_name", "inputs": [input_name], "params": {"mapping": mapping},
+    }
+
+
+def _dead_branch_config(name: str) -> PipelineConfig:
+    """keep_a → remap_a 가 Save 에 연결되고, ds-b 분기는 미연결로 남은 DAG."""
+    return PipelineConfig(
+        name=name,
+        output=_OUTPUT,
+        tasks={
+            "keep_a": _keep("ds-a"),
+            "remap_a": _remap("keep_a", {"person": "pedestrian"}),
+            "keep_b": _keep("ds-b"),
+            "remap_b": _remap("keep_b", {"car": "vehicle"}),
+        },
+        terminal_task="remap_a",
+    )
+
+
+def _duplicate_branch_config(name: str) -> PipelineConfig:
+    """같은 keep → remap 체인이 두 분기에 복제된 뒤 merge 되는 DAG."""
+    return PipelineConfig(
+        name=name,
+        output=_OUTPUT,
+        tasks={
+            "keep_x": _keep("ds-a"),
+            "remap_x": _remap("keep_x", {"person": "pedestrian"}),
+            "keep_y": _keep("ds-a"),
+            "remap_y": _remap("keep_y", {"person": "pedestrian"}),
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["remap_x", "remap_y"],
+                "params": {},
+            },
+        },
+    )
+
+
+@pytest.fixture
+def two_source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["010.jpg", "011.jpg"]),
+    }
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1~3. 최적화 계획
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestOptimizePipelineConfig:
+
+    def test_dead_branch_removed(self):
+        plan = optimize_pipeline_config(_dead_branch_config("dead"))
+
+        assert plan.terminal_task_name == "remap_a"
+        assert plan.removed_tasks == ["keep_b", "remap_b"]
+        assert set(plan.config.tasks) == {"keep_a", "remap_a"}
+        assert plan.execution_order == ["keep_a", "remap_a"]
+        assert plan.config.get_all_source_dataset_ids() == ["ds-a"]
+
+    def test_duplicate_chain_shared(self):
+        plan = optimize_pipeline_config(_duplicate_branch_config("dup"))
+
+        assert plan.removed_tasks == []
+        assert plan.duplicate_of == {"keep_y": "keep_x", "remap_y": "remap_x"}
+        assert plan.computed_task_names == ["keep_x", "remap_x", "merge"]
+        assert plan.is_rewritten
+
+    def test_different_params_not_shared(self):
+        config = _duplicate_branch_config("dup_params")
+        config.tasks["remap_y"].params = {"mapping": {"person": "walker"}}
+
+        plan = optimize_pipeline_config(config)
+
+        assert plan.duplicate_of == {"keep_y": "keep_x"}
+
+    @pytest.mark.parametrize("seed, shared", [(7, True), (None, False)])
+    def test_unseeded_sampling_not_shared(self, seed, shared):
+        config = _duplicate_branch_config("dup_sample")
+        for task_name in ("keep_x", "keep_y"):
+            config.tasks[task_name].operator = "det_sample_n_images"
+            config.tasks[task_name].params = {"n": 2, "seed": seed}
+
+        plan = optimize_pipeline_config(config)
+
+        assert ("keep_y" in plan.duplicate_of) is shared
+
+    def test_unchanged_plan(self):
+        config = PipelineConfig(name="plain", output=_OUTPUT, tasks={"keep": _keep("ds-a")})
+
+        plan = optimize_pipeline_config(config)
+
+        assert plan.config is config
+        assert not plan.is_rewritten
+        assert plan.describe()[-1] == "  - 실행 순서: keep"
+
+    def test_ambiguous_terminal_raises(self):
+        config = _dead_branch_config("ambiguous")
+        config.terminal_task = None
+
+        with pytest.raises(ValueError, match="최종 출력 태스크가 2개 이상"):
+            optimize_pipeline_config(config)
+
+
+# ─────────────────────────────────────────────────────────────────
+# 4. executor 적용
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorAppliesPlan:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    def test_dead_branch_skipped(self, two_source_storage, execution_mode, caplog):
+        storage, source_metas = two_source_storage
+        caplog.set_level(logging.INFO, logger="lib")
+        events: list[tuple[str, str, dict]] = []
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        )
+
+        result = executor.run(_dead_branch_config(f"dead_{execution_mode}"))
+
+        # ds-b 는 제거된 분기에서만 쓰이므로 로드하지 않는다
+        assert len(executor.load_thread_names) == 1
+        assert [(name, status) for name, status, _ in events if name.endswith("_b")] == [
+            ("keep_b", "SKIPPED"), ("remap_b", "SKIPPED"),
+        ]
+        coco, _ = read_output(storage, result.output_storage_uri)
+        assert {c["name"] for c in coco["categories"]} == {"pedestrian", "car"}
+        assert len(coco["images"]) == 2
+
+        log_text = (storage.resolve_path(result.output_storage_uri) / "processing.log").read_text(
+            encoding="utf-8",
+        )
+        assert "dead branch 제거 (최종 출력에 도달하지 않음): keep_b, remap_b" in log_text
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    def test_duplicate_computed_once(self, two_source_storage, execution_mode, monkeypatch):
+        storage, source_metas = two_source_storage
+        computed_steps: list[list[str]] = []
+        original_compute = PipelineDagExecutor._compute_work_item
+
+        def _recording_compute(self, steps, input_metas):
+            computed_steps.append([operator_name for operator_name, _ in steps])
+            return original_compute(self, steps, input_metas)
+
+        monkeypatch.setattr(PipelineDagExecutor, "_compute_work_item", _recording_compute)
+        events: list[tuple[str, str, dict]] = []
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        )
+
+        result = executor.run(_duplicate_branch_config(f"dup_{execution_mode}"))
+
+        if execution_mode != "process":
+            # keep_x 는 keep_y 가 결과를 재사용하므로 fusion 체인을 끊는다
+            assert computed_steps == [
+                ["det_filter_keep_images_containing_class_name"],
+                ["det_remap_class_name"],
+                ["det_merge_datasets"],
+            ]
+        done_counts = {
+            name: (detail["input_images"], detail["output_images"])
+            for name, status, detail in events
+            if status == "DONE" and name != "__image_materialize__"
+        }
+        assert done_counts == {
+            "keep_x": (3, 2), "remap_x": (2, 2),
+            "keep_y": (3, 2), "remap_y": (2, 2),
+            "merge": (4, 4),
+        }
+        # 두 분기 결과가 파일명 충돌로 각각 rename 되어 4장 모두 저장된다
+        coco, _ = read_output(storage, result.output_storage_uri)
+        file_names = [image["file_name"] for image in coco["images"]]
+        assert len(file_names) == len(set(file_names)) == 4
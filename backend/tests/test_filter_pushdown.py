@@ -0,0 +1,275 @@
+"""
+필터 선행 이동 (DAG optimizer predicate pushdown) 테스트.
+
+테스트 영역:
+  1. 계획 — 필터/샘플링을 이미지 변환 앞으로 옮기고, 병합 직후 필터는 병합 안으로 넣음
+  2. 교환 법칙 — 필터→변환 결과가 변환→필터와 동일, 병합 중 필터 == 병합 후 필터
+  3. executor — pushdown on/off 출력 동일 (파일명 충돌 rename / image_id 포함), 변환 입력 수 감소
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from lib.manipulators import MANIPULATOR_REGISTRY
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_optimizer import optimize_pipeline_config
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source
+from tests.test_copy_on_write import _classification_meta, _detection_meta
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _rotate(input_name: str) -> dict:
+    return {"operator": "det_rotate_image", "inputs": [input_name], "params": {"degrees": 90}}
+
+
+def _remove(input_name: str, class_name: str) -> dict:
+    return {
+        "operator": "det_filter_remove_images_containing_class_name",
+        "inputs": [input_name],
+        "params": {"class_names": [class_name]},
+    }
+
+
+def _pushdown_config(name: str) -> PipelineConfig:
+    """
+    ds-a → rotate_a → remove_a ─┐
+                                ├→ merge → keep
+    ds-b → rotate_b ────────────┘
+    """
+    return PipelineConfig(
+        name=name,
+        output=_OUTPUT,
+        tasks={
+            "rotate_a": _rotate("source:dataset_version:ds-a"),
+            "remove_a": _remove("rotate_a", "car"),
+            "rotate_b": _rotate("source:dataset_version:ds-b"),
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["remove_a", "rotate_b"],
+                "params": {},
+            },
+            "keep": {
+                "operator": "det_filter_keep_images_containing_class_name",
+                "inputs": ["merge"],
+                "params": {"class_names": ["person"]},
+            },
+        },
+    )
+
+
+@pytest.fixture
+def colliding_source_storage(tmp_path: Path):
+    """두 소스에 같은 파일명(002, 003)이 있어 병합 시 rename 이 일어난다."""
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg", "004.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["002.jpg", "003.jpg", "005.jpg"]),
+    }
+    # 회전은 실제 이미지를 디코딩하므로 더미 바이트를 작은 JPEG 로 바꾼다
+    for index, source_meta in enumerate(source_metas.values()):
+        images_dir = storage.get_images_dir(source_meta.storage_uri)
+        for record in source_meta.image_records:
+            Image.new("RGB", (8, 6), (40 * index, 10 * record.image_id, 0)).save(
+                images_dir / record.file_name, format="JPEG",
+            )
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 계획
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPushdownPlan:
+
+    def test_filter_moved_ahead_of_transform(self):
+        plan = optimize_pipeline_config(_pushdown_config("plan"))
+
+        assert plan.moved_ahead == {"remove_a": ["rotate_a"]}
+        assert plan.config.tasks["remove_a"].inputs == ["source:dataset_version:ds-a"]
+        assert plan.config.tasks["rotate_a"].inputs == ["remove_a"]
+        assert plan.config.tasks["merge"].inputs == ["rotate_a", "rotate_b"]
+        # merge 입력 dataset_id 는 원래 이름을 유지한다
+        assert plan.result_names == {"rotate_a": "remove_a"}
+
+    def test_filter_after_merge_applied_in_merge(self):
+        plan = optimize_pipeline_config(_pushdown_config("plan_merge"))
+
+        assert plan.merge_filters == {"merge": ["keep"]}
+        assert plan.terminal_task_name == "keep"
+
+    def test_moves_past_consecutive_transforms_and_updates_terminal(self):
+        config = PipelineConfig(
+            name="plan_chain",
+            output=_OUTPUT,
+            tasks={
+                "rotate": _rotate("source:dataset_version:ds-a"),
+                "mask": {
+                    "operator": "det_mask_region_by_class",
+                    "inputs": ["rotate"],
+                    "params": {"class_names": "car"},
+                },
+                "remove": _remove("mask", "person"),
+            },
+        )
+
+        plan = optimize_pipeline_config(config)
+
+        assert plan.moved_ahead == {"remove": ["mask", "rotate"]}
+        assert plan.execution_order == ["remove", "rotate", "mask"]
+        assert plan.terminal_task_name == "mask"
+        assert plan.result_names == {"mask": "remove"}
+
+    @pytest.mark.parametrize("seed, moved", [(3, True), (None, False)])
+    def test_seeded_sampling_moved(self, seed, moved):
+        config = PipelineConfig(
+            name="plan_sample",
+            output=_OUTPUT,
+            tasks={
+                "rotate": _rotate("source:dataset_version:ds-a"),
+                "sample": {
+                    "operator": "det_sample_n_images",
+                    "inputs": ["rotate"],
+                    "params": {"n": 2, "seed": seed},
+                },
+            },
+        )
+
+        plan = optimize_pipeline_config(config)
+
+        assert ("sample" in plan.moved_ahead) is moved
+
+    def test_sampling_not_applied_in_merge(self):
+        config = _pushdown_config("plan_merge_sample")
+        config.tasks["keep"].operator = "det_sample_n_images"
+        config.tasks["keep"].params = {"n": 2}
+
+        assert optimize_pipeline_config(config).merge_filters == {}
+
+    def test_shared_transform_not_moved(self):
+        """변환 결과를 다른 태스크도 쓰면 옮기지 않는다."""
+        config = _pushdown_config("plan_shared")
+        config.tasks["merge"].inputs = ["remove_a", "rotate_a", "rotate_b"]
+
+        plan = optimize_pipeline_config(config)
+
+        assert plan.moved_ahead == {}
+
+    def test_disabled(self):
+        plan = optimize_pipeline_config(_pushdown_config("plan_off"), push_down_filters=False)
+
+        assert plan.moved_ahead == {} and plan.merge_filters == {}
+        assert not plan.is_rewritten
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 교환 법칙
+# ─────────────────────────────────────────────────────────────────
+
+
+def _apply(steps, input_meta):
+    meta = input_meta
+    for operator_name, params in steps:
+        meta = MANIPULATOR_REGISTRY[operator_name]().transform_annotation(meta, params)
+    return meta
+
+
+class TestCommutation:
+
+    @pytest.mark.parametrize(
+        "selection, transform, meta_factory",
+        [
+            (("det_filter_remove_images_containing_class_name", {"class_names": ["car"]}),
+             ("det_rotate_image", {"degrees": 270}), _detection_meta),
+            (("det_sample_n_images", {"n": 2, "seed": 5}),
+             ("det_mask_region_by_class", {"class_names": "car"}), _detection_meta),
+            (("cls_filter_by_class", {"head_name": "color", "mode": "exclude",
+                                      "classes": ["blue"]}),
+             ("cls_rotate_image", {"degrees": 90}), _classification_meta),
+            (("cls_sample_n_images", {"n": 3, "seed": 1}),
+             ("cls_crop_image", {"direction": "상단", "crop_pct": 30}), _classification_meta),
+        ],
+        ids=["det_filter", "det_sample", "cls_filter", "cls_sample"],
+    )
+    def test_selection_commutes_with_transform(self, selection, transform, meta_factory):
+        assert _apply([selection, transform], meta_factory()) == \
+            _apply([transform, selection], meta_factory())
+
+    def test_merge_record_filter_matches_filter_after_merge(self, colliding_source_storage):
+        _, source_metas = colliding_source_storage
+        merge = MANIPULATOR_REGISTRY["det_merge_datasets"]()
+        keep_person = MANIPULATOR_REGISTRY["det_filter_keep_images_containing_class_name"]()
+        params = {"class_names": ["person"]}
+        inputs = [source_metas["ds-a"], source_metas["ds-b"]]
+
+        expected = keep_person.transform_annotation(merge.transform_annotation(inputs, {}), params)
+        predicate = keep_person.build_record_transform(inputs[0], params).apply
+        pushed = merge.transform_annotation(
+            inputs, {}, context={"record_filter": lambda record: predicate(record) is not None},
+        )
+
+        assert pushed.image_records == expected.image_records
+        assert pushed.extra == expected.extra
+        assert [r.image_id for r in pushed.image_records] == [1, 3, 5, 7]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPushdownExecution:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    @pytest.mark.parametrize("fuse_record_operators", [True, False])
+    def test_same_output_as_without_pushdown(
+        self, colliding_source_storage, run_in_memory, execution_mode, fuse_record_operators,
+    ):
+        storage, source_metas = colliding_source_storage
+        suffix = f"{execution_mode}_{fuse_record_operators}"
+
+        _, pushed_coco, pushed_images = run_in_memory(
+            storage, source_metas, _pushdown_config(f"pushed_{suffix}"),
+            execution_mode=execution_mode, fuse_record_operators=fuse_record_operators,
+        )
+        _, plain_coco, plain_images = run_in_memory(
+            storage, source_metas, _pushdown_config(f"plain_{suffix}"),
+            execution_mode=execution_mode, fuse_record_operators=fuse_record_operators,
+            push_down_filters=False,
+        )
+
+        assert pushed_coco["images"] == plain_coco["images"]
+        assert pushed_coco["annotations"] == plain_coco["annotations"]
+        assert pushed_coco["categories"] == plain_coco["categories"]
+        assert list(pushed_images) == list(plain_images)
+        # 충돌 파일(003)이 rename 되어 있어야 한다 — rename 판정이 필터 전 기준
+        assert any(name.endswith("_003.jpg") for name in pushed_images)
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    def test_transform_sees_fewer_records(self, colliding_source_storage, execution_mode):
+        storage, source_metas = colliding_source_storage
+        events: list[tuple[str, str, dict]] = []
+        executor = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        )
+        config = _pushdown_config(f"counts_{execution_mode}")
+
+        executor.run(config)
+
+        done_counts = {
+            name: (detail["input_images"], detail["output_images"])
+            for name, status, detail in events
+            if status == "DONE" and name in config.tasks
+        }
+        assert done_counts == {
+            "remove_a": (4, 2),
+            "rotate_a": (2, 2),
+            "rotate_b": (3, 3),
+            "merge": (5, 5),
+            "keep": (5, 4),
+        }
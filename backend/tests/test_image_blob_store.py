@@ -0,0 +1,248 @@
+"""
+content-addressed 이미지 blob 저장소 테스트.
+
+테스트 영역:
+  1. ImageBlobStore — adopt 로 같은 바이트 파일 공유, 참조 수, release / collect_garbage,
+     .image_refs 기록 / 병합, 소스 digest 색인 (collect_garbage 가 지우지 않음)
+  2. ImageMaterializer(blob_store) — 복사 이미지를 blob 으로 링크, 출력 참조 목록 / 소스 색인 기록,
+     소스 버전 디렉토리는 바꾸지 않음, 색인이 있으면 해시하지 않음, 같은 변환 결과 공유
+  3. LocalStorageClient.delete_dataset_directory — 마지막 참조 버전을 지울 때 blob 삭제,
+     소스 색인 삭제
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import lib.pipeline.image_blob_store as image_blob_store_module
+from app.core.storage import LocalStorageClient
+from lib.pipeline.image_blob_store import (
+    IMAGE_REFS_FILENAME,
+    ImageBlobStore,
+    file_digest,
+    read_image_refs,
+    write_image_refs,
+)
+from lib.pipeline.image_materializer import ImageMaterializer
+from lib.pipeline.pipeline_data_models import (
+    DatasetMeta,
+    DatasetPlan,
+    ImageManipulationSpec,
+    ImagePlan,
+)
+from tests.conftest import FileStorage
+
+
+def _write_image(path: Path, content: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return path
+
+
+def _plan(image_plans: list[ImagePlan]) -> DatasetPlan:
+    return DatasetPlan(
+        output_meta=DatasetMeta(dataset_id="out", storage_uri="out"), image_plans=image_plans,
+    )
+
+
+@pytest.fixture
+def blob_store(tmp_path: Path) -> ImageBlobStore:
+    return ImageBlobStore(tmp_path / ".blobs")
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. ImageBlobStore
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestImageBlobStore:
+
+    def test_adopt_shares_identical_bytes(self, blob_store, tmp_path):
+        first = _write_image(tmp_path / "out/v1/images/a.jpg", b"same pixels")
+        second = _write_image(tmp_path / "out/v2/images/b.jpg", b"same pixels")
+
+        first_digest = blob_store.adopt(first)
+        second_digest = blob_store.adopt(second)
+
+        assert first_digest == second_digest == file_digest(first)
+        assert first.stat().st_ino == second.stat().st_ino
+        assert second.read_bytes() == b"same pixels"
+        assert blob_store.reference_count(first_digest) == 2
+        # 같은 파일을 다시 넣어도 참조 수는 그대로
+        assert blob_store.adopt(first) == first_digest
+        assert blob_store.reference_count(first_digest) == 2
+
+    def test_release_only_unreferenced(self, blob_store, tmp_path):
+        kept = _write_image(tmp_path / "v1/images/a.jpg", b"kept")
+        dropped = _write_image(tmp_path / "v2/images/b.jpg", b"dropped")
+        kept_digest, dropped_digest = blob_store.adopt(kept), blob_store.adopt(dropped)
+        dropped.unlink()
+
+        release_result = blob_store.release([kept_digest, dropped_digest])
+
+        assert release_result.removed == 1
+        assert release_result.freed_bytes == len(b"dropped")
+        assert blob_store.blob_path(kept_digest).exists()
+        assert not blob_store.blob_path(dropped_digest).exists()
+
+    def test_collect_garbage_grace(self, blob_store, tmp_path):
+        image_path = _write_image(tmp_path / "v1/images/a.jpg", b"orphan")
+        digest = blob_store.adopt(image_path)
+        image_path.unlink()
+
+        assert blob_store.collect_garbage(grace_seconds=3600).removed == 0
+        gc_result = blob_store.collect_garbage(grace_seconds=0)
+
+        assert (gc_result.scanned, gc_result.removed) == (1, 1)
+        assert not blob_store.blob_path(digest).exists()
+
+    def test_source_refs_in_store(self, blob_store, tmp_path):
+        image_path = _write_image(tmp_path / "v1/images/a.jpg", b"orphan")
+        digest = blob_store.adopt(image_path)
+        image_path.unlink()
+        version_root = tmp_path / "source/v1"
+
+        assert blob_store.write_source_refs(version_root, {"images/a.jpg": "aa"})
+        assert blob_store.write_source_refs(version_root, {"images/b.jpg": "bb"})
+        gc_result = blob_store.collect_garbage(grace_seconds=0)
+
+        assert (gc_result.scanned, gc_result.removed) == (1, 1)
+        assert not blob_store.blob_path(digest).exists()
+        assert blob_store.read_source_refs(version_root) == {
+            "images/a.jpg": "aa", "images/b.jpg": "bb",
+        }
+        assert not version_root.exists()
+        blob_store.forget_source_refs(version_root)
+        assert blob_store.read_source_refs(version_root) == {}
+
+    def test_image_refs_merge(self, tmp_path):
+        assert write_image_refs(tmp_path, {"images/a.jpg": "aa"})
+        assert write_image_refs(tmp_path, {"images/b.jpg": "bb"})
+
+        assert read_image_refs(tmp_path) == {"images/a.jpg": "aa", "images/b.jpg": "bb"}
+        assert read_image_refs(tmp_path / "missing") == {}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. ImageMaterializer(blob_store)
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMaterializerBlobStore:
+
+    def test_copy_plans_linked_to_blobs(self, blob_store, tmp_path, monkeypatch):
+        storage = FileStorage(tmp_path)
+        source_image = _write_image(tmp_path / "source/v1/images/a.jpg", b"pixels")
+        source_inode = source_image.stat().st_ino
+        copy_plan = [ImagePlan(src_uri="source/v1/images/a.jpg", dst_uri="out/v1/images/a.jpg")]
+
+        result = ImageMaterializer(storage, blob_store=blob_store).materialize(_plan(copy_plan))
+
+        digest = file_digest(source_image)
+        # 처음에는 출력에 복사한 뒤 출력 파일을 저장소에 넣는다 (소스 버전은 그대로)
+        assert result.link_counts == {"copy": 1}
+        assert (tmp_path / "out/v1/images/a.jpg").stat().st_ino == (
+            blob_store.blob_path(digest).stat().st_ino
+        )
+        assert source_image.stat().st_ino == source_inode
+        assert [path.name for path in (tmp_path / "source/v1").iterdir()] == ["images"]
+        assert blob_store.read_source_refs(tmp_path / "source/v1") == {"images/a.jpg": digest}
+        assert read_image_refs(tmp_path / "out/v1") == {"images/a.jpg": digest}
+        assert blob_store.reference_count(digest) == 1
+
+        # 소스 색인이 있으면 다시 해시하지 않고 blob 을 링크한다
+        def _fail_digest(path):
+            raise AssertionError("해시하면 안 된다")
+
+        monkeypatch.setattr(image_blob_store_module, "file_digest", _fail_digest)
+        linked_result = ImageMaterializer(
+            storage, blob_store=blob_store, io_workers=2,
+        ).materialize(_plan([
+            ImagePlan(src_uri="source/v1/images/a.jpg", dst_uri="out/v2/images/a.jpg"),
+        ]))
+        assert linked_result.link_counts == {"blob": 1}
+        assert blob_store.reference_count(digest) == 2
+        assert source_image.stat().st_ino == source_inode
+
+    def test_identical_sources_not_rewritten(self, blob_store, tmp_path):
+        storage = FileStorage(tmp_path)
+        first = _write_image(tmp_path / "source/v1/images/a.jpg", b"same pixels")
+        second = _write_image(tmp_path / "source/v2/images/a.jpg", b"same pixels")
+        source_inodes = (first.stat().st_ino, second.stat().st_ino)
+
+        ImageMaterializer(storage, blob_store=blob_store, link_strategy="hardlink").materialize(
+            _plan([
+                ImagePlan(
+                    src_uri=f"source/{version}/images/a.jpg",
+                    dst_uri=f"out/{version}/images/a.jpg",
+                )
+                for version in ("v1", "v2")
+            ]),
+        )
+
+        # 출력끼리는 blob 을 공유하지만 소스 파일은 교체하지 않는다
+        assert (first.stat().st_ino, second.stat().st_ino) == source_inodes
+        assert (tmp_path / "out/v1/images/a.jpg").stat().st_ino == (
+            tmp_path / "out/v2/images/a.jpg"
+        ).stat().st_ino
+        assert not (tmp_path / "source/v1" / IMAGE_REFS_FILENAME).exists()
+        assert not (tmp_path / "source/v2" / IMAGE_REFS_FILENAME).exists()
+
+    def test_missing_source_skipped(self, blob_store, tmp_path):
+        result = ImageMaterializer(FileStorage(tmp_path), blob_store=blob_store).materialize(
+            _plan([ImagePlan(src_uri="source/v1/images/x.jpg", dst_uri="out/v1/images/x.jpg")]),
+        )
+
+        assert result.skipped_files == ["x.jpg"]
+        assert not (tmp_path / "out/v1" / IMAGE_REFS_FILENAME).exists()
+
+    def test_identical_transform_outputs_shared(self, blob_store, tmp_path):
+        storage = FileStorage(tmp_path)
+        (tmp_path / "source/v1/images").mkdir(parents=True)
+        Image.new("RGB", (12, 6), color=(10, 20, 30)).save(tmp_path / "source/v1/images/a.png")
+        specs = [ImageManipulationSpec(operation="rotate_image", params={"degrees": 180})]
+        materializer = ImageMaterializer(storage, blob_store=blob_store)
+
+        for version in ("v1", "v2"):
+            result = materializer.materialize(_plan([ImagePlan(
+                src_uri="source/v1/images/a.png", dst_uri=f"out/{version}/images/a.png",
+                specs=specs,
+            )]))
+            assert result.link_counts == {}
+
+        first, second = (tmp_path / f"out/{v}/images/a.png" for v in ("v1", "v2"))
+        assert first.stat().st_ino == second.stat().st_ino
+        assert read_image_refs(tmp_path / "out/v2") == {"images/a.png": file_digest(second)}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. LocalStorageClient.delete_dataset_directory
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestDeleteReleasesBlobs:
+
+    def test_last_reference_removes_blob(self, tmp_path):
+        storage = LocalStorageClient(str(tmp_path), image_blob_store_dir=".blobs")
+        blob_store = storage.image_blob_store
+        _write_image(tmp_path / "source/a/train/v1.0.0/images/a.jpg", b"pixels")
+        for version in ("v1.0.0", "v2.0.0"):
+            ImageMaterializer(storage, blob_store=blob_store).materialize(_plan([ImagePlan(
+                src_uri="source/a/train/v1.0.0/images/a.jpg",
+                dst_uri=f"processed/p/train/{version}/images/a.jpg",
+            )]))
+        digest = read_image_refs(tmp_path / "processed/p/train/v1.0.0")["images/a.jpg"]
+
+        source_root = tmp_path / "source/a/train/v1.0.0"
+        assert blob_store.read_source_refs(source_root) == {"images/a.jpg": digest}
+
+        storage.delete_dataset_directory("source/a/train/v1.0.0")
+        assert blob_store.read_source_refs(source_root) == {}
+        storage.delete_dataset_directory("processed/p/train/v1.0.0")
+        assert blob_store.reference_count(digest) == 1
+
+        storage.delete_dataset_directory("processed/p/train/v2.0.0")
+        assert not blob_store.blob_path(digest).exists()
+        assert not (tmp_path / "processed").exists()
@@ -0,0 +1,194 @@
+"""
+이미지 변환 체인 컴파일러 (image_transform_chain) 테스트.
+
+테스트 영역:
+  1. 결과 픽셀 — spec 을 하나씩 적용한 결과와 같음 (회전 / crop / mask 조합, 정규화 bbox,
+     팔레트 / 그레이스케일 이미지)
+  2. 컴파일 — 연속 회전 합치기, crop box 1개 + 회전 1회 + 최종 좌표 mask, 체인 캐시,
+     미지원 spec 제외, PIXEL_OPERATIONS 구간
+"""
+from __future__ import annotations
+
+import itertools
+import random
+
+import pytest
+from PIL import Image, ImageDraw, ImageFilter
+
+import lib.pipeline.image_transform_chain as image_transform_chain_module
+from lib.pipeline.image_transform_chain import compile_transform_chain
+from lib.pipeline.pipeline_data_models import ImageManipulationSpec
+
+
+def _rotate(degrees: int) -> ImageManipulationSpec:
+    return ImageManipulationSpec(operation="rotate_image", params={"degrees": degrees})
+
+
+def _crop(direction: str, crop_pct: int) -> ImageManipulationSpec:
+    return ImageManipulationSpec(
+        operation="crop_image_vertical", params={"direction": direction, "crop_pct": crop_pct},
+    )
+
+
+def _mask(bboxes: list, fill_color: str = "black", normalized: bool = False):
+    return ImageManipulationSpec(operation="mask_region", params={
+        "bboxes": bboxes, "fill_color": fill_color, "bbox_normalized": normalized,
+    })
+
+
+def _apply_one_by_one(img: Image.Image, specs: list[ImageManipulationSpec]) -> Image.Image:
+    """spec 을 하나씩 적용하는 기준 구현 (변환 체인 이전 ImageMaterializer 와 같은 규칙)."""
+    transposes = {
+        90: Image.Transpose.ROTATE_270, 180: Image.Transpose.ROTATE_180,
+        270: Image.Transpose.ROTATE_90,
+    }
+    for spec in specs:
+        params = spec.params
+        if spec.operation == "rotate_image":
+            img = img.transpose(transposes[params["degrees"]])
+        elif spec.operation == "crop_image_vertical":
+            width, height = img.size
+            cut_rows = max(0, min(int(height * params["crop_pct"] / 100), height - 1))
+            if params["direction"] == "up":
+                img = img.crop((0, cut_rows, width, height))
+            else:
+                img = img.crop((0, 0, width, height - cut_rows))
+        else:
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGB")
+            fill_rgb = (0, 0, 0) if params["fill_color"] == "black" else (255, 255, 255)
+            draw = ImageDraw.Draw(img)
+            for bx, by, bw, bh in params["bboxes"]:
+                if params["bbox_normalized"]:
+                    bx, bw = bx * img.width, bw * img.width
+                    by, bh = by * img.height, bh * img.height
+                draw.rectangle([int(bx), int(by), int(bx + bw), int(by + bh)], fill=fill_rgb)
+    return img
+
+
+def _gradient_image(width: int, height: int, mode: str = "RGB") -> Image.Image:
+    img = Image.new("RGB", (width, height))
+    img.putdata([
+        ((x * 37) % 256, (y * 53) % 256, (x * y) % 256)
+        for y in range(height) for x in range(width)
+    ])
+    return img.convert(mode) if mode != "RGB" else img
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 결과 픽셀
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestSamePixelsAsOneByOne:
+
+    @pytest.mark.parametrize("mode", ["RGB", "L", "P", "RGBA"])
+    def test_random_chains(self, mode):
+        rng = random.Random(7)
+        source = _gradient_image(23, 17, mode)
+        for _ in range(200):
+            specs: list[ImageManipulationSpec] = []
+            for _ in range(rng.randint(1, 6)):
+                kind = rng.choice(["rotate", "crop", "mask"])
+                if kind == "rotate":
+                    specs.append(_rotate(rng.choice([90, 180, 270])))
+                elif kind == "crop":
+                    specs.append(_crop(rng.choice(["up", "down"]), rng.randint(1, 99)))
+                elif rng.random() < 0.5:
+                    specs.append(_mask(
+                        [[rng.uniform(-3, 20), rng.uniform(-3, 20), rng.uniform(0, 12),
+                          rng.uniform(0, 12)] for _ in range(rng.randint(1, 3))],
+                        rng.choice(["black", "white"]),
+                    ))
+                else:
+                    specs.append(_mask(
+                        [[rng.random(), rng.random(), rng.random() / 2, rng.random() / 2]],
+                        rng.choice(["black", "white"]), normalized=True,
+                    ))
+
+            expected = _apply_one_by_one(source.copy(), specs)
+            compiled = compile_transform_chain(specs).apply(source.copy())
+
+            assert compiled.mode == expected.mode, specs
+            assert compiled.size == expected.size, specs
+            assert compiled.tobytes() == expected.tobytes(), specs
+
+    def test_all_orderings(self):
+        source = _gradient_image(9, 14)
+        rotations = [_rotate(degrees) for degrees in (90, 180, 270)]
+        crops = [_crop(direction, 35) for direction in ("up", "down")]
+        masks = [_mask([[1, 2, 3, 4]], "white")]
+        for specs in itertools.permutations(rotations[:2] + crops + masks, 4):
+            expected = _apply_one_by_one(source.copy(), list(specs))
+            compiled = compile_transform_chain(list(specs)).apply(source.copy())
+            assert compiled.tobytes() == expected.tobytes(), specs
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 컴파일
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestCompile:
+
+    def test_single_crop_and_rotation(self):
+        specs = [
+            _rotate(90), _rotate(90), _crop("up", 50),
+            _mask([[0, 0, 1, 1], [15, 0, 2, 1]]), _rotate(270), _crop("down", 50),
+        ]
+
+        chain = compile_transform_chain(specs)
+        resolved = chain.segments[0].resolve((20, 10))
+
+        assert len(chain.segments) == 1
+        assert chain.segments[0].steps[0] == ("rotate", 2)
+        # 180° 회전 후 상단 절반 제거 = 소스 상단 절반만 남고, 그 뒤 270° 회전 후 하단 절반 제거
+        # = 소스 왼쪽 절반만 남는다 (crop 1회 + 시계 90° 회전 1회)
+        assert resolved.crop_box == (0, 0, 10, 5)
+        assert resolved.quarter_turns == 1
+        # 첫 mask 는 마지막 crop 으로 잘려 나가고, 둘째는 최종 좌표로 옮겨진다
+        assert resolved.masks == (((0, 2, 1, 4), (0, 0, 0)),)
+        assert resolved.convert_rgb
+
+    def test_rotations_cancel(self):
+        chain = compile_transform_chain([_rotate(90), _rotate(270)])
+
+        assert chain.segments == ()
+        source = _gradient_image(5, 3)
+        assert chain.apply(source) is source
+
+    def test_chain_cached_per_spec_sequence(self):
+        first = compile_transform_chain([_crop("up", 30), _mask([[1, 1, 2, 2]])])
+        second = compile_transform_chain([_crop("up", 30), _mask([[1, 1, 2, 2]])])
+        other = compile_transform_chain([_crop("up", 31), _mask([[1, 1, 2, 2]])])
+
+        assert first is second
+        assert other is not first
+
+    def test_unsupported_specs_dropped(self, caplog):
+        specs = [
+            _rotate(45), _crop("left", 30), _crop("up", 0),
+            ImageManipulationSpec(operation="sharpen", params={}),
+        ]
+
+        assert compile_transform_chain(specs).segments == ()
+        assert "미지원 이미지 변환 operation: sharpen" in caplog.text
+
+    def test_pixel_operation_splits_segments(self, monkeypatch):
+        monkeypatch.setitem(
+            image_transform_chain_module.PIXEL_OPERATIONS, "test_blur",
+            lambda img, params: img.filter(ImageFilter.BoxBlur(params["radius"])),
+        )
+        specs = [
+            _rotate(90), _crop("up", 20),
+            ImageManipulationSpec(operation="test_blur", params={"radius": 1}),
+            _rotate(90),
+        ]
+        source = _gradient_image(12, 8)
+
+        chain = compile_transform_chain(specs)
+        expected = _apply_one_by_one(source, specs[:2]).filter(ImageFilter.BoxBlur(1))
+        expected = expected.transpose(Image.Transpose.ROTATE_270)
+
+        assert [segment.pixel_operation for segment in chain.segments] == ["test_blur", None]
+        assert chain.apply(source).tobytes() == expected.tobytes()
@@ -0,0 +1,349 @@
+"""
+증분 재실행 (이전 출력 이미지 재사용) 테스트.
+
+테스트 영역:
+  1. fingerprint — 단일 source 의 레코드별 변환만 대상, 구성 / 이미지 변환 체인 코드가 바뀌면
+     fingerprint 도 바뀜
+  2. source diff — 추가 / 변경(annotation, 이미지 파일) / 삭제 판정
+  3. executor — 변경 없는 이미지는 hardlink, 출력은 전체 재실행과 동일, 재사용 불가면 전체 실행
+"""
+from __future__ import annotations
+
+import shutil
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+import lib.pipeline.incremental as incremental_module
+from lib.pipeline import image_transform_chain
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.incremental import (
+    INCREMENTAL_STATE_FILENAME,
+    diff_source_records,
+    incremental_fingerprint,
+    read_incremental_state,
+    scan_image_files,
+)
+from lib.pipeline.pipeline_data_models import Annotation, DatasetMeta
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source, read_output
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _chain_config(name: str, mapping: dict[str, str] | None = None) -> PipelineConfig:
+    """source → remap → remove_car (레코드별 변환만)."""
+    return PipelineConfig.model_validate({
+        "name": name,
+        "output": _OUTPUT,
+        "tasks": {
+            "remap": {
+                "operator": "det_remap_class_name",
+                "inputs": ["source:dataset_version:ds-v1"],
+                "params": {"mapping": mapping or {"person": "pedestrian"}},
+            },
+            "remove_car": {
+                "operator": "det_filter_remove_images_containing_class_name",
+                "inputs": ["remap"],
+                "params": {"class_names": ["car"]},
+            },
+        },
+    })
+
+
+def _with_source(config: PipelineConfig, dataset_id: str) -> PipelineConfig:
+    """같은 파이프라인을 다른 source 버전으로 resolve 한 config."""
+    data = config.model_dump()
+    data["tasks"]["remap"]["inputs"] = [f"source:dataset_version:{dataset_id}"]
+    return PipelineConfig.model_validate(data)
+
+
+def _next_source_version(
+    storage: FileStorage,
+    previous_meta: DatasetMeta,
+    dataset_id: str,
+    added_file_names: list[str],
+) -> DatasetMeta:
+    """이전 버전 디렉토리를 그대로 복사(mtime 보존)하고 이미지를 덧붙인 다음 source 버전."""
+    storage_uri = previous_meta.storage_uri.replace("v1.0.0", "v2.0.0")
+    shutil.copytree(
+        storage.resolve_path(previous_meta.storage_uri), storage.resolve_path(storage_uri),
+    )
+    added_meta = make_source(storage, "tmp", "added", added_file_names)
+    records = list(previous_meta.image_records)
+    for offset, record in enumerate(added_meta.image_records, start=len(records) + 1):
+        shutil.copy2(
+            storage.resolve_path(added_meta.storage_uri) / "images" / record.file_name,
+            storage.resolve_path(storage_uri) / "images" / record.file_name,
+        )
+        records.append(replace(record, image_id=offset))
+    return replace(
+        previous_meta, dataset_id=dataset_id, storage_uri=storage_uri, image_records=records,
+    )
+
+
+@pytest.fixture
+def versioned_sources(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_v1 = make_source(storage, "ds-v1", "alpha", ["001.jpg", "002.jpg", "003.jpg"])
+    source_v2 = _next_source_version(storage, source_v1, "ds-v2", ["004.jpg", "005.jpg"])
+    return storage, {"ds-v1": source_v1, "ds-v2": source_v2}
+
+
+def _read_output(storage: FileStorage, output_storage_uri: str) -> tuple[dict, dict[str, int]]:
+    """(COCO dict, {이미지 파일명: inode})"""
+    coco, images = read_output(storage, output_storage_uri)
+    return coco, {name: path.stat().st_ino for name, path in images.items()}
+
+
+def _materialize_detail(events: list[tuple[str, str, dict]]) -> dict:
+    return next(
+        detail for name, status, detail in events
+        if name == "__image_materialize__" and status == "DONE"
+    )
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. fingerprint
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestIncrementalFingerprint:
+
+    def test_record_chain_eligible(self):
+        assert incremental_fingerprint(_chain_config("fp"), "images") is not None
+
+    def test_independent_of_source_version(self):
+        config = _chain_config("fp")
+
+        assert incremental_fingerprint(config, "images") == \
+            incremental_fingerprint(_with_source(config, "ds-v2"), "images")
+
+    def test_params_change_fingerprint(self):
+        assert incremental_fingerprint(_chain_config("fp"), "images") != \
+            incremental_fingerprint(_chain_config("fp", {"person": "human"}), "images")
+
+    def test_transform_chain_code_change_fingerprint(self, monkeypatch):
+        before = incremental_fingerprint(_chain_config("fp"), "images")
+        original_getsource = incremental_module.inspect.getsource
+        monkeypatch.setattr(
+            incremental_module.inspect, "getsource",
+            lambda module: original_getsource(module) + (
+                "\n# changed" if module is image_transform_chain else ""
+            ),
+        )
+
+        assert incremental_fingerprint(_chain_config("fp"), "images") != before
+
+    @pytest.mark.parametrize("task", [
+        {
+            "operator": "det_sample_n_images",
+            "inputs": ["source:dataset_version:ds-v1"],
+            "params": {"n": 2, "seed": 1},
+        },
+        {
+            "operator": "det_merge_datasets",
+            "inputs": ["source:dataset_version:ds-v1", "source:dataset_version:ds-b"],
+            "params": {},
+        },
+    ])
+    def test_whole_dataset_operators_not_eligible(self, task):
+        config = PipelineConfig.model_validate({
+            "name": "fp", "output": _OUTPUT, "tasks": {"only": task},
+        })
+
+        assert incremental_fingerprint(config, "images") is None
+
+    def test_extra_outputs_not_eligible(self):
+        data = _chain_config("fp").model_dump()
+        data["extra_outputs"] = [{"terminal_task": "remap", "output": {**_OUTPUT, "split": "VAL"}}]
+
+        assert incremental_fingerprint(PipelineConfig.model_validate(data), "images") is None
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. source diff
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestDiffSourceRecords:
+
+    def _diff(self, storage, previous_meta, current_meta):
+        return diff_source_records(
+            previous_meta,
+            current_meta,
+            scan_image_files(storage, previous_meta.storage_uri, "images"),
+            scan_image_files(storage, current_meta.storage_uri, "images"),
+            "images",
+        )
+
+    def test_added_records(self, versioned_sources):
+        storage, source_metas = versioned_sources
+
+        source_diff = self._diff(storage, source_metas["ds-v1"], source_metas["ds-v2"])
+
+        assert source_diff.unchanged_paths == {"images/001.jpg", "images/002.jpg", "images/003.jpg"}
+        assert (source_diff.added_count, source_diff.changed_count, source_diff.removed_count) == \
+            (2, 0, 0)
+
+    def test_changed_annotation_and_removed_record(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        current_meta = source_metas["ds-v2"]
+        changed_record = replace(
+            current_meta.image_records[0],
+            annotations=[
+                Annotation(annotation_type="BBOX", category_name="car", bbox=[1, 2, 3, 4]),
+            ],
+        )
+        current_meta = replace(
+            current_meta, image_records=[changed_record, *current_meta.image_records[2:]],
+        )
+
+        source_diff = self._diff(storage, source_metas["ds-v1"], current_meta)
+
+        assert source_diff.unchanged_paths == {"images/003.jpg"}
+        assert (source_diff.added_count, source_diff.changed_count, source_diff.removed_count) == \
+            (2, 1, 1)
+
+    def test_changed_image_file(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        current_meta = source_metas["ds-v2"]
+        (storage.resolve_path(current_meta.storage_uri) / "images" / "002.jpg").write_bytes(
+            b"re-encoded image",
+        )
+
+        source_diff = self._diff(storage, source_metas["ds-v1"], current_meta)
+
+        assert "images/002.jpg" not in source_diff.unchanged_paths
+        assert source_diff.changed_count == 1
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestIncrementalRerun:
+
+    @pytest.mark.parametrize("stream_records", [False, True])
+    def test_unchanged_images_hardlinked(self, versioned_sources, stream_records):
+        storage, source_metas = versioned_sources
+        config = _chain_config(f"rerun_{stream_records}")
+        executor_kwargs = {"stream_records": stream_records}
+
+        first_result = InMemorySourceExecutor(storage, source_metas, **executor_kwargs).run(
+            config, target_version="1.0",
+        )
+        events: list[tuple[str, str, dict]] = []
+        incremental_result = InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+            **executor_kwargs,
+        ).run(
+            _with_source(config, "ds-v2"), target_version="2.0",
+            incremental_base_uri=first_result.output_storage_uri,
+        )
+        full_result = InMemorySourceExecutor(storage, source_metas, **executor_kwargs).run(
+            _with_source(config, "ds-v2"), target_version="3.0",
+        )
+
+        _, first_inodes = _read_output(storage, first_result.output_storage_uri)
+        incremental_coco, incremental_inodes = _read_output(
+            storage, incremental_result.output_storage_uri,
+        )
+        full_coco, full_inodes = _read_output(storage, full_result.output_storage_uri)
+        # remove_car 로 001, 003 (person) 이 남고 v2 에서 004 (person) 추가
+        assert sorted(incremental_inodes) == sorted(full_inodes) == \
+            ["001.jpg", "003.jpg", "004.jpg"]
+        assert incremental_coco == full_coco
+        assert incremental_inodes["001.jpg"] == first_inodes["001.jpg"]
+        assert incremental_inodes["003.jpg"] == first_inodes["003.jpg"]
+        assert _materialize_detail(events)["reused"] == 2
+        assert _materialize_detail(events)["materialized"] == 3
+
+    def test_changed_image_rematerialized(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        config = _chain_config("rerun_changed")
+        source_images_dir = storage.resolve_path(source_metas["ds-v2"].storage_uri) / "images"
+        (source_images_dir / "003.jpg").write_bytes(b"re-encoded image")
+
+        first_result = InMemorySourceExecutor(storage, source_metas).run(
+            config, target_version="1.0",
+        )
+        incremental_result = InMemorySourceExecutor(storage, source_metas).run(
+            _with_source(config, "ds-v2"), target_version="2.0",
+            incremental_base_uri=first_result.output_storage_uri,
+        )
+
+        _, first_inodes = _read_output(storage, first_result.output_storage_uri)
+        _, incremental_inodes = _read_output(storage, incremental_result.output_storage_uri)
+        assert incremental_inodes["001.jpg"] == first_inodes["001.jpg"]
+        assert incremental_inodes["003.jpg"] != first_inodes["003.jpg"]
+        output_images_dir = storage.resolve_path(incremental_result.output_storage_uri) / "images"
+        assert (output_images_dir / "003.jpg").read_bytes() == b"re-encoded image"
+
+    def test_config_change_runs_full(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        events: list[tuple[str, str, dict]] = []
+
+        first_result = InMemorySourceExecutor(storage, source_metas).run(
+            _chain_config("rerun_config"), target_version="1.0",
+        )
+        second_result = InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        ).run(
+            _with_source(_chain_config("rerun_config", {"person": "human"}), "ds-v2"),
+            target_version="2.0", incremental_base_uri=first_result.output_storage_uri,
+        )
+
+        _, first_inodes = _read_output(storage, first_result.output_storage_uri)
+        _, second_inodes = _read_output(storage, second_result.output_storage_uri)
+        assert not set(first_inodes.values()) & set(second_inodes.values())
+        assert "reused" not in _materialize_detail(events)
+
+    def test_missing_state_runs_full(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        config = _chain_config("rerun_no_state")
+
+        first_result = InMemorySourceExecutor(storage, source_metas).run(
+            config, target_version="1.0",
+        )
+        first_output_dir = storage.resolve_path(first_result.output_storage_uri)
+        (first_output_dir / INCREMENTAL_STATE_FILENAME).unlink()
+        second_result = InMemorySourceExecutor(storage, source_metas).run(
+            _with_source(config, "ds-v2"), target_version="2.0",
+            incremental_base_uri=first_result.output_storage_uri,
+        )
+
+        _, first_inodes = _read_output(storage, first_result.output_storage_uri)
+        _, second_inodes = _read_output(storage, second_result.output_storage_uri)
+        assert not set(first_inodes.values()) & set(second_inodes.values())
+
+    def test_state_records_source_version(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        config = _chain_config("rerun_state")
+
+        result = InMemorySourceExecutor(storage, source_metas).run(config)
+
+        state = read_incremental_state(storage, result.output_storage_uri)
+        assert state["source_dataset_id"] == "ds-v1"
+        assert state["fingerprint"] == incremental_fingerprint(config, "images")
+
+    def test_no_state_for_ineligible_pipeline(self, versioned_sources):
+        storage, source_metas = versioned_sources
+        config = PipelineConfig.model_validate({
+            "name": "rerun_merge",
+            "output": _OUTPUT,
+            "tasks": {
+                "merge": {
+                    "operator": "det_merge_datasets",
+                    "inputs": ["source:dataset_version:ds-v1", "source:dataset_version:ds-v2"],
+                    "params": {},
+                },
+            },
+        })
+
+        result = InMemorySourceExecutor(storage, source_metas).run(config)
+
+        assert read_incremental_state(storage, result.output_storage_uri) is None
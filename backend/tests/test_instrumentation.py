@@ -0,0 +1,180 @@
+"""
+실행 단계 계측 (instrumentation) 테스트.
+
+테스트 영역:
+  1. measure_stage / format_stage_summary — 측정값 채움, None 필드 생략, wall 내림차순 요약
+  2. executor — source 로드 / 계획 / 작업 단위(fusion 체인 1단위) / 실체화 / annotation 작성 계측,
+     serial / thread / process 모드 동일, hook 실패 무시
+  3. 보고 — 기본 출력 실체화 DONE 의 stages, processing.log [단계별 성능], streaming 경로
+"""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.instrumentation import (
+    InstrumentationHook,
+    StageMetrics,
+    StageMetricsCollector,
+    format_stage_summary,
+    measure_stage,
+)
+from tests.conftest import FileStorage, InMemorySourceExecutor, branch_fusion_config, make_source
+
+
+class _RecordingHook(InstrumentationHook):
+
+    def __init__(self) -> None:
+        self.metrics: list[StageMetrics] = []
+
+    def on_stage_end(self, metrics: StageMetrics) -> None:
+        self.metrics.append(metrics)
+
+    def names_of(self, stage: str) -> list[str]:
+        return sorted(metrics.name for metrics in self.metrics if metrics.stage == stage)
+
+
+class _FailingHook(InstrumentationHook):
+
+    def on_stage_end(self, metrics: StageMetrics) -> None:
+        raise RuntimeError("metrics backend down")
+
+
+@pytest.fixture
+def fusion_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["011.jpg", "012.jpg", "013.jpg"]),
+        "ds-c": make_source(storage, "ds-c", "gamma", ["021.jpg", "022.jpg", "023.jpg"]),
+    }
+    return storage, source_metas
+
+
+def _run(storage, source_metas, name: str, **executor_kwargs):
+    hook = _RecordingHook()
+    events: list[tuple[str, str, dict]] = []
+    result = InMemorySourceExecutor(
+        storage, source_metas,
+        instrumentation_hooks=[hook],
+        on_task_progress=lambda task_name, status, detail: events.append(
+            (task_name, status, detail),
+        ),
+        **executor_kwargs,
+    ).run(branch_fusion_config(name))
+    done_details = {task_name: detail for task_name, status, detail in events if status == "DONE"}
+    return result, hook, done_details
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. measure_stage / format_stage_summary
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMeasureStage:
+
+    def test_fills_metrics(self):
+        with measure_stage("task", "busy") as metrics:
+            deadline = time.perf_counter() + 0.02
+            while time.perf_counter() < deadline:
+                pass
+            metrics.record_count = 7
+
+        assert metrics.wall_seconds >= 0.02
+        assert metrics.cpu_seconds > 0
+        assert metrics.record_count == 7
+        assert "annotation_count" not in metrics.as_dict()
+
+    def test_metrics_filled_on_error(self):
+        with pytest.raises(ValueError):
+            with measure_stage("task", "broken") as metrics:
+                raise ValueError("boom")
+
+        assert metrics.wall_seconds >= 0
+
+    def test_summary_sorted_by_wall(self):
+        collector = StageMetricsCollector()
+        collector.on_stage_end(StageMetrics(stage="task", name="fast", wall_seconds=0.1))
+        collector.on_stage_end(StageMetrics(
+            stage="materialize", name="TRAIN", wall_seconds=2.0, record_count=10,
+        ))
+
+        lines = collector.summary_lines()
+
+        assert lines == format_stage_summary(collector.metrics)
+        assert "TRAIN" in lines[0] and "records=10" in lines[0]
+        assert "fast" in lines[1]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. executor 계측
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorInstrumentation:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    def test_stages_measured(self, fusion_storage, execution_mode):
+        storage, source_metas = fusion_storage
+
+        _, hook, _ = _run(
+            storage, source_metas, f"instr_{execution_mode}",
+            execution_mode=execution_mode, max_workers=3,
+        )
+
+        assert hook.names_of("source_load") == ["ds-a", "ds-b", "ds-c"]
+        # fusion 체인(keep → remap)은 한 단위로 잰다
+        assert hook.names_of("task") == [
+            "keep_a → remap_a", "keep_b → remap_b", "keep_c → remap_c", "merge",
+        ]
+        assert hook.names_of("plan") == ["dag_optimize", "image_plans:TRAIN"]
+        assert hook.names_of("materialize") == ["TRAIN"]
+        assert hook.names_of("annotation_write") == ["TRAIN"]
+        source_load = next(m for m in hook.metrics if m.stage == "source_load")
+        assert (source_load.record_count, source_load.annotation_count) == (3, 3)
+        merge = next(m for m in hook.metrics if m.name == "merge")
+        assert merge.record_count == 6
+
+    def test_failing_hook_ignored(self, fusion_storage):
+        storage, source_metas = fusion_storage
+
+        result = InMemorySourceExecutor(
+            storage, source_metas, instrumentation_hooks=[_FailingHook()],
+        ).run(branch_fusion_config("instr_failing_hook"))
+
+        assert result.image_count == 6
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. 보고 (task_progress / processing.log)
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestInstrumentationReport:
+
+    def test_stages_in_materialize_done_and_processing_log(self, fusion_storage):
+        storage, source_metas = fusion_storage
+
+        result, hook, done_details = _run(storage, source_metas, "instr_report")
+
+        stages = done_details["__image_materialize__"]["stages"]
+        assert [stage["name"] for stage in stages] == [m.name for m in hook.metrics]
+        assert all("wall_seconds" in stage and "cpu_seconds" in stage for stage in stages)
+        log_text = (storage.resolve_path(result.output_storage_uri) / "processing.log").read_text(
+            encoding="utf-8",
+        )
+        assert "[단계별 성능]" in log_text
+        assert "keep_a → remap_a: wall=" in log_text
+
+    def test_streaming_materialize_measured(self, fusion_storage):
+        storage, source_metas = fusion_storage
+
+        _, hook, done_details = _run(
+            storage, source_metas, "instr_stream", stream_records=True,
+        )
+
+        assert hook.names_of("materialize") == ["TRAIN (streaming)"]
+        assert hook.names_of("annotation_write") == []
+        assert done_details["__image_materialize__"]["stages"]
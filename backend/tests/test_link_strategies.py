@@ -0,0 +1,212 @@
+"""
+이미지 배치 방식 (place_file / ImageMaterializer link_strategy) 테스트.
+
+테스트 영역:
+  1. place_file — hardlink, 실패 시 다음 방식으로 대체, 지원하지 않는 방식 기억,
+     소스 파일 없으면 FileNotFoundError
+  2. ImageMaterializer — link_strategy 로 복사 이미지 배치, 방식별 수 / 대체 횟수 기록,
+     링크는 출력 파일을 stat 하지 않음 (쓴 바이트 0, journal 크기 없음), 출력 쪽 경로 오류는 올림
+  3. executor — processing.log / perf.json 에 배치 방식 기록
+"""
+from __future__ import annotations
+
+import errno
+from pathlib import Path
+
+import pytest
+
+import lib.pipeline.image_materializer as image_materializer_module
+from lib.pipeline.image_materializer import FilePlacement, ImageMaterializer, place_file
+from lib.pipeline.pipeline_data_models import DatasetMeta, DatasetPlan, ImagePlan
+from lib.pipeline.processing_log import PROCESSING_LOG_FILENAME
+from lib.pipeline.run_checkpoint import MaterializeJournal
+from tests.conftest import FileStorage, InMemorySourceExecutor, branch_fusion_config, make_source
+
+
+def _fail_with(error_number: int, calls: list[Path]):
+    def _fail(src_path: Path, dst_path: Path) -> None:
+        calls.append(src_path)
+        raise OSError(error_number, "not supported")
+    return _fail
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    (tmp_path / "src").mkdir()
+    source_path = tmp_path / "src" / "a.jpg"
+    source_path.write_bytes(b"image bytes")
+    return source_path
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. place_file
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPlaceFile:
+
+    def test_hardlink(self, source_file, tmp_path):
+        dst_path = tmp_path / "b.jpg"
+        dst_path.write_bytes(b"old")
+
+        placement = place_file(source_file, dst_path, "hardlink")
+
+        assert placement == FilePlacement("hardlink")
+        assert dst_path.stat().st_ino == source_file.stat().st_ino
+
+    def test_falls_back_in_order(self, source_file, tmp_path, monkeypatch):
+        calls: list[Path] = []
+        functions = image_materializer_module._PLACE_FUNCTIONS
+        monkeypatch.setitem(functions, "hardlink", _fail_with(errno.EXDEV, calls))
+        monkeypatch.setitem(functions, "reflink", _fail_with(errno.EOPNOTSUPP, calls))
+        dst_path = tmp_path / "b.jpg"
+
+        placement = place_file(source_file, dst_path, "hardlink")
+
+        assert placement.method in ("copy_file_range", "copy")
+        assert placement.fallbacks[:2] == ("hardlink", "reflink")
+        assert dst_path.read_bytes() == b"image bytes"
+        assert dst_path.stat().st_ino != source_file.stat().st_ino
+
+    def test_copy_strategy_only_copies(self, source_file, tmp_path, monkeypatch):
+        calls: list[Path] = []
+        monkeypatch.setitem(
+            image_materializer_module._PLACE_FUNCTIONS, "hardlink",
+            _fail_with(errno.EXDEV, calls),
+        )
+
+        placement = place_file(source_file, tmp_path / "b.jpg", "copy")
+
+        assert placement == FilePlacement("copy", size=len(b"image bytes"))
+        assert calls == []
+
+    def test_unsupported_method_remembered(self, source_file, tmp_path, monkeypatch):
+        calls: list[Path] = []
+        monkeypatch.setitem(
+            image_materializer_module._PLACE_FUNCTIONS, "hardlink",
+            _fail_with(errno.EXDEV, calls),
+        )
+        unsupported: set[tuple[str, Path]] = set()
+
+        first = place_file(source_file, tmp_path / "b.jpg", "hardlink", unsupported)
+        second = place_file(source_file, tmp_path / "c.jpg", "hardlink", unsupported)
+
+        assert len(calls) == 1
+        assert first.fallbacks[0] == second.fallbacks[0] == "hardlink"
+        assert ("hardlink", source_file.parent) in unsupported
+
+    def test_missing_source_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            place_file(tmp_path / "missing.jpg", tmp_path / "b.jpg", "hardlink")
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. ImageMaterializer
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMaterializerLinkStrategy:
+
+    def test_copy_plans_hardlinked(self, source_file, tmp_path):
+        storage = FileStorage(tmp_path)
+        dataset_plan = DatasetPlan(
+            output_meta=DatasetMeta(dataset_id="out", storage_uri="out"),
+            image_plans=[
+                ImagePlan(src_uri="src/a.jpg", dst_uri="out/a.jpg"),
+                ImagePlan(src_uri="src/missing.jpg", dst_uri="out/missing.jpg"),
+            ],
+        )
+
+        result = ImageMaterializer(storage, link_strategy="hardlink").materialize(dataset_plan)
+
+        assert result.link_counts == {"hardlink": 1}
+        assert result.link_fallbacks == {}
+        assert result.skipped_files == ["missing.jpg"]
+        assert (tmp_path / "out" / "a.jpg").stat().st_ino == source_file.stat().st_ino
+
+    def test_default_copies(self, source_file, tmp_path):
+        storage = FileStorage(tmp_path)
+        dataset_plan = DatasetPlan(
+            output_meta=DatasetMeta(dataset_id="out", storage_uri="out"),
+            image_plans=[ImagePlan(src_uri="src/a.jpg", dst_uri="out/a.jpg")],
+        )
+
+        result = ImageMaterializer(storage).materialize(dataset_plan)
+
+        assert result.link_counts == {"copy": 1}
+        assert (tmp_path / "out" / "a.jpg").stat().st_ino != source_file.stat().st_ino
+
+    def test_link_not_measured(self, source_file, tmp_path, monkeypatch):
+        storage = FileStorage(tmp_path)
+        dataset_plan = DatasetPlan(
+            output_meta=DatasetMeta(dataset_id="out", storage_uri="out"),
+            image_plans=[ImagePlan(src_uri="src/a.jpg", dst_uri="out/a.jpg")],
+        )
+        journal = MaterializeJournal(tmp_path / "journal", completed={}, key="run")
+        stat_paths: list[Path] = []
+        original_stat = Path.stat
+
+        def _stat(self, *args, **kwargs):
+            stat_paths.append(self)
+            return original_stat(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "stat", _stat)
+        result = ImageMaterializer(
+            storage, journal=journal, link_strategy="hardlink",
+        ).materialize(dataset_plan)
+        journal.close()
+        monkeypatch.undo()
+
+        assert stat_paths == []
+        assert result.materialized_count == 1
+        assert result.bytes_written == 0
+        assert (tmp_path / "journal").read_text(encoding="utf-8").splitlines()[1] == "out/a.jpg\t-"
+        # 크기 없는 기록은 파일이 있으면 끝난 것으로 본다
+        resumed = MaterializeJournal(tmp_path / "journal", {"out/a.jpg": None}, key="run")
+        assert resumed.is_completed("out/a.jpg", tmp_path / "out" / "a.jpg")
+        assert not resumed.is_completed("out/a.jpg", tmp_path / "out" / "b.jpg")
+
+    def test_output_side_not_found_raises(self, source_file, tmp_path, monkeypatch):
+        storage = FileStorage(tmp_path)
+        dataset_plan = DatasetPlan(
+            output_meta=DatasetMeta(dataset_id="out", storage_uri="out"),
+            image_plans=[ImagePlan(src_uri="src/a.jpg", dst_uri="out/a.jpg")],
+        )
+
+        def _lost_output(src_path: Path, dst_path: Path) -> None:
+            raise FileNotFoundError(errno.ENOENT, "No such file or directory", str(dst_path))
+
+        monkeypatch.setitem(image_materializer_module._PLACE_FUNCTIONS, "hardlink", _lost_output)
+
+        with pytest.raises(FileNotFoundError):
+            ImageMaterializer(storage, link_strategy="hardlink").materialize(dataset_plan)
+
+    def test_invalid_strategy(self, tmp_path):
+        with pytest.raises(ValueError):
+            ImageMaterializer(FileStorage(tmp_path), link_strategy="symlink")
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorLinkStrategy:
+
+    def test_strategy_reported(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        source_metas = {
+            "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+            "ds-b": make_source(storage, "ds-b", "beta", ["011.jpg", "012.jpg", "013.jpg"]),
+            "ds-c": make_source(storage, "ds-c", "gamma", ["021.jpg", "022.jpg", "023.jpg"]),
+        }
+
+        result = InMemorySourceExecutor(
+            storage, source_metas, materialize_link_strategy="hardlink",
+        ).run(branch_fusion_config("link_hardlink"))
+
+        output_dir = storage.resolve_path(result.output_storage_uri)
+        log_text = (output_dir / PROCESSING_LOG_FILENAME).read_text(encoding="utf-8")
+        assert "이미지 배치 방식     : hardlink=6 (설정: hardlink)" in log_text
+        assert result.perf_report["materialize"]["links"] == {"hardlink": 6}
+        assert result.perf_report["materialize"]["link_fallbacks"] == {}
@@ -0,0 +1,162 @@
+"""
+이미지 실체화 I/O 파이프라인 (read-ahead / write-behind, 처리 순서) 테스트.
+
+테스트 영역:
+  1. 처리 순서 — 소스 디렉토리 / inode 순으로 처리, skipped_files 는 ImagePlan 순서
+  2. 단계 실행 — 읽기 → 변환 → 쓰기 결과가 순차 실행과 같음, buffer_bytes 로 읽기 제한,
+     기존 출력 hardlink 를 덮어쓰지 않음
+"""
+from __future__ import annotations
+
+import os
+
+from PIL import Image
+
+from lib.pipeline.image_materializer import ImageMaterializer
+from lib.pipeline.pipeline_data_models import (
+    DatasetMeta,
+    DatasetPlan,
+    ImageManipulationSpec,
+    ImagePlan,
+)
+from tests.conftest import FileStorage
+
+_SPECS = [
+    ImageManipulationSpec(operation="rotate_image", params={"degrees": 90}),
+    ImageManipulationSpec(
+        operation="mask_region", params={"bboxes": [[0, 0, 3, 3]], "fill_color": "black"},
+    ),
+]
+
+
+def _dataset_plan(image_plans: list[ImagePlan]) -> DatasetPlan:
+    return DatasetPlan(
+        output_meta=DatasetMeta(dataset_id="out", storage_uri="out"), image_plans=image_plans,
+    )
+
+
+def _write_sources(storage: FileStorage, directory: str, file_names: list[str]) -> None:
+    """file_names 순서대로 PNG 를 만든다 (보통 inode 도 이 순서로 커진다)."""
+    (storage.base_path / directory).mkdir(parents=True, exist_ok=True)
+    for index, file_name in enumerate(file_names):
+        Image.new("RGB", (10 + index, 6), color=(index * 30, 10, 0)).save(
+            storage.base_path / directory / file_name,
+        )
+
+
+def _transform_plans(file_names: list[str], output_dirname: str) -> list[ImagePlan]:
+    return [
+        ImagePlan(src_uri=f"src/{name}", dst_uri=f"{output_dirname}/{name}", specs=_SPECS)
+        for name in file_names
+    ]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 처리 순서
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestLocalityOrder:
+
+    def test_sorted_by_directory_and_inode(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        _write_sources(storage, "b", ["z.png", "y.png"])
+        _write_sources(storage, "a", ["x.png"])
+        image_plans = [
+            ImagePlan(src_uri=uri, dst_uri=f"out/{index}.png")
+            for index, uri in enumerate(["b/y.png", "a/x.png", "b/z.png", "a/missing.png"])
+        ]
+
+        ordered = ImageMaterializer(storage)._order_by_locality(image_plans)
+
+        inode = {uri: os.stat(tmp_path / uri).st_ino for uri in ("b/y.png", "b/z.png")}
+        expected_b = sorted(["b/y.png", "b/z.png"], key=inode.__getitem__)
+        # 없는 파일은 inode 0 — 같은 디렉토리의 맨 앞
+        assert [plan.src_uri for _, plan in ordered] == [
+            "a/missing.png", "a/x.png", *expected_b,
+        ]
+        assert sorted(index for index, _ in ordered) == [0, 1, 2, 3]
+
+    def test_skipped_files_in_plan_order(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        _write_sources(storage, "src", ["c.png", "a.png"])
+        image_plans = [
+            ImagePlan(src_uri=f"src/{name}", dst_uri=f"out/{name}")
+            for name in ("d.png", "c.png", "b.png", "a.png")
+        ]
+
+        for io_workers in (1, 4):
+            result = ImageMaterializer(storage, io_workers=io_workers).materialize(
+                _dataset_plan(image_plans),
+            )
+            assert result.skipped_files == ["d.png", "b.png"]
+            assert result.materialized_count == 2
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 단계 실행
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestStagedTransform:
+
+    def test_thread_pipeline_matches_serial(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        file_names = [f"{index:02d}.png" for index in range(8)]
+        _write_sources(storage, "src", file_names)
+
+        serial_result = ImageMaterializer(storage).materialize(
+            _dataset_plan(_transform_plans(file_names, "serial")),
+        )
+        staged_result = ImageMaterializer(
+            storage, io_workers=3, transform_workers=2, transform_pool="thread",
+        ).materialize(_dataset_plan(_transform_plans(file_names, "staged")))
+
+        assert staged_result.transform_counts == serial_result.transform_counts
+        assert staged_result.bytes_written == serial_result.bytes_written
+        for file_name in file_names:
+            assert (tmp_path / "staged" / file_name).read_bytes() == (
+                tmp_path / "serial" / file_name
+            ).read_bytes()
+
+    def test_buffer_limit_holds_back_reads(self, tmp_path, monkeypatch):
+        storage = FileStorage(tmp_path)
+        file_names = [f"{index:02d}.png" for index in range(5)]
+        _write_sources(storage, "src", file_names)
+        events: list[str] = []
+        materializer = ImageMaterializer(
+            storage, io_workers=4, transform_workers=2, transform_pool="thread", buffer_bytes=1,
+        )
+        read_source, write_output = materializer._read_source, materializer._write_output
+
+        def _read(src_path):
+            events.append("read")
+            return read_source(src_path)
+
+        def _write(image_plan, image_bytes):
+            events.append("write")
+            return write_output(image_plan, image_bytes)
+
+        monkeypatch.setattr(materializer, "_read_source", _read)
+        monkeypatch.setattr(materializer, "_write_output", _write)
+        result = materializer.materialize(_dataset_plan(_transform_plans(file_names, "out")))
+
+        # 버퍼에 이미지가 있는 동안에는 다음 이미지를 읽지 않는다
+        assert events == ["read", "write"] * 5
+        assert result.materialized_count == 5
+
+    def test_existing_hardlink_not_overwritten(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        _write_sources(storage, "src", ["a.png"])
+        shared = tmp_path / "shared.png"
+        shared.write_bytes(b"shared bytes")
+        (tmp_path / "out").mkdir()
+        os.link(shared, tmp_path / "out" / "a.png")
+
+        ImageMaterializer(
+            storage, io_workers=2, transform_workers=2, transform_pool="thread",
+        ).materialize(_dataset_plan(_transform_plans(["a.png"], "out")))
+
+        assert shared.read_bytes() == b"shared bytes"
+        with Image.open(tmp_path / "out" / "a.png") as output_image:
+            assert output_image.size == (6, 10)
@@ -0,0 +1,176 @@
+"""
+파싱된 DatasetMeta 사이드카 캐시(lib.pipeline.io.meta_cache) 테스트.
+
+테스트 영역:
+  1. use_meta_cache=True — 첫 로드는 파싱 후 캐시 기록, 두 번째는 파싱 없이 캐시 반환
+  2. 메타 파일 교체 / 스키마 버전 변경 시 캐시 무시
+  3. skip_image_sizes=True 로드는 캐시를 읽기만 하고 기록하지 않음
+  4. 손상된 캐시 파일 / invalidate_meta_cache
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import lib.pipeline.dag_executor as dag_executor_module
+import lib.pipeline.io.meta_cache as meta_cache_module
+from lib.pipeline.dag_executor import load_source_meta_from_storage, warm_source_meta_cache
+from lib.pipeline.io.coco_io import write_coco_json
+from lib.pipeline.io.meta_cache import META_CACHE_FILENAME, invalidate_meta_cache
+from tests.conftest import FileStorage, make_source
+
+STORAGE_URI = "source/alpha/train/v1.0.0"
+
+
+@pytest.fixture
+def coco_storage(tmp_path: Path) -> FileStorage:
+    """images/ + annotations/instances.json 을 가진 COCO 데이터셋 1개."""
+    storage = FileStorage(tmp_path)
+    source_meta = make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"])
+    annotations_dir = storage.get_annotations_dir(STORAGE_URI)
+    annotations_dir.mkdir(parents=True, exist_ok=True)
+    write_coco_json(source_meta, annotations_dir / "instances.json")
+    return storage
+
+
+@pytest.fixture
+def yolo_storage(tmp_path: Path) -> FileStorage:
+    """annotations/*.txt + 루트 data.yaml 을 가진 YOLO 데이터셋 1개."""
+    storage = FileStorage(tmp_path)
+    annotations_dir = storage.get_annotations_dir(STORAGE_URI)
+    annotations_dir.mkdir(parents=True, exist_ok=True)
+    (annotations_dir / "001.txt").write_text("0 0.5 0.5 0.2 0.2\n", encoding="utf-8")
+    (annotations_dir / "002.txt").write_text("1 0.3 0.3 0.1 0.1\n", encoding="utf-8")
+    (storage.resolve_path(STORAGE_URI) / "data.yaml").write_text(
+        "names:\n  0: person\n  1: car\n", encoding="utf-8",
+    )
+    return storage
+
+
+def _load_coco(storage: FileStorage, **kwargs):
+    return load_source_meta_from_storage(
+        storage=storage,
+        storage_uri=STORAGE_URI,
+        annotation_format="COCO",
+        annotation_files=["instances.json"],
+        dataset_id="ds-a",
+        **kwargs,
+    )
+
+
+def _load_yolo(storage: FileStorage, **kwargs):
+    return load_source_meta_from_storage(
+        storage=storage,
+        storage_uri=STORAGE_URI,
+        annotation_format="YOLO",
+        annotation_files=["001.txt", "002.txt"],
+        annotation_meta_file="data.yaml",
+        dataset_id="ds-a",
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def parse_counter(monkeypatch) -> list[str]:
+    """실제 파서 호출을 기록한다."""
+    calls: list[str] = []
+    original_parse = dag_executor_module._parse_source_meta_files
+
+    def _counting_parse(*args, **kwargs):
+        calls.append(args[2])
+        return original_parse(*args, **kwargs)
+
+    monkeypatch.setattr(dag_executor_module, "_parse_source_meta_files", _counting_parse)
+    return calls
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 캐시 적중
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMetaCacheHit:
+
+    def test_second_load_skips_parse(self, coco_storage, parse_counter):
+        first = _load_coco(coco_storage, use_meta_cache=True)
+        cache_path = coco_storage.resolve_path(STORAGE_URI) / META_CACHE_FILENAME
+        assert cache_path.exists()
+
+        second = _load_coco(coco_storage, use_meta_cache=True)
+
+        assert parse_counter == ["COCO"]
+        assert second == first
+        assert second is not first
+
+    def test_cache_disabled_by_default(self, coco_storage, parse_counter):
+        _load_coco(coco_storage)
+        _load_coco(coco_storage)
+
+        assert parse_counter == ["COCO", "COCO"]
+        assert not (coco_storage.resolve_path(STORAGE_URI) / META_CACHE_FILENAME).exists()
+
+    def test_warm_then_skip_image_sizes_reader_hits(self, coco_storage, parse_counter):
+        assert warm_source_meta_cache(
+            coco_storage, STORAGE_URI, "COCO", ["instances.json"], dataset_id="ds-a",
+        )
+        meta = _load_coco(coco_storage, use_meta_cache=True, skip_image_sizes=True)
+
+        assert parse_counter == ["COCO"]
+        assert meta.image_count == 3
+
+    def test_skip_image_sizes_does_not_write(self, coco_storage):
+        _load_coco(coco_storage, use_meta_cache=True, skip_image_sizes=True)
+
+        assert not (coco_storage.resolve_path(STORAGE_URI) / META_CACHE_FILENAME).exists()
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 무효화
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMetaCacheInvalidation:
+
+    def test_replaced_meta_file_reparses(self, yolo_storage, parse_counter):
+        before = _load_yolo(yolo_storage, use_meta_cache=True)
+        assert before.categories == ["person", "car"]
+
+        (yolo_storage.resolve_path(STORAGE_URI) / "data.yaml").write_text(
+            "names:\n  0: pedestrian\n  1: vehicle\n", encoding="utf-8",
+        )
+        after = _load_yolo(yolo_storage, use_meta_cache=True)
+
+        assert parse_counter == ["YOLO", "YOLO"]
+        assert after.categories == ["pedestrian", "vehicle"]
+
+    def test_schema_version_bump_reparses(self, coco_storage, parse_counter, monkeypatch):
+        _load_coco(coco_storage, use_meta_cache=True)
+        monkeypatch.setattr(
+            meta_cache_module, "META_CACHE_SCHEMA_VERSION",
+            meta_cache_module.META_CACHE_SCHEMA_VERSION + 1,
+        )
+        _load_coco(coco_storage, use_meta_cache=True)
+
+        assert parse_counter == ["COCO", "COCO"]
+
+    def test_invalidate_removes_cache(self, coco_storage, parse_counter):
+        _load_coco(coco_storage, use_meta_cache=True)
+
+        assert invalidate_meta_cache(coco_storage, STORAGE_URI) is True
+        assert invalidate_meta_cache(coco_storage, STORAGE_URI) is False
+        _load_coco(coco_storage, use_meta_cache=True)
+
+        assert parse_counter == ["COCO", "COCO"]
+
+    def test_corrupt_cache_falls_back_to_parse(self, coco_storage, parse_counter):
+        cache_path = coco_storage.resolve_path(STORAGE_URI) / META_CACHE_FILENAME
+        cache_path.write_bytes(b"not a pickle")
+
+        meta = _load_coco(coco_storage, use_meta_cache=True)
+
+        assert parse_counter == ["COCO"]
+        assert meta.image_count == 3
+        # 재파싱 결과로 캐시가 다시 기록된다
+        assert _load_coco(coco_storage, use_meta_cache=True) == meta
+        assert parse_counter == ["COCO"]
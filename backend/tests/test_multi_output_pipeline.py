@@ -0,0 +1,298 @@
+"""
+Multi-output 파이프라인 (PipelineConfig.extra_outputs) 테스트.
+
+테스트 영역:
+  1. config — 추가 출력 검증 (태스크 존재 / dataset_type 일치 / split 중복), 직렬화 생략, sink 판정
+  2. optimizer — 모든 출력의 상류 유지, 출력 태스크 결과를 바꾸는 재배선 금지
+  3. executor — 공통 상류 1회 계산, 출력별 결과가 단일 출력 run 과 동일, 출력별 lineage source
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_optimizer import optimize_pipeline_config
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source, read_output
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _remap(input_name: str, mapping: dict[str, str]) -> dict:
+    return {
+        "operator": "det_remap_class_name", "inputs": [input_name], "params": {"mapping": mapping},
+    }
+
+
+def _filter(operator: str, input_name: str, class_name: str) -> dict:
+    return {"operator": operator, "inputs": [input_name], "params": {"class_names": [class_name]}}
+
+
+def _multi_output_config(name: str, **overrides) -> PipelineConfig:
+    """
+    ds-a → remap ─┬→ keep_person    (기본 출력, TRAIN)
+                  └→ remove_person  (추가 출력, VAL)
+    ds-b → remap_b                  (추가 출력, TEST)
+    """
+    data = {
+        "name": name,
+        "output": _OUTPUT,
+        "terminal_task": "keep_person",
+        "tasks": {
+            "remap": _remap("source:dataset_version:ds-a", {"car": "vehicle"}),
+            "keep_person": _filter(
+                "det_filter_keep_images_containing_class_name", "remap", "person",
+            ),
+            "remove_person": _filter(
+                "det_filter_remove_images_containing_class_name", "remap", "person",
+            ),
+            "remap_b": _remap("source:dataset_version:ds-b", {"person": "pedestrian"}),
+        },
+        "extra_outputs": [
+            {"terminal_task": "remove_person", "output": {**_OUTPUT, "split": "VAL"}},
+            {"terminal_task": "remap_b", "output": {**_OUTPUT, "split": "TEST"}},
+        ],
+    }
+    data.update(overrides)
+    return PipelineConfig.model_validate(data)
+
+
+def _single_output_config(name: str, terminal_task: str, split: str) -> PipelineConfig:
+    """같은 DAG 에서 출력 하나만 남긴 config (비교 기준)."""
+    data = _multi_output_config(name).model_dump()
+    data.pop("extra_outputs")
+    data["terminal_task"] = terminal_task
+    data["output"] = {**_OUTPUT, "split": split}
+    return PipelineConfig.model_validate(data)
+
+
+@pytest.fixture
+def two_source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg", "004.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["010.jpg", "011.jpg"]),
+    }
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. config
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExtraOutputConfig:
+
+    def test_unknown_terminal_task_rejected(self):
+        with pytest.raises(ValidationError, match="extra_outputs\\[0\\].terminal_task"):
+            _multi_output_config("bad", extra_outputs=[
+                {"terminal_task": "missing", "output": {**_OUTPUT, "split": "VAL"}},
+            ])
+
+    def test_dataset_type_must_match_primary(self):
+        with pytest.raises(ValidationError, match="dataset_type"):
+            _multi_output_config("bad", extra_outputs=[
+                {
+                    "terminal_task": "remove_person",
+                    "output": {**_OUTPUT, "dataset_type": "PROCESSED", "split": "VAL"},
+                },
+            ])
+
+    def test_duplicate_split_rejected(self):
+        with pytest.raises(ValidationError, match="split"):
+            _multi_output_config("bad", extra_outputs=[
+                {"terminal_task": "remove_person", "output": {**_OUTPUT, "split": "train"}},
+            ])
+
+    def test_empty_extra_outputs_omitted_from_dump(self):
+        config = _single_output_config("single", "keep_person", "TRAIN")
+
+        assert "extra_outputs" not in config.model_dump()
+        assert _multi_output_config("multi").model_dump()["extra_outputs"][0]["terminal_task"] == \
+            "remove_person"
+
+    def test_extra_output_sink_not_counted_for_terminal(self):
+        """terminal_task 없이도 추가 출력 태스크를 뺀 sink 가 하나면 기본 출력이 정해진다."""
+        config = _multi_output_config("sink", terminal_task=None, extra_outputs=[
+            {"terminal_task": "remove_person", "output": {**_OUTPUT, "split": "VAL"}},
+            {"terminal_task": "remap_b", "output": {**_OUTPUT, "split": "TEST"}},
+        ])
+
+        assert config.get_terminal_task_name() == "keep_person"
+
+    def test_upstream_source_dataset_ids(self):
+        config = _multi_output_config("upstream")
+
+        assert config.get_upstream_source_dataset_ids("keep_person") == ["ds-a"]
+        assert config.get_upstream_source_dataset_ids("remap_b") == ["ds-b"]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. optimizer
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMultiOutputPlan:
+
+    def test_all_output_branches_kept(self):
+        plan = optimize_pipeline_config(_multi_output_config("plan"))
+
+        assert plan.removed_tasks == []
+        assert plan.output_task_names == ["keep_person", "remove_person", "remap_b"]
+
+    def test_filter_not_moved_ahead_of_output_transform(self):
+        """변환 결과가 추가 출력이면 뒤의 필터를 앞으로 옮기지 않는다 (변환 결과가 달라짐)."""
+        config = PipelineConfig.model_validate({
+            "name": "plan_pinned",
+            "output": _OUTPUT,
+            "terminal_task": "remove_car",
+            "tasks": {
+                "rotate": {
+                    "operator": "det_rotate_image",
+                    "inputs": ["source:dataset_version:ds-a"],
+                    "params": {"degrees": 90},
+                },
+                "remove_car": _filter(
+                    "det_filter_remove_images_containing_class_name", "rotate", "car",
+                ),
+            },
+            "extra_outputs": [{"terminal_task": "rotate", "output": {**_OUTPUT, "split": "VAL"}}],
+        })
+
+        plan = optimize_pipeline_config(config)
+
+        assert plan.moved_ahead == {}
+        assert plan.output_task_names == ["remove_car", "rotate"]
+
+    def test_moved_output_filter_hands_over_output(self):
+        """추가 출력인 필터가 변환을 앞지르면 그 출력은 변환 태스크가 맡는다."""
+        config = PipelineConfig.model_validate({
+            "name": "plan_handover",
+            "output": _OUTPUT,
+            "terminal_task": "remap_b",
+            "tasks": {
+                "rotate": {
+                    "operator": "det_rotate_image",
+                    "inputs": ["source:dataset_version:ds-a"],
+                    "params": {"degrees": 90},
+                },
+                "remove_car": _filter(
+                    "det_filter_remove_images_containing_class_name", "rotate", "car",
+                ),
+                "remap_b": _remap("source:dataset_version:ds-b", {"car": "vehicle"}),
+            },
+            "extra_outputs": [
+                {"terminal_task": "remove_car", "output": {**_OUTPUT, "split": "VAL"}},
+            ],
+        })
+
+        plan = optimize_pipeline_config(config)
+
+        assert plan.moved_ahead == {"remove_car": ["rotate"]}
+        assert plan.extra_terminal_task_names == ["rotate"]
+        assert plan.config.extra_outputs[0].terminal_task == "rotate"
+
+    def test_output_merge_not_absorbing_filter(self):
+        """병합 결과가 출력이면 뒤의 필터를 병합 안으로 넣지 않는다."""
+        config = PipelineConfig.model_validate({
+            "name": "plan_merge_output",
+            "output": _OUTPUT,
+            "terminal_task": "keep",
+            "tasks": {
+                "merge": {
+                    "operator": "det_merge_datasets",
+                    "inputs": ["source:dataset_version:ds-a", "source:dataset_version:ds-b"],
+                    "params": {},
+                },
+                "keep": _filter(
+                    "det_filter_keep_images_containing_class_name", "merge", "person",
+                ),
+            },
+            "extra_outputs": [{"terminal_task": "merge", "output": {**_OUTPUT, "split": "VAL"}}],
+        })
+
+        assert optimize_pipeline_config(config).merge_filters == {}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMultiOutputExecution:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    @pytest.mark.parametrize("stream_records", [False, True])
+    def test_each_output_matches_single_output_run(
+        self, two_source_storage, run_in_memory, execution_mode, stream_records,
+    ):
+        storage, source_metas = two_source_storage
+        suffix = f"{execution_mode}_{stream_records}"
+        executor_kwargs = {"execution_mode": execution_mode, "stream_records": stream_records}
+
+        result = InMemorySourceExecutor(storage, source_metas, **executor_kwargs).run(
+            _multi_output_config(f"multi_{suffix}"),
+        )
+
+        assert [r.output_split for r in (result, *result.extra_results)] == ["TRAIN", "VAL", "TEST"]
+        for output_result, (terminal_task, split) in zip(
+            (result, *result.extra_results),
+            [("keep_person", "TRAIN"), ("remove_person", "VAL"), ("remap_b", "TEST")],
+            strict=True,
+        ):
+            single_result, single_coco, single_images = run_in_memory(
+                storage, source_metas,
+                _single_output_config(f"single_{terminal_task}_{suffix}", terminal_task, split),
+                **executor_kwargs,
+            )
+            multi_coco, multi_images = read_output(storage, output_result.output_storage_uri)
+            assert multi_coco["images"] == single_coco["images"]
+            assert multi_coco["annotations"] == single_coco["annotations"]
+            assert multi_coco["categories"] == single_coco["categories"]
+            assert list(multi_images) == list(single_images)
+            assert output_result.image_count == single_result.image_count
+
+    def test_shared_prefix_computed_once(self, two_source_storage):
+        storage, source_metas = two_source_storage
+        events: list[tuple[str, str, dict]] = []
+
+        InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        ).run(_multi_output_config("once"))
+
+        running_counts: dict[str, int] = {}
+        for name, status, _ in events:
+            if status == "RUNNING":
+                running_counts[name] = running_counts.get(name, 0) + 1
+        assert running_counts["remap"] == 1
+        # 출력마다 이미지 실체화 진행을 따로 보고한다
+        done_details = {name: detail for name, status, detail in events if status == "DONE"}
+        assert done_details["__image_materialize__:remove_person"]["output_split"] == "VAL"
+        assert done_details["__image_materialize__:remap_b"]["materialized"] == 2
+        assert "__image_materialize__" in done_details
+
+    def test_lineage_sources_and_versions_per_output(self, two_source_storage):
+        storage, source_metas = two_source_storage
+
+        result = InMemorySourceExecutor(storage, source_metas).run(
+            _multi_output_config("lineage"), target_version="3.0",
+            extra_target_versions=["1.0", "7.0"],
+        )
+
+        assert result.source_dataset_ids == ["ds-a"]
+        assert [r.source_dataset_ids for r in result.extra_results] == [["ds-a"], ["ds-b"]]
+        assert result.output_storage_uri == "fusion/lineage/train/3.0"
+        assert [r.output_storage_uri for r in result.extra_results] == [
+            "fusion/lineage/val/1.0", "fusion/lineage/test/7.0",
+        ]
+
+    def test_extra_target_versions_length_checked(self, two_source_storage):
+        storage, source_metas = two_source_storage
+
+        with pytest.raises(ValueError, match="extra_target_versions"):
+            InMemorySourceExecutor(storage, source_metas).run(
+                _multi_output_config("versions"), extra_target_versions=["1.0"],
+            )
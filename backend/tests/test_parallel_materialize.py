@@ -0,0 +1,179 @@
+"""
+병렬 이미지 실체화 (ImageMaterializer io_workers / transform_workers) 테스트.
+
+테스트 영역:
+  1. 복사 — 순차 실행과 같은 MaterializeResult (스킵 순서, 바이트 수), 진행률 콜백 주기,
+     journal 로 이전 시도 이미지 건너뜀
+  2. 변환 — process pool 결과가 순차 실행과 같음, daemon 프로세스에서는 thread pool
+  3. executor — materialize_io_workers 로 실행해도 출력이 같음
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+import lib.pipeline.image_materializer as image_materializer_module
+from lib.pipeline.image_materializer import ImageMaterializer
+from lib.pipeline.pipeline_data_models import (
+    DatasetMeta,
+    DatasetPlan,
+    ImageManipulationSpec,
+    ImagePlan,
+)
+from lib.pipeline.run_checkpoint import MaterializeJournal
+from tests.conftest import FileStorage, branch_fusion_config, make_source
+
+
+def _dataset_plan(image_plans: list[ImagePlan]) -> DatasetPlan:
+    return DatasetPlan(
+        output_meta=DatasetMeta(dataset_id="out", storage_uri="out"), image_plans=image_plans,
+    )
+
+
+def _copy_plan(storage: FileStorage, file_count: int, missing: set[int]) -> DatasetPlan:
+    """src/ 에 file_count 개 파일을 만들고 (missing 번호는 만들지 않음) 복사 계획을 돌려준다."""
+    (storage.base_path / "src").mkdir(parents=True)
+    image_plans: list[ImagePlan] = []
+    for index in range(file_count):
+        file_name = f"{index:04d}.jpg"
+        if index not in missing:
+            (storage.base_path / "src" / file_name).write_bytes(b"x" * (index + 1))
+        image_plans.append(ImagePlan(src_uri=f"src/{file_name}", dst_uri=f"dst/{file_name}"))
+    return _dataset_plan(image_plans)
+
+
+def _transform_plan(storage: FileStorage, output_dirname: str) -> DatasetPlan:
+    (storage.base_path / "src").mkdir(parents=True, exist_ok=True)
+    specs = [
+        ImageManipulationSpec(operation="rotate_image", params={"degrees": 90}),
+        ImageManipulationSpec(
+            operation="mask_region", params={"bboxes": [[0, 0, 4, 4]], "fill_color": "white"},
+        ),
+    ]
+    image_plans: list[ImagePlan] = []
+    for index in range(6):
+        file_name = f"{index:02d}.png"
+        source_path = storage.base_path / "src" / file_name
+        if not source_path.exists():
+            Image.new("RGB", (16 + index, 8), color=(index * 40, 0, 0)).save(source_path)
+        image_plans.append(ImagePlan(
+            src_uri=f"src/{file_name}", dst_uri=f"{output_dirname}/{file_name}", specs=specs,
+        ))
+    return _dataset_plan(image_plans)
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 복사
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestParallelCopy:
+
+    def test_same_result_as_serial(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        dataset_plan = _copy_plan(storage, 250, missing={3, 120, 201})
+        serial_progress: list[tuple[int, int]] = []
+        parallel_progress: list[tuple[int, int]] = []
+
+        serial_result = ImageMaterializer(
+            storage, progress_callback=lambda *args: serial_progress.append(args),
+        ).materialize(dataset_plan)
+        parallel_result = ImageMaterializer(
+            storage, progress_callback=lambda *args: parallel_progress.append(args),
+            io_workers=8,
+        ).materialize(dataset_plan)
+
+        assert parallel_result == serial_result
+        assert parallel_result.skipped_files == ["0003.jpg", "0120.jpg", "0201.jpg"]
+        assert parallel_result.bytes_written == sum(range(1, 251)) - (4 + 121 + 202)
+        assert parallel_progress == serial_progress == [(100, 250), (200, 250), (250, 250)]
+
+    def test_resumes_from_journal(self, tmp_path):
+        storage = FileStorage(tmp_path)
+        dataset_plan = _copy_plan(storage, 10, missing=set())
+        ImageMaterializer(storage).materialize(dataset_plan)
+        journal = MaterializeJournal(
+            tmp_path / "journal",
+            completed={"dst/0000.jpg": 1, "dst/0001.jpg": 2},
+            key="run",
+        )
+
+        result = ImageMaterializer(storage, journal=journal, io_workers=4).materialize(
+            dataset_plan,
+        )
+        journal.close()
+
+        assert result.materialized_count == 10
+        assert result.resumed_count == 2
+        recorded = (tmp_path / "journal").read_text(encoding="utf-8").splitlines()
+        assert len(recorded) == 1 + 8
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 변환
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestParallelTransform:
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        storage = FileStorage(tmp_path)
+
+        serial_result = ImageMaterializer(storage).materialize(
+            _transform_plan(storage, "serial"),
+        )
+        parallel_result = ImageMaterializer(
+            storage, transform_workers=2, transform_pool="process",
+        ).materialize(_transform_plan(storage, "parallel"))
+
+        assert parallel_result.transform_counts == {"rotate_image": 6, "mask_region": 6}
+        assert parallel_result.materialized_count == serial_result.materialized_count == 6
+        for serial_path in sorted((tmp_path / "serial").iterdir()):
+            parallel_path = tmp_path / "parallel" / serial_path.name
+            assert parallel_path.read_bytes() == serial_path.read_bytes()
+
+    def test_daemon_process_uses_thread_pool(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(
+            image_materializer_module.multiprocessing, "current_process",
+            lambda: SimpleNamespace(daemon=True),
+        )
+        materializer = ImageMaterializer(FileStorage(tmp_path), transform_workers=2)
+
+        assert materializer._transform_pool_mode() == "thread"
+
+    def test_invalid_transform_pool(self, tmp_path):
+        with pytest.raises(ValueError):
+            ImageMaterializer(FileStorage(tmp_path), transform_pool="gpu")
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorParallelMaterialize:
+
+    def test_output_same_as_serial(self, tmp_path, run_in_memory):
+        storage = FileStorage(tmp_path)
+        source_metas = {
+            "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+            "ds-b": make_source(storage, "ds-b", "beta", ["011.jpg", "012.jpg", "013.jpg"]),
+            "ds-c": make_source(storage, "ds-c", "gamma", ["021.jpg", "022.jpg", "023.jpg"]),
+        }
+
+        outputs = []
+        image_counts = []
+        for name, executor_kwargs in (
+            ("serial_materialize", {}),
+            ("parallel_materialize", {"materialize_io_workers": 4}),
+        ):
+            result, coco, images = run_in_memory(
+                storage, source_metas, branch_fusion_config(name), **executor_kwargs,
+            )
+            image_bytes = {image_name: path.read_bytes() for image_name, path in images.items()}
+            outputs.append((coco["images"], coco["annotations"], image_bytes))
+            image_counts.append(result.image_count)
+        assert outputs[0] == outputs[1]
+        assert image_counts == [6, 6]
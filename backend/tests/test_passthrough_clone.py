@@ -0,0 +1,257 @@
+"""
+passthrough 복제 (clone_passthrough) 테스트.
+
+테스트 영역:
+  1. COCO / YOLO 복제 — annotation 바이트 동일, 이미지 hardlink, 파싱 결과 캐시로 수치 (파싱 없음)
+  2. 복제하지 않는 경우 — 출력 포맷이 다르거나 clone_passthrough=False 면 기존 실체화 경로,
+     images 디렉토리가 레코드와 맞지 않으면 (레코드 없는 파일 / 없는 이미지) 일반 경로로 대체
+  3. warm_source_meta_cache(parsed_meta=...) — 출력 캐시를 파싱 없이 기록
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import lib.pipeline.dag_executor as dag_executor_module
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import (
+    SourceDescriptor,
+    load_source_meta_from_storage,
+    warm_source_meta_cache,
+)
+from lib.pipeline.io.coco_io import write_coco_json
+from lib.pipeline.io.meta_cache import META_CACHE_FILENAME
+from lib.pipeline.io.yolo_io import _write_yolo_data_yaml, write_yolo_dir
+from tests.conftest import DescribedSourceExecutor, FileStorage, make_source
+
+
+def _passthrough_config(name: str, annotation_format: str) -> PipelineConfig:
+    return PipelineConfig.model_validate({
+        "name": name,
+        "output": {
+            "dataset_type": "SOURCE", "annotation_format": annotation_format, "split": "TRAIN",
+        },
+        "tasks": {},
+        "passthrough_source_split_id": "split-a",
+        "passthrough_source_dataset_id": "ds-a",
+    })
+
+
+def _fail_parse(*args, **kwargs):
+    raise AssertionError("annotation 을 파싱하면 안 된다")
+
+
+@pytest.fixture
+def coco_source(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_meta = make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"])
+    annotations_dir = storage.get_annotations_dir(source_meta.storage_uri)
+    annotations_dir.mkdir(parents=True)
+    write_coco_json(source_meta, annotations_dir / "instances.json")
+    descriptor = SourceDescriptor(
+        dataset_id="ds-a",
+        storage_uri=source_meta.storage_uri,
+        annotation_format="COCO",
+        annotation_files=["instances.json"],
+        extra={"dataset_name": "alpha"},
+        use_meta_cache=True,
+    )
+    return storage, descriptor
+
+
+@pytest.fixture
+def yolo_source(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_meta = make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg"])
+    # YOLO 파서는 이미지 크기를 Pillow 로 읽는다
+    for record in source_meta.image_records:
+        Image.new("RGB", (record.width, record.height)).save(
+            storage.get_images_dir(source_meta.storage_uri) / record.file_name,
+        )
+    annotations_dir = storage.get_annotations_dir(source_meta.storage_uri)
+    annotations_dir.mkdir(parents=True)
+    write_yolo_dir(source_meta, annotations_dir)
+    _write_yolo_data_yaml(sorted(source_meta.categories), storage.resolve_path(
+        source_meta.storage_uri,
+    ))
+    descriptor = SourceDescriptor(
+        dataset_id="ds-a",
+        storage_uri=source_meta.storage_uri,
+        annotation_format="YOLO",
+        annotation_files=sorted(path.name for path in annotations_dir.glob("*.txt")),
+        annotation_meta_file="data.yaml",
+        use_meta_cache=True,
+    )
+    return storage, descriptor
+
+
+def _warm(storage: FileStorage, descriptor: SourceDescriptor) -> None:
+    assert warm_source_meta_cache(
+        storage=storage,
+        storage_uri=descriptor.storage_uri,
+        annotation_format=descriptor.annotation_format,
+        annotation_files=descriptor.annotation_files,
+        annotation_meta_file=descriptor.annotation_meta_file,
+        dataset_id=descriptor.dataset_id,
+    )
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 복제
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPassthroughClone:
+
+    def test_coco_clone_without_parse(self, coco_source, monkeypatch):
+        storage, descriptor = coco_source
+        _warm(storage, descriptor)
+        monkeypatch.setattr(dag_executor_module, "_parse_source_meta_files", _fail_parse)
+        events: list[tuple[str, str, dict]] = []
+
+        result = DescribedSourceExecutor(
+            storage, {"ds-a": descriptor},
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        ).run(_passthrough_config("clone_coco", "COCO"))
+
+        source_root = storage.resolve_path(descriptor.storage_uri)
+        output_root = storage.resolve_path(result.output_storage_uri)
+        source_json = source_root / "annotations" / "instances.json"
+        assert (output_root / "annotations" / "instances.json").read_bytes() == (
+            source_json.read_bytes()
+        )
+        for file_name in ("001.jpg", "002.jpg", "003.jpg"):
+            assert (output_root / "images" / file_name).stat().st_ino == (
+                source_root / "images" / file_name
+            ).stat().st_ino
+        assert result.cloned_source_dataset_id == "ds-a"
+        assert result.image_count == 3
+        assert result.annotation_filenames == ["instances.json"]
+        assert sorted(result.output_meta.categories) == ["car", "person"]
+        done_details = {name: detail for name, status, detail in events if status == "DONE"}
+        assert done_details["__passthrough_load__"]["output_images"] == 3
+        assert done_details["__image_materialize__"]["materialized"] == 3
+        assert result.perf_report is not None
+
+    def test_yolo_clone_keeps_data_yaml(self, yolo_source):
+        storage, descriptor = yolo_source
+        source_root = storage.resolve_path(descriptor.storage_uri)
+
+        result = DescribedSourceExecutor(storage, {"ds-a": descriptor}).run(
+            _passthrough_config("clone_yolo", "YOLO"),
+        )
+
+        output_root = storage.resolve_path(result.output_storage_uri)
+        assert result.cloned_source_dataset_id == "ds-a"
+        assert result.annotation_filenames == descriptor.annotation_files
+        assert result.annotation_meta_filename == "data.yaml"
+        copied_paths = ["data.yaml"] + [
+            f"annotations/{name}" for name in descriptor.annotation_files
+        ]
+        for relative_path in copied_paths:
+            assert (output_root / relative_path).read_bytes() == (
+                source_root / relative_path
+            ).read_bytes()
+        # source 캐시가 없으면 한 번 파싱하고 캐시를 남긴다
+        assert result.output_meta.image_count == 2
+        assert (source_root / META_CACHE_FILENAME).exists()
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 복제하지 않는 경우
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestPassthroughWithoutClone:
+
+    def test_format_mismatch_materializes(self, coco_source):
+        storage, descriptor = coco_source
+
+        result = DescribedSourceExecutor(storage, {"ds-a": descriptor}).run(
+            _passthrough_config("clone_to_yolo", "YOLO"),
+        )
+
+        output_root = storage.resolve_path(result.output_storage_uri)
+        assert result.cloned_source_dataset_id is None
+        assert result.annotation_meta_filename == "data.yaml"
+        assert len(list((output_root / "annotations").glob("*.txt"))) == 3
+
+    def test_clone_disabled(self, coco_source):
+        storage, descriptor = coco_source
+
+        result = DescribedSourceExecutor(
+            storage, {"ds-a": descriptor}, clone_passthrough=False,
+        ).run(_passthrough_config("clone_off", "COCO"))
+
+        output_root = storage.resolve_path(result.output_storage_uri)
+        source_root = storage.resolve_path(descriptor.storage_uri)
+        assert result.cloned_source_dataset_id is None
+        assert result.image_count == 3
+        assert (output_root / "images" / "001.jpg").stat().st_ino != (
+            source_root / "images" / "001.jpg"
+        ).stat().st_ino
+
+    def test_stray_file_not_cloned(self, coco_source):
+        storage, descriptor = coco_source
+        source_images_dir = storage.get_images_dir(descriptor.storage_uri)
+        (source_images_dir / "stray.jpg").write_bytes(b"no record")
+
+        result = DescribedSourceExecutor(storage, {"ds-a": descriptor}).run(
+            _passthrough_config("clone_stray", "COCO"),
+        )
+
+        output_images_dir = storage.get_images_dir(result.output_storage_uri)
+        assert len(list(source_images_dir.iterdir())) == 4
+        assert result.cloned_source_dataset_id is None
+        assert result.image_count == 3
+        assert result.output_meta.image_count == 3
+        assert sorted(path.name for path in output_images_dir.iterdir()) == [
+            "001.jpg", "002.jpg", "003.jpg",
+        ]
+
+    def test_missing_image_pruned_and_reported(self, coco_source):
+        storage, descriptor = coco_source
+        (storage.get_images_dir(descriptor.storage_uri) / "002.jpg").unlink()
+
+        result = DescribedSourceExecutor(storage, {"ds-a": descriptor}).run(
+            _passthrough_config("clone_missing", "COCO"),
+        )
+
+        assert result.cloned_source_dataset_id is None
+        assert result.image_count == 2
+        assert result.skipped_image_files == ["002.jpg"]
+        assert [record.file_name for record in result.output_meta.image_records] == [
+            "001.jpg", "003.jpg",
+        ]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. 출력 파싱 결과 캐시
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestWarmParsedMeta:
+
+    def test_output_cache_written_without_parse(self, coco_source, monkeypatch):
+        storage, descriptor = coco_source
+        result = DescribedSourceExecutor(storage, {"ds-a": descriptor}).run(
+            _passthrough_config("clone_warm", "COCO"),
+        )
+        monkeypatch.setattr(dag_executor_module, "_parse_source_meta_files", _fail_parse)
+        cache_args = {
+            "storage": storage,
+            "storage_uri": result.output_storage_uri,
+            "annotation_format": result.output_format,
+            "annotation_files": result.annotation_filenames,
+            "annotation_meta_file": result.annotation_meta_filename,
+            "dataset_id": "out-1",
+        }
+
+        assert warm_source_meta_cache(**cache_args, parsed_meta=result.output_meta)
+        cached_meta = load_source_meta_from_storage(**cache_args, use_meta_cache=True)
+
+        assert cached_meta.dataset_id == "out-1"
+        assert cached_meta.storage_uri == result.output_storage_uri
+        assert cached_meta.image_count == 3
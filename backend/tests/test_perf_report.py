@@ -0,0 +1,182 @@
+"""
+run 성능 보고서 (perf.json) / run 간 비교 테스트.
+
+테스트 영역:
+  1. executor — 기본 출력 디렉토리에 perf.json, PipelineResult.perf_report 와 같은 내용,
+     이미지 / 바이트 / 변환 횟수 / 스킵 수, 태스크 결과 캐시 hit 비율, 추가 출력 합산
+  2. compare_perf_reports — 느려진 태스크 / phase / 처리량, 짧은 항목 무시, 한쪽에만 있는 태스크
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.perf_report import PERF_REPORT_FILENAME, compare_perf_reports
+from lib.pipeline.task_result_cache import TaskResultCache
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _filter_config(name: str, **extra) -> PipelineConfig:
+    """ds-a → remove_car → remap"""
+    return PipelineConfig.model_validate({
+        "name": name,
+        "output": _OUTPUT,
+        "tasks": {
+            "remove_car": {
+                "operator": "det_filter_remove_images_containing_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"class_names": ["car"]},
+            },
+            "remap": {
+                "operator": "det_remap_class_name",
+                "inputs": ["remove_car"],
+                "params": {"mapping": {"person": "pedestrian"}},
+            },
+        },
+        **extra,
+    })
+
+
+@pytest.fixture
+def source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_metas = {
+        "ds-a": make_source(
+            storage, "ds-a", "alpha", [f"{idx:03d}.jpg" for idx in range(1, 9)],
+        ),
+    }
+    return storage, source_metas
+
+
+def _report(
+    tasks: dict[str, float],
+    phase_b: float = 10.0,
+    images_per_second: float = 100.0,
+    seconds: float = 10.0,
+) -> dict:
+    return {
+        "tasks": {name: {"wall_seconds": wall} for name, wall in tasks.items()},
+        "phases": {"phase_a": 5.0, "phase_b": phase_b},
+        "materialize": {
+            "seconds": seconds, "images_per_second": images_per_second, "mb_per_second": 10.0,
+        },
+    }
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. executor 의 perf.json
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorPerfReport:
+
+    def test_perf_json_written(self, source_storage):
+        storage, source_metas = source_storage
+        images_dir = storage.get_images_dir(source_metas["ds-a"].storage_uri)
+        (images_dir / "003.jpg").unlink()
+
+        result = InMemorySourceExecutor(storage, source_metas).run(_filter_config("perf"))
+
+        perf_path = storage.resolve_path(result.output_storage_uri) / PERF_REPORT_FILENAME
+        report = json.loads(perf_path.read_text(encoding="utf-8"))
+        assert report == result.perf_report
+        materialize = report["materialize"]
+        # person 이미지 001, 003, 005, 007 중 003 은 소스 파일이 없다
+        assert (materialize["images"], materialize["skipped"]) == (3, 1)
+        assert materialize["bytes_written"] == sum(
+            (images_dir / name).stat().st_size for name in ("001.jpg", "005.jpg", "007.jpg")
+        )
+        assert list(report["tasks"]) == ["remove_car → remap"]
+        assert set(report["stages"]) == {
+            "source_load", "plan", "task", "materialize", "annotation_write",
+        }
+        assert report["phases"]["phase_a"] + report["phases"]["phase_b"] == \
+            pytest.approx(report["wall_seconds"], abs=1e-3)
+        assert report["cache"] is None
+
+    def test_transform_counts(self, source_storage, monkeypatch):
+        storage, source_metas = source_storage
+        config = _filter_config("perf_rotate")
+        config_data = config.model_dump()
+        config_data["tasks"]["rotate"] = {
+            "operator": "det_rotate_image",
+            "inputs": ["remap"],
+            "params": {"degrees": 180},
+        }
+        # 더미 이미지는 디코드할 수 없으므로 변환 저장은 복사로 대신한다
+        monkeypatch.setattr(
+            "lib.pipeline.image_materializer.ImageMaterializer._transform_and_save",
+            lambda self, src_path, dst_path, specs: dst_path.write_bytes(src_path.read_bytes()),
+        )
+
+        result = InMemorySourceExecutor(storage, source_metas).run(
+            PipelineConfig.model_validate(config_data),
+        )
+
+        assert result.perf_report["transforms"] == {"rotate_image": 4}
+
+    def test_cache_hit_ratio(self, source_storage, tmp_path):
+        storage, source_metas = source_storage
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=1024 * 1024)
+
+        InMemorySourceExecutor(storage, source_metas, task_result_cache=cache).run(
+            _filter_config("perf_cache"), target_version="1.0",
+        )
+        result = InMemorySourceExecutor(storage, source_metas, task_result_cache=cache).run(
+            _filter_config("perf_cache"), target_version="2.0",
+        )
+
+        assert result.perf_report["cache"] == {"hits": 2, "misses": 0, "hit_ratio": 1.0}
+
+    def test_extra_outputs_summed(self, source_storage):
+        storage, source_metas = source_storage
+        config = _filter_config("perf_multi", extra_outputs=[
+            {"terminal_task": "remove_car", "output": {**_OUTPUT, "split": "VAL"}},
+        ])
+
+        result = InMemorySourceExecutor(storage, source_metas).run(config)
+
+        report = result.perf_report
+        assert [output["output_split"] for output in report["outputs"]] == ["VAL", "TRAIN"]
+        assert report["materialize"]["images"] == 8
+        assert result.extra_results[0].perf_report is None
+        extra_dir = storage.resolve_path(result.extra_results[0].output_storage_uri)
+        assert not (extra_dir / PERF_REPORT_FILENAME).exists()
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. compare_perf_reports
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestComparePerfReports:
+
+    def test_slower_task_and_throughput_flagged(self):
+        baseline = _report({"merge": 4.0, "remap": 2.0})
+        current = _report({"merge": 10.0, "remap": 2.2}, images_per_second=40.0)
+
+        comparison = compare_perf_reports(baseline, current)
+
+        assert [(r.kind, r.name, r.ratio) for r in comparison.regressions] == [
+            ("task", "merge", 2.5), ("throughput", "images_per_second", 2.5),
+        ]
+
+    def test_short_items_ignored(self):
+        baseline = _report({"remap": 0.1}, seconds=0.2, images_per_second=100.0)
+        current = _report({"remap": 0.5}, seconds=0.5, images_per_second=10.0)
+
+        assert compare_perf_reports(baseline, current).regressions == []
+
+    def test_phase_and_unmatched_tasks(self):
+        baseline = _report({"a → b": 3.0})
+        current = _report({"a": 1.0, "b": 1.0}, phase_b=30.0)
+
+        comparison = compare_perf_reports(baseline, current)
+
+        assert [(r.kind, r.name) for r in comparison.regressions] == [("phase", "phase_b")]
+        assert comparison.unmatched_tasks == ["a", "a → b", "b"]
@@ -9,6 +9,7 @@ PipelineConfig DAG 구조 단위 테스트.
   - 자기 참조 감지
   - 터미널 태스크(sink 노드) 식별
   - source dataset_id 수집
+  - run 중복 판정용 정규화 해시 (build_run_config_hash)
 """
 from __future__ import annotations
 
@@ -22,6 +23,7 @@ from lib.pipeline.config import (
     OutputConfig,
     PipelineConfig,
     TaskConfig,
+    build_run_config_hash,
     load_pipeline_config_from_yaml,
 )
 
@@ -247,6 +249,55 @@ class TestTopologicalOrder:
         assert order.index("src_b") < order.index("merge")
 
 
+class TestExecutionLevels:
+    """execution_levels() 검증 — 병렬 실행 단위."""
+
+    def test_linear_chain_one_task_per_level(self):
+        config = PipelineConfig(
+            name="chain",
+            output=_DEFAULT_OUTPUT,
+            tasks={
+                "c": TaskConfig(operator="op", inputs=["b"]),
+                "a": TaskConfig(operator="op", inputs=["source:dataset_split:x"]),
+                "b": TaskConfig(operator="op", inputs=["a"]),
+            },
+        )
+        assert config.execution_levels() == [["a"], ["b"], ["c"]]
+
+    def test_independent_branches_share_levels(self):
+        """source 별 분기 2단 → merge. 같은 깊이의 분기 태스크는 같은 level."""
+        config = PipelineConfig(
+            name="branches",
+            output=_DEFAULT_OUTPUT,
+            tasks={
+                "filter_a": TaskConfig(operator="op", inputs=["source:dataset_split:a"]),
+                "filter_b": TaskConfig(operator="op", inputs=["source:dataset_split:b"]),
+                "remap_a": TaskConfig(operator="op", inputs=["filter_a"]),
+                "remap_b": TaskConfig(operator="op", inputs=["filter_b"]),
+                "merge": TaskConfig(operator="op", inputs=["remap_a", "remap_b"]),
+            },
+        )
+        assert config.execution_levels() == [
+            ["filter_a", "filter_b"],
+            ["remap_a", "remap_b"],
+            ["merge"],
+        ]
+
+    def test_uneven_branches_use_deepest_dependency(self):
+        """짧은 분기는 먼저 끝나고, merge 는 가장 깊은 입력 다음 level."""
+        config = PipelineConfig(
+            name="uneven",
+            output=_DEFAULT_OUTPUT,
+            tasks={
+                "a1": TaskConfig(operator="op", inputs=["source:dataset_split:a"]),
+                "a2": TaskConfig(operator="op", inputs=["a1"]),
+                "b1": TaskConfig(operator="op", inputs=["source:dataset_split:b"]),
+                "merge": TaskConfig(operator="op", inputs=["a2", "b1"]),
+            },
+        )
+        assert config.execution_levels() == [["a1", "b1"], ["a2"], ["merge"]]
+
+
 # =============================================================================
 # Terminal Task (Sink Node)
 # =============================================================================
@@ -289,6 +340,38 @@ class TestTerminalTask:
             )
             config.get_terminal_task_name()
 
+    def test_explicit_terminal_task(self):
+        """terminal_task 가 지정되면 sink 가 여러 개여도 그 태스크가 최종 출력."""
+        config = PipelineConfig(
+            name="explicit_terminal",
+            output=_DEFAULT_OUTPUT,
+            tasks={
+                "a": TaskConfig(operator="op", inputs=["source:dataset_split:x"]),
+                "b": TaskConfig(operator="op", inputs=["source:dataset_split:y"]),
+            },
+            terminal_task="b",
+        )
+        assert config.get_terminal_task_name() == "b"
+
+    def test_unknown_terminal_task_rejected(self):
+        with pytest.raises(ValueError, match="terminal_task"):
+            PipelineConfig(
+                name="bad_terminal",
+                output=_DEFAULT_OUTPUT,
+                tasks={"a": TaskConfig(operator="op", inputs=["source:dataset_split:x"])},
+                terminal_task="missing",
+            )
+
+    def test_unset_terminal_task_not_dumped(self):
+        """미지정 terminal_task 는 dump 에 없다 — 기존 PipelineVersion.config 비교 유지."""
+        config = PipelineConfig(
+            name="dump",
+            output=_DEFAULT_OUTPUT,
+            tasks={"a": TaskConfig(operator="op", inputs=["source:dataset_split:x"])},
+        )
+        assert "terminal_task" not in config.model_dump()
+        assert config.model_copy(update={"terminal_task": "a"}).model_dump()["terminal_task"] == "a"
+
 
 # =============================================================================
 # Source Dataset ID 수집
@@ -504,3 +587,56 @@ class TestYamlParsing:
         assert config.get_all_source_split_ids() == [
             "550e8400-e29b-41d4-a716-446655440000"
         ]
+
+
+# =============================================================================
+# run 중복 판정용 정규화 해시
+# =============================================================================
+
+class TestRunConfigHash:
+
+    _CONFIG = {
+        "name": "hash_test",
+        "output": _DEFAULT_OUTPUT,
+        "tasks": {
+            "keep": {
+                "operator": "filter_keep_images_containing_class_name",
+                "inputs": ["source:dataset_version:ver-a"],
+                "params": {"class_names": ["person"]},
+            },
+        },
+    }
+
+    def test_key_order_and_defaults_ignored(self):
+        reordered = {
+            "tasks": self._CONFIG["tasks"],
+            "output": {"annotation_format": "COCO", "split": "NONE"},
+            "name": "hash_test",
+            "extra_outputs": [],
+        }
+
+        assert build_run_config_hash("pv-1", {"s1": "1.0"}, self._CONFIG) == (
+            build_run_config_hash("pv-1", {"s1": "1.0"}, reordered)
+        )
+
+    def test_inputs_change_hash(self):
+        base_hash = build_run_config_hash("pv-1", {"s1": "1.0"}, self._CONFIG)
+        changed_params = {
+            **self._CONFIG,
+            "tasks": {"keep": {**self._CONFIG["tasks"]["keep"], "params": {"class_names": []}}},
+        }
+
+        assert build_run_config_hash("pv-2", {"s1": "1.0"}, self._CONFIG) != base_hash
+        assert build_run_config_hash("pv-1", {"s1": "2.0"}, self._CONFIG) != base_hash
+        assert build_run_config_hash("pv-1", {"s1": "1.0"}, changed_params) != base_hash
+
+    def test_input_file_change_hash(self):
+        """버전 번호가 같아도 메타 파일이 교체되면 (크기 / mtime) 해시가 달라진다."""
+        files = {"s1": [["instances.json", 120, 1_000], ["data.yaml", 40, 2_000]]}
+        replaced_meta = {"s1": [["instances.json", 120, 1_000], ["data.yaml", 52, 3_000]]}
+        base_hash = build_run_config_hash("pv-1", {"s1": "1.0"}, self._CONFIG, files)
+
+        assert build_run_config_hash("pv-1", {"s1": "1.0"}, self._CONFIG, files) == base_hash
+        assert build_run_config_hash(
+            "pv-1", {"s1": "1.0"}, self._CONFIG, replaced_meta,
+        ) != base_hash
@@ -0,0 +1,62 @@
+"""
+파이프라인 run 이어서 실행 (resume_pipeline) 테스트.
+
+테스트 영역:
+  1. 실행 모드 유지 — 제출 시 PipelineRun.incremental 을 그대로 _execute_pipeline 에 전달
+"""
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import app.tasks.pipeline_tasks as pipeline_tasks
+
+
+class _FakeSession:
+
+    def __init__(self, execution):
+        self._execution = execution
+        self.closed = False
+
+    def query(self, model):
+        return self
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def one(self):
+        return self._execution
+
+    def close(self):
+        self.closed = True
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 실행 모드 유지
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestResumeKeepsMode:
+
+    @pytest.mark.parametrize("incremental", [True, False])
+    def test_incremental_forwarded(self, monkeypatch, incremental):
+        execution = SimpleNamespace(
+            id="run-1", transform_config={"name": "p"}, incremental=incremental,
+        )
+        session = _FakeSession(execution)
+        calls: list[dict] = []
+
+        def _execute(celery_task, db, execution_id, pipeline_config, **kwargs):
+            calls.append({"execution_id": execution_id, "config": pipeline_config, **kwargs})
+            return {"status": "DONE"}
+
+        monkeypatch.setattr(pipeline_tasks, "SyncSessionLocal", lambda: session)
+        monkeypatch.setattr(pipeline_tasks, "_execute_pipeline", _execute)
+
+        assert pipeline_tasks.resume_pipeline("run-1") == {"status": "DONE"}
+        assert calls == [{
+            "execution_id": "run-1", "config": {"name": "p"},
+            "incremental": incremental, "resume": True,
+        }]
+        assert session.closed
@@ -595,3 +595,42 @@ class TestValidateClsAddHeadDuplicates:
             if issue.code == "CLS_ADD_HEAD_DUPLICATE"
         ]
         assert duplicate_errors == []
+
+
+# =============================================================================
+# 최종 출력 태스크 / 미연결 분기
+# =============================================================================
+
+
+class TestValidateTerminalTask:
+    """(9) 최종 출력 태스크 결정 가능 여부."""
+
+    _TWO_SINK_TASKS = {
+        "keep": {
+            "operator": "det_filter_keep_images_containing_class_name",
+            "inputs": ["source:dataset_split:00000000-0000-0000-0000-000000000001"],
+            "params": {"class_names": ["person"]},
+        },
+        "convert": {
+            "operator": "det_format_convert_to_coco",
+            "inputs": ["source:dataset_split:00000000-0000-0000-0000-000000000002"],
+            "params": {},
+        },
+    }
+
+    def test_multiple_sinks_without_terminal_task(self):
+        result = validate_pipeline_config_static(_make_config(tasks=self._TWO_SINK_TASKS))
+
+        error_codes = [i.code for i in result.issues if i.severity == ValidationSeverity.ERROR]
+        assert error_codes == ["AMBIGUOUS_TERMINAL_TASK"]
+
+    def test_unreachable_tasks_warned(self):
+        config = _make_config(tasks=self._TWO_SINK_TASKS)
+        config.terminal_task = "convert"
+
+        result = validate_pipeline_config_static(config)
+
+        assert result.is_valid is True
+        unreachable = [i for i in result.issues if i.code == "UNREACHABLE_TASKS"]
+        assert len(unreachable) == 1
+        assert "keep" in unreachable[0].message
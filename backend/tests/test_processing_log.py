@@ -0,0 +1,132 @@
+"""
+processing.log 상세 실행 로그 spool 테스트.
+
+테스트 영역:
+  1. ProcessingLogSpoolHandler — 줄 단위 기록, 크기 상한 회전 + 생략 표시, append, discard
+  2. executor — processing.log 에 상세 로그 포함, 성공 시 spool 삭제, 실패 시 spool 보존
+"""
+from __future__ import annotations
+
+import io
+import logging
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.processing_log import (
+    PROCESSING_LOG_FILENAME,
+    PROCESSING_LOG_SPOOL_FILENAME,
+    ProcessingLogSpoolHandler,
+)
+from tests.conftest import FileStorage, InMemorySourceExecutor, branch_fusion_config, make_source
+
+
+def _log_lines(handler: ProcessingLogSpoolHandler, messages: list[str]) -> str:
+    test_logger = logging.getLogger("lib.test_processing_log")
+    test_logger.setLevel(logging.INFO)
+    test_logger.addHandler(handler)
+    try:
+        for message in messages:
+            test_logger.info(message)
+    finally:
+        test_logger.removeHandler(handler)
+    copied = io.StringIO()
+    handler.copy_to(copied)
+    return copied.getvalue()
+
+
+@pytest.fixture
+def fusion_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["011.jpg", "012.jpg", "013.jpg"]),
+        "ds-c": make_source(storage, "ds-c", "gamma", ["021.jpg", "022.jpg", "023.jpg"]),
+    }
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. ProcessingLogSpoolHandler
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestProcessingLogSpoolHandler:
+
+    def test_lines_written_to_spool(self, tmp_path):
+        handler = ProcessingLogSpoolHandler(tmp_path / "spool")
+
+        copied = _log_lines(handler, ["첫 줄", "둘째 줄"])
+
+        assert copied == "첫 줄\n둘째 줄\n"
+        assert (tmp_path / "spool").read_text(encoding="utf-8") == copied
+        handler.close()
+
+    def test_rotation_keeps_tail_within_cap(self, tmp_path):
+        handler = ProcessingLogSpoolHandler(tmp_path / "spool", max_bytes=200)
+
+        copied = _log_lines(handler, [f"line {index:04d} " + "x" * 20 for index in range(50)])
+
+        spool_bytes = sum(path.stat().st_size for path in tmp_path.iterdir())
+        assert spool_bytes <= 200
+        assert handler.dropped_bytes > 0
+        first_line, *kept_lines = copied.splitlines()
+        assert f"앞부분 {handler.dropped_bytes} bytes 생략" in first_line
+        assert kept_lines[-1].startswith("line 0049")
+        # 버린 바이트 + 남은 바이트 = 전체
+        assert handler.dropped_bytes + spool_bytes == 50 * len("line 0000 " + "x" * 20 + "\n")
+        handler.close()
+
+    def test_append_and_discard(self, tmp_path):
+        first = ProcessingLogSpoolHandler(tmp_path / "spool")
+        _log_lines(first, ["이전 시도"])
+        first.close()
+
+        resumed = ProcessingLogSpoolHandler(tmp_path / "spool", append=True)
+        copied = _log_lines(resumed, ["이어서 실행"])
+        resumed.discard()
+
+        assert copied == "이전 시도\n이어서 실행\n"
+        assert list(tmp_path.iterdir()) == []
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorProcessingLog:
+
+    def test_detail_log_appended_and_spool_removed(self, fusion_storage, caplog):
+        storage, source_metas = fusion_storage
+        caplog.set_level(logging.INFO, logger="lib")
+
+        result = InMemorySourceExecutor(storage, source_metas).run(
+            branch_fusion_config("plog_ok"),
+        )
+
+        output_dir = storage.resolve_path(result.output_storage_uri)
+        log_text = (output_dir / PROCESSING_LOG_FILENAME).read_text(encoding="utf-8")
+        header, detail = log_text.split("상세 실행 로그", 1)
+        assert "[실행 결과 요약]" in header
+        assert "파이프라인 실행 시작: name=plog_ok" in detail
+        assert not (output_dir / PROCESSING_LOG_SPOOL_FILENAME).exists()
+
+    def test_spool_kept_on_failure(self, fusion_storage, monkeypatch, caplog):
+        storage, source_metas = fusion_storage
+        caplog.set_level(logging.INFO, logger="lib")
+        executor = InMemorySourceExecutor(storage, source_metas)
+
+        def _fail(*args, **kwargs):
+            raise RuntimeError("materialize failed")
+
+        monkeypatch.setattr(executor, "_materialize_and_write", _fail)
+        with pytest.raises(RuntimeError):
+            executor.run(branch_fusion_config("plog_fail"))
+
+        output_dir = storage.resolve_path(storage.build_dataset_uri(
+            dataset_type="FUSION", name="plog_fail", split="TRAIN", version="v1.0.0",
+        ))
+        spool_text = (output_dir / PROCESSING_LOG_SPOOL_FILENAME).read_text(encoding="utf-8")
+        assert "파이프라인 실행 시작: name=plog_fail" in spool_text
+        assert not (output_dir / PROCESSING_LOG_FILENAME).exists()
@@ -0,0 +1,284 @@
+"""
+run checkpoint / 이어서 실행 테스트.
+
+테스트 영역:
+  1. RunCheckpoint — Phase A 결과 저장/복원, 다른 run 의 checkpoint 무시, 잘린 journal 줄 무시
+  2. executor — 성공하면 checkpoint 삭제, 출력 동일
+  3. 이어서 실행 — Phase A 생략, journal 의 이미지(크기 일치)만 건너뜀,
+     출력은 한 번에 끝낸 run 과 동일
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.image_materializer import ImageMaterializer
+from lib.pipeline.run_checkpoint import (
+    CHECKPOINT_DIRNAME,
+    PhaseACheckpoint,
+    RunCheckpoint,
+    build_checkpoint_key,
+)
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source, read_output
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _merge_config(name: str) -> PipelineConfig:
+    """ds-a / ds-b → remap → merge → remove_car"""
+    return PipelineConfig.model_validate({
+        "name": name,
+        "output": _OUTPUT,
+        "tasks": {
+            "remap_a": {
+                "operator": "det_remap_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"mapping": {"person": "pedestrian"}},
+            },
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["remap_a", "source:dataset_version:ds-b"],
+                "params": {},
+            },
+            "remove_car": {
+                "operator": "det_filter_remove_images_containing_class_name",
+                "inputs": ["merge"],
+                "params": {"class_names": ["car"]},
+            },
+        },
+    })
+
+
+@pytest.fixture
+def source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_metas = {
+        "ds-a": make_source(
+            storage, "ds-a", "alpha", [f"{idx:03d}.jpg" for idx in range(1, 9)],
+        ),
+        "ds-b": make_source(storage, "ds-b", "beta", ["101.jpg", "102.jpg", "103.jpg"]),
+    }
+    return storage, source_metas
+
+
+@pytest.fixture
+def failing_materializer(monkeypatch):
+    """fail_after 장을 실체화한 뒤 예외를 낸다 (worker 중단 흉내)."""
+    state = {"fail_after": None, "count": 0}
+    original = ImageMaterializer._materialize_single_image
+
+    def _materialize(self, image_plan):
+        if state["fail_after"] is not None and state["count"] >= state["fail_after"]:
+            raise OSError("NAS mount lost")
+        state["count"] += 1
+        return original(self, image_plan)
+
+    monkeypatch.setattr(ImageMaterializer, "_materialize_single_image", _materialize)
+    return state
+
+
+def _read_output(storage: FileStorage, output_storage_uri: str) -> tuple[dict, dict[str, bytes]]:
+    coco, images = read_output(storage, output_storage_uri)
+    return coco, {name: path.read_bytes() for name, path in images.items()}
+
+
+def _checkpoint_dir(storage: FileStorage, config: PipelineConfig, version: str) -> Path:
+    return storage.resolve_path(f"fusion/{config.name}/train/{version}") / CHECKPOINT_DIRNAME
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. RunCheckpoint
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestRunCheckpoint:
+
+    def test_phase_a_round_trip(self, source_storage):
+        storage, source_metas = source_storage
+        checkpoint = RunCheckpoint(storage, "fusion/ck/train/1.0", "key-1")
+
+        assert checkpoint.save_phase_a(
+            PhaseACheckpoint(output_meta=source_metas["ds-a"], source_storage_uris=["src/a"]),
+        )
+        restored = checkpoint.load_phase_a()
+
+        assert restored.output_meta == source_metas["ds-a"]
+        assert restored.source_storage_uris == ["src/a"]
+
+    def test_other_run_checkpoint_ignored(self, source_storage):
+        storage, source_metas = source_storage
+        RunCheckpoint(storage, "fusion/ck/train/1.0", "key-1").save_phase_a(
+            PhaseACheckpoint(output_meta=source_metas["ds-a"], source_storage_uris=[]),
+        )
+
+        assert RunCheckpoint(storage, "fusion/ck/train/1.0", "key-2").load_phase_a() is None
+
+    def test_key_depends_on_config_and_versions(self):
+        config_dict = _merge_config("ck").model_dump()
+
+        assert build_checkpoint_key(config_dict, "1.0", [], "images") != \
+            build_checkpoint_key(config_dict, "2.0", [], "images")
+        assert build_checkpoint_key(config_dict, "1.0", [], "images") == \
+            build_checkpoint_key(_merge_config("ck").model_dump(), "1.0", [], "images")
+
+    def test_journal_resume_skips_truncated_line(self, source_storage):
+        storage, _ = source_storage
+        checkpoint = RunCheckpoint(storage, "fusion/ck/train/1.0", "key-1")
+        journal = checkpoint.open_journal(resume=False)
+        journal.record("fusion/ck/train/1.0/images/001.jpg", 10)
+        journal.close()
+        with open(journal.journal_path, "a", encoding="utf-8") as f:
+            f.write("fusion/ck/train/1.0/images/0")
+
+        assert checkpoint.open_journal(resume=True).completed == {
+            "fusion/ck/train/1.0/images/001.jpg": 10,
+        }
+        assert checkpoint.open_journal(resume=False).completed == {}
+
+    def test_journal_of_other_run_ignored(self, source_storage):
+        storage, _ = source_storage
+        journal = RunCheckpoint(storage, "fusion/ck/train/1.0", "key-1").open_journal(resume=False)
+        journal.record("fusion/ck/train/1.0/images/001.jpg", 10)
+        journal.close()
+
+        resumed = RunCheckpoint(storage, "fusion/ck/train/1.0", "key-2").open_journal(resume=True)
+
+        assert resumed.completed == {}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. checkpoint 를 남기는 run
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestCheckpointedRun:
+
+    @pytest.mark.parametrize("stream_records", [False, True])
+    def test_checkpoint_removed_and_output_unchanged(self, source_storage, stream_records):
+        storage, source_metas = source_storage
+        config = _merge_config(f"ck_done_{stream_records}")
+
+        checkpointed = InMemorySourceExecutor(
+            storage, source_metas, checkpoint=True, stream_records=stream_records,
+        ).run(config, target_version="1.0")
+        plain = InMemorySourceExecutor(
+            storage, source_metas, stream_records=stream_records,
+        ).run(config, target_version="2.0")
+
+        assert not _checkpoint_dir(storage, config, "1.0").exists()
+        assert _read_output(storage, checkpointed.output_storage_uri) == \
+            _read_output(storage, plain.output_storage_uri)
+
+    def test_failed_run_keeps_checkpoint(self, source_storage, failing_materializer):
+        storage, source_metas = source_storage
+        config = _merge_config("ck_failed")
+        failing_materializer["fail_after"] = 3
+
+        with pytest.raises(OSError, match="NAS mount lost"):
+            InMemorySourceExecutor(storage, source_metas, checkpoint=True).run(
+                config, target_version="1.0",
+            )
+
+        checkpoint_dir = _checkpoint_dir(storage, config, "1.0")
+        assert (checkpoint_dir / "phase_a.pkl").exists()
+        journal_lines = (checkpoint_dir / "materialize.journal").read_text().splitlines()
+        assert len(journal_lines) == 1 + 3  # 키 헤더 + 이미지 3장
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. 이어서 실행
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestResume:
+
+    def _fail_then_resume(self, storage, source_metas, failing_materializer, config, **run_kwargs):
+        failing_materializer["fail_after"] = 3
+        with pytest.raises(OSError):
+            InMemorySourceExecutor(storage, source_metas, checkpoint=True).run(
+                config, target_version="1.0",
+            )
+        failing_materializer["fail_after"] = None
+        events: list[tuple[str, str, dict]] = []
+        resume_executor = InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        )
+        result = resume_executor.run(config, target_version="1.0", resume=True, **run_kwargs)
+        return resume_executor, result, events
+
+    def test_resume_skips_phase_a_and_written_images(
+        self, source_storage, failing_materializer,
+    ):
+        storage, source_metas = source_storage
+        config = _merge_config("ck_resume")
+
+        resume_executor, resumed_result, events = self._fail_then_resume(
+            storage, source_metas, failing_materializer, config,
+        )
+        reference = InMemorySourceExecutor(storage, source_metas).run(
+            config, target_version="2.0",
+        )
+
+        # source 를 다시 로드하지 않는다 (Phase A 전체 생략)
+        assert resume_executor.load_thread_names == []
+        done_details = {name: detail for name, status, detail in events if status == "DONE"}
+        assert done_details["merge"]["resumed"] is True
+        assert done_details["__image_materialize__"]["resumed"] == 3
+        assert done_details["__image_materialize__"]["materialized"] == reference.image_count
+        assert _read_output(storage, resumed_result.output_storage_uri) == \
+            _read_output(storage, reference.output_storage_uri)
+        assert not _checkpoint_dir(storage, config, "1.0").exists()
+
+    def test_partially_written_image_redone(self, source_storage, failing_materializer):
+        storage, source_metas = source_storage
+        config = _merge_config("ck_partial")
+        failing_materializer["fail_after"] = 3
+        with pytest.raises(OSError):
+            InMemorySourceExecutor(storage, source_metas, checkpoint=True).run(
+                config, target_version="1.0",
+            )
+        journal_path = _checkpoint_dir(storage, config, "1.0") / "materialize.journal"
+        first_written = journal_path.read_text().splitlines()[1].split("\t")[0]
+        storage.resolve_path(first_written).write_bytes(b"")
+        failing_materializer["fail_after"] = None
+        events: list[tuple[str, str, dict]] = []
+
+        result = InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        ).run(config, target_version="1.0", resume=True)
+
+        done_details = {name: detail for name, status, detail in events if status == "DONE"}
+        assert done_details["__image_materialize__"]["resumed"] == 2
+        _, images = _read_output(storage, result.output_storage_uri)
+        assert all(images.values())
+
+    def test_resume_without_checkpoint_runs_full(self, source_storage):
+        storage, source_metas = source_storage
+        executor = InMemorySourceExecutor(storage, source_metas)
+
+        result = executor.run(_merge_config("ck_none"), target_version="1.0", resume=True)
+
+        assert executor.load_thread_names
+        assert result.image_count > 0
+
+    def test_changed_config_ignores_checkpoint(self, source_storage, failing_materializer):
+        storage, source_metas = source_storage
+        failing_materializer["fail_after"] = 3
+        with pytest.raises(OSError):
+            InMemorySourceExecutor(storage, source_metas, checkpoint=True).run(
+                _merge_config("ck_changed"), target_version="1.0",
+            )
+        failing_materializer["fail_after"] = None
+        changed_data = _merge_config("ck_changed").model_dump()
+        changed_data["tasks"]["remove_car"]["params"]["class_names"] = ["pedestrian"]
+        executor = InMemorySourceExecutor(storage, source_metas)
+
+        executor.run(
+            PipelineConfig.model_validate(changed_data), target_version="1.0", resume=True,
+        )
+
+        assert executor.load_thread_names
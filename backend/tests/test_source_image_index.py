@@ -0,0 +1,140 @@
+"""
+source 이미지 디렉토리 인덱스 테스트.
+
+테스트 영역:
+  1. SourceImageIndex / prune_missing_images — detection / classification 경로 판단,
+     인덱스 밖 경로 유지, 입력 meta 불변
+  2. executor — 없는 이미지를 manipulator 전에 제외, 출력별 skipped 보고,
+     Phase B 에서 소스 이미지 존재 확인 없음, 인덱스 끄면 기존 경로
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.pipeline_data_models import DatasetMeta, ImageRecord
+from lib.pipeline.source_image_index import (
+    SourceImageIndex,
+    build_source_image_index,
+    prune_missing_images,
+)
+from tests.conftest import FileStorage, InMemorySourceExecutor, branch_fusion_config, make_source
+
+
+def _record(file_name: str) -> ImageRecord:
+    return ImageRecord(image_id=1, file_name=file_name, width=10, height=10)
+
+
+@pytest.fixture
+def fusion_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["011.jpg", "012.jpg", "013.jpg"]),
+        "ds-c": make_source(storage, "ds-c", "gamma", ["021.jpg", "022.jpg", "023.jpg"]),
+    }
+    # keep(person) 을 통과하는 001.jpg 의 실제 이미지를 지운다
+    (storage.get_images_dir(source_metas["ds-a"].storage_uri) / "001.jpg").unlink()
+    return storage, source_metas
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. SourceImageIndex / prune_missing_images
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestSourceImageIndex:
+
+    def test_contains(self):
+        index = SourceImageIndex(images_dirname="images", file_names=frozenset({"a.jpg"}))
+
+        assert index.contains(_record("a.jpg")) is True
+        assert index.contains(_record("b.jpg")) is False
+        assert index.contains(_record("images/a.jpg")) is True
+        assert index.contains(_record("images/b.jpg")) is False
+        # images 디렉토리 밖 경로는 인덱스로 판단하지 않는다
+        assert index.contains(_record("other/b.jpg")) is None
+
+    def test_build_missing_dir_returns_none(self, tmp_path):
+        assert build_source_image_index(FileStorage(tmp_path), "no/such/uri", "images") is None
+
+    def test_prune_keeps_input_meta(self):
+        meta = DatasetMeta(
+            dataset_id="ds", storage_uri="uri",
+            image_records=[_record("a.jpg"), _record("b.jpg"), _record("other/c.jpg")],
+        )
+        index = SourceImageIndex(images_dirname="images", file_names=frozenset({"a.jpg"}))
+
+        pruned = prune_missing_images(meta, index)
+
+        assert [record.file_name for record in pruned.image_records] == ["a.jpg", "other/c.jpg"]
+        assert pruned.image_index is index and index.missing_files == ["b.jpg"]
+        assert meta.image_count == 3 and meta.image_index is None
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestExecutorSourceImageIndex:
+
+    def test_pruned_before_tasks_and_reported(self, fusion_storage):
+        storage, source_metas = fusion_storage
+        events: list[tuple[str, str, dict]] = []
+
+        result = InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        ).run(branch_fusion_config("index_pruned"))
+
+        done_details = {name: detail for name, status, detail in events if status == "DONE"}
+        # keep_a 는 처음부터 001.jpg 가 빠진 2장을 받는다
+        assert done_details["keep_a"]["input_images"] == 2
+        assert result.image_count == 5
+        assert result.skipped_image_files == ["001.jpg"]
+        assert done_details["__image_materialize__"]["skipped"] == 1
+
+    def test_skipped_only_for_outputs_using_source(self, fusion_storage):
+        storage, source_metas = fusion_storage
+        config_data = branch_fusion_config("index_multi").model_dump()
+        config_data["extra_outputs"] = [{
+            "terminal_task": "remap_b",
+            "output": {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "VAL"},
+        }]
+
+        result = InMemorySourceExecutor(storage, source_metas).run(
+            PipelineConfig.model_validate(config_data),
+        )
+
+        assert result.skipped_image_files == ["001.jpg"]
+        assert result.extra_results[0].skipped_image_files == []
+
+    def test_no_source_exists_check_in_phase_b(self, fusion_storage, monkeypatch):
+        storage, source_metas = fusion_storage
+        source_dirs = {
+            storage.get_images_dir(meta.storage_uri) for meta in source_metas.values()
+        }
+        checked_paths: list[Path] = []
+        original_exists = Path.exists
+
+        def _recording_exists(path: Path, *args, **kwargs) -> bool:
+            checked_paths.append(path)
+            return original_exists(path, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", _recording_exists)
+        InMemorySourceExecutor(storage, source_metas).run(branch_fusion_config("index_stat"))
+
+        assert [path for path in checked_paths if path.parent in source_dirs] == []
+
+    def test_index_disabled_skips_in_phase_b(self, fusion_storage):
+        storage, source_metas = fusion_storage
+
+        result = InMemorySourceExecutor(
+            storage, source_metas, index_source_images=False,
+        ).run(branch_fusion_config("index_off"))
+
+        assert result.image_count == 5
+        assert result.skipped_image_files == ["001.jpg"]
@@ -0,0 +1,316 @@
+"""
+레코드 단위 streaming 실행 (PipelineDagExecutor stream_records=True) 테스트.
+
+테스트 영역:
+  1. stream writer — CocoJsonStreamWriter / YoloLabelStreamWriter 가 일괄 writer 와 같은 파일 작성
+  2. streamed tail 계획 — 최종 출력까지의 per-record 구간, 샘플링/병합은 pipeline breaker
+  3. executor — streaming on/off 출력 동일 (serial/thread/process, COCO/YOLO, 스킵 이미지 포함),
+     출력 레코드 리스트 / DatasetPlan 을 만들지 않음
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import PipelineDagExecutor
+from lib.pipeline.dag_optimizer import optimize_pipeline_config
+from lib.pipeline.image_materializer import ImageMaterializer
+from lib.pipeline.io.coco_io import CocoJsonStreamWriter, write_coco_json
+from lib.pipeline.io.yolo_io import YoloLabelStreamWriter, write_yolo_dir
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source, read_output_coco
+from tests.test_copy_on_write import _detection_meta
+
+
+def _output(annotation_format: str = "COCO") -> dict:
+    return {"dataset_type": "FUSION", "annotation_format": annotation_format, "split": "TRAIN"}
+
+
+def _keep(input_name: str, class_name: str = "person") -> dict:
+    return {
+        "operator": "det_filter_keep_images_containing_class_name",
+        "inputs": [input_name],
+        "params": {"class_names": [class_name]},
+    }
+
+
+def _remap(input_name: str) -> dict:
+    return {
+        "operator": "det_remap_class_name",
+        "inputs": [input_name],
+        "params": {"mapping": {"person": "pedestrian"}},
+    }
+
+
+def _sample(input_name: str) -> dict:
+    return {
+        "operator": "det_sample_n_images", "inputs": [input_name], "params": {"n": 3, "seed": 4},
+    }
+
+
+def _chain_config(name: str, annotation_format: str = "COCO") -> PipelineConfig:
+    """ds-a → remap → keep (전 구간 per-record)."""
+    return PipelineConfig(
+        name=name,
+        output=_output(annotation_format),
+        tasks={
+            "remap": _remap("source:dataset_version:ds-a"),
+            "keep": _keep("remap", "pedestrian"),
+        },
+    )
+
+
+def _breaker_config(name: str, annotation_format: str = "COCO") -> PipelineConfig:
+    """
+    ds-a → sample ─┐
+                   ├→ merge → remap → keep_car
+    ds-b ──────────┘
+    """
+    return PipelineConfig(
+        name=name,
+        output=_output(annotation_format),
+        tasks={
+            "sample": _sample("source:dataset_version:ds-a"),
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["sample", "source:dataset_version:ds-b"],
+                "params": {},
+            },
+            "remap": _remap("merge"),
+            "keep_car": _keep("remap", "car"),
+        },
+    )
+
+
+@pytest.fixture
+def stream_source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path)
+    source_metas = {
+        "ds-a": make_source(
+            storage, "ds-a", "alpha", [f"{index:03d}.jpg" for index in range(1, 9)],
+        ),
+        "ds-b": make_source(storage, "ds-b", "beta", ["002.jpg", "009.jpg", "010.jpg", "011.jpg"]),
+    }
+    return storage, source_metas
+
+
+def _read_output_files(storage: FileStorage, output_storage_uri: str) -> dict[str, bytes]:
+    """출력 디렉토리의 annotation / 이미지 / data.yaml 내용 (processing.log, perf.json 제외)."""
+    output_dir = storage.resolve_path(output_storage_uri)
+    return {
+        str(path.relative_to(output_dir)): path.read_bytes()
+        for path in sorted(output_dir.rglob("*"))
+        if path.is_file() and path.name not in ("processing.log", "perf.json")
+    }
+
+
+def _run_pair(storage, source_metas, config_factory, suffix, **kwargs):
+    """같은 DAG 를 streaming on/off 로 실행해 (streamed 결과, 일괄 결과, streamed DONE 이벤트)."""
+    events: list[tuple[str, str, dict]] = []
+    streamed_result = InMemorySourceExecutor(
+        storage, source_metas, stream_records=True,
+        on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        **kwargs,
+    ).run(config_factory(f"streamed_{suffix}"))
+    batch_result = InMemorySourceExecutor(storage, source_metas, **kwargs).run(
+        config_factory(f"batch_{suffix}"),
+    )
+    return streamed_result, batch_result, events
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. stream writer
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestStreamWriters:
+
+    @pytest.mark.parametrize("image_count", [0, 1, 4])
+    def test_coco_stream_writer_matches_write_coco_json(self, tmp_path, image_count):
+        meta = _detection_meta()
+        meta.categories = ["person", "forklift", "car"]
+        meta.image_records = meta.image_records[:image_count]
+        write_coco_json(meta, tmp_path / "batch.json")
+
+        with CocoJsonStreamWriter(meta.categories, tmp_path / "stream.json") as writer:
+            for record in meta.image_records:
+                writer.write(record)
+
+        assert (tmp_path / "stream.json").read_bytes() == (tmp_path / "batch.json").read_bytes()
+        # 임시 annotation spool 파일은 남지 않는다
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["batch.json", "stream.json"]
+
+    def test_coco_stream_writer_removes_partial_file_on_error(self, tmp_path):
+        meta = _detection_meta()
+
+        with pytest.raises(RuntimeError):
+            with CocoJsonStreamWriter(meta.categories, tmp_path / "stream.json") as writer:
+                writer.write(meta.image_records[0])
+                raise RuntimeError("중단")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_yolo_stream_writer_matches_write_yolo_dir(self, tmp_path):
+        meta = _detection_meta()
+        write_yolo_dir(meta, tmp_path / "batch")
+
+        with YoloLabelStreamWriter(meta.categories, tmp_path / "stream") as writer:
+            for record in meta.image_records:
+                writer.write(record)
+
+        batch_files = {p.name: p.read_bytes() for p in (tmp_path / "batch").iterdir()}
+        stream_files = {p.name: p.read_bytes() for p in (tmp_path / "stream").iterdir()}
+        assert stream_files == batch_files
+        assert writer.image_count == len(meta.image_records)
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. streamed tail 계획
+# ─────────────────────────────────────────────────────────────────
+
+
+def _streamed_tail(config: PipelineConfig) -> list[str]:
+    plan = optimize_pipeline_config(config)
+    executor = PipelineDagExecutor(storage=None, stream_records=True)  # type: ignore[arg-type]
+    fused_chains = executor._plan_fused_chains(plan.config, plan.duplicate_of, plan.merge_filters)
+    return executor._plan_streamed_tail(
+        plan.config, plan.terminal_task_name, plan.duplicate_of, fused_chains,
+    )
+
+
+class TestStreamedTailPlan:
+
+    def test_whole_per_record_chain_streamed(self):
+        assert _streamed_tail(_chain_config("tail_chain")) == ["remap", "keep"]
+
+    def test_merge_and_sampling_are_pipeline_breakers(self):
+        assert _streamed_tail(_breaker_config("tail_breaker")) == ["remap", "keep_car"]
+
+    def test_filter_applied_in_merge_not_streamed(self):
+        config = _breaker_config("tail_merge_filter")
+        del config.tasks["remap"]
+        config.tasks["keep_car"].inputs = ["merge"]
+
+        assert _streamed_tail(config) == []
+
+    def test_branches_before_merge_not_streamed(self):
+        """병합 앞 분기는 병합이 전체 결과를 보아야 하므로 streaming 하지 않는다."""
+        config = PipelineConfig(
+            name="tail_branches",
+            output=_output(),
+            tasks={
+                "remap": _remap("source:dataset_version:ds-a"),
+                "keep": _keep("remap", "pedestrian"),
+                "keep_car": _keep("remap", "car"),
+                "merge": {
+                    "operator": "det_merge_datasets",
+                    "inputs": ["keep", "keep_car"],
+                    "params": {},
+                },
+                "final": {
+                    "operator": "det_remap_class_name",
+                    "inputs": ["merge"],
+                    "params": {"mapping": {"car": "vehicle"}},
+                },
+            },
+        )
+
+        assert _streamed_tail(config) == ["final"]
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestStreamingExecution:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    @pytest.mark.parametrize("annotation_format", ["COCO", "YOLO"])
+    @pytest.mark.parametrize("config_factory", [_chain_config, _breaker_config])
+    def test_same_output_as_batch(
+        self, stream_source_storage, execution_mode, annotation_format, config_factory,
+    ):
+        storage, source_metas = stream_source_storage
+        suffix = f"{config_factory.__name__}_{execution_mode}_{annotation_format}"
+
+        streamed_result, batch_result, _ = _run_pair(
+            storage, source_metas,
+            lambda name: config_factory(name, annotation_format), suffix,
+            execution_mode=execution_mode,
+        )
+
+        assert _read_output_files(storage, streamed_result.output_storage_uri) == \
+            _read_output_files(storage, batch_result.output_storage_uri)
+        assert streamed_result.annotation_filenames == batch_result.annotation_filenames
+        assert streamed_result.image_count == batch_result.image_count
+        assert streamed_result.output_meta.categories == batch_result.output_meta.categories
+
+    def test_task_progress_same_as_batch(self, stream_source_storage):
+        storage, source_metas = stream_source_storage
+        batch_events: list[tuple[str, str, dict]] = []
+
+        _, _, streamed_events = _run_pair(
+            storage, source_metas, _breaker_config, "progress",
+        )
+        InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: batch_events.append(
+                (name, status, detail),
+            ),
+        ).run(_breaker_config("progress_batch_events"))
+
+        def _done_counts(events):
+            return {
+                name: (detail.get("input_images"), detail.get("output_images"),
+                       detail.get("total_images"), detail.get("materialized"))
+                for name, status, detail in events if status == "DONE"
+            }
+
+        assert _done_counts(streamed_events) == _done_counts(batch_events)
+        assert [name for name, status, _ in streamed_events if status == "DONE"][-3:] == [
+            "remap", "keep_car", "__image_materialize__",
+        ]
+
+    def test_missing_source_image_skipped(self, stream_source_storage):
+        storage, source_metas = stream_source_storage
+        # keep 을 통과하는 003.jpg 의 실제 이미지를 지운다
+        (storage.get_images_dir(source_metas["ds-a"].storage_uri) / "003.jpg").unlink()
+
+        streamed_result, batch_result, _ = _run_pair(
+            storage, source_metas, _chain_config, "missing",
+        )
+
+        assert streamed_result.skipped_image_files == ["003.jpg"]
+        assert batch_result.skipped_image_files == ["003.jpg"]
+        assert _read_output_files(storage, streamed_result.output_storage_uri) == \
+            _read_output_files(storage, batch_result.output_storage_uri)
+        coco = read_output_coco(storage, streamed_result.output_storage_uri)
+        assert "003.jpg" not in {image["file_name"] for image in coco["images"]}
+
+    def test_records_not_collected(self, stream_source_storage, monkeypatch):
+        """streamed tail 은 출력 레코드 리스트도, DatasetPlan 도 만들지 않는다."""
+        storage, source_metas = stream_source_storage
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("streaming 실행에서 호출되면 안 됨")
+
+        monkeypatch.setattr(PipelineDagExecutor, "_compute_fused_chain_output", _fail)
+        monkeypatch.setattr(ImageMaterializer, "materialize", _fail)
+
+        result = InMemorySourceExecutor(storage, source_metas, stream_records=True).run(
+            _chain_config("not_collected"),
+        )
+
+        assert result.output_meta.image_records == []
+        assert result.output_meta.categories == ["pedestrian", "car"]
+        assert result.image_count == 4
+
+    def test_manifest_output_not_streamed(self):
+        """CLS_MANIFEST 는 실행 후 레코드로 class 별 이미지 수를 집계하므로 일괄 경로를 쓴다."""
+        executor = PipelineDagExecutor(storage=None, stream_records=True)  # type: ignore[arg-type]
+
+        assert executor._streams_output("COCO")
+        assert not executor._streams_output("CLS_MANIFEST")
+        assert not PipelineDagExecutor(storage=None)._streams_output("COCO")  # type: ignore[arg-type]
@@ -0,0 +1,331 @@
+"""
+run 간 태스크 결과 memoization (TaskResultCache) 테스트.
+
+테스트 영역:
+  1. TaskResultCache — 저장/조회, 헤더만 읽는 통계 조회, 크기 상한 LRU 삭제, 손상 항목 무시
+  2. executor — 두 번째 run 은 캐시에서 찾고 출력 동일 (직렬/병렬, fusion on/off),
+     다른 파이프라인의 같은 prefix 재사용, 마지막 태스크만 바뀌면 상류 재사용
+  3. 키 — 결정적이지 않은 태스크/하류는 캐시 안 함, manipulator 코드가 바뀌면 miss,
+     같은 버전의 메타 파일(data.yaml 등)을 교체하면 miss
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline import task_result_cache
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.dag_executor import SourceDescriptor
+from lib.pipeline.io.coco_io import write_coco_json
+from lib.pipeline.pipeline_data_models import DatasetMeta
+from lib.pipeline.task_result_cache import TaskResultCache, build_task_cache_key
+from tests.conftest import (
+    DescribedSourceExecutor,
+    FileStorage,
+    InMemorySourceExecutor,
+    make_source,
+    read_output_coco,
+)
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _remap(input_name: str, mapping: dict[str, str]) -> dict:
+    return {
+        "operator": "det_remap_class_name", "inputs": [input_name], "params": {"mapping": mapping},
+    }
+
+
+def _sample(input_name: str, seed: int | None) -> dict:
+    return {
+        "operator": "det_sample_n_images", "inputs": [input_name], "params": {"n": 3, "seed": seed},
+    }
+
+
+def _merge_config(name: str, final_mapping: dict[str, str] | None = None) -> PipelineConfig:
+    """
+    ds-a → keep_a ─────────────┐
+                               ├→ merge → final
+    ds-b → remap_b1 → remap_b2 ┘
+    keep_a 를 통과한 002.jpg 가 ds-b 에도 있어 병합 시 rename 이 일어난다.
+    """
+    return PipelineConfig(
+        name=name,
+        output=_OUTPUT,
+        tasks={
+            "keep_a": {
+                "operator": "det_filter_keep_images_containing_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"class_names": ["person"]},
+            },
+            "remap_b1": _remap("source:dataset_version:ds-b", {"car": "vehicle"}),
+            "remap_b2": _remap("remap_b1", {"person": "pedestrian"}),
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["keep_a", "remap_b2"],
+                "params": {},
+            },
+            "final": _remap("merge", final_mapping or {"vehicle": "car"}),
+        },
+    )
+
+
+@pytest.fixture
+def source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "003.jpg", "002.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["002.jpg", "010.jpg", "011.jpg"]),
+    }
+    return storage, source_metas
+
+
+def _run(storage, source_metas, config, cache, **executor_kwargs):
+    """run 1회. (PipelineResult, {태스크명: DONE detail}) 를 돌려준다."""
+    events: list[tuple[str, str, dict]] = []
+    result = InMemorySourceExecutor(
+        storage, source_metas, task_result_cache=cache,
+        on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        **executor_kwargs,
+    ).run(config)
+    return result, {name: detail for name, status, detail in events if status == "DONE"}
+
+
+def _cache_statuses(done_details: dict[str, dict], config: PipelineConfig) -> dict[str, str | None]:
+    return {name: done_details[name].get("cache") for name in config.tasks}
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. TaskResultCache
+# ─────────────────────────────────────────────────────────────────
+
+
+def _meta(dataset_id: str) -> DatasetMeta:
+    return DatasetMeta(dataset_id=dataset_id, storage_uri="", categories=["person"])
+
+
+class TestTaskResultCache:
+
+    def test_put_and_get(self, tmp_path):
+        cache = TaskResultCache(tmp_path, max_bytes=1024 * 1024)
+        stats = {"k1": {"input_images": 3, "output_images": 2, "category_count": 1}}
+
+        assert cache.put("k1" * 32, _meta("a"), stats)
+        meta, task_stats = cache.get("k1" * 32)
+
+        assert meta.dataset_id == "a" and task_stats == stats
+        assert cache.read_stats("k1" * 32) == stats
+        assert cache.get("k2" * 32) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        cache = TaskResultCache(tmp_path, max_bytes=1024 * 1024)
+        keys = ["aa" * 32, "bb" * 32, "cc" * 32]
+        for key in keys[:2]:
+            cache.put(key, _meta(key), {})
+        entry_size = cache.total_bytes() // 2
+        cache.max_bytes = entry_size * 2
+        # 오래된 순서: aa → bb. aa 를 조회하면 bb 가 가장 오래된 항목이 된다
+        for offset, key in enumerate(keys[:2]):
+            os.utime(cache._entry_path(key), (1_000 + offset, 1_000 + offset))
+        assert cache.get(keys[0]) is not None
+
+        cache.put(keys[2], _meta(keys[2]), {})
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None and cache.get(keys[2]) is not None
+        assert cache.evictions == 1
+        assert cache.total_bytes() <= cache.max_bytes
+
+    def test_entry_larger_than_limit_not_stored(self, tmp_path):
+        cache = TaskResultCache(tmp_path, max_bytes=10)
+
+        assert not cache.put("aa" * 32, _meta("a"), {})
+        assert cache.total_bytes() == 0
+
+    def test_corrupted_entry_ignored(self, tmp_path):
+        cache = TaskResultCache(tmp_path, max_bytes=1024 * 1024)
+        cache.put("aa" * 32, _meta("a"), {})
+        cache._entry_path("aa" * 32).write_bytes(b"not a pickle")
+
+        assert cache.get("aa" * 32) is None
+        assert cache.read_stats("aa" * 32) is None
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. executor
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestMemoizedExecution:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    @pytest.mark.parametrize("fuse_record_operators", [True, False])
+    def test_second_run_hits_and_output_unchanged(
+        self, source_storage, tmp_path, execution_mode, fuse_record_operators,
+    ):
+        storage, source_metas = source_storage
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+        executor_kwargs = {
+            "execution_mode": execution_mode, "fuse_record_operators": fuse_record_operators,
+        }
+        suffix = f"{execution_mode}_{fuse_record_operators}"
+
+        first_result, first_done = _run(
+            storage, source_metas, _merge_config(f"first_{suffix}"), cache, **executor_kwargs,
+        )
+        second_result, second_done = _run(
+            storage, source_metas, _merge_config(f"second_{suffix}"), cache, **executor_kwargs,
+        )
+        plain_result, _ = _run(
+            storage, source_metas, _merge_config(f"plain_{suffix}"), None, **executor_kwargs,
+        )
+
+        config = _merge_config("statuses")
+        assert set(_cache_statuses(first_done, config).values()) == {"miss"}
+        assert set(_cache_statuses(second_done, config).values()) == {"hit"}
+        assert second_done["__image_materialize__"]["cache_hits"] == 5
+        assert second_done["__image_materialize__"]["cache_misses"] == 0
+        # 캐시에서 찾은 태스크도 첫 run 과 같은 진행 통계를 보고한다
+        for task_name in config.tasks:
+            assert (
+                second_done[task_name]["input_images"], second_done[task_name]["output_images"],
+            ) == (first_done[task_name]["input_images"], first_done[task_name]["output_images"])
+        second_coco = read_output_coco(storage, second_result.output_storage_uri)
+        assert second_coco == read_output_coco(storage, first_result.output_storage_uri)
+        assert second_coco == read_output_coco(storage, plain_result.output_storage_uri)
+        # 병합 rename(002.jpg 충돌)도 그대로 재현된다
+        assert any(image["file_name"].endswith("_002.jpg") for image in second_coco["images"])
+
+    def test_changed_final_params_reuse_upstream(self, source_storage, tmp_path):
+        storage, source_metas = source_storage
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+
+        _run(storage, source_metas, _merge_config("before"), cache, fuse_record_operators=False)
+        changed_config = _merge_config("after", final_mapping={"vehicle": "truck"})
+        result, done_details = _run(
+            storage, source_metas, changed_config, cache, fuse_record_operators=False,
+        )
+
+        assert _cache_statuses(done_details, changed_config) == {
+            "keep_a": "hit", "remap_b1": "hit", "remap_b2": "hit", "merge": "hit",
+            "final": "miss",
+        }
+        coco = read_output_coco(storage, result.output_storage_uri)
+        assert "truck" in [category["name"] for category in coco["categories"]]
+
+    def test_other_pipeline_reuses_shared_prefix(self, source_storage, tmp_path):
+        """다른 파이프라인이라도 같은 source 에 같은 태스크를 적용한 prefix 는 재사용한다."""
+        storage, source_metas = source_storage
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+        first_config = PipelineConfig(name="first", output=_OUTPUT, tasks={
+            "remap": _remap("source:dataset_version:ds-a", {"car": "vehicle"}),
+            "sample": _sample("remap", seed=7),
+        })
+        second_config = PipelineConfig(name="second", output=_OUTPUT, tasks={
+            "rename": _remap("source:dataset_version:ds-a", {"car": "vehicle"}),
+            "pick": _sample("rename", seed=7),
+            "keep": {
+                "operator": "det_filter_keep_images_containing_class_name",
+                "inputs": ["pick"],
+                "params": {"class_names": ["person"]},
+            },
+        })
+
+        _run(storage, source_metas, first_config, cache)
+        _, done_details = _run(storage, source_metas, second_config, cache)
+
+        # 병합이 아닌 태스크의 키에는 입력 태스크명이 들어가지 않는다
+        assert _cache_statuses(done_details, second_config) == {
+            "rename": "hit", "pick": "hit", "keep": "miss",
+        }
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. 키
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestCacheKey:
+
+    def test_unseeded_sampling_and_downstream_not_cached(self, source_storage, tmp_path):
+        storage, source_metas = source_storage
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+        config = PipelineConfig(name="unseeded", output=_OUTPUT, tasks={
+            "remap": _remap("source:dataset_version:ds-a", {"car": "vehicle"}),
+            "sample": _sample("remap", seed=None),
+            "final": _remap("sample", {"vehicle": "car"}),
+        })
+
+        _run(storage, source_metas, config, cache)
+        _, done_details = _run(storage, source_metas, config, cache)
+
+        assert _cache_statuses(done_details, config) == {
+            "remap": "hit", "sample": None, "final": None,
+        }
+
+    def test_manipulator_code_change_misses(self, source_storage, tmp_path, monkeypatch):
+        storage, source_metas = source_storage
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+        config = _merge_config("code_version")
+
+        _run(storage, source_metas, config, cache)
+        original_code_version = task_result_cache.manipulator_code_version
+        monkeypatch.setattr(
+            task_result_cache, "manipulator_code_version",
+            lambda operator_name: (
+                "changed" if operator_name == "det_merge_datasets"
+                else original_code_version(operator_name)
+            ),
+        )
+        _, done_details = _run(storage, source_metas, config, cache)
+
+        assert _cache_statuses(done_details, config) == {
+            "keep_a": "hit", "remap_b1": "hit", "remap_b2": "hit", "merge": "miss",
+            "final": "miss",
+        }
+
+    def test_replaced_meta_file_misses(self, source_storage, tmp_path):
+        storage, source_metas = source_storage
+        source_root = storage.resolve_path(source_metas["ds-a"].storage_uri)
+        annotations_dir = storage.get_annotations_dir(source_metas["ds-a"].storage_uri)
+        annotations_dir.mkdir(parents=True)
+        write_coco_json(source_metas["ds-a"], annotations_dir / "instances.json")
+        (source_root / "data.yaml").write_text("names: [person, car]\n", encoding="utf-8")
+        descriptors = {"ds-a": SourceDescriptor(
+            dataset_id="ds-a", storage_uri=source_metas["ds-a"].storage_uri,
+            annotation_format="COCO", annotation_files=["instances.json"],
+            annotation_meta_file="data.yaml", extra={"dataset_name": "alpha"},
+        )}
+        cache = TaskResultCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+        config = PipelineConfig(name="meta_file", output=_OUTPUT, tasks={
+            "remap": _remap("source:dataset_version:ds-a", {"car": "vehicle"}),
+        })
+
+        def _remap_cache_status() -> str | None:
+            events: list[tuple[str, str, dict]] = []
+            DescribedSourceExecutor(
+                storage, descriptors, task_result_cache=cache,
+                on_task_progress=lambda name, status, detail: events.append(
+                    (name, status, detail),
+                ),
+            ).run(config)
+            return next(
+                detail.get("cache") for name, status, detail in events
+                if name == "remap" and status == "DONE"
+            )
+
+        assert _remap_cache_status() == "miss"
+        assert _remap_cache_status() == "hit"
+        # 같은 버전 id / storage_uri 에서 메타 파일만 교체 (클래스 이름 변경)
+        (source_root / "data.yaml").write_text("names: [pedestrian, car]\n", encoding="utf-8")
+        assert _remap_cache_status() == "miss"
+
+    def test_input_order_changes_key(self):
+        inputs = [["source", "ds-a", "uri-a", "alpha"], ["source", "ds-b", "uri-b", "beta"]]
+
+        assert build_task_cache_key("det_merge_datasets", {}, inputs) != \
+            build_task_cache_key("det_merge_datasets", {}, inputs[::-1])
+        assert build_task_cache_key("unknown_operator", {}, inputs) is None
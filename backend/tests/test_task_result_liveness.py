@@ -0,0 +1,213 @@
+"""
+중간 태스크 결과 liveness 기반 해제 + 디스크 spill + RSS 보고 테스트.
+
+테스트 영역:
+  1. 마지막 소비 태스크가 꺼내 가면 결과 해제 (최종 태스크 / retain_task_results 는 보존)
+  2. 한참 뒤 level 에서 쓰이는 결과는 spill_dir 에 내렸다가 다시 읽음 — 출력 동일, 임시 파일 정리
+  3. 태스크 DONE 에 rss_mb, 이미지 실체화 DONE 에 peak_rss_mb
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from lib.pipeline import dag_executor
+from lib.pipeline.config import PipelineConfig
+from lib.pipeline.memory_usage import RunPeakRss, current_rss_bytes
+from tests.conftest import FileStorage, InMemorySourceExecutor, make_source, read_output_coco
+
+_OUTPUT = {"dataset_type": "FUSION", "annotation_format": "COCO", "split": "TRAIN"}
+
+
+def _remap(input_name: str, mapping: dict[str, str]) -> dict:
+    return {
+        "operator": "det_remap_class_name", "inputs": [input_name], "params": {"mapping": mapping},
+    }
+
+
+def _wide_config(name: str) -> PipelineConfig:
+    """
+    ds-a → keep_a ──────────────────────────┐
+                                            ├→ merge → final
+    ds-b → remap_b1 → remap_b2 → remap_b3 ──┘
+    keep_a 는 level 0 에서 만들어져 level 3 의 merge 에서야 쓰인다.
+    """
+    return PipelineConfig(
+        name=name,
+        output=_OUTPUT,
+        tasks={
+            "keep_a": {
+                "operator": "det_filter_keep_images_containing_class_name",
+                "inputs": ["source:dataset_version:ds-a"],
+                "params": {"class_names": ["person"]},
+            },
+            "remap_b1": _remap("source:dataset_version:ds-b", {"car": "vehicle"}),
+            "remap_b2": _remap("remap_b1", {"vehicle": "auto"}),
+            "remap_b3": _remap("remap_b2", {"person": "pedestrian"}),
+            "merge": {
+                "operator": "det_merge_datasets",
+                "inputs": ["keep_a", "remap_b3"],
+                "params": {},
+            },
+            "final": _remap("merge", {"auto": "car"}),
+        },
+    )
+
+
+@pytest.fixture
+def wide_source_storage(tmp_path: Path):
+    storage = FileStorage(tmp_path / "storage")
+    source_metas = {
+        "ds-a": make_source(storage, "ds-a", "alpha", ["001.jpg", "002.jpg", "003.jpg"]),
+        "ds-b": make_source(storage, "ds-b", "beta", ["002.jpg", "010.jpg"]),
+    }
+    return storage, source_metas
+
+
+@pytest.fixture
+def captured_stores(monkeypatch):
+    """run 중 만들어진 _TaskResultStore 를 모은다."""
+    stores: list[dag_executor._TaskResultStore] = []
+    original_init = dag_executor._TaskResultStore.__init__
+
+    def _capturing_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        stores.append(self)
+
+    monkeypatch.setattr(dag_executor._TaskResultStore, "__init__", _capturing_init)
+    return stores
+
+
+# ─────────────────────────────────────────────────────────────────
+# 1. 마지막 소비 후 해제
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestReleaseAfterLastConsumer:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread"])
+    def test_intermediates_released(self, wide_source_storage, captured_stores, execution_mode):
+        storage, source_metas = wide_source_storage
+
+        InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode, fuse_record_operators=False,
+        ).run(_wide_config(f"release_{execution_mode}"))
+
+        store = captured_stores[0]
+        assert sorted(store.released_names) == [
+            "keep_a", "merge", "remap_b1", "remap_b2", "remap_b3",
+        ]
+        assert "final" in store and "merge" not in store
+
+    def test_released_as_soon_as_consumed(self, wide_source_storage, captured_stores):
+        """remap_b1 은 remap_b2 가 시작할 때 해제된다 (run 끝까지 기다리지 않음)."""
+        storage, source_metas = wide_source_storage
+        released_at_running: dict[str, list[str]] = {}
+
+        def _on_progress(task_name, status, detail):
+            if status == "RUNNING" and captured_stores:
+                released_at_running[task_name] = list(captured_stores[0].released_names)
+
+        InMemorySourceExecutor(
+            storage, source_metas, fuse_record_operators=False, on_task_progress=_on_progress,
+        ).run(_wide_config("release_timing"))
+
+        assert released_at_running["remap_b3"] == ["remap_b1"]
+
+    def test_retain_task_results_keeps_everything(self, wide_source_storage, captured_stores):
+        storage, source_metas = wide_source_storage
+
+        InMemorySourceExecutor(
+            storage, source_metas, fuse_record_operators=False, retain_task_results=True,
+        ).run(_wide_config("retain"))
+
+        store = captured_stores[0]
+        assert store.released_names == []
+        assert all(name in store for name in ("keep_a", "remap_b1", "merge", "final"))
+
+    def test_duplicate_task_reads_counted(self, wide_source_storage, captured_stores):
+        """중복 태스크가 대표 결과를 꺼내 간 뒤에야 대표 결과가 해제된다."""
+        storage, source_metas = wide_source_storage
+        config_data = _wide_config("release_duplicate").model_dump()
+        config_data["tasks"]["keep_a2"] = dict(config_data["tasks"]["keep_a"])
+        config_data["tasks"]["merge"]["inputs"] = ["keep_a", "keep_a2", "remap_b3"]
+        config = PipelineConfig.model_validate(config_data)
+
+        result = InMemorySourceExecutor(
+            storage, source_metas, fuse_record_operators=False,
+        ).run(config)
+
+        assert {"keep_a", "keep_a2"} <= set(captured_stores[0].released_names)
+        assert len(read_output_coco(storage, result.output_storage_uri)["images"]) == 6
+
+
+# ─────────────────────────────────────────────────────────────────
+# 2. 디스크 spill
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestSpillToDisk:
+
+    @pytest.mark.parametrize("execution_mode", ["serial", "thread", "process"])
+    def test_far_consumer_spilled_and_output_unchanged(
+        self, wide_source_storage, captured_stores, tmp_path, execution_mode,
+    ):
+        storage, source_metas = wide_source_storage
+        spill_dir = tmp_path / "spill"
+
+        spilled_result = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode, fuse_record_operators=False,
+            spill_dir=spill_dir,
+        ).run(_wide_config(f"spill_{execution_mode}"))
+        plain_result = InMemorySourceExecutor(
+            storage, source_metas, execution_mode=execution_mode, fuse_record_operators=False,
+        ).run(_wide_config(f"plain_{execution_mode}"))
+
+        assert captured_stores[0].spilled_names == ["keep_a"]
+        assert captured_stores[1].spilled_names == []
+        assert read_output_coco(storage, spilled_result.output_storage_uri) == \
+            read_output_coco(storage, plain_result.output_storage_uri)
+        # run 별 임시 디렉토리는 정리된다
+        assert list(spill_dir.iterdir()) == []
+
+    def test_spill_level_gap(self, wide_source_storage, captured_stores, tmp_path):
+        storage, source_metas = wide_source_storage
+
+        InMemorySourceExecutor(
+            storage, source_metas, fuse_record_operators=False,
+            spill_dir=tmp_path / "spill", spill_level_gap=3,
+        ).run(_wide_config("spill_gap"))
+
+        assert captured_stores[0].spilled_names == []
+
+
+# ─────────────────────────────────────────────────────────────────
+# 3. RSS 보고
+# ─────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc 기반 RSS 측정")
+class TestRssReporting:
+
+    def test_rss_in_task_progress(self, wide_source_storage):
+        storage, source_metas = wide_source_storage
+        events: list[tuple[str, str, dict]] = []
+
+        InMemorySourceExecutor(
+            storage, source_metas,
+            on_task_progress=lambda name, status, detail: events.append((name, status, detail)),
+        ).run(_wide_config("rss"))
+
+        done_details = {name: detail for name, status, detail in events if status == "DONE"}
+        assert all(done_details[name]["rss_mb"] > 0 for name in ("keep_a", "merge", "final"))
+        materialize_detail = done_details["__image_materialize__"]
+        assert materialize_detail["peak_rss_mb"] >= done_details["final"]["rss_mb"]
+
+    def test_run_peak_not_below_samples(self):
+        tracker = RunPeakRss()
+        sampled = tracker.sample()
+
+        assert sampled == pytest.approx(current_rss_bytes(), rel=0.5)
+        assert tracker.peak_bytes() >= sampled
@@ -28,6 +28,8 @@ import type {
   PipelineListPageResponse,
   PipelineUpdateRequest,
   PipelineRunSubmitRequest,
+  PipelineRunEstimateResponse,
+  PipelineRunPerfComparisonResponse,
   PipelineVersionResponse,
   PipelineVersionUpdateRequest,
   PipelineAutomationRealResponse,
@@ -97,6 +99,18 @@ export const pipelineRunsApi = {
 
   get: (runId: string) =>
     api.get<PipelineExecutionResponse>(`/pipelines/runs/${runId}`),
+
+  /** 실패/중단된 run 을 checkpoint 에서 이어서 실행 (force: RUNNING 으로 남은 run 도 허용) */
+  resume: (runId: string, force = false) =>
+    api.post<PipelineSubmitResponse>(`/pipelines/runs/${runId}/resume`, null, {
+      params: { force },
+    }),
+
+  /** 같은 PipelineVersion 의 기준 run(기본: 직전 성공 run) 대비 느려진 태스크 / 처리량 */
+  comparePerf: (runId: string, baselineRunId?: string) =>
+    api.get<PipelineRunPerfComparisonResponse>(`/pipelines/runs/${runId}/perf-comparison`, {
+      params: baselineRunId ? { baseline_run_id: baselineRunId } : undefined,
+    }),
 }
 
 // =============================================================================
@@ -177,6 +191,10 @@ export const pipelineVersionsApi = {
   /** Version Resolver Modal → run dispatch */
   submitRun: (versionId: string, body: PipelineRunSubmitRequest) =>
     api.post<PipelineSubmitResponse>(`/pipelines/versions/${versionId}/runs`, body),
+
+  /** 제출 전 비용 추정 (dry-run — 이미지는 쓰지 않음) */
+  estimateRun: (versionId: string, body: PipelineRunSubmitRequest) =>
+    api.post<PipelineRunEstimateResponse>(`/pipelines/versions/${versionId}/runs/estimate`, body),
 }
 
 // =============================================================================
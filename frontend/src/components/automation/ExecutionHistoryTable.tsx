@@ -37,6 +37,7 @@ const STATUS_COLOR: Record<PipelineExecutionSummary['status'], string> = {
   RUNNING: 'processing',
   DONE: 'success',
   FAILED: 'error',
+  REUSED: 'cyan',
   SKIPPED_NO_DELTA: 'gold',
   SKIPPED_UPSTREAM_FAILED: 'volcano',
 }
@@ -45,6 +46,7 @@ const STATUS_LABEL: Record<PipelineExecutionSummary['status'], string> = {
   RUNNING: 'Running',
   DONE: 'Done',
   FAILED: 'Failed',
+  REUSED: 'Reused',
   SKIPPED_NO_DELTA: 'Skipped (no-delta)',
   SKIPPED_UPSTREAM_FAILED: 'Skipped (upstream)',
 }
@@ -239,6 +241,7 @@ export default function ExecutionHistoryTable() {
                 'RUNNING',
                 'DONE',
                 'FAILED',
+                'REUSED',
                 'SKIPPED_NO_DELTA',
                 'SKIPPED_UPSTREAM_FAILED',
               ] as PipelineExecutionSummary['status'][]
@@ -18,6 +18,7 @@ const STATUS_COLOR: Record<PipelineExecutionSummary['status'], string> = {
   RUNNING: 'processing',
   DONE: 'success',
   FAILED: 'error',
+  REUSED: 'cyan',
   SKIPPED_NO_DELTA: 'default',
   SKIPPED_UPSTREAM_FAILED: 'default',
 }
@@ -27,6 +28,7 @@ const STATUS_LABEL: Record<PipelineExecutionSummary['status'], string> = {
   RUNNING: 'Running',
   DONE: 'Done',
   FAILED: 'Failed',
+  REUSED: 'Reused',
   SKIPPED_NO_DELTA: 'Skipped (no-delta)',
   SKIPPED_UPSTREAM_FAILED: 'Skipped (upstream)',
 }
@@ -15,8 +15,13 @@ import {
   CopyOutlined,
   CodeOutlined,
 } from '@ant-design/icons'
-import type { PipelineExecutionResponse } from '@/types/pipeline'
-import { formatDate } from '@/utils/format'
+import { pipelineRunsApi } from '@/api/pipeline'
+import type {
+  PipelineExecutionResponse,
+  PipelineRunPerfComparisonResponse,
+  StageMetricsItem,
+} from '@/types/pipeline'
+import { formatBytes, formatDate } from '@/utils/format'
 import dayjs from 'dayjs'
 
 const { Text } = Typography
@@ -54,6 +59,16 @@ const TASK_STATUS_COLOR: Record<string, string> = {
   RUNNING: '#1677ff',
   DONE: '#52c41a',
   FAILED: '#ff4d4f',
+  SKIPPED: '#bfbfbf',
+}
+
+/** 계측 단계 라벨 */
+const STAGE_LABELS: Record<StageMetricsItem['stage'], string> = {
+  source_load: '소스 로드',
+  plan: '계획',
+  task: '태스크',
+  materialize: '이미지 저장',
+  annotation_write: '어노테이션 작성',
 }
 
 /**
@@ -136,9 +151,41 @@ export default function ExecutionDetailDrawer({
   onNavigateToDataset?: (groupId: string, datasetId: string) => void
 }) {
   const [isConfigModalOpen, setIsConfigModalOpen] = useState(false)
+  const [isResuming, setIsResuming] = useState(false)
+  const [perfComparison, setPerfComparison] = useState<PipelineRunPerfComparisonResponse | null>(null)
+  const [isComparingPerf, setIsComparingPerf] = useState(false)
 
   if (!execution) return null
 
+  const handleResume = async () => {
+    setIsResuming(true)
+    try {
+      await pipelineRunsApi.resume(execution.id)
+      message.success('이어서 실행을 제출했습니다. 끝난 태스크와 이미지는 건너뜁니다.')
+    } catch {
+      message.error('이어서 실행을 제출하지 못했습니다.')
+    } finally {
+      setIsResuming(false)
+    }
+  }
+
+  const handleComparePerf = async () => {
+    setIsComparingPerf(true)
+    try {
+      const response = await pipelineRunsApi.comparePerf(execution.id)
+      setPerfComparison(response.data)
+    } catch (error: unknown) {
+      const detail = (error as { response?: { data?: { detail?: string } } })?.response?.data?.detail
+      message.error(detail ?? '성능 비교에 실패했습니다.')
+    } finally {
+      setIsComparingPerf(false)
+    }
+  }
+
+  const perfReport = execution.perf_report
+  // 다른 run 을 열면 이전 비교 결과는 보이지 않게 한다
+  const visiblePerfComparison = perfComparison?.run_id === execution.id ? perfComparison : null
+
   const config = execution.config as Record<string, unknown> | null
   const pipelineName = (config?.name as string) ?? '(이름 없음)'
   const pipelineDescription = (config?.description as string) ?? null
@@ -150,6 +197,10 @@ export default function ExecutionDetailDrawer({
     started_at?: string; finished_at?: string;
     input_images?: number; output_images?: number;
     total_images?: number; materialized?: number; skipped?: number;
+    peak_rss_mb?: number;
+    cache?: 'hit' | 'miss'; cache_hits?: number; cache_misses?: number;
+    reused?: number; resumed?: number | boolean;
+    stages?: StageMetricsItem[];
   }> | null
 
   // PostgreSQL JSONB는 키를 알파벳순 재정렬하므로, started_at 기준으로 실행 순서 복원
@@ -161,6 +212,10 @@ export default function ExecutionDetailDrawer({
       })
     : []
 
+  // 단계별 계측값은 기본 출력의 이미지 실체화 DONE 에 run 전체가 실린다 (오래 걸린 순)
+  const stageMetrics = [...(taskProgressRaw?.['__image_materialize__']?.stages ?? [])]
+    .sort((a, b) => b.wall_seconds - a.wall_seconds)
+
   const statusTag = STATUS_TAG[execution.status] ?? { color: 'default', label: execution.status }
   const progressPercent = execution.total_count > 0
     ? Math.round((execution.processed_count / execution.total_count) * 100)
@@ -255,9 +310,10 @@ export default function ExecutionDetailDrawer({
           <Divider orientation="left" style={{ fontSize: 13 }}>태스크별 진행</Divider>
           <div style={{ display: 'flex', flexDirection: 'column', gap: 6 }}>
             {sortedTaskProgressEntries.map(([taskName, progress], index) => {
-              const isImageMaterialize = taskName === '__image_materialize__'
+              // 추가 출력(multi-output)은 `__image_materialize__:<task>` 로 출력별로 보고된다
+              const isImageMaterialize = taskName.startsWith('__image_materialize__')
               const operatorLabel = isImageMaterialize
-                ? '이미지 저장'
+                ? (progress.output_split ? `이미지 저장 (${progress.output_split})` : '이미지 저장')
                 : (OPERATOR_LABELS[progress.operator] ?? progress.operator)
               const statusColor = TASK_STATUS_COLOR[progress.status] ?? '#8c8c8c'
 
@@ -287,10 +343,17 @@ export default function ExecutionDetailDrawer({
                     >
                       {progress.status === 'DONE' ? '완료'
                         : progress.status === 'RUNNING' ? '실행 중'
-                          : progress.status === 'FAILED' ? '실패' : '대기'}
+                          : progress.status === 'FAILED' ? '실패'
+                            : progress.status === 'SKIPPED' ? '생략' : '대기'}
                     </Tag>
                   </div>
 
+                  {progress.status === 'SKIPPED' && progress.skip_reason === 'dead_branch' && (
+                    <div style={{ marginTop: 4, paddingLeft: 36, fontSize: 12, color: '#8c8c8c' }}>
+                      Save 노드에 도달하지 않는 분기라 실행하지 않았습니다.
+                    </div>
+                  )}
+
                   {/* 상세 정보 (완료된 태스크) */}
                   {progress.status === 'DONE' && (
                     <div style={{ marginTop: 4, paddingLeft: 36, fontSize: 12, color: '#8c8c8c' }}>
@@ -298,11 +361,17 @@ export default function ExecutionDetailDrawer({
                         <>
                           {progress.materialized != null && `저장: ${progress.materialized.toLocaleString()}장`}
                           {progress.skipped != null && progress.skipped > 0 && ` / 스킵: ${progress.skipped}장`}
+                          {progress.reused != null && ` / 이전 출력 재사용: ${progress.reused.toLocaleString()}장`}
+                          {typeof progress.resumed === 'number' && ` / 이어서 실행: ${progress.resumed.toLocaleString()}장 건너뜀`}
+                          {progress.peak_rss_mb != null && ` / 최대 메모리: ${progress.peak_rss_mb.toLocaleString()}MB`}
+                          {progress.cache_hits != null && ` / 캐시: ${progress.cache_hits}개 재사용, ${progress.cache_misses ?? 0}개 계산`}
                         </>
                       ) : (
                         <>
                           {progress.input_images != null && `입력: ${progress.input_images.toLocaleString()}장`}
                           {progress.output_images != null && ` → 출력: ${progress.output_images.toLocaleString()}장`}
+                          {progress.cache === 'hit' && ' (캐시 재사용)'}
+                          {progress.resumed === true && 'checkpoint 에서 복원'}
                         </>
                       )}
                       {progress.started_at && progress.finished_at && (
@@ -319,6 +388,79 @@ export default function ExecutionDetailDrawer({
         </>
       )}
 
+      {/* ── 단계별 성능 (계측값이 있으면 표시) ── */}
+      {stageMetrics.length > 0 && (
+        <>
+          <Divider orientation="left" style={{ fontSize: 13 }}>단계별 성능</Divider>
+          <div style={{ display: 'flex', flexDirection: 'column', gap: 4, fontSize: 12 }}>
+            {stageMetrics.map((metrics, index) => (
+              <div key={`${metrics.stage}-${metrics.name}-${index}`} style={{ display: 'flex', gap: 8 }}>
+                <Tag style={{ margin: 0, fontSize: 11 }}>{STAGE_LABELS[metrics.stage] ?? metrics.stage}</Tag>
+                <Text ellipsis={{ tooltip: metrics.name }} style={{ flex: 1, fontSize: 12 }}>
+                  {metrics.name}
+                </Text>
+                <Text type="secondary" style={{ fontSize: 12 }}>
+                  {`${metrics.wall_seconds.toFixed(2)}초 (CPU ${metrics.cpu_seconds.toFixed(2)}초)`}
+                  {metrics.rss_delta_mb != null && ` / 메모리 ${metrics.rss_delta_mb >= 0 ? '+' : ''}${metrics.rss_delta_mb}MB`}
+                  {metrics.record_count != null && ` / ${metrics.record_count.toLocaleString()}장`}
+                  {metrics.annotation_count != null && ` / ${metrics.annotation_count.toLocaleString()}개 객체`}
+                </Text>
+              </div>
+            ))}
+          </div>
+        </>
+      )}
+
+      {/* ── 성능 보고서 (perf.json) + 이전 run 대비 비교 ── */}
+      {perfReport && (
+        <>
+          <Divider orientation="left" style={{ fontSize: 13 }}>성능 보고서</Divider>
+          <Descriptions column={1} size="small" bordered>
+            <Descriptions.Item label="전체 / 태스크 / 저장">
+              {`${perfReport.wall_seconds.toFixed(1)}초 / ${perfReport.phases.phase_a.toFixed(1)}초 / ${perfReport.phases.phase_b.toFixed(1)}초`}
+            </Descriptions.Item>
+            <Descriptions.Item label="저장 처리량">
+              {perfReport.materialize.images_per_second != null
+                ? `${perfReport.materialize.images_per_second.toLocaleString()}장/초`
+                : '-'}
+              {perfReport.materialize.mb_per_second != null && ` / ${perfReport.materialize.mb_per_second}MB/초`}
+              {` (${formatBytes(perfReport.materialize.bytes_written)})`}
+            </Descriptions.Item>
+            {perfReport.cache?.hit_ratio != null && (
+              <Descriptions.Item label="캐시 재사용률">
+                {`${Math.round(perfReport.cache.hit_ratio * 100)}%`}
+              </Descriptions.Item>
+            )}
+          </Descriptions>
+          <Button
+            size="small"
+            style={{ marginTop: 8 }}
+            loading={isComparingPerf}
+            onClick={handleComparePerf}
+          >
+            이전 run 과 비교
+          </Button>
+          {visiblePerfComparison && (
+            <div style={{ marginTop: 8, fontSize: 12 }}>
+              {visiblePerfComparison.regressions.length === 0 ? (
+                <Text type="secondary" style={{ fontSize: 12 }}>
+                  {`${visiblePerfComparison.slowdown_ratio}배 이상 느려진 항목이 없습니다.`}
+                </Text>
+              ) : (
+                visiblePerfComparison.regressions.map((regression) => (
+                  <div key={`${regression.kind}-${regression.name}`}>
+                    <Tag color="red" style={{ fontSize: 11 }}>{`${regression.ratio}배`}</Tag>
+                    {regression.kind === 'throughput'
+                      ? `${regression.name}: ${regression.baseline} → ${regression.current}`
+                      : `${regression.name}: ${regression.baseline.toFixed(1)}초 → ${regression.current.toFixed(1)}초`}
+                  </div>
+                ))
+              )}
+            </div>
+          )}
+        </>
+      )}
+
       {/* ── 출력 설정 ── */}
       {outputConfig && (
         <>
@@ -391,6 +533,15 @@ export default function ExecutionDetailDrawer({
               {execution.error_message}
             </Text>
           </div>
+          {execution.status === 'FAILED' && (
+            <div style={{ marginTop: 8 }}>
+              <Tooltip title="끝난 태스크와 이미 저장한 이미지는 건너뛰고 실패한 지점부터 다시 실행합니다.">
+                <Button size="small" loading={isResuming} onClick={handleResume}>
+                  이어서 실행
+                </Button>
+              </Tooltip>
+            </div>
+          )}
         </>
       )}
 
@@ -7,14 +7,26 @@
  * 추출해, 각 split 별 최신 READY DatasetVersion 을 기본값으로 한 드롭다운을 표시.
  *
  * 확정 시 `POST /pipelines/entities/{id}/runs` 로 `{split_id: version}` 을 제출.
+ * "비용 추정" 은 같은 입력으로 `POST /pipelines/versions/{id}/runs/estimate` (dry-run) 를 호출해
+ * 출력 이미지 수 / 복사량 / 변환 이미지 수 / 예상 소요 시간을 제출 전에 보여준다.
+ * 같은 입력으로 이미 성공한 run 이 있으면 (outcome=DUPLICATE_OFFERED) 그 출력을 재사용할지
+ * 새로 실행할지 고르게 하고, 고른 duplicate_policy 로 다시 제출한다.
  */
 import { useEffect, useMemo, useState } from 'react'
-import { Modal, Select, Typography, Space, Alert, Spin, Tag, Divider } from 'antd'
+import {
+  Modal, Select, Typography, Space, Alert, Spin, Tag, Divider, Button, Descriptions,
+} from 'antd'
 import { useQueries, useMutation, useQueryClient } from '@tanstack/react-query'
 import { datasetsForPipelineApi, pipelineVersionsApi } from '@/api/pipeline'
-import type { PipelineVersionResponse } from '@/types/pipeline'
+import type {
+  DuplicateRunPolicy,
+  PipelineRunEstimateResponse,
+  PipelineSubmitResponse,
+  PipelineVersionResponse,
+} from '@/types/pipeline'
 import type { DatasetGroup, DatasetSummary } from '@/types/dataset'
 import { parseSourceRef } from '@/pipeline-sdk/sourceFormat'
+import { formatBytes, formatNumber } from '@/utils/format'
 
 const { Text } = Typography
 
@@ -87,6 +99,8 @@ export function VersionResolverModal({
   const queryClient = useQueryClient()
   const [resolvedVersions, setResolvedVersions] = useState<Record<string, string>>({})
   const [errorMessage, setErrorMessage] = useState<string | null>(null)
+  const [estimate, setEstimate] = useState<PipelineRunEstimateResponse | null>(null)
+  const [duplicateOffer, setDuplicateOffer] = useState<PipelineSubmitResponse | null>(null)
 
   // 필요한 split_id 목록을 config 에서 추출
   const requiredSplitIds = useMemo(() => {
@@ -127,17 +141,29 @@ export function VersionResolverModal({
     }
     setResolvedVersions(defaults)
     setErrorMessage(null)
+    setEstimate(null)
   }, [open, groupsQuery.data, requiredSplitIds, splitInfoMap])
 
+  // 입력 버전이 바뀌면 이전 추정 / 중복 안내는 맞지 않는다
+  useEffect(() => {
+    setEstimate(null)
+    setDuplicateOffer(null)
+  }, [resolvedVersions])
+
   const submitMutation = useMutation({
-    mutationFn: async () => {
+    mutationFn: async (duplicatePolicy?: DuplicateRunPolicy) => {
       if (!pipelineVersion) throw new Error('pipelineVersion 없음')
       const response = await pipelineVersionsApi.submitRun(pipelineVersion.id, {
         resolved_input_versions: resolvedVersions,
+        duplicate_policy: duplicatePolicy,
       })
       return response.data
     },
     onSuccess: (data) => {
+      if (data.outcome === 'DUPLICATE_OFFERED') {
+        setDuplicateOffer(data)
+        return
+      }
       queryClient.invalidateQueries({ queryKey: ['pipeline-concepts'] })
       queryClient.invalidateQueries({ queryKey: ['pipeline-versions'] })
       queryClient.invalidateQueries({ queryKey: ['pipeline-runs'] })
@@ -153,6 +179,24 @@ export function VersionResolverModal({
     },
   })
 
+  const estimateMutation = useMutation({
+    mutationFn: async () => {
+      if (!pipelineVersion) throw new Error('pipelineVersion 없음')
+      const response = await pipelineVersionsApi.estimateRun(pipelineVersion.id, {
+        resolved_input_versions: resolvedVersions,
+      })
+      return response.data
+    },
+    onSuccess: (data) => setEstimate(data),
+    onError: (err: unknown) => {
+      const message =
+        (err as { response?: { data?: { detail?: string } } })?.response?.data?.detail
+        ?? (err as Error)?.message
+        ?? '알 수 없는 오류'
+      setErrorMessage(message)
+    },
+  })
+
   if (!pipelineVersion) return null
 
   const isLoading = groupsQuery.isLoading
@@ -172,7 +216,7 @@ export function VersionResolverModal({
         </Space>
       }
       onCancel={onClose}
-      onOk={() => submitMutation.mutate()}
+      onOk={() => submitMutation.mutate(undefined)}
       okText="이 버전으로 실행"
       okButtonProps={{ disabled: !allVersionsSelected || submitMutation.isPending }}
       cancelText="취소"
@@ -189,6 +233,32 @@ export function VersionResolverModal({
           onClose={() => setErrorMessage(null)}
         />
       )}
+      {duplicateOffer && (
+        <Alert
+          type="info" showIcon
+          message="같은 입력으로 이미 성공한 실행이 있습니다"
+          description="기존 출력 버전을 그대로 연결하거나 (worker 실행 없음) 새로 실행할 수 있습니다."
+          action={
+            <Space direction="vertical" size={4}>
+              <Button
+                size="small" type="primary"
+                loading={submitMutation.isPending}
+                onClick={() => submitMutation.mutate('reuse')}
+              >
+                기존 출력 재사용
+              </Button>
+              <Button
+                size="small"
+                loading={submitMutation.isPending}
+                onClick={() => submitMutation.mutate('run')}
+              >
+                새로 실행
+              </Button>
+            </Space>
+          }
+          style={{ marginBottom: 12 }}
+        />
+      )}
       <Text type="secondary" style={{ fontSize: 12 }}>
         각 입력 split 에서 사용할 DatasetVersion 을 선택하세요. 기본값은 해당 split 의
         최신 READY 버전입니다.
@@ -244,6 +314,46 @@ export function VersionResolverModal({
           })}
         </Space>
       )}
+      <Divider style={{ margin: '12px 0' }} />
+      <Button
+        size="small"
+        onClick={() => estimateMutation.mutate()}
+        loading={estimateMutation.isPending}
+        disabled={!allVersionsSelected}
+      >
+        비용 추정
+      </Button>
+      {estimate && (
+        <Descriptions size="small" column={2} style={{ marginTop: 8 }}>
+          <Descriptions.Item label="출력 이미지">
+            {formatNumber(estimate.total_images)}
+          </Descriptions.Item>
+          <Descriptions.Item label="복사량">{formatBytes(estimate.total_bytes)}</Descriptions.Item>
+          <Descriptions.Item label="변환 (디코드/인코드)">
+            {formatNumber(estimate.total_transforms)}
+          </Descriptions.Item>
+          <Descriptions.Item label="예상 소요">
+            {estimate.estimated_duration_seconds != null
+              ? `약 ${Math.ceil(estimate.estimated_duration_seconds / 60)}분`
+              : '이력 없음'}
+          </Descriptions.Item>
+          {estimate.outputs.some((output) => output.missing_image_count > 0) && (
+            <Descriptions.Item label="소스 없음 (건너뜀)" span={2}>
+              {formatNumber(
+                estimate.outputs.reduce((sum, output) => sum + output.missing_image_count, 0),
+              )}
+            </Descriptions.Item>
+          )}
+          {estimate.is_sampled && (
+            <Descriptions.Item span={2}>
+              <Text type="secondary" style={{ fontSize: 11 }}>
+                source {formatNumber(estimate.source_image_count)}장 중{' '}
+                {formatNumber(estimate.sampled_source_image_count)}장 표본으로 추정한 값입니다.
+              </Text>
+            </Descriptions.Item>
+          )}
+        </Descriptions>
+      )}
     </Modal>
   )
 }
@@ -568,6 +568,7 @@ function RunHistoryTable({ items }: RunHistoryTableProps) {
           status === 'DONE' ? 'green'
           : status === 'FAILED' ? 'red'
           : status === 'RUNNING' ? 'blue'
+          : status === 'REUSED' ? 'cyan'
           : 'default'
         return <Tag color={color}>{status}</Tag>
       },
@@ -164,12 +164,21 @@ export const saveDefinition: NodeDefinition<'save'> = {
 
   // SaveNode 는 task 를 발생시키지 않고 PipelineConfig 루트(name/output)만 기여.
   // Load→Save 직결(passthrough) 이면 `passthrough_source_split_id` 를 root 에 추가.
+  // 처리 노드와 연결되면 그 task 키를 `terminal_task` 로 추가 (graphToConfig 가 필요할 때만 유지).
   toConfigContribution(data, ctx) {
     let passthroughSplitId: string | undefined
+    let terminalTask: string | undefined
     if (ctx.incomingEdges.length === 1) {
-      const sourceData = ctx.getNodeData(ctx.incomingEdges[0].source)
+      const sourceNodeId = ctx.incomingEdges[0].source
+      const sourceData = ctx.getNodeData(sourceNodeId)
       if (sourceData?.type === 'dataLoad' && sourceData.splitId) {
         passthroughSplitId = sourceData.splitId
+      } else if (
+        sourceData?.type === 'operator'
+        || sourceData?.type === 'merge'
+        || sourceData?.type === 'placeholder'
+      ) {
+        terminalTask = `task_${sourceNodeId}`
       }
     }
     return {
@@ -182,6 +191,7 @@ export const saveDefinition: NodeDefinition<'save'> = {
           split: data.split,
         },
         ...(passthroughSplitId ? { passthrough_source_split_id: passthroughSplitId } : {}),
+        ...(terminalTask ? { terminal_task: terminalTask } : {}),
       },
     }
   },
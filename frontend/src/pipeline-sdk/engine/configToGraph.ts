@@ -6,7 +6,8 @@
  *      (dataLoad → operator → merge → placeholder → save)
  *   2. ownership 맵을 뒤집어 sourceDatasetId/taskKey → nodeId 인덱스 생성
  *   3. 각 task의 inputs를 해석하여 엣지 생성
- *   4. save 노드는 sink task(다른 task의 input으로 참조되지 않는 task)에 연결
+ *   4. save 노드는 terminal_task 가 있으면 그 task 에, 없으면 sink task
+ *      (다른 task의 input으로 참조되지 않는 task)에 연결
  *   5. 자동 레이아웃 적용
  */
 import type { Edge } from '@xyflow/react'
@@ -129,8 +130,12 @@ export function pipelineConfigToGraph(
         }
       }
     }
+    // terminal_task 가 지정되면 나머지 sink 는 Save 에 연결되지 않은 분기다.
+    const terminalTask = config.terminal_task && config.terminal_task in config.tasks
+      ? config.terminal_task
+      : null
     for (const taskKey of Object.keys(config.tasks)) {
-      if (referencedTaskKeys.has(taskKey)) continue
+      if (terminalTask ? taskKey !== terminalTask : referencedTaskKeys.has(taskKey)) continue
       const sourceNodeId = taskKeyToNodeId.get(taskKey)
       if (sourceNodeId) {
         edges.push({
@@ -80,10 +80,32 @@ export function graphToPipelineConfig(
     output: rootParts.output,
     tasks,
     passthrough_source_split_id: rootWithPassthrough.passthrough_source_split_id ?? null,
+    ...(needsTerminalTask(tasks, rootParts.terminal_task)
+      ? { terminal_task: rootParts.terminal_task }
+      : {}),
     schema_version: CURRENT_SCHEMA_VERSION,
   } as PipelineConfig
 }
 
+/**
+ * Save 에 연결된 task 가 유일한 sink 가 아닐 때만 terminal_task 를 config 에 남긴다.
+ *
+ * sink 가 하나면 백엔드가 terminal 을 자동 판정하므로 생략한다 — 기존 config 와
+ * 동일한 JSON 을 유지해야 PipelineVersion 이 불필요하게 늘어나지 않는다.
+ */
+function needsTerminalTask(
+  tasks: PipelineConfig['tasks'],
+  terminalTask: string | null | undefined,
+): terminalTask is string {
+  if (!terminalTask || !(terminalTask in tasks)) return false
+  const referencedTaskKeys = new Set<string>()
+  for (const taskConfig of Object.values(tasks)) {
+    for (const input of taskConfig.inputs) referencedTaskKeys.add(input)
+  }
+  const sinkTaskKeys = Object.keys(tasks).filter((key) => !referencedTaskKeys.has(key))
+  return !(sinkTaskKeys.length === 1 && sinkTaskKeys[0] === terminalTask)
+}
+
 
 /**
  * Save 노드 없이도 동작하는 부분 config 생성.
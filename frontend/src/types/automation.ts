@@ -167,7 +167,14 @@ export interface PipelineExecutionSummary {
   id: string
   pipeline_id: string
   pipeline_name: string
-  status: 'PENDING' | 'RUNNING' | 'DONE' | 'FAILED' | 'SKIPPED_NO_DELTA' | 'SKIPPED_UPSTREAM_FAILED'
+  status:
+    | 'PENDING'
+    | 'RUNNING'
+    | 'DONE'
+    | 'FAILED'
+    | 'REUSED'
+    | 'SKIPPED_NO_DELTA'
+    | 'SKIPPED_UPSTREAM_FAILED'
   trigger_kind: TriggerKind
   /** automation 경로일 때만 값. manual_from_editor 면 null. */
   automation_trigger_source: AutomationTriggerSource | null
@@ -28,6 +28,12 @@ export interface OutputConfig {
   split: 'TRAIN' | 'VAL' | 'TEST' | 'NONE'
 }
 
+/** 추가 출력 — 같은 run 에서 다른 태스크 결과를 같은 그룹의 다른 split 으로 저장 */
+export interface ExtraOutputConfig {
+  terminal_task: string
+  output: OutputConfig
+}
+
 export interface PipelineConfig {
   name: string
   description?: string
@@ -42,6 +48,13 @@ export interface PipelineConfig {
   schema_version?: number
   /** PipelineRun.transform_config 측에서 채워지는 resolved 버전. FE spec 단계에선 항상 null. */
   passthrough_source_dataset_id?: string | null
+  /**
+   * Save 노드에 연결된 태스크 키. sink 태스크가 2개 이상일 때만 채운다 —
+   * 나머지 분기는 백엔드 DAG 최적화에서 dead branch 로 제외된다.
+   */
+  terminal_task?: string | null
+  /** 추가 Save 노드 (multi-output). 공통 상류 태스크는 run 당 1회만 계산된다. */
+  extra_outputs?: ExtraOutputConfig[]
 }
 
 /**
@@ -70,17 +83,41 @@ export interface PipelineValidationIssue {
   field: string
 }
 
+/** DAG 최적화 결과 (dead branch 제거 / 중복 태스크 공유) */
+export interface PipelineOptimizedPlan {
+  terminal_task: string
+  /** 추가 출력 태스크 (config.extra_outputs 순서) */
+  extra_terminal_tasks: string[]
+  execution_order: string[]
+  removed_tasks: string[]
+  /** 중복 태스크 → 결과를 재사용하는 대표 태스크 */
+  duplicate_of: Record<string, string>
+  /** 앞당겨 실행하는 필터 태스크 → 앞지른 이미지 변환 태스크 */
+  moved_ahead: Record<string, string[]>
+  /** 병합 태스크 → 병합 중에 적용하는 필터 태스크 */
+  merge_filters: Record<string, string[]>
+}
+
 export interface PipelineValidationResponse {
   is_valid: boolean
   error_count: number
   warning_count: number
   issues: PipelineValidationIssue[]
+  /** 검증 통과 시에만 채워진다. passthrough 는 null. */
+  optimized_plan?: PipelineOptimizedPlan | null
 }
 
 export interface PipelineSubmitResponse {
   execution_id: string
   celery_task_id: string | null
   message: string
+  /**
+   * DISPATCHED — 새 run 실행 / REUSED — 같은 입력의 성공 run 출력 재사용 (worker 없음) /
+   * DUPLICATE_OFFERED — 같은 입력의 성공 run 이 있어 제출 보류 (execution_id 는 그 run)
+   */
+  outcome: 'DISPATCHED' | 'REUSED' | 'DUPLICATE_OFFERED'
+  duplicate_of_execution_id: string | null
+  output_dataset_id: string | null
 }
 
 /**
@@ -99,32 +136,73 @@ export interface PipelineSaveResponse {
   message: string
 }
 
+/** 실행 단계 1개의 계측값 (backend lib/pipeline/instrumentation.StageMetrics) */
+export interface StageMetricsItem {
+  stage: 'source_load' | 'plan' | 'task' | 'materialize' | 'annotation_write'
+  /** source dataset_id / 태스크명(fusion 체인은 "a → b") / 출력 split 등 */
+  name: string
+  wall_seconds: number
+  /** 단계를 실행한 스레드의 CPU 시간 */
+  cpu_seconds: number
+  rss_mb?: number
+  rss_delta_mb?: number
+  /** 단계 중 프로세스 최대 RSS 가 올라갔을 때만 */
+  peak_rss_mb?: number
+  record_count?: number
+  annotation_count?: number
+}
+
 /** DAG 태스크별 진행 상태 */
 export interface TaskProgressItem {
-  status: 'PENDING' | 'RUNNING' | 'DONE' | 'FAILED'
+  /** SKIPPED — DAG 최적화로 실행하지 않은 태스크 (skip_reason 참고) */
+  status: 'PENDING' | 'RUNNING' | 'DONE' | 'FAILED' | 'SKIPPED'
   operator: string
+  skip_reason?: 'dead_branch'
   started_at?: string
   finished_at?: string
   input_images?: number
   output_images?: number
+  /** 태스크 완료 시점의 worker 프로세스 RSS (MB) */
+  rss_mb?: number
+  /** run 간 태스크 결과 캐시 사용 여부 (캐시가 켜져 있고 결정적인 태스크만) */
+  cache?: 'hit' | 'miss'
   /** 이미지 실체화 단계 전용 필드 */
   total_images?: number
   materialized?: number
   skipped?: number
+  /** run 전체의 최대 RSS (MB) */
+  peak_rss_mb?: number
+  /** run 전체의 태스크 결과 캐시 hit / miss 태스크 수 */
+  cache_hits?: number
+  cache_misses?: number
+  /** 증분 재실행에서 이전 출력 이미지를 재사용(hardlink)한 수 */
+  reused?: number
+  /** 이어서 실행(resume)에서 중단 전 이미 만들어 둔 이미지 수 */
+  resumed?: number | boolean
+  /** 추가 출력의 이미지 실체화 단계 (`__image_materialize__:<task>`) 전용 — 출력 split */
+  output_split?: string
+  /** 기본 출력의 이미지 실체화 단계 전용 — run 전체의 단계별 계측값 */
+  stages?: StageMetricsItem[]
 }
 
 export interface PipelineExecutionResponse {
   id: string
   output_dataset_id: string
+  /** multi-output run 의 추가 출력 DatasetVersion.id (config.extra_outputs 순서) */
+  extra_output_dataset_ids: string[]
   config: Record<string, unknown> | null
-  status: 'PENDING' | 'RUNNING' | 'DONE' | 'FAILED'
+  status: 'PENDING' | 'RUNNING' | 'DONE' | 'FAILED' | 'REUSED'
   current_stage: string | null
   processed_count: number
   total_count: number
   error_message: string | null
   celery_task_id: string | null
   task_progress: Record<string, TaskProgressItem> | null
+  /** 성공한 run 의 성능 보고서 (출력 디렉토리 perf.json 과 같은 내용) */
+  perf_report: PipelinePerfReport | null
   pipeline_image_url: string | null
+  /** REUSED run 이 출력을 가리키는 원래 DONE run id */
+  reused_from_run_id: string | null
   /** 이 run 을 만든 Pipeline (concept) 의 name (없으면 null — legacy run). */
   pipeline_name: string | null
   /** 이 run 을 만든 PipelineVersion 의 version 문자열 (예: "1.0"). */
@@ -141,6 +219,56 @@ export interface PipelineExecutionResponse {
   created_at: string
 }
 
+/** 이미지 실체화 성능 (perf.json 의 materialize / outputs[]) */
+export interface PipelineMaterializePerf {
+  output_split?: string
+  images: number
+  skipped: number
+  reused: number
+  resumed: number
+  bytes_written: number
+  seconds: number
+  images_per_second: number | null
+  mb_per_second: number | null
+}
+
+/** run 성능 보고서 (backend lib/pipeline/perf_report) */
+export interface PipelinePerfReport {
+  schema_version: number
+  pipeline_name: string
+  wall_seconds: number
+  phases: { phase_a: number; phase_b: number }
+  /** 계측 단계 종류별 wall 시간 합 */
+  stages: Partial<Record<StageMetricsItem['stage'], number>>
+  /** 작업 단위별 (fusion 체인은 "a → b") */
+  tasks: Record<string, { wall_seconds: number; cpu_seconds: number; record_count: number | null }>
+  materialize: PipelineMaterializePerf
+  outputs: PipelineMaterializePerf[]
+  transforms: Record<string, number>
+  cache: { hits: number; misses: number; hit_ratio: number | null } | null
+  peak_rss_mb: number | null
+}
+
+export interface PipelinePerfRegression {
+  kind: 'task' | 'phase' | 'throughput'
+  name: string
+  baseline: number
+  current: number
+  /** 느려진 배율 (시간은 current / baseline, 처리량은 baseline / current) */
+  ratio: number
+}
+
+/** 같은 PipelineVersion 의 기준 run 과 성능 비교 */
+export interface PipelineRunPerfComparisonResponse {
+  run_id: string
+  baseline_run_id: string
+  slowdown_ratio: number
+  regressions: PipelinePerfRegression[]
+  unmatched_tasks: string[]
+  run_perf_report: PipelinePerfReport
+  baseline_perf_report: PipelinePerfReport
+}
+
 export interface PipelineListResponse {
   items: PipelineExecutionResponse[]
   total: number
@@ -272,8 +400,36 @@ export interface PipelineVersionUpdateRequest {
 }
 
 /** POST /pipelines/versions/{id}/runs 요청 바디 */
+/** 같은 입력으로 성공한 run 이 있을 때 — 미지정이면 서버 설정 */
+export type DuplicateRunPolicy = 'offer' | 'reuse' | 'run'
+
 export interface PipelineRunSubmitRequest {
   resolved_input_versions: Record<string, string>  // {split_id: version}
+  duplicate_policy?: DuplicateRunPolicy
+}
+
+/** 출력 1개의 추정 비용 (dry-run) */
+export interface PipelineOutputEstimate {
+  output_split: string
+  image_count: number
+  copy_only_count: number
+  transform_count: number  // 디코드 → 변환 → 인코드가 필요한 이미지 수
+  transform_operations: Record<string, number>
+  bytes_to_copy: number
+  missing_image_count: number  // 소스 파일이 없어 건너뛸 이미지 수
+}
+
+/** POST /pipelines/versions/{id}/runs/estimate 응답 — 제출 전 비용 추정 */
+export interface PipelineRunEstimateResponse {
+  outputs: PipelineOutputEstimate[]
+  total_images: number
+  total_bytes: number
+  total_transforms: number
+  source_image_count: number
+  sampled_source_image_count: number
+  is_sampled: boolean  // true 면 source 표본으로 돌려 비율로 확대한 값
+  images_per_second: number | null  // 최근 성공 run 처리 속도 (이력 없으면 null)
+  estimated_duration_seconds: number | null
 }
 
 // =============================================================================
@@ -305,6 +461,8 @@ export interface PipelineAutomationUpsertRequest {
 
 export interface PipelineAutomationRerunRequest {
   mode: 'if_delta' | 'force_latest'
+  /** 직전 성공 run 출력에서 변경 없는 이미지 재사용 (생략 시 true) */
+  incremental?: boolean
 }
 
 // =============================================================================
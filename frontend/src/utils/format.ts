@@ -70,3 +70,18 @@ export function formatNumber(n: number | null | undefined): string {
   if (n == null) return '-'
   return n.toLocaleString('ko-KR')
 }
+
+/**
+ * 바이트 수 포맷팅 (1024 단위)
+ */
+export function formatBytes(bytes: number | null | undefined): string {
+  if (bytes == null) return '-'
+  const units = ['B', 'KB', 'MB', 'GB', 'TB']
+  let value = bytes
+  let unitIndex = 0
+  while (value >= 1024 && unitIndex < units.length - 1) {
+    value /= 1024
+    unitIndex += 1
+  }
+  return `${unitIndex === 0 ? value : value.toFixed(1)} ${units[unitIndex]}`
+}